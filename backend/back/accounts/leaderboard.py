@@ -0,0 +1,234 @@
+import bisect
+import logging
+from typing import Final, Optional
+
+import redis
+from django.conf import settings
+from django.db import transaction
+
+from .models import Users
+
+logger = logging.getLogger(__name__)
+
+LEADERBOARD_KEY: Final = "pong:leaderboard"
+LEADERBOARD_MAX_LIMIT: Final = 100
+
+# (user_id, 레이팅, 1부터 시작하는 순위)
+LeaderboardRow = tuple[str, int, int]
+
+
+class Leaderboard:
+    """
+    유저를 레이팅 순으로 정렬해서 상위 N명, 유저의 순위, 유저 주변의 순위를 찾는 기본 클래스
+
+    처음 사용할 때 비어 있으면 Users 테이블에서 다시 만들고, 그 뒤로는 게임 결과가
+    저장될 때 update로 바뀐 레이팅만 반영한다.
+    """
+
+    def __init__(self):
+        self.__is_loaded: bool = False
+
+    def ensure_loaded(self) -> None:
+        if self.__is_loaded:
+            return
+        if self.get_size() == 0:
+            self.rebuild()
+        self.__is_loaded = True
+
+    def rebuild(self) -> int:
+        """
+        Users 테이블의 레이팅으로 리더보드를 다시 만드는 함수
+        Returns:
+            int: 리더보드에 들어간 유저 수
+        """
+        scores = {
+            str(user_id): rating
+            for user_id, rating in Users.objects.order_by().values_list(
+                "user_id", "rating"
+            )
+        }
+        self.replace(scores)
+        self.__is_loaded = True
+        return len(scores)
+
+    def update(self, scores: dict[str, int]) -> None:
+        raise NotImplementedError
+
+    def replace(self, scores: dict[str, int]) -> None:
+        raise NotImplementedError
+
+    def get_size(self) -> int:
+        raise NotImplementedError
+
+    def get_range(self, start: int, end: int) -> list[LeaderboardRow]:
+        """
+        순위가 start번째부터 end번째까지인 유저를 반환하는 함수, 0부터 시작하며 end도 포함
+        Args:
+            start: 시작 위치
+            end: 끝 위치
+
+        Returns:
+            list[LeaderboardRow]: (user_id, 레이팅, 순위) 목록
+        """
+        raise NotImplementedError
+
+    def get_index(self, user_id: str) -> Optional[int]:
+        """
+        유저의 0부터 시작하는 위치를 반환하는 함수
+        Args:
+            user_id: 유저의 user_id
+
+        Returns:
+            int or None: 위치, 리더보드에 없으면 None
+        """
+        raise NotImplementedError
+
+    def get_top(self, limit: int) -> list[LeaderboardRow]:
+        self.ensure_loaded()
+        return self.get_range(0, limit - 1)
+
+    def get_around(
+        self, user_id: str, neighbor_cnt: int
+    ) -> tuple[Optional[int], list[LeaderboardRow]]:
+        """
+        유저의 순위와 위아래로 neighbor_cnt명씩의 유저를 반환하는 함수
+        Args:
+            user_id: 유저의 user_id
+            neighbor_cnt: 위아래로 가져올 유저 수
+
+        Returns:
+            tuple: 유저의 순위(없으면 None), (user_id, 레이팅, 순위) 목록
+        """
+        self.ensure_loaded()
+        index = self.get_index(user_id)
+        if index is None:
+            return None, []
+        rows = self.get_range(max(index - neighbor_cnt, 0), index + neighbor_cnt)
+        return index + 1, rows
+
+
+class InMemoryLeaderboard(Leaderboard):
+    """
+    프로세스 메모리에 (-레이팅, user_id) 순으로 정렬된 목록을 두는 리더보드
+
+    순위는 bisect로 O(log n)에 찾고, 레이팅이 바뀌면 목록에서 빼고 다시 넣는다.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.__scores: dict[str, int] = {}
+        self.__ranking: list[tuple[int, str]] = []
+
+    def update(self, scores: dict[str, int]) -> None:
+        for user_id, score in scores.items():
+            old_score = self.__scores.get(user_id)
+            if old_score is not None:
+                del self.__ranking[
+                    bisect.bisect_left(self.__ranking, (-old_score, user_id))
+                ]
+            self.__scores[user_id] = score
+            bisect.insort(self.__ranking, (-score, user_id))
+
+    def replace(self, scores: dict[str, int]) -> None:
+        self.__scores = dict(scores)
+        self.__ranking = sorted((-score, user_id) for user_id, score in scores.items())
+
+    def get_size(self) -> int:
+        return len(self.__ranking)
+
+    def get_range(self, start: int, end: int) -> list[LeaderboardRow]:
+        return [
+            (user_id, -score, start + offset + 1)
+            for offset, (score, user_id) in enumerate(self.__ranking[start : end + 1])
+        ]
+
+    def get_index(self, user_id: str) -> Optional[int]:
+        score = self.__scores.get(user_id)
+        if score is None:
+            return None
+        return bisect.bisect_left(self.__ranking, (-score, user_id))
+
+
+class RedisLeaderboard(Leaderboard):
+    """
+    Redis sorted set에 레이팅을 score로 두는 리더보드, 모든 replica가 공유
+
+    ZADD, ZREVRANK, ZREVRANGE 모두 O(log n)이고, 다시 만들 때는 임시 키에 채운 뒤
+    RENAME으로 바꿔서 읽는 쪽이 빈 리더보드를 보지 않게 한다.
+    """
+
+    def __init__(self, url: str, key: str = LEADERBOARD_KEY):
+        super().__init__()
+        self.__redis = redis.Redis.from_url(url)
+        self.__key: str = key
+
+    def update(self, scores: dict[str, int]) -> None:
+        if scores:
+            self.__redis.zadd(self.__key, scores)
+
+    def replace(self, scores: dict[str, int]) -> None:
+        if not scores:
+            self.__redis.delete(self.__key)
+            return
+        tmp_key = self.__key + ":rebuild"
+        with self.__redis.pipeline(transaction=True) as pipe:
+            pipe.delete(tmp_key)
+            pipe.zadd(tmp_key, scores)
+            pipe.rename(tmp_key, self.__key)
+            pipe.execute()
+
+    def get_size(self) -> int:
+        return self.__redis.zcard(self.__key)
+
+    def get_range(self, start: int, end: int) -> list[LeaderboardRow]:
+        rows = self.__redis.zrevrange(self.__key, start, end, withscores=True)
+        return [
+            (user_id.decode("utf-8"), int(score), start + offset + 1)
+            for offset, (user_id, score) in enumerate(rows)
+        ]
+
+    def get_index(self, user_id: str) -> Optional[int]:
+        return self.__redis.zrevrank(self.__key, user_id)
+
+
+def update_leaderboard_on_commit(scores: dict[str, int]) -> None:
+    """
+    트랜잭션이 커밋되면 바뀐 레이팅을 리더보드에 반영하는 함수
+    Args:
+        scores: user_id별 새 레이팅
+
+    Returns:
+        None
+    """
+
+    def update() -> None:
+        try:
+            # 비어 있으면 커밋된 레이팅으로 먼저 다시 만들어서 일부 유저만 들어가지 않게 함
+            LEADERBOARD.ensure_loaded()
+            LEADERBOARD.update(scores)
+        except redis.RedisError:
+            # 다음 rebuild_leaderboard까지 리더보드의 레이팅이 늦을 수 있음
+            logger.exception("leaderboard update failed")
+
+    if scores:
+        transaction.on_commit(update)
+
+
+def create_leaderboard(backend: str, url: str) -> Leaderboard:
+    """
+    설정에 맞는 리더보드를 만드는 함수
+    Args:
+        backend: memory 또는 redis
+        url: redis 리더보드가 사용할 Redis URL
+
+    Returns:
+        Leaderboard: 리더보드
+    """
+    if backend == "redis":
+        return RedisLeaderboard(url)
+    return InMemoryLeaderboard()
+
+
+LEADERBOARD: Leaderboard = create_leaderboard(
+    settings.GAME_REGISTRY_BACKEND, settings.REDIS_URL
+)
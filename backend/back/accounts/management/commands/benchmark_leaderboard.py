@@ -0,0 +1,77 @@
+import random
+import timeit
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from accounts.leaderboard import InMemoryLeaderboard, Leaderboard, RedisLeaderboard
+from accounts.models import Users
+
+
+class Command(BaseCommand):
+    help = "리더보드의 상위 N명, 순위, 주변 순위 조회 속도를 SQL 정렬과 비교, 만든 유저는 롤백"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=10000)
+        parser.add_argument("--number", type=int, default=200)
+        parser.add_argument("--limit", type=int, default=10)
+        parser.add_argument(
+            "--redis-url", default="", help="주어지면 Redis sorted set으로 측정"
+        )
+
+    @staticmethod
+    def sql_top(limit: int) -> list:
+        return list(
+            Users.objects.order_by("-rating", "user_id").values_list(
+                "user_id", "rating"
+            )[:limit]
+        )
+
+    @staticmethod
+    def sql_around(user: Users, limit: int) -> list:
+        index = Users.objects.filter(rating__gt=user.rating).count()
+        return list(
+            Users.objects.order_by("-rating", "user_id").values_list(
+                "user_id", "rating"
+            )[max(index - limit, 0) : index + limit + 1]
+        )
+
+    def report(self, name: str, top, around, number: int) -> None:
+        top_us = timeit.timeit(top, number=number) / number * 1e6
+        around_us = timeit.timeit(around, number=number) / number * 1e6
+        self.stdout.write(f"{name:<12} top {top_us:10.2f}us around {around_us:10.2f}us")
+
+    def handle(self, *args, **options):
+        user_cnt, number, limit = options["users"], options["number"], options["limit"]
+        leaderboard: Leaderboard = (
+            RedisLeaderboard(options["redis_url"], key="pong:leaderboard:benchmark")
+            if options["redis_url"]
+            else InMemoryLeaderboard()
+        )
+        with transaction.atomic():
+            Users.objects.bulk_create(
+                Users(
+                    intra_id=f"benchmark{idx}",
+                    nickname=f"benchmark{idx}",
+                    rating=random.randint(600, 1800),
+                )
+                for idx in range(user_cnt)
+            )
+            users = list(Users.objects.filter(intra_id__startswith="benchmark"))
+            leaderboard.rebuild()
+            target = random.choice(users)
+            self.stdout.write(f"{len(users)} users, {number} runs, limit {limit}")
+            self.report(
+                "sql",
+                lambda: self.sql_top(limit),
+                lambda: self.sql_around(target, limit),
+                number,
+            )
+            self.report(
+                "leaderboard",
+                lambda: leaderboard.get_top(limit),
+                lambda: leaderboard.get_around(str(target.user_id), limit),
+                number,
+            )
+            leaderboard.replace({})
+            transaction.set_rollback(True)
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from accounts.leaderboard import LEADERBOARD
+
+
+class Command(BaseCommand):
+    help = "Users 테이블의 레이팅으로 리더보드를 다시 만듦"
+
+    def handle(self, *args, **options):
+        user_cnt = LEADERBOARD.rebuild()
+        self.stdout.write(f"leaderboard: {user_cnt} users")
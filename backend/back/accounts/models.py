@@ -88,6 +88,8 @@ class Users(AbstractBaseUser, PermissionsMixin):
     house: str = models.CharField(choices=HouseEnum.choices, max_length=2)
     win_count: int = models.IntegerField(default=0)
     lose_count: int = models.IntegerField(default=0)
+    # 일반 게임 결과로 갱신되는 Elo 레이팅, 매칭 상대를 고르는 데 사용
+    rating: int = models.IntegerField(default=1000)
     created_time: datetime = models.DateTimeField(auto_now_add=True, editable=False)
     updated_time: datetime = models.DateTimeField(auto_now=True)
     status: str = models.CharField(
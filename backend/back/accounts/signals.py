@@ -1,7 +1,11 @@
 from django.contrib.auth.signals import user_logged_in, user_logged_out
+from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.contrib.sessions.models import Session
 
+from .leaderboard import update_leaderboard_on_commit
+from .models import Users
+
 
 @receiver(user_logged_in)
 def on_user_logged_in(sender, request, user, **kwargs):
@@ -23,3 +27,10 @@ def on_user_logged_out(sender, request, user, **kwargs):
         # 세션 키 필드 초기화
         user.session_key = None
         user.save()
+
+
+@receiver(post_save, sender=Users)
+def on_user_created(sender, instance, created, **kwargs):
+    # 리더보드를 만든 뒤에 가입한 유저도 게임 결과 전에 순위를 받도록 바로 넣음
+    if created:
+        update_leaderboard_on_commit({str(instance.user_id): instance.rating})
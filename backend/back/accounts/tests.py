@@ -5,7 +5,10 @@ from datetime import datetime
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.urls import reverse
+from .leaderboard import LEADERBOARD, InMemoryLeaderboard, update_leaderboard_on_commit
 from .models import UserStatusEnum, Users
+from games.models import GeneralGameLogs
+from games.stats import AGGREGATE_CACHE, rebuild_game_stats
 
 
 class UsersViewSetTest(APITestCase):
@@ -126,9 +129,19 @@ class ChartViewSetTest(APITestCase):
         self.user4 = get_user_model().objects.create_user(
             intra_id="4", house="SL", win_count=4, lose_count=6
         )
-        self.create_url = reverse("general_game_logs")
         self.start_time = make_aware(datetime(2021, 1, 1, 0, 0, 0))
         self.end_time = make_aware(datetime(2021, 1, 2, 1, 0, 0))
+        AGGREGATE_CACHE.clear()
+
+    def create_log(self, player1, player2):
+        GeneralGameLogs.objects.create(
+            start_time=self.start_time,
+            end_time=self.end_time,
+            player1=player1,
+            player2=player2,
+            player1_score=5,
+            player2_score=3,
+        )
 
     def test_get_house_with_authenticate(self):
         """
@@ -136,42 +149,11 @@ class ChartViewSetTest(APITestCase):
         """
         self.client.force_authenticate(user=self.user1)
 
-        data = {
-            "start_time": self.start_time,
-            "end_time": self.end_time,
-            "player1_intra_id": self.user1.intra_id,
-            "player2_intra_id": self.user2.intra_id,
-            "player1_score": 5,
-            "player2_score": 3,
-        }
-        self.client.post(self.create_url, data)
-        data = {
-            "start_time": self.start_time,
-            "end_time": self.end_time,
-            "player1_intra_id": self.user1.intra_id,
-            "player2_intra_id": self.user3.intra_id,
-            "player1_score": 5,
-            "player2_score": 3,
-        }
-        self.client.post(self.create_url, data)
-        data = {
-            "start_time": self.start_time,
-            "end_time": self.end_time,
-            "player1_intra_id": self.user4.intra_id,
-            "player2_intra_id": self.user1.intra_id,
-            "player1_score": 5,
-            "player2_score": 3,
-        }
-        self.client.post(self.create_url, data)
-        data = {
-            "start_time": self.start_time,
-            "end_time": self.end_time,
-            "player1_intra_id": self.user1.intra_id,
-            "player2_intra_id": self.user4.intra_id,
-            "player1_score": 5,
-            "player2_score": 3,
-        }
-        self.client.post(self.create_url, data)
+        self.create_log(self.user1, self.user2)
+        self.create_log(self.user1, self.user3)
+        self.create_log(self.user4, self.user1)
+        self.create_log(self.user1, self.user4)
+        rebuild_game_stats()
 
         url = reverse("chart")
         response = self.client.get(url)
@@ -193,6 +175,124 @@ class ChartViewSetTest(APITestCase):
             self.assertEqual(key, house[idx])
             self.assertEqual(value, rate[idx])
 
+    def test_chart_reads_stats_tables(self):
+        """
+        게임 로그 수와 상관없이 통계 테이블만 읽어서 차트를 만드는지 테스트
+        """
+        self.client.force_authenticate(user=self.user1)
+        for _ in range(10):
+            self.create_log(self.user1, self.user2)
+        rebuild_game_stats()
+
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("chart"))
+        self.assertEqual(response.data["win_count"], 10)
+        self.assertEqual(response.data["rate"]["GR"], 1.0)
+
+        # 기숙사 승률은 캐시에서 읽음
+        with self.assertNumQueries(1):
+            cached_response = self.client.get(reverse("chart"))
+        self.assertEqual(cached_response.data["house"], response.data["house"])
+
+
+class LeaderboardTest(APITestCase):
+    def setUp(self):
+        self.users = [
+            get_user_model().objects.create_user(intra_id=str(idx), rating=rating)
+            for idx, rating in enumerate((1200, 1100, 1000, 900, 800))
+        ]
+        LEADERBOARD.rebuild()
+
+    def test_in_memory_leaderboard_ranks(self):
+        """
+        레이팅 순으로 상위 유저, 순위, 주변 유저를 찾고 레이팅이 바뀌면 순위가 바뀌는지 테스트
+        """
+        leaderboard = InMemoryLeaderboard()
+        leaderboard.replace({"a": 10, "b": 30, "c": 20, "d": 40})
+        self.assertEqual(leaderboard.get_top(2), [("d", 40, 1), ("b", 30, 2)])
+        self.assertEqual(
+            leaderboard.get_around("c", 1),
+            (3, [("b", 30, 2), ("c", 20, 3), ("a", 10, 4)]),
+        )
+        leaderboard.update({"a": 50, "e": 0})
+        self.assertEqual(
+            leaderboard.get_around("a", 1), (1, [("a", 50, 1), ("d", 40, 2)])
+        )
+        self.assertEqual(leaderboard.get_index("e"), 4)
+        self.assertEqual(leaderboard.get_around("nobody", 1), (None, []))
+
+    def test_get_top(self):
+        """
+        상위 limit명의 순위와 유저 정보를 가져오는 테스트
+        """
+        self.client.force_authenticate(user=self.users[0])
+        response = self.client.get(reverse("leaderboard"), {"limit": 3})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [
+                (row["rank"], row["intra_id"], row["rating"])
+                for row in response.data["results"]
+            ],
+            [(1, "0", 1200), (2, "1", 1100), (3, "2", 1000)],
+        )
+
+    def test_get_around_user(self):
+        """
+        유저의 순위와 위아래 유저를 가져오는 테스트
+        """
+        self.client.force_authenticate(user=self.users[0])
+        response = self.client.get(
+            reverse("leaderboard_user", kwargs={"intra_id": "2"}), {"around": 1}
+        )
+        self.assertEqual(response.data["rank"], 3)
+        self.assertEqual(
+            [row["intra_id"] for row in response.data["results"]], ["1", "2", "3"]
+        )
+
+        response = self.client.get(reverse("leaderboard_me"), {"around": 1})
+        self.assertEqual(response.data["rank"], 1)
+        self.assertEqual(
+            [row["intra_id"] for row in response.data["results"]], ["0", "1"]
+        )
+
+        response = self.client.get(
+            reverse("leaderboard_user", kwargs={"intra_id": "nobody"})
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_new_user_joins_leaderboard(self):
+        """
+        리더보드를 만든 뒤에 가입한 유저도 자신의 순위를 받는지 테스트
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            user = get_user_model().objects.create_user(intra_id="new", rating=950)
+        self.client.force_authenticate(user=user)
+        response = self.client.get(reverse("leaderboard_me"), {"around": 1})
+        self.assertEqual(response.data["rank"], 4)
+
+    def test_missing_user_is_not_added_on_read(self):
+        """
+        리더보드에 없는 유저를 조회하면 rank가 None이고 리더보드는 바뀌지 않는지 테스트
+        """
+        user = get_user_model().objects.create_user(intra_id="missing", rating=950)
+        self.client.force_authenticate(user=user)
+        response = self.client.get(reverse("leaderboard_me"), {"around": 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.data["rank"])
+        self.assertEqual(response.data["results"], [])
+        self.assertIsNone(LEADERBOARD.get_index(str(user.user_id)))
+
+    def test_rating_change_updates_leaderboard(self):
+        """
+        게임 결과가 커밋되면 바뀐 레이팅이 리더보드에 반영되는지 테스트
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            Users.objects.filter(pk=self.users[4].pk).update(rating=1300)
+            update_leaderboard_on_commit({str(self.users[4].user_id): 1300})
+        self.assertEqual(
+            LEADERBOARD.get_top(1)[0], (str(self.users[4].user_id), 1300, 1)
+        )
+
 
 class LoginLogoutUserStatusTest(APITestCase):
     def setUp(self):
@@ -24,4 +24,19 @@ urlpatterns: list[partial] = [
         name="test_user_login",
     ),
     path("chart/", views.ChartViewSet.as_view({"get": "list"}), name="chart"),
+    path(
+        "leaderboard/",
+        views.LeaderboardViewSet.as_view({"get": "list"}),
+        name="leaderboard",
+    ),
+    path(
+        "leaderboard/me/",
+        views.LeaderboardUserViewSet.as_view({"get": "list"}),
+        name="leaderboard_me",
+    ),
+    path(
+        "leaderboard/users/<str:intra_id>/",
+        views.LeaderboardUserViewSet.as_view({"get": "list"}),
+        name="leaderboard_user",
+    ),
 ]
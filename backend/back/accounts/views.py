@@ -1,5 +1,6 @@
 import os
 import random
+import uuid
 import string
 from typing import Final
 import requests
@@ -10,18 +11,15 @@ from rest_framework.views import APIView
 from django.shortcuts import redirect
 from django.core.files.base import ContentFile
 from django.conf import settings
-from django.db.models import Q
 from .serializers import UsersSerializer, UsersDetailSerializer
 from .models import Users, HouseEnum, UserStatusEnum
 from rest_framework.permissions import IsAuthenticated
 from django.contrib.auth import login
 from rest_framework.exceptions import ValidationError, PermissionDenied
 from django.contrib.auth import logout
-from games.models import GeneralGameLogs, TournamentGameLogs
-from games.serializers import (
-    GeneralGameLogsListSerializer,
-    TournamentGameLogsListSerializer,
-)
+from games.models import HeadToHeadStats
+from .leaderboard import LEADERBOARD, LEADERBOARD_MAX_LIMIT, LeaderboardRow
+from games.stats import get_house_stats
 
 HOUSE: Final = {
     "Gam": HouseEnum.RAVENCLAW,
@@ -32,6 +30,9 @@ HOUSE: Final = {
 
 BASE_FULL_IP: Final = f"https://{os.environ.get('BASE_IP')}/"
 
+LEADERBOARD_DEFAULT_LIMIT: Final = 10
+LEADERBOARD_DEFAULT_AROUND: Final = 5
+
 
 # https://squirmm.tistory.com/entry/Django-DRF-Method-Override-%EB%B0%A9%EB%B2%95
 class UsersViewSet(viewsets.ModelViewSet):
@@ -88,6 +89,7 @@ class UsersDetailViewSet(viewsets.ModelViewSet):
         "intra_id",
         "win_count",
         "lose_count",
+        "rating",
         "created_time",
         "updated_time",
         "is_staff",
@@ -268,33 +270,6 @@ class ChartViewSet(viewsets.ModelViewSet):
     serializer_class: UsersSerializer = UsersSerializer
     http_method_names = ["get"]
 
-    @staticmethod
-    def _add_data(
-        request: requests, data: dict, win_logs: dict, lose_logs: dict
-    ) -> None:
-        """
-        사용자의 승패 횟수를 추가하는 함수
-        Args:
-            request: 사용자 정보가 있는 request
-            data: 사용자의 게임 로그
-            win_logs: 기숙사의 승리 횟수
-            lose_logs: 기숙사의 패배 횟수
-
-        Returns:
-            None
-        """
-        for logs in data:
-            if logs["player1"]["intra_id"] == request.user.intra_id:
-                if logs["player1_score"] > logs["player2_score"]:
-                    win_logs[logs["player2"]["house"]] += 1
-                else:
-                    lose_logs[logs["player2"]["house"]] += 1
-            else:
-                if logs["player2_score"] > logs["player1_score"]:
-                    win_logs[logs["player1"]["house"]] += 1
-                else:
-                    lose_logs[logs["player1"]["house"]] += 1
-
     @csrf_exempt
     def list(self, request, *args, **kwargs) -> Response:
         """
@@ -304,27 +279,16 @@ class ChartViewSet(viewsets.ModelViewSet):
             사용자와 각 기숙사별 승률과 기숙사 전체 승률
         """
         data = {}
+        houses = ("RA", "GR", "HU", "SL")
 
         # 사용자의 각 기숙사 별 대결 승률
-        win_logs = {"RA": 0, "GR": 0, "HU": 0, "SL": 0}
-        lose_logs = {"RA": 0, "GR": 0, "HU": 0, "SL": 0}
-        general_game = GeneralGameLogs.objects.all()
-        general_game_queryset = general_game.filter(
-            Q(player1=request.user.user_id) | Q(player2=request.user.user_id)
-        )
-        general_game_serializer = GeneralGameLogsListSerializer(
-            general_game_queryset, many=True
-        )
-        self._add_data(request, general_game_serializer.data, win_logs, lose_logs)
-
-        tournament = TournamentGameLogs.objects.all()
-        tournament_queryset = tournament.filter(
-            Q(player1=request.user.user_id) | Q(player2=request.user.user_id)
-        )
-        tournament_serializer = TournamentGameLogsListSerializer(
-            tournament_queryset, many=True
-        )
-        self._add_data(request, tournament_serializer.data, win_logs, lose_logs)
+        win_logs = dict.fromkeys(houses, 0)
+        lose_logs = dict.fromkeys(houses, 0)
+        for house, win_count, lose_count in HeadToHeadStats.objects.filter(
+            user=request.user.user_id
+        ).values_list("opponent_house", "win_count", "lose_count"):
+            win_logs[house] = win_count
+            lose_logs[house] = lose_count
 
         data["win_count"] = sum(win_logs.values())
         data["lose_count"] = sum(lose_logs.values())
@@ -338,14 +302,10 @@ class ChartViewSet(viewsets.ModelViewSet):
         }
 
         # 각 기숙사 별 승률
+        house_stats = get_house_stats()
         data["house"] = {}
-        for house in ("RA", "GR", "HU", "SL"):
-            queryset = UsersViewSet.queryset.filter(house=house)
-            serializer = UsersSerializer(queryset, many=True)
-            total_win_count, total_lose_count = 0, 0
-            for user in serializer.data:
-                total_win_count += user["win_count"]
-                total_lose_count += user["lose_count"]
+        for house in houses:
+            total_win_count, total_lose_count = house_stats.get(house, (0, 0))
             rate = (
                 total_win_count / (total_win_count + total_lose_count)
                 if total_win_count + total_lose_count
@@ -356,6 +316,109 @@ class ChartViewSet(viewsets.ModelViewSet):
         return Response(data)
 
 
+def get_int_query_param(request, name: str, default: int, max_value: int) -> int:
+    """
+    쿼리 파라미터를 1 이상 max_value 이하의 정수로 가져옴
+    Args:
+        request: 요청 정보가 담긴 객체
+        name: 쿼리 파라미터 이름
+        default: 파라미터가 없거나 올바르지 않을 때의 값
+        max_value: 최댓값
+
+    Returns:
+        int: 파라미터 값
+    """
+    try:
+        value = int(request.query_params[name])
+    except (KeyError, ValueError):
+        return default
+    return min(max(value, 1), max_value)
+
+
+def build_leaderboard_rows(rows: list[LeaderboardRow]) -> list[dict]:
+    """
+    리더보드의 (user_id, 레이팅, 순위)에 유저 정보를 한 번에 조회해서 붙임
+    Args:
+        rows: 리더보드에서 가져온 순위 목록
+
+    Returns:
+        list[dict]: 순위와 레이팅이 포함된 유저 정보
+    """
+    users = Users.objects.in_bulk([user_id for user_id, _, _ in rows])
+    results = []
+    for user_id, rating, rank in rows:
+        user = users.get(uuid.UUID(user_id))
+        # 리더보드에만 남아 있는 삭제된 유저는 제외
+        if user is not None:
+            results.append(
+                {"rank": rank, "rating": rating, **UsersSerializer(user).data}
+            )
+    return results
+
+
+class LeaderboardViewSet(viewsets.ModelViewSet):
+    """
+    레이팅 상위 유저 조회
+    """
+
+    permission_classes = [IsAuthenticated]
+    queryset = Users.objects.all()
+    serializer_class: UsersSerializer = UsersSerializer
+    http_method_names = ["get"]
+
+    def list(self, request, *args, **kwargs) -> Response:
+        """
+        GET method override
+
+        Returns:
+            레이팅 상위 limit명의 순위와 유저 정보
+        """
+        limit = get_int_query_param(
+            request, "limit", LEADERBOARD_DEFAULT_LIMIT, LEADERBOARD_MAX_LIMIT
+        )
+        return Response({"results": build_leaderboard_rows(LEADERBOARD.get_top(limit))})
+
+
+class LeaderboardUserViewSet(viewsets.ModelViewSet):
+    """
+    유저의 순위와 위아래 순위의 유저 조회
+    """
+
+    permission_classes = [IsAuthenticated]
+    queryset = Users.objects.all()
+    serializer_class: UsersSerializer = UsersSerializer
+    http_method_names = ["get"]
+
+    def list(self, request, *args, **kwargs) -> Response:
+        """
+        GET method override
+
+        Returns:
+            유저의 순위와 위아래로 around명씩의 순위와 유저 정보
+        """
+        if "intra_id" in kwargs:
+            try:
+                user = Users.objects.get(intra_id=kwargs["intra_id"])
+            except Users.DoesNotExist:
+                return Response(
+                    {"error": "없는 유저입니다."}, status=status.HTTP_404_NOT_FOUND
+                )
+        else:
+            user = request.user
+        neighbor_cnt = get_int_query_param(
+            request, "around", LEADERBOARD_DEFAULT_AROUND, LEADERBOARD_MAX_LIMIT // 2
+        )
+        # 가입할 때 리더보드에 들어가지 못한 유저는 다음 rebuild_leaderboard까지 rank가 None
+        rank, rows = LEADERBOARD.get_around(str(user.user_id), neighbor_cnt)
+        return Response(
+            {
+                "rank": rank,
+                "rating": user.rating,
+                "results": build_leaderboard_rows(rows),
+            }
+        )
+
+
 class TestAccountLogin(APIView):
     """
     테스트 유저용 로그인
@@ -154,15 +154,35 @@ AUTH_USER_MODEL = "accounts.Users"
 # Daphne
 ASGI_APPLICATION = "back.asgi.application"
 
+# 멤버가 모두 같은 프로세스에 있는 그룹은 Redis를 거치지 않고 전달
 CHANNEL_LAYERS = {
     "default": {
-        "BACKEND": "channels_redis.core.RedisChannelLayer",
+        "BACKEND": "pong_game.module.HybridChannelLayer.HybridChannelLayer",
         "CONFIG": {
             "hosts": [("channels", 6379)],
         },
     },
 }
 
+# 게임 물리 연산 주기와 클라이언트에게 프레임을 전송하는 주기(Hz)
+GAME_SIMULATION_RATE = int(os.environ.get("GAME_SIMULATION_RATE", 120))
+GAME_BROADCAST_RATE = int(os.environ.get("GAME_BROADCAST_RATE", 30))
+# scalar: 게임마다 물리 계산, batch: 모든 게임을 numpy 배열로 한 번에 계산
+GAME_PHYSICS_ENGINE = os.environ.get("GAME_PHYSICS_ENGINE", "scalar")
+# memory: 프로세스 안에서만 게임을 찾음, redis: 모든 레플리카가 게임의 소유 프로세스를 찾음
+GAME_REGISTRY_BACKEND = os.environ.get("GAME_REGISTRY_BACKEND", "memory")
+REDIS_URL = os.environ.get("REDIS_URL", "redis://channels:6379/0")
+# memory: 프로세스 메모리, file: TOURNAMENT_JOURNAL_PATH 파일, redis: REDIS_URL의 stream에 기록
+TOURNAMENT_JOURNAL_BACKEND = os.environ.get("TOURNAMENT_JOURNAL_BACKEND", "memory")
+TOURNAMENT_JOURNAL_PATH = os.environ.get(
+    "TOURNAMENT_JOURNAL_PATH", os.path.join(BASE_DIR, "tournament.journal")
+)
+# 파드가 다시 만들어져도 이전 기록을 복구하도록 파드 이름이 아닌 고정된 stream key를 사용
+# 레플리카마다 따로 기록하려면 StatefulSet 순번처럼 바뀌지 않는 값을 붙여서 설정
+TOURNAMENT_JOURNAL_KEY = os.environ.get(
+    "TOURNAMENT_JOURNAL_KEY", "pong:tournament_journal"
+)
+
 # 기본 render 방식을 json 방식으로 변경
 REST_FRAMEWORK = {
     "DEFAULT_RENDERER_CLASSES": [
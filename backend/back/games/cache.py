@@ -0,0 +1,187 @@
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Final, Hashable, Optional
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+# 프로세스 캐시는 다른 replica의 무효화를 받지 못하므로 짧게 유지
+LOCAL_CACHE_SECONDS: Final = 1
+REDIS_CACHE_SECONDS: Final = 30
+LOCAL_CACHE_MAX_SIZE: Final = 128
+
+
+class LocalTTLCache:
+    """
+    프로세스 메모리에 최대 max_size개를 ttl초 동안 저장하는 LRU 캐시
+    """
+
+    def __init__(self, max_size: int = LOCAL_CACHE_MAX_SIZE, ttl: float = 1):
+        self.max_size: int = max_size
+        self.ttl: float = ttl
+        # 키별 (값, 만료 monotonic 시각), 최근에 읽은 키가 뒤에 위치
+        self.__entries: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self.__entries.get(key)
+        if entry is None:
+            return None
+        value, expire_time = entry
+        if expire_time <= time.monotonic():
+            del self.__entries[key]
+            return None
+        self.__entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self.__entries[key] = (value, time.monotonic() + self.ttl)
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.max_size:
+            self.__entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self.__entries.pop(key, None)
+
+    def clear(self) -> None:
+        self.__entries.clear()
+
+
+class AggregateCache:
+    """
+    모든 유저에게 같은 집계 결과를 캐시하는 클래스
+
+    프로세스 LRU 캐시를 먼저 보고, url이 주어지면 replica끼리 공유하는 Redis를
+    다음으로 본 뒤에야 load로 DB를 읽는다. 게임 결과가 저장되면 invalidate로
+    두 캐시를 모두 지우고, 다른 replica의 프로세스 캐시는 local_ttl초 안에 만료된다.
+    invalidate는 키별 세대 번호를 올리고, load 전에 읽은 세대가 그대로일 때만
+    결과를 저장해서 load 도중에 지워진 오래된 결과가 다시 캐시되지 않게 한다.
+    Redis에 문제가 있으면 캐시 없이 DB를 읽는다.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        local_ttl: float = LOCAL_CACHE_SECONDS,
+        redis_ttl: int = REDIS_CACHE_SECONDS,
+        max_size: int = LOCAL_CACHE_MAX_SIZE,
+        prefix: str = "pong:aggregate:",
+    ):
+        self.__local: LocalTTLCache = LocalTTLCache(max_size, local_ttl)
+        self.__redis: Optional[redis.Redis] = redis.Redis.from_url(url) if url else None
+        self.__redis_ttl: int = redis_ttl
+        self.__prefix: str = prefix
+        # 키별로 이 프로세스에서 invalidate한 횟수
+        self.__generations: dict[str, int] = {}
+
+    def get_or_load(self, key: str, load: Callable[[], Any]) -> Any:
+        """
+        캐시된 집계 결과를 반환하고 없으면 load로 읽어서 캐시하는 함수
+        Args:
+            key: 집계 이름
+            load: DB에서 집계 결과를 읽는 함수, 결과는 json으로 저장할 수 있어야 함
+
+        Returns:
+            Any: 집계 결과
+        """
+        value = self.__local.get(key)
+        if value is not None:
+            return value
+        local_generation = self.__generations.get(key, 0)
+        redis_generation = None
+        is_redis_read = False
+        if self.__redis is not None:
+            try:
+                data, redis_generation = self.__redis.mget(
+                    self.__prefix + key, self.__get_generation_key(key)
+                )
+                is_redis_read = True
+            except redis.RedisError:
+                logger.warning("aggregate cache read failed: %s", key)
+                data = None
+            if data is not None:
+                value = json.loads(data)
+                self.__local.set(key, value)
+                return value
+
+        # json을 거친 값과 같은 모양으로 반환되도록 변환
+        value = json.loads(json.dumps(load()))
+        if is_redis_read:
+            self.__set_if_current(key, value, redis_generation)
+        if self.__generations.get(key, 0) == local_generation:
+            self.__local.set(key, value)
+        return value
+
+    def __get_generation_key(self, key: str) -> str:
+        return self.__prefix + key + ":generation"
+
+    def __set_if_current(
+        self, key: str, value: Any, generation: Optional[bytes]
+    ) -> None:
+        """
+        load 전에 읽은 세대가 그대로일 때만 Redis에 집계 결과를 저장하는 함수
+        Args:
+            key: 집계 이름
+            value: 집계 결과
+            generation: load 전에 읽은 세대 번호
+
+        Returns:
+            None
+        """
+        generation_key = self.__get_generation_key(key)
+        try:
+            with self.__redis.pipeline() as pipe:
+                pipe.watch(generation_key)
+                if pipe.get(generation_key) != generation:
+                    return
+                pipe.multi()
+                pipe.set(self.__prefix + key, json.dumps(value), ex=self.__redis_ttl)
+                pipe.execute()
+        except redis.WatchError:
+            # 저장하는 사이에 invalidate 됨
+            pass
+        except redis.RedisError:
+            logger.warning("aggregate cache write failed: %s", key)
+
+    def invalidate(self, key: str) -> None:
+        """
+        집계 결과의 캐시를 지우는 함수
+        Args:
+            key: 집계 이름
+
+        Returns:
+            None
+        """
+        self.__generations[key] = self.__generations.get(key, 0) + 1
+        self.__local.delete(key)
+        if self.__redis is not None:
+            try:
+                with self.__redis.pipeline() as pipe:
+                    pipe.incr(self.__get_generation_key(key))
+                    pipe.delete(self.__prefix + key)
+                    pipe.execute()
+            except redis.RedisError:
+                logger.warning("aggregate cache invalidate failed: %s", key)
+
+    def clear(self) -> None:
+        self.__local.clear()
+
+
+def create_aggregate_cache(backend: str, url: str) -> AggregateCache:
+    """
+    설정에 맞는 집계 캐시를 만드는 함수
+    Args:
+        backend: memory 또는 redis
+        url: redis 캐시가 사용할 Redis URL
+
+    Returns:
+        AggregateCache: 집계 캐시
+    """
+    if backend == "redis":
+        return AggregateCache(url)
+    return AggregateCache()
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from games.stats import rebuild_game_stats
+
+
+class Command(BaseCommand):
+    help = "게임 로그와 유저의 승패 수로 상대 기숙사별 통계와 기숙사 통계를 다시 만듦"
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            head_to_head_cnt, house_cnt = rebuild_game_stats()
+        self.stdout.write(
+            f"HeadToHeadStats: {head_to_head_cnt} rows, HouseStats: {house_cnt} rows"
+        )
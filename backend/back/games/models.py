@@ -3,7 +3,7 @@ from typing import Union
 from datetime import datetime
 
 from django.db import models
-from accounts.models import Users
+from accounts.models import HouseEnum, Users
 
 
 class GeneralGameLogs(models.Model):
@@ -34,6 +34,21 @@ class GeneralGameLogs(models.Model):
     class Meta:
         db_table = "GeneralGameLogs"
         ordering = ["-start_time"]
+        # 로그 목록의 keyset 페이지네이션 순서 (-start_time, pk)
+        indexes = [
+            models.Index(
+                fields=["-start_time", "game_id"], name="general_log_start_time"
+            ),
+            # 유저의 로그는 player1 쪽과 player2 쪽을 각 인덱스로 따로 읽고 합침
+            models.Index(
+                fields=["player1", "-start_time", "game_id"],
+                name="general_log_player1",
+            ),
+            models.Index(
+                fields=["player2", "-start_time", "game_id"],
+                name="general_log_player2",
+            ),
+        ]
 
 
 class TournamentGameLogs(models.Model):
@@ -64,8 +79,62 @@ class TournamentGameLogs(models.Model):
     class Meta:
         db_table = "TournamentGameLogs"
         ordering = ["-start_time"]
+        # 로그 목록의 keyset 페이지네이션 순서 (-start_time, pk)
+        indexes = [
+            models.Index(
+                fields=["-start_time", "id"], name="tournament_log_start_time"
+            ),
+            # 유저의 로그는 player1 쪽과 player2 쪽을 각 인덱스로 따로 읽고 합침
+            models.Index(
+                fields=["player1", "-start_time", "id"],
+                name="tournament_log_player1",
+            ),
+            models.Index(
+                fields=["player2", "-start_time", "id"],
+                name="tournament_log_player2",
+            ),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=["tournament_name", "round"], name="tournament_game_id"
             )
         ]
+
+
+class HeadToHeadStats(models.Model):
+    """
+    유저의 상대 기숙사별 승패 수, 게임 결과가 저장될 때 함께 갱신
+    """
+
+    user: Users = models.ForeignKey(
+        "accounts.Users",
+        on_delete=models.CASCADE,
+        db_column="user",
+        related_name="head_to_head_stats",
+    )
+    opponent_house: str = models.CharField(choices=HouseEnum.choices, max_length=2)
+    win_count: int = models.IntegerField(default=0)
+    lose_count: int = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "HeadToHeadStats"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "opponent_house"], name="head_to_head_stats_id"
+            )
+        ]
+
+
+class HouseStats(models.Model):
+    """
+    기숙사 유저들의 승패 수 합계, 게임 결과가 저장될 때 함께 갱신
+    """
+
+    house: str = models.CharField(
+        primary_key=True, choices=HouseEnum.choices, max_length=2
+    )
+    win_count: int = models.IntegerField(default=0)
+    lose_count: int = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "HouseStats"
@@ -0,0 +1,150 @@
+import base64
+import binascii
+import json
+from collections import OrderedDict
+from typing import Optional
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q, QuerySet
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class GameLogKeysetPagination(BasePagination):
+    """
+    게임 로그를 (-start_time, pk) 순서의 keyset으로 나누는 페이지네이션
+
+    cursor는 이전 페이지 마지막 로그의 (start_time, pk)를 담은 토큰이고,
+    다음 페이지는 그 로그보다 뒤에 오는 로그만 조건으로 찾으므로 OFFSET 없이
+    인덱스를 따라 읽는다. 페이지를 넘기는 사이에 로그가 추가되어도 이미 본 로그가
+    다시 나오거나 빠지지 않는다.
+
+    player1 또는 player2가 유저인 로그처럼 OR 조건은 인덱스 하나로 순서대로 읽을 수
+    없으므로, paginate_querysets로 쪽마다 (player, -start_time, pk) 인덱스를 따라
+    따로 읽고 합친다.
+    """
+
+    page_size: int = 20
+    max_page_size: int = 100
+    cursor_query_param: str = "cursor"
+    page_size_query_param: str = "page_size"
+    invalid_cursor_message: str = "잘못된 cursor입니다."
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request, view=None
+    ) -> Optional[list]:
+        """
+        cursor 다음의 로그를 page_size개 가져오는 함수
+        Args:
+            queryset: 필터가 적용된 게임 로그 queryset
+            request: 요청 정보가 담긴 객체
+            view: 요청을 처리하는 view
+
+        Returns:
+            list: 현재 페이지의 로그
+
+        Raises:
+            NotFound: cursor가 올바르지 않을 때
+        """
+        return self.paginate_querysets([queryset], request, view)
+
+    def paginate_querysets(
+        self, querysets: list[QuerySet], request, view=None
+    ) -> Optional[list]:
+        """
+        여러 queryset을 하나의 목록으로 보고 cursor 다음의 로그를 page_size개 가져오는 함수,
+        queryset마다 keyset 순서로 page_size + 1개까지만 읽어서 합침
+        Args:
+            querysets: 같은 모델의 게임 로그 queryset 목록, 겹치는 로그는 한 번만 나옴
+            request: 요청 정보가 담긴 객체
+            view: 요청을 처리하는 view
+
+        Returns:
+            list: 현재 페이지의 로그
+
+        Raises:
+            NotFound: cursor가 올바르지 않을 때
+        """
+        self.request = request
+        page_size = self.get_page_size(request)
+        cursor = request.query_params.get(self.cursor_query_param)
+        after_cursor = None
+        if cursor:
+            start_time, pk = self.decode_cursor(cursor, querysets[0].model)
+            after_cursor = Q(start_time__lt=start_time) | Q(
+                start_time=start_time, pk__gt=pk
+            )
+
+        logs = {}
+        for queryset in querysets:
+            queryset = queryset.order_by("-start_time", "pk")
+            if after_cursor is not None:
+                queryset = queryset.filter(after_cursor)
+            # 한 개를 더 읽어서 다음 페이지가 있는지 확인
+            for log in queryset[: page_size + 1]:
+                logs[log.pk] = log
+
+        results = sorted(logs.values(), key=lambda log: log.pk)
+        results.sort(key=lambda log: log.start_time, reverse=True)
+        self.has_next = len(results) > page_size
+        self.page = results[:page_size]
+        return self.page
+
+    def get_page_size(self, request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def encode_cursor(self, log) -> str:
+        data = json.dumps([log.start_time.isoformat(), str(log.pk)])
+        return base64.urlsafe_b64encode(data.encode("utf-8")).decode("ascii")
+
+    def decode_cursor(self, cursor: str, model) -> tuple:
+        try:
+            start_time, pk = json.loads(
+                base64.urlsafe_b64decode(cursor.encode("ascii"))
+            )
+            start_time = parse_datetime(start_time)
+            pk = model._meta.pk.to_python(pk)
+        except (
+            binascii.Error,
+            UnicodeError,
+            TypeError,
+            ValueError,
+            DjangoValidationError,
+        ):
+            raise NotFound(self.invalid_cursor_message)
+        if start_time is None:
+            raise NotFound(self.invalid_cursor_message)
+        return start_time, pk
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self.encode_cursor(self.page[-1]),
+        )
+
+    def get_paginated_response(self, data) -> Response:
+        return Response(
+            OrderedDict([("next", self.get_next_link()), ("results", data)])
+        )
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
@@ -0,0 +1,206 @@
+from collections import defaultdict
+from typing import Iterable, Union
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+
+from accounts.models import HouseEnum, Users
+from .cache import create_aggregate_cache
+from .models import (
+    GeneralGameLogs,
+    TournamentGameLogs,
+    HeadToHeadStats,
+    HouseStats,
+)
+
+AGGREGATE_CACHE = create_aggregate_cache(
+    settings.GAME_REGISTRY_BACKEND, settings.REDIS_URL
+)
+HOUSE_STATS_KEY = "house_stats"
+
+# (user_id, 상대 기숙사)별 [승리 수, 패배 수]
+HeadToHeadCounts = dict[tuple[str, str], list[int]]
+# 기숙사별 [승리 수, 패배 수]
+HouseCounts = dict[str, list[int]]
+
+
+def count_head_to_head(
+    logs: Iterable[tuple[str, str, int, int]], houses: dict[str, str]
+) -> HeadToHeadCounts:
+    """
+    게임 로그에서 유저의 상대 기숙사별 승패 수를 세는 함수, 점수가 같으면 두 유저 모두 패배
+    Args:
+        logs: (player1 user_id, player2 user_id, player1 점수, player2 점수) 목록
+        houses: user_id별 기숙사
+
+    Returns:
+        HeadToHeadCounts: (user_id, 상대 기숙사)별 [승리 수, 패배 수]
+    """
+    counts = defaultdict(lambda: [0, 0])
+    for player1_id, player2_id, player1_score, player2_score in logs:
+        player1_id, player2_id = str(player1_id), str(player2_id)
+        counts[(player1_id, houses[player2_id])][
+            0 if player1_score > player2_score else 1
+        ] += 1
+        counts[(player2_id, houses[player1_id])][
+            0 if player2_score > player1_score else 1
+        ] += 1
+    return dict(counts)
+
+
+def add_head_to_head_stats(counts: HeadToHeadCounts) -> None:
+    """
+    유저의 상대 기숙사별 승패 수를 더하는 함수, 트랜잭션 안에서 호출해야 함
+    Args:
+        counts: (user_id, 상대 기숙사)별 더할 [승리 수, 패배 수]
+
+    Returns:
+        None
+    """
+    if not counts:
+        return
+    # 처음 만나는 (유저, 상대 기숙사)의 행을 만든 뒤 모든 행을 한 번에 증가
+    HeadToHeadStats.objects.bulk_create(
+        [
+            HeadToHeadStats(user_id=user_id, opponent_house=house)
+            for user_id, house in counts
+        ],
+        ignore_conflicts=True,
+    )
+    rows = HeadToHeadStats.objects.filter(
+        user_id__in={user_id for user_id, _ in counts}
+    ).values_list("pk", "user_id", "opponent_house")
+    changed_stats = []
+    for pk, user_id, house in rows:
+        count = counts.get((str(user_id), house))
+        if count is not None:
+            changed_stats.append(
+                HeadToHeadStats(
+                    pk=pk,
+                    win_count=F("win_count") + count[0],
+                    lose_count=F("lose_count") + count[1],
+                )
+            )
+    HeadToHeadStats.objects.bulk_update(changed_stats, ["win_count", "lose_count"])
+
+
+def add_house_stats(counts: HouseCounts) -> None:
+    """
+    기숙사별 승패 수 합계를 더하는 함수, 트랜잭션 안에서 호출해야 함
+    Args:
+        counts: 기숙사별 더할 [승리 수, 패배 수]
+
+    Returns:
+        None
+    """
+    if not counts:
+        return
+    HouseStats.objects.bulk_create(
+        [HouseStats(house=house) for house in counts], ignore_conflicts=True
+    )
+    HouseStats.objects.bulk_update(
+        [
+            HouseStats(
+                house=house,
+                win_count=F("win_count") + win_count,
+                lose_count=F("lose_count") + lose_count,
+            )
+            for house, (win_count, lose_count) in counts.items()
+        ],
+        ["win_count", "lose_count"],
+    )
+    transaction.on_commit(invalidate_house_stats)
+
+
+def load_house_stats() -> HouseCounts:
+    return {
+        house: [win_count, lose_count]
+        for house, win_count, lose_count in HouseStats.objects.values_list(
+            "house", "win_count", "lose_count"
+        )
+    }
+
+
+def get_house_stats() -> HouseCounts:
+    """
+    기숙사별 승패 수 합계를 캐시에서 가져오는 함수, 캐시에 없으면 HouseStats를 읽음
+    Returns:
+        HouseCounts: 기숙사별 [승리 수, 패배 수]
+    """
+    return AGGREGATE_CACHE.get_or_load(HOUSE_STATS_KEY, load_house_stats)
+
+
+def invalidate_house_stats() -> None:
+    AGGREGATE_CACHE.invalidate(HOUSE_STATS_KEY)
+
+
+def get_head_to_head_rows(
+    model: Union[type[GeneralGameLogs], type[TournamentGameLogs]],
+) -> Iterable[tuple[str, str, int, int]]:
+    """
+    게임 로그를 (유저, 상대 기숙사)별로 DB에서 묶어서 승패 수를 세는 함수
+    Args:
+        model: GeneralGameLogs 또는 TournamentGameLogs
+
+    Returns:
+        Iterable: (user_id, 상대 기숙사, 승리 수, 패배 수) 목록
+    """
+    for player, opponent in (("player1", "player2"), ("player2", "player1")):
+        score, opponent_score = f"{player}_score", f"{opponent}_score"
+        yield from (
+            model.objects.order_by()
+            .values_list(player, f"{opponent}__house")
+            .annotate(
+                win_count=Count("pk", filter=Q(**{f"{score}__gt": F(opponent_score)})),
+                lose_count=Count(
+                    "pk", filter=Q(**{f"{score}__lte": F(opponent_score)})
+                ),
+            )
+        )
+
+
+def rebuild_game_stats() -> tuple[int, int]:
+    """
+    게임 로그와 유저의 승패 수로 통계 테이블을 다시 만드는 함수, 트랜잭션 안에서 호출해야 함
+    Returns:
+        tuple[int, int]: 만든 HeadToHeadStats 행 수, HouseStats 행 수
+    """
+    counts = defaultdict(lambda: [0, 0])
+    for model in (GeneralGameLogs, TournamentGameLogs):
+        for user_id, house, win_count, lose_count in get_head_to_head_rows(model):
+            counts[(user_id, house)][0] += win_count
+            counts[(user_id, house)][1] += lose_count
+    HeadToHeadStats.objects.all().delete()
+    HeadToHeadStats.objects.bulk_create(
+        [
+            HeadToHeadStats(
+                user_id=user_id,
+                opponent_house=house,
+                win_count=win_count,
+                lose_count=lose_count,
+            )
+            for (user_id, house), (win_count, lose_count) in counts.items()
+        ]
+    )
+
+    house_totals = {
+        house: (win_count or 0, lose_count or 0)
+        for house, win_count, lose_count in Users.objects.order_by()
+        .values_list("house")
+        .annotate(Sum("win_count"), Sum("lose_count"))
+    }
+    houses = sorted(set(HouseEnum.values) | house_totals.keys())
+    HouseStats.objects.all().delete()
+    HouseStats.objects.bulk_create(
+        [
+            HouseStats(
+                house=house,
+                win_count=house_totals.get(house, (0, 0))[0],
+                lose_count=house_totals.get(house, (0, 0))[1],
+            )
+            for house in houses
+        ]
+    )
+    transaction.on_commit(invalidate_house_stats)
+    return len(counts), len(houses)
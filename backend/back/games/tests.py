@@ -1,13 +1,21 @@
+import time
+from unittest.mock import MagicMock, patch
+
+from django.test import TestCase
 from django.utils.timezone import make_aware
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.urls import reverse
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from .models import (
     GeneralGameLogs,
     TournamentGameLogs,
 )
 from datetime import datetime, timedelta
 from accounts.models import Users
+from .cache import AggregateCache, LocalTTLCache
+from .stats import AGGREGATE_CACHE, add_house_stats, get_house_stats
 
 
 class GeneralGameLogsViewSetTest(APITestCase):
@@ -140,10 +148,14 @@ class GeneralGameLogsViewSetTest(APITestCase):
         )
 
         # get 데이터 확인
-        self.assertEqual(response.data[0]["start_time"], self.start_time.isoformat())
-        self.assertEqual(response.data[0]["end_time"], self.end_time.isoformat())
-        self.assertEqual(response.data[0]["player1"]["intra_id"], player1)
-        self.assertEqual(response.data[0]["player2"]["intra_id"], player2)
+        self.assertEqual(
+            response.data["results"][0]["start_time"], self.start_time.isoformat()
+        )
+        self.assertEqual(
+            response.data["results"][0]["end_time"], self.end_time.isoformat()
+        )
+        self.assertEqual(response.data["results"][0]["player1"]["intra_id"], player1)
+        self.assertEqual(response.data["results"][0]["player2"]["intra_id"], player2)
 
     def test_score_minus(self):
         """
@@ -194,9 +206,13 @@ class GeneralGameLogsListMeViewSetTest(APITestCase):
         """
         self.client.force_authenticate(user=self.user1)
         response = self.client.get(self.list_url)
-        self.assertEqual(len(response.data), 2)
-        self.assertEqual(response.data[0]["player1"]["intra_id"], self.user1.intra_id)
-        self.assertEqual(response.data[1]["player1"]["intra_id"], self.user1.intra_id)
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertEqual(
+            response.data["results"][0]["player1"]["intra_id"], self.user1.intra_id
+        )
+        self.assertEqual(
+            response.data["results"][1]["player1"]["intra_id"], self.user1.intra_id
+        )
 
 
 class TournamentGameLogsViewSetTest(APITestCase):
@@ -414,19 +430,25 @@ class TournamentGameLogsViewSetTest(APITestCase):
         response = self.client.get(
             reverse("tournament_name_logs", kwargs={"name": self.tournament_name})
         )
-        assert len(response.data) == 3
-        self.assertEqual(self.user1.intra_id, response.data[0]["player1"]["intra_id"])
-        self.assertEqual(self.user3.intra_id, response.data[1]["player1"]["intra_id"])
-        self.assertEqual(self.user3.intra_id, response.data[2]["player1"]["intra_id"])
+        assert len(response.data["results"]) == 3
+        self.assertEqual(
+            self.user1.intra_id, response.data["results"][0]["player1"]["intra_id"]
+        )
+        self.assertEqual(
+            self.user3.intra_id, response.data["results"][1]["player1"]["intra_id"]
+        )
+        self.assertEqual(
+            self.user3.intra_id, response.data["results"][2]["player1"]["intra_id"]
+        )
 
         response = self.client.get(
             reverse(
                 "tournament_game_user_logs", kwargs={"intra_id": self.user1.intra_id}
             )
         )
-        assert len(response.data) == 2
-        self.assertEqual(1, response.data[0]["round"])
-        self.assertEqual(3, response.data[1]["round"])
+        assert len(response.data["results"]) == 2
+        self.assertEqual(1, response.data["results"][0]["round"])
+        self.assertEqual(3, response.data["results"][1]["round"])
 
     def test_score_minus(self):
         """
@@ -484,6 +506,255 @@ class TournamentGameLogsListMeViewSetTest(APITestCase):
         """
         self.client.force_authenticate(user=self.user1)
         response = self.client.get(self.list_url)
-        self.assertEqual(len(response.data), 2)
-        self.assertEqual(response.data[0]["player1"]["intra_id"], self.user1.intra_id)
-        self.assertEqual(response.data[1]["player1"]["intra_id"], self.user1.intra_id)
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertEqual(
+            response.data["results"][0]["player1"]["intra_id"], self.user1.intra_id
+        )
+        self.assertEqual(
+            response.data["results"][1]["player1"]["intra_id"], self.user1.intra_id
+        )
+
+
+class GameLogsPaginationTest(APITestCase):
+    def setUp(self):
+        self.user1 = Users.objects.create_user(intra_id="user1")
+        self.user2 = Users.objects.create_user(intra_id="user2")
+        self.list_url = reverse("general_game_me_logs")
+        start_time = make_aware(datetime(2021, 1, 1, 0, 0, 0))
+        # 시작 시간이 같은 로그가 페이지 경계에 걸치도록 두 개씩 생성
+        for i in range(5):
+            for _ in range(2):
+                GeneralGameLogs.objects.create(
+                    start_time=start_time + timedelta(minutes=i),
+                    end_time=start_time + timedelta(hours=1),
+                    player1=self.user1,
+                    player2=self.user2,
+                    player1_score=5,
+                    player2_score=i,
+                )
+
+    def get_all_pages(self, url):
+        game_ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            game_ids.extend(log["game_id"] for log in response.data["results"])
+            url = response.data["next"]
+        return game_ids
+
+    def test_cursor_pages_in_keyset_order(self):
+        """
+        cursor로 모든 페이지를 넘기면 (-start_time, pk) 순서로 빠짐없이 가져오는지 테스트
+        """
+        self.client.force_authenticate(user=self.user1)
+        response = self.client.get(self.list_url, {"page_size": 3})
+        self.assertEqual(len(response.data["results"]), 3)
+        self.assertIsNotNone(response.data["next"])
+
+        expected = [
+            str(game_id)
+            for game_id in GeneralGameLogs.objects.order_by(
+                "-start_time", "pk"
+            ).values_list("game_id", flat=True)
+        ]
+        self.assertEqual(self.get_all_pages(f"{self.list_url}?page_size=3"), expected)
+
+    def test_new_log_does_not_shift_next_page(self):
+        """
+        페이지를 넘기는 사이에 새 로그가 추가되어도 다음 페이지가 밀리지 않는지 테스트
+        """
+        self.client.force_authenticate(user=self.user1)
+        response = self.client.get(self.list_url, {"page_size": 4})
+        first_page = [log["game_id"] for log in response.data["results"]]
+        GeneralGameLogs.objects.create(
+            start_time=make_aware(datetime(2022, 1, 1, 0, 0, 0)),
+            end_time=make_aware(datetime(2022, 1, 1, 1, 0, 0)),
+            player1=self.user1,
+            player2=self.user2,
+            player1_score=5,
+            player2_score=0,
+        )
+        rest = self.get_all_pages(response.data["next"])
+        self.assertEqual(len(first_page) + len(rest), 10)
+        self.assertFalse(set(first_page) & set(rest))
+
+    def test_player_sides_merged_in_keyset_order(self):
+        """
+        player1 쪽과 player2 쪽 로그를 따로 읽어도 합친 순서대로 빠짐없이 나뉘는지 테스트
+        """
+        start_time = make_aware(datetime(2021, 1, 1, 0, 0, 30))
+        for i in range(5):
+            GeneralGameLogs.objects.create(
+                start_time=start_time + timedelta(minutes=i),
+                end_time=start_time + timedelta(hours=1),
+                player1=self.user2,
+                player2=self.user1,
+                player1_score=5,
+                player2_score=i,
+            )
+        expected = [
+            str(game_id)
+            for game_id in GeneralGameLogs.objects.order_by(
+                "-start_time", "pk"
+            ).values_list("game_id", flat=True)
+        ]
+        self.client.force_authenticate(user=self.user1)
+        for page_size in (1, 3, 4):
+            self.assertEqual(
+                self.get_all_pages(f"{self.list_url}?page_size={page_size}"),
+                expected,
+            )
+
+    def test_invalid_cursor(self):
+        """
+        잘못된 cursor는 404를 반환하는지 테스트
+        """
+        self.client.force_authenticate(user=self.user1)
+        response = self.client.get(self.list_url, {"cursor": "invalid"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_tournament_logs_are_paginated(self):
+        """
+        토너먼트 로그도 같은 cursor 페이지로 나뉘는지 테스트
+        """
+        start_time = make_aware(datetime(2021, 1, 1, 0, 0, 0))
+        for i in range(3):
+            TournamentGameLogs.objects.create(
+                start_time=start_time,
+                end_time=start_time + timedelta(hours=1),
+                player1=self.user1,
+                player2=self.user2,
+                player1_score=5,
+                player2_score=3,
+                tournament_name="test",
+                round=i + 1,
+                is_final=i == 2,
+            )
+        self.client.force_authenticate(user=self.user1)
+        url = reverse("tournament_name_logs", kwargs={"name": "test"})
+        response = self.client.get(url, {"page_size": 2})
+        self.assertEqual([log["round"] for log in response.data["results"]], [1, 2])
+        response = self.client.get(response.data["next"])
+        self.assertEqual([log["round"] for log in response.data["results"]], [3])
+        self.assertIsNone(response.data["next"])
+
+
+class GameLogsQueryCountTest(APITestCase):
+    def setUp(self):
+        self.user1 = Users.objects.create_user(intra_id="user1")
+        self.start_time = make_aware(datetime(2021, 1, 1, 0, 0, 0))
+        self.opponent_cnt = 0
+
+    def create_logs(self, cnt):
+        for i in range(cnt):
+            self.opponent_cnt += 1
+            opponent = Users.objects.create_user(
+                intra_id=f"opponent{self.opponent_cnt}"
+            )
+            GeneralGameLogs.objects.create(
+                start_time=self.start_time + timedelta(minutes=self.opponent_cnt),
+                end_time=self.start_time + timedelta(hours=1),
+                player1=self.user1,
+                player2=opponent,
+                player1_score=5,
+                player2_score=3,
+            )
+            TournamentGameLogs.objects.create(
+                start_time=self.start_time + timedelta(minutes=self.opponent_cnt),
+                end_time=self.start_time + timedelta(hours=1),
+                player1=opponent,
+                player2=self.user1,
+                player1_score=5,
+                player2_score=3,
+                tournament_name="test",
+                round=self.opponent_cnt,
+                is_final=False,
+            )
+
+    def test_query_count_does_not_grow_with_rows(self):
+        """
+        로그 수와 상관없이 플레이어를 포함한 로그 조회의 쿼리 수가 일정한지 테스트
+        """
+        self.client.force_authenticate(user=self.user1)
+        urls = [
+            reverse("general_game_all_logs"),
+            reverse("general_game_me_logs"),
+            reverse("general_game_user_logs", kwargs={"intra_id": "user1"}),
+            reverse("tournament_game_all_logs"),
+            reverse("tournament_game_me_logs"),
+            reverse("tournament_game_user_logs", kwargs={"intra_id": "user1"}),
+            reverse("tournament_name_logs", kwargs={"name": "test"}),
+        ]
+        for url in urls:
+            self.create_logs(1)
+            with CaptureQueriesContext(connection) as context:
+                self.client.get(url)
+            query_cnt = len(context.captured_queries)
+
+            self.create_logs(5)
+            with self.assertNumQueries(query_cnt):
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertGreater(len(response.data["results"]), 5)
+            self.assertIn("intra_id", response.data["results"][0]["player2"])
+
+
+class AggregateCacheTest(TestCase):
+    def test_local_cache_evicts_least_recently_used(self):
+        """
+        가장 오래 읽지 않은 키부터 빠지고 ttl이 지나면 만료되는지 테스트
+        """
+        cache = LocalTTLCache(max_size=2, ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.set("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual((cache.get("a"), cache.get("c")), (1, 3))
+
+        with patch("games.cache.time.monotonic", return_value=time.monotonic() + 11):
+            self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 1)
+
+    def test_load_once_until_invalidated(self):
+        """
+        캐시가 지워지기 전까지는 집계를 한 번만 읽는지 테스트
+        """
+        cache = AggregateCache()
+        load = MagicMock(return_value={"GR": (1, 2)})
+        self.assertEqual(cache.get_or_load("house", load), {"GR": [1, 2]})
+        self.assertEqual(cache.get_or_load("house", load), {"GR": [1, 2]})
+        self.assertEqual(load.call_count, 1)
+
+        cache.invalidate("house")
+        cache.get_or_load("house", load)
+        self.assertEqual(load.call_count, 2)
+
+    def test_invalidate_during_load_is_not_overwritten(self):
+        """
+        load 도중에 invalidate되면 오래된 결과를 Redis와 프로세스 캐시에 저장하지 않는지 테스트
+        """
+        cache = AggregateCache(
+            "redis://127.0.0.1:6379/0", prefix=f"test:aggregate:{time.time()}:"
+        )
+
+        def stale_load():
+            # 게임 결과가 load 도중에 커밋된 상황
+            cache.invalidate("house")
+            return {"GR": [1, 0]}
+
+        self.assertEqual(cache.get_or_load("house", stale_load), {"GR": [1, 0]})
+        load = MagicMock(return_value={"GR": [2, 0]})
+        self.assertEqual(cache.get_or_load("house", load), {"GR": [2, 0]})
+        self.assertEqual(load.call_count, 1)
+
+    def test_game_result_invalidates_house_stats(self):
+        """
+        기숙사 통계가 바뀐 트랜잭션이 커밋되면 캐시가 지워지는지 테스트
+        """
+        AGGREGATE_CACHE.clear()
+        self.assertEqual(get_house_stats(), {})
+        with self.captureOnCommitCallbacks(execute=True):
+            add_house_stats({"GR": [1, 0]})
+        with self.assertNumQueries(1):
+            self.assertEqual(get_house_stats(), {"GR": [1, 0]})
@@ -1,12 +1,12 @@
 import uuid
 from typing import Union, Optional
 from django.core.exceptions import ObjectDoesNotExist
-from django.db.models import Q
 from rest_framework import viewsets, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.exceptions import ValidationError
 from accounts.models import Users
+from .pagination import GameLogKeysetPagination
 from .serializers import (
     GeneralGameLogsListSerializer,
     TournamentGameLogsListSerializer,
@@ -83,15 +83,49 @@ def create_with_intra_id_convert_to_user_id(self, request) -> Response:
     return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
 
 
+def get_player_querysets(queryset, user: Users) -> list:
+    """
+    유저가 player1인 로그와 player2인 로그를 따로 찾는 queryset 목록,
+    쪽마다 (player, -start_time, pk) 인덱스를 따라 순서대로 읽을 수 있음
+    Args:
+        queryset: 게임 로그 queryset
+        user: 로그를 찾을 유저
+
+    Returns:
+        list: player1 쪽, player2 쪽 queryset
+    """
+    return [
+        queryset.filter(player1=user.user_id),
+        queryset.filter(player2=user.user_id),
+    ]
+
+
+def paginate_game_logs(self, *querysets) -> Response:
+    """
+    게임 로그를 (-start_time, pk) 순서의 cursor 페이지로 나눠서 반환
+    Args:
+        self: viewset 객체
+        querysets: 필터가 적용된 게임 로그 queryset, 여러 개면 합쳐서 나눔
+
+    Returns:
+        Response: 다음 페이지 링크와 현재 페이지의 Game Log 정보
+    """
+    page = self.paginator.paginate_querysets(list(querysets), self.request, view=self)
+    serializer = self.serializer_class(page, many=True)
+    return self.get_paginated_response(serializer.data)
+
+
 class GeneralGameLogsListViewSet(viewsets.ModelViewSet):
     """
     일반 게임 로그 리스트를 위한 ViewSet
     """
 
     permission_classes = [IsAuthenticated]
-    queryset = GeneralGameLogs.objects.all()
+    # 로그마다 플레이어를 따로 조회하지 않도록 한 번에 join
+    queryset = GeneralGameLogs.objects.select_related("player1", "player2")
     serializer_class: GeneralGameLogsListSerializer = GeneralGameLogsListSerializer
     http_method_names = ["get"]
+    pagination_class = GameLogKeysetPagination
 
     def list(self, request, *args, **kwargs) -> Response:
         if "intra_id" not in kwargs:
@@ -103,11 +137,7 @@ class GeneralGameLogsListViewSet(viewsets.ModelViewSet):
                 {"error": "유저가 존재하지 않습니다."},
                 status=status.HTTP_404_NOT_FOUND,
             )
-        queryset = self.queryset.filter(
-            Q(player1=user.user_id) | Q(player2=user.user_id)
-        )
-        serializer = self.serializer_class(queryset, many=True)
-        return Response(serializer.data)
+        return paginate_game_logs(self, *get_player_querysets(self.queryset, user))
 
 
 class GeneralGameLogsListMeViewSet(viewsets.ModelViewSet):
@@ -116,17 +146,15 @@ class GeneralGameLogsListMeViewSet(viewsets.ModelViewSet):
     """
 
     permission_classes = [IsAuthenticated]
-    queryset = GeneralGameLogs.objects.all()
+    # 로그마다 플레이어를 따로 조회하지 않도록 한 번에 join
+    queryset = GeneralGameLogs.objects.select_related("player1", "player2")
     serializer_class: GeneralGameLogsListSerializer = GeneralGameLogsListSerializer
     http_method_names = ["get"]
+    pagination_class = GameLogKeysetPagination
 
     def list(self, request, *args, **kwargs) -> Response:
         user = request.user
-        queryset = self.queryset.filter(
-            Q(player1=user.user_id) | Q(player2=user.user_id)
-        )
-        serializer = self.serializer_class(queryset, many=True)
-        return Response(serializer.data)
+        return paginate_game_logs(self, *get_player_querysets(self.queryset, user))
 
 
 class TournamentGameLogsListViewSet(viewsets.ModelViewSet):
@@ -135,11 +163,13 @@ class TournamentGameLogsListViewSet(viewsets.ModelViewSet):
     """
 
     permission_classes = [IsAuthenticated]
-    queryset = TournamentGameLogs.objects.all()
+    # 로그마다 플레이어를 따로 조회하지 않도록 한 번에 join
+    queryset = TournamentGameLogs.objects.select_related("player1", "player2")
     serializer_class: TournamentGameLogsListSerializer = (
         TournamentGameLogsListSerializer
     )
     http_method_names = ["get"]
+    pagination_class = GameLogKeysetPagination
 
     def list(self, request, *args, **kwargs) -> Response:
         if "intra_id" not in kwargs and "name" not in kwargs:
@@ -152,15 +182,12 @@ class TournamentGameLogsListViewSet(viewsets.ModelViewSet):
                     {"error": "유저가 존재하지 않습니다."},
                     status=status.HTTP_404_NOT_FOUND,
                 )
-            queryset = self.queryset.filter(
-                Q(player1=user.user_id) | Q(player2=user.user_id)
-            )
+            querysets = get_player_querysets(self.queryset, user)
         elif "name" in kwargs and "intra_id" not in kwargs:
-            queryset = self.queryset.filter(tournament_name=kwargs["name"])
+            querysets = [self.queryset.filter(tournament_name=kwargs["name"])]
         else:
             raise ValidationError({"detail": "잘못된 요청입니다."})
-        serializer = self.serializer_class(queryset, many=True)
-        return Response(serializer.data)
+        return paginate_game_logs(self, *querysets)
 
 
 class TournamentGameLogsListMeViewSet(viewsets.ModelViewSet):
@@ -169,16 +196,14 @@ class TournamentGameLogsListMeViewSet(viewsets.ModelViewSet):
     """
 
     permission_classes = [IsAuthenticated]
-    queryset = TournamentGameLogs.objects.all()
+    # 로그마다 플레이어를 따로 조회하지 않도록 한 번에 join
+    queryset = TournamentGameLogs.objects.select_related("player1", "player2")
     serializer_class: TournamentGameLogsListSerializer = (
         TournamentGameLogsListSerializer
     )
     http_method_names = ["get"]
+    pagination_class = GameLogKeysetPagination
 
     def list(self, request, *args, **kwargs) -> Response:
         user = request.user
-        queryset = self.queryset.filter(
-            Q(player1=user.user_id) | Q(player2=user.user_id)
-        )
-        serializer = self.serializer_class(queryset, many=True)
-        return Response(serializer.data)
+        return paginate_game_logs(self, *get_player_querysets(self.queryset, user))
@@ -1,14 +1,35 @@
 import asyncio
 import hashlib
 import json
+import logging
+import signal
 import uuid
-from typing import Deque, Optional
-from django.db.models import F
+from typing import Iterable, Optional
+from django.conf import settings
 from channels.generic.websocket import AsyncWebsocketConsumer
+from channels.layers import get_channel_layer
 from channels.db import database_sync_to_async
 from accounts.models import Users, UserStatusEnum
-from collections import deque
 from .module.GeneralGame import GeneralGame
+from .module.GameScheduler import GameScheduler, GameTick
+from .module.BatchPhysics import BatchPhysics
+from .module.GameFrame import DeltaSnapshot
+from .module.GroupBroadcaster import GroupBroadcaster, Send
+from .module.HybridChannelLayer import HybridChannelLayer
+from .module.MatchMaker import (
+    MatchLoop,
+    MatchMaker,
+    MatchTicket,
+    create_match_maker,
+)
+from .module.GameResultWriter import GameResult, GameResultWriter, OnSaved
+from .module.GameRegistry import GameRecord, GameRegistry, create_game_registry
+from .module.WorkerRing import HashRing, WorkerHeartbeat
+from .module.TournamentJournal import (
+    TournamentJournal,
+    create_tournament_journal,
+    get_unfinished_records,
+)
 from .module.GameSetValue import (
     MessageType,
     MAX_SCORE,
@@ -21,9 +42,15 @@ from .module.GameSetValue import (
     GameStatus,
     RoundNumber,
     MAX_TOURNAMENT_NAME_LENGTH,
+    GAME_TICK_RATE,
+    BINARY_FRAME_SUBPROTOCOL,
+    DELTA_FRAME_SUBPROTOCOL,
+    TRAJECTORY_FRAME_SUBPROTOCOL,
+    TRAJECTORY_SYNC_TICK_CNT,
+    GAME_LEASE_RENEW_SECONDS,
+    FrameFormat,
+    JournalEvent,
 )
-from games.serializers import GeneralGameLogsSerializer, TournamentGameLogsSerializer
-from rest_framework.exceptions import ValidationError
 from .module.Player import Player
 from .module.Round import Round
 from .module.Tournament import Tournament
@@ -31,6 +58,142 @@ from games.models import TournamentGameLogs
 
 ACTIVE_GENERAL_GAMES: dict[str, GeneralGame] = {}
 ACTIVE_TOURNAMENTS: dict[str, Tournament] = {}
+# 레지스트리에 토너먼트를 기록할 때 게임 id와 겹치지 않도록 붙이는 접두사
+TOURNAMENT_RECORD_PREFIX: str = "tournament:"
+STEP_SCALE: float = GAME_TICK_RATE / settings.GAME_SIMULATION_RATE
+# batch 엔진이면 모든 게임의 물리 스텝을 틱마다 한 번의 배열 연산으로 진행
+BATCH_PHYSICS: Optional[BatchPhysics] = (
+    BatchPhysics(step_scale=STEP_SCALE)
+    if settings.GAME_PHYSICS_ENGINE == "batch"
+    else None
+)
+GAME_SCHEDULER: GameScheduler = GameScheduler(
+    tick_rate=settings.GAME_BROADCAST_RATE,
+    step_rate=settings.GAME_SIMULATION_RATE,
+    before_tick=BATCH_PHYSICS.step if BATCH_PHYSICS is not None else None,
+)
+# 게임 진행 프레임은 형식별로 한 번 만들어 같은 프로세스의 플레이어에게 직접 전송
+GROUP_BROADCASTER: GroupBroadcaster = GroupBroadcaster()
+# 다른 레플리카에서도 게임의 소유 프로세스를 찾을 수 있도록 게임 정보를 기록
+GAME_REGISTRY: GameRegistry = create_game_registry(
+    settings.GAME_REGISTRY_BACKEND, settings.REDIS_URL
+)
+# 옮겨지는 게임은 consistent hash ring에서 게임 id를 담당하는 워커가,
+# 새 게임은 하트비트로 알린 게임 수가 가장 적은 워커가 소유
+# 토너먼트는 링에서 토너먼트 이름을 담당하는 워커가 소유하고 하트비트마다 기록을 연장
+WORKER_HEARTBEAT: WorkerHeartbeat = WorkerHeartbeat(
+    GAME_REGISTRY,
+    HashRing(),
+    get_load=lambda: len(ACTIVE_GENERAL_GAMES),
+    on_beat=lambda: renew_tournament_records(),
+)
+# 레지스트리를 공유하면 매칭 대기열도 공유해서 모든 레플리카의 대기자를 함께 매칭
+MATCH_MAKER: MatchMaker = create_match_maker(
+    settings.GAME_REGISTRY_BACKEND, settings.REDIS_URL
+)
+# 끝난 게임의 결과는 모아서 한 트랜잭션으로 저장
+GAME_RESULT_WRITER: GameResultWriter = GameResultWriter()
+LEASE_RENEW_TICK_CNT: int = settings.GAME_BROADCAST_RATE * GAME_LEASE_RENEW_SECONDS
+# 프로세스가 죽어도 토너먼트를 복구할 수 있도록 상태 변화를 기록
+TOURNAMENT_JOURNAL: TournamentJournal = create_tournament_journal(
+    settings.TOURNAMENT_JOURNAL_BACKEND,
+    settings.TOURNAMENT_JOURNAL_PATH,
+    settings.REDIS_URL,
+    settings.TOURNAMENT_JOURNAL_KEY,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def start_game_loop(game_key: str, game: GeneralGame, tick: GameTick) -> None:
+    """
+    게임을 물리 엔진과 GAME_SCHEDULER에 등록하는 함수
+    Args:
+        game_key: 스케줄러에서 게임을 구분하는 키
+        game: 진행할 게임
+        tick: 매 틱마다 호출할 코루틴 함수
+
+    Returns:
+        None
+    """
+    if BATCH_PHYSICS is not None:
+        game.attach_physics(BATCH_PHYSICS)
+    GAME_SCHEDULER.register(game_key, tick, on_finish=game.detach_physics)
+
+
+async def discard_closed_channel(channel_layer, channel_name: str) -> None:
+    """
+    연결이 끊긴 채널에는 HybridChannelLayer가 group_send 메시지를 넣지 않도록
+    채널이 들어간 모든 그룹에서 빼는 함수
+    Args:
+        channel_layer: 컨슈머의 채널 레이어
+        channel_name: 연결이 끊긴 채널 이름
+
+    Returns:
+        None
+    """
+    if isinstance(channel_layer, HybridChannelLayer):
+        await channel_layer.discard_channel(channel_name)
+
+
+FRAME_SUBPROTOCOLS: dict[str, FrameFormat] = {
+    BINARY_FRAME_SUBPROTOCOL: FrameFormat.BINARY,
+    DELTA_FRAME_SUBPROTOCOL: FrameFormat.DELTA,
+    TRAJECTORY_FRAME_SUBPROTOCOL: FrameFormat.TRAJECTORY,
+}
+
+
+def negotiate_frame_format(scope: dict) -> tuple[FrameFormat, Optional[str]]:
+    """
+    클라이언트가 요청한 서브프로토콜 중 처음으로 지원하는 프레임 형식을 고르는 함수
+    Args:
+        scope: 웹소켓 연결 scope
+
+    Returns:
+        tuple: 프레임 형식과 accept할 서브프로토콜, 지원하는 것이 없으면 JSON과 None
+    """
+    for subprotocol in scope.get("subprotocols", []):
+        if subprotocol in FRAME_SUBPROTOCOLS:
+            return FRAME_SUBPROTOCOLS[subprotocol], subprotocol
+    return FrameFormat.JSON, None
+
+
+def build_frame_events(game: GeneralGame, frame_formats: set) -> dict:
+    """
+    게임 진행 프레임을 형식별로 한 번씩만 만드는 함수,
+    같은 형식의 플레이어들은 만들어진 이벤트를 그대로 받음
+    Args:
+        game: 프레임을 만들 게임
+        frame_formats: 그룹 멤버들이 사용하는 프레임 형식
+
+    Returns:
+        dict: 형식별 이벤트, trajectory는 보낼 것이 없으면 빠짐
+    """
+    events = {}
+    if FrameFormat.JSON in frame_formats:
+        events[FrameFormat.JSON] = {
+            "type": "websocket.send",
+            "text": game.build_game_json(),
+        }
+    if FrameFormat.BINARY in frame_formats:
+        events[FrameFormat.BINARY] = {
+            "type": "websocket.send",
+            "bytes": game.build_game_frame(),
+        }
+    if FrameFormat.DELTA in frame_formats:
+        # delta는 받는 쪽마다 ack가 달라서 값만 공유하고 각자 만듦
+        events[FrameFormat.DELTA] = {
+            "tick_no": game.get_tick_no(),
+            "values": game.get_frame_values(),
+        }
+    if FrameFormat.TRAJECTORY in frame_formats:
+        is_changed = game.check_motion_changed()
+        if is_changed or game.get_tick_no() % TRAJECTORY_SYNC_TICK_CNT == 0:
+            events[FrameFormat.TRAJECTORY] = {
+                "type": "websocket.send",
+                "text": game.build_trajectory_json(is_sync=not is_changed),
+            }
+    return events
 
 
 class LoginConsumer(AsyncWebsocketConsumer):
@@ -64,60 +227,93 @@ class GeneralGameWaitConsumer(AsyncWebsocketConsumer):
     일반 게임 매칭 대기 컨슈머
     """
 
-    nickname_list: list[str] = list()
-    wait_list: Deque["GeneralGameWaitConsumer"] = deque()
-
     def __init__(self, *args, **kwargs):
         super().__init__(args, kwargs)
         self.user: Optional[Users] = None
+        # 매칭 대기열에 있는 동안의 대기자 정보
+        self.ticket: Optional[MatchTicket] = None
 
     async def connect(self) -> None:
         self.user = self.scope["user"]
 
-        # 유저가 인증되어 있고 대기 리스트에 추가되었을 때
-        if self.user.is_authenticated and await self.add_wait_list():
-            await self.accept()
-            if len(GeneralGameWaitConsumer.wait_list) > 1:
-                await GeneralGameWaitConsumer.game_match()
-        # 인증되지 않았거나 이미 대기 리스트에 있는 경우
-        else:
+        # 인증되지 않은 경우
+        if not self.user.is_authenticated:
             await self.close()
+            return
+        await join_worker_ring()
+        # 다른 워커에서 매칭되어도 결과를 받을 수 있도록 대기열에 넣기 전에 accept
+        await self.accept()
+        ticket = MatchTicket(
+            self.user.intra_id,
+            self.user.nickname,
+            self.channel_name,
+            GAME_REGISTRY.get_owner(),
+            self.user.rating,
+            user_id=str(self.user.user_id),
+        )
+        # 이미 대기열에 있는 경우
+        if not await MATCH_MAKER.push(ticket):
+            await self.close()
+            return
+        self.ticket = ticket
+        MATCH_LOOP.wake()
 
     async def disconnect(self, close_code) -> None:
-        if self.user.is_authenticated:
-            if (
-                self in GeneralGameWaitConsumer.wait_list
-                and self.user.nickname in GeneralGameWaitConsumer.nickname_list
-            ):
-                GeneralGameWaitConsumer.nickname_list.remove(self.user.nickname)
-                GeneralGameWaitConsumer.wait_list.remove(self)
-
-    @classmethod
-    async def game_match(cls) -> None:
-        """
-        대기 리스트에 있는 유저들을 매칭시키는 함수
-        """
-        game_id = str(uuid.uuid4())
-        player1 = GeneralGameWaitConsumer.wait_list.popleft()
-        player2 = GeneralGameWaitConsumer.wait_list.popleft()
-        await player1.send(json.dumps({"game_id": game_id}))
-        await player2.send(json.dumps({"game_id": game_id}))
-        GeneralGameWaitConsumer.nickname_list.remove(player1.user.nickname)
-        GeneralGameWaitConsumer.nickname_list.remove(player2.user.nickname)
-        ACTIVE_GENERAL_GAMES[game_id] = GeneralGame(
-            Player(1, player1.user.intra_id, player1.user.nickname),
-            Player(2, player2.user.intra_id, player2.user.nickname),
-        )
+        if self.ticket is not None:
+            await MATCH_MAKER.cancel(self.ticket)
 
-    async def add_wait_list(self) -> bool:
+    async def match_found(self, event) -> None:
         """
-        대기 리스트에 유저를 추가하는 함수
+        매칭된 게임의 id를 클라이언트에게 보내는 함수
         """
-        if self.user.nickname in GeneralGameWaitConsumer.nickname_list:
-            return False
-        GeneralGameWaitConsumer.wait_list.append(self)
-        GeneralGameWaitConsumer.nickname_list.append(self.user.nickname)
-        return True
+        self.ticket = None
+        await self.send(json.dumps({"game_id": event["game_id"]}))
+
+
+async def match_general_game(ticket1: MatchTicket, ticket2: MatchTicket) -> None:
+    """
+    두 대기자의 게임을 게임 수가 가장 적은 워커에 만들고 두 대기자에게 알리는 함수
+    Args:
+        ticket1: 먼저 들어온 대기자
+        ticket2: ticket1과 레이팅이 가장 가까운 상대
+
+    Returns:
+        None
+    """
+    game_id = str(uuid.uuid4())
+    players = [
+        [ticket1.intra_id, ticket1.nickname, ticket1.user_id],
+        [ticket2.intra_id, ticket2.nickname, ticket2.user_id],
+    ]
+    channel_layer = get_channel_layer()
+    owner, owner_channel = WORKER_HEARTBEAT.get_least_loaded()
+    if owner is None or owner == GAME_REGISTRY.get_owner():
+        await create_general_game(game_id, players)
+    else:
+        # 플레이어가 어느 워커로 접속해도 소유 워커를 찾을 수 있도록 먼저 기록하고,
+        # 플레이어에게 알리기 전에 보내므로 소유 워커는 접속보다 생성을 먼저 받음
+        await GAME_REGISTRY.register(
+            game_id,
+            GameRecord(
+                owner=owner,
+                status=GameStatus.WAIT.value,
+                player1=ticket1.intra_id,
+                player2=ticket2.intra_id,
+                owner_channel=owner_channel,
+            ),
+        )
+        await channel_layer.send(
+            owner_channel,
+            {"type": "game.create", "game_id": game_id, "players": players},
+        )
+    for ticket in (ticket1, ticket2):
+        await channel_layer.send(
+            ticket.channel_name, {"type": "match.found", "game_id": game_id}
+        )
+
+
+# 대기자가 있는 동안 주기적으로 대기열 전체를 매칭
+MATCH_LOOP: MatchLoop = MatchLoop(MATCH_MAKER, match_general_game)
 
 
 class GeneralGameConsumer(AsyncWebsocketConsumer):
@@ -131,17 +327,25 @@ class GeneralGameConsumer(AsyncWebsocketConsumer):
         self.db_complete: bool = False
         self.game_id: Optional[str] = None
         self.game_group_name: Optional[str] = None
-        self.game_loop_task: Optional[asyncio.Task] = None
+        self.frame_format: FrameFormat = FrameFormat.JSON
+        self.delta_snapshot: Optional[DeltaSnapshot] = None
+        # 다른 프로세스가 소유한 게임이면 그 프로세스의 GAME_OWNER_RELAY 채널
+        self.owner_channel: Optional[str] = None
 
     async def connect(self) -> None:
         self.user = self.scope["user"]
         if self.user.is_authenticated:
             self.game_id = str(self.scope["url_route"]["kwargs"]["game_id"])
 
-            # 접속하려는 게임이 없는 게임이거나 이미 시작된 게임이거나 현재 플레이어가 존재하지 않는 게임일 경우
+            # 이 프로세스에 없는 게임이면 소유 프로세스로 연결을 전달
+            if self.game_id not in ACTIVE_GENERAL_GAMES.keys():
+                await join_worker_ring()
+                await self.connect_remote_game()
+                return
+
+            # 이미 시작된 게임이거나 현재 플레이어가 존재하지 않는 게임일 경우
             if (
-                self.game_id not in ACTIVE_GENERAL_GAMES.keys()
-                or ACTIVE_GENERAL_GAMES[self.game_id].get_status() != GameStatus.WAIT
+                ACTIVE_GENERAL_GAMES[self.game_id].get_status() != GameStatus.WAIT
                 or ACTIVE_GENERAL_GAMES[self.game_id].get_player(self.user.intra_id)
                 is None
             ):
@@ -149,29 +353,77 @@ class GeneralGameConsumer(AsyncWebsocketConsumer):
                 return
             game = ACTIVE_GENERAL_GAMES[self.game_id]
             player, number = game.get_player(self.user.intra_id)
+            self.frame_format, subprotocol = negotiate_frame_format(self.scope)
+            if self.frame_format == FrameFormat.DELTA:
+                self.delta_snapshot = DeltaSnapshot()
             self.game_group_name = f"game_{self.game_id}"
             await self.channel_layer.group_add(self.game_group_name, self.channel_name)
-            await self.accept()
+            await self.accept(subprotocol)
+            GROUP_BROADCASTER.add(
+                self.game_group_name,
+                self.channel_name,
+                self.get_frame_send(),
+                key=self.frame_format,
+            )
             await self.send(GeneralGame.build_ready_json(number, player.get_nickname()))
         else:
             await self.close()
 
+    async def connect_remote_game(self) -> None:
+        """
+        다른 프로세스가 소유한 게임에 연결하는 함수,
+        이후 입력은 소유 프로세스로 전달하고 받은 메시지는 그대로 소켓으로 보냄
+        Returns:
+            None
+        """
+        record = await GAME_REGISTRY.get(self.game_id)
+        if record is not None:
+            owner, owner_channel = record.owner, record.owner_channel
+            is_joinable = record.status == GameStatus.WAIT.value and record.has_player(
+                self.user.intra_id
+            )
+        else:
+            # 소유 워커가 아직 게임을 기록하지 않았으면 링으로 찾고 확인은 소유 워커에 맡김
+            owner, owner_channel = WORKER_HEARTBEAT.get_owner(self.game_id)
+            is_joinable = True
+        if not owner_channel or owner == GAME_REGISTRY.get_owner() or not is_joinable:
+            await self.close()
+            return
+        self.owner_channel = owner_channel
+        _, subprotocol = negotiate_frame_format(self.scope)
+        await self.accept(subprotocol)
+        await self.channel_layer.send(
+            self.owner_channel,
+            {
+                "type": "player.attach",
+                "game_id": self.game_id,
+                "channel_name": self.channel_name,
+                "intra_id": self.user.intra_id,
+                "subprotocols": self.scope.get("subprotocols", []),
+            },
+        )
+
     async def disconnect(self, close_code) -> None:
+        await discard_closed_channel(self.channel_layer, self.channel_name)
+        if self.owner_channel is not None:
+            await self.channel_layer.send(
+                self.owner_channel,
+                {"type": "player.detach", "channel_name": self.channel_name},
+            )
+            return
         if self.user.is_authenticated:
             game = ACTIVE_GENERAL_GAMES.get(self.game_id)
             if game:
                 ACTIVE_GENERAL_GAMES.pop(self.game_id)
+                await GAME_REGISTRY.remove(self.game_id)
                 if game.get_status() != GameStatus.END:  # 게임 중간에 나갔을 경우
                     game.set_status(GameStatus.ERROR)
                     data = game.build_error_json(self.user.nickname)
                     await self.channel_layer.group_send(
                         self.game_group_name, {"type": "game.message", "message": data}
                     )
-                try:  # cancel() 동작이 끝날 때까지 대기
-                    self.game_loop_task.cancel()
-                    await self.game_loop_task
-                except:
-                    pass  # task가 이미 취소된 경우
+                GAME_SCHEDULER.unregister(self.game_id)
+            GROUP_BROADCASTER.discard(self.game_group_name, self.channel_name)
             await self.channel_layer.group_discard(
                 self.game_group_name, self.channel_name
             )
@@ -182,10 +434,57 @@ class GeneralGameConsumer(AsyncWebsocketConsumer):
         # Send message to WebSocket
         await self.send(text_data=message)
 
+    def get_frame_send(self) -> Send:
+        """
+        GROUP_BROADCASTER가 게임 진행 프레임을 전달할 함수를 반환하는 함수,
+        delta 형식이 아니면 미리 만든 websocket.send 이벤트를 그대로 보냄
+        Returns:
+            Send: 프레임 이벤트를 받을 코루틴 함수
+        """
+        if self.frame_format == FrameFormat.DELTA:
+            return self.send_delta_frame
+        return self.base_send
+
+    async def send_delta_frame(self, event) -> None:
+        data = self.delta_snapshot.build(event["tick_no"], event["values"])
+        await self.send(text_data=json.dumps(data))
+
+    async def game_migrate(self, event) -> None:
+        """
+        게임이 다른 워커로 옮겨졌음을 알리고 소켓을 닫는 함수,
+        클라이언트는 migrate 메시지를 받으면 다시 접속해서 새 워커의 게임에 들어감
+        """
+        await self.send(text_data=event["message"])
+        await self.close()
+
+    async def game_relay(self, event) -> None:
+        """
+        소유 프로세스의 RemoteGeneralGamePlayer가 보낸 메시지를 소켓으로 보내는 함수
+        """
+        await self.base_send(event["event"])
+
     async def receive(self, text_data: json = None, bytes_data=None) -> None:
+        # 다른 프로세스가 소유한 게임이면 입력을 그대로 전달
+        if self.owner_channel is not None:
+            await self.channel_layer.send(
+                self.owner_channel,
+                {
+                    "type": "player.input",
+                    "channel_name": self.channel_name,
+                    "text_data": text_data,
+                },
+            )
+            return
+
         data = json.loads(text_data)
         game = ACTIVE_GENERAL_GAMES.get(self.game_id)
 
+        # delta 프레임을 받은 클라이언트의 확인
+        if data["message_type"] == MessageType.ACK.value:
+            if self.delta_snapshot is not None:
+                self.delta_snapshot.ack(int(data["tick"]))
+            return
+
         # 게임이 이미 사라진 경우
         if not game:
             return
@@ -205,10 +504,16 @@ class GeneralGameConsumer(AsyncWebsocketConsumer):
                     },
                 )
                 game.set_status(GameStatus.PLAYING)
-                game.set_game_time(GameTimeType.START_TIME.value)
-                self.game_loop_task = asyncio.create_task(
-                    self.send_game_messages_loop(game)
+                # 다른 워커에서 옮겨온 게임은 처음 시작 시간을 유지
+                if game.get_game_time(GameTimeType.START_TIME.value) is None:
+                    game.set_game_time(GameTimeType.START_TIME.value)
+                game.start_wait_ball()  # 시작 전 2초 동안 공 정지
+                start_game_loop(
+                    self.game_id,
+                    game,
+                    lambda step_cnt: self.game_tick(game, step_cnt),
                 )
+                await GAME_REGISTRY.set_status(self.game_id, GameStatus.PLAYING)
 
         # 게임이 진행 중인 경우
         elif (
@@ -223,123 +528,670 @@ class GeneralGameConsumer(AsyncWebsocketConsumer):
             and game.get_status() == GameStatus.END
             and self.db_complete is False
         ):
-            try:
-                winner_id, loser_id = game.get_winner_loser_intra_id()
-                if self.user.intra_id == winner_id:
-                    self.db_complete = True
-                    await self.save_game_user_data_to_db(
-                        game.get_db_data(), winner_id, loser_id
-                    )
-                    await self.channel_layer.group_send(
-                        self.game_group_name,
-                        {
-                            "type": "game.message",
-                            "message": game.build_complete_json(),
-                        },
-                    )
-            except ValidationError:
-                await self.channel_layer.group_send(
-                    self.game_group_name,
-                    {
-                        "type": "game.message",
-                        "message": game.build_complete_json(is_error=True),
-                    },
+            winner_id, loser_id = game.get_winner_loser_intra_id()
+            if self.user.intra_id == winner_id:
+                self.db_complete = True
+                GAME_RESULT_WRITER.submit(
+                    GameResult([game.get_db_data()], [(winner_id, loser_id)], True),
+                    self.get_complete_send(game),
                 )
 
-    async def wait_ball(self, game: GeneralGame) -> None:
+    async def game_tick(self, game: GeneralGame, step_cnt: int) -> bool:
         """
-        게임 시작 전 2초 동안 공 정지
+        GAME_SCHEDULER가 매 틱마다 호출하여 게임 메시지를 전송하는 함수
         Args:
             game: GeneralGame 객체
+            step_cnt: 지난 틱 이후 진행할 스텝 수
 
         Returns:
-            None
+            bool: 게임이 계속 진행되면 True, 종료되면 False
         """
-        cnt = 0
-        while cnt < 60:
-            await asyncio.sleep(1 / 30)
+        # 게임 에러 발생 또는 이미 종료된 경우
+        if game.get_status() not in (GameStatus.PLAYING, GameStatus.SCORE):
+            return False
+
+        game.update_game(step_cnt, STEP_SCALE)
+        if game.get_tick_no() % LEASE_RENEW_TICK_CNT == 0:
+            await GAME_REGISTRY.renew(self.game_id)
+
+        # 게임 진행 중일 때 (시작 전, 득점 후 2초 동안은 공이 정지한 상태)
+        if game.get_status() == GameStatus.PLAYING:
+            events = build_frame_events(
+                game, GROUP_BROADCASTER.get_keys(self.game_group_name)
+            )
+            await GROUP_BROADCASTER.broadcast(self.game_group_name, events)
+
+        # 득점 시
+        elif game.get_status() == GameStatus.SCORE:
             await self.channel_layer.group_send(
                 self.game_group_name,
+                {"type": "game.message", "message": game.build_score_json()},
+            )
+            score1, score2 = game.get_score()
+
+            # 게임 종료 시
+            if score1 == MAX_SCORE or score2 == MAX_SCORE:
+                await self.channel_layer.group_send(
+                    self.game_group_name,
+                    {"type": "game.message", "message": game.build_end_json()},
+                )
+                game.set_status(GameStatus.END)
+                game.set_game_time(GameTimeType.END_TIME.value)
+                return False
+            game.set_status(GameStatus.PLAYING)
+            game.start_wait_ball()  # 스코어 후 2초 동안 공 정지
+        return True
+
+    def get_complete_send(self, game: GeneralGame) -> OnSaved:
+        """
+        게임 결과가 저장되면 플레이어들에게 complete를 보낼 함수를 반환하는 함수
+        Args:
+            game: 결과를 저장할 게임
+
+        Returns:
+            OnSaved: 저장 성공 여부를 받는 코루틴 함수
+        """
+        channel_layer, game_group_name = self.channel_layer, self.game_group_name
+
+        async def send_complete(is_saved: bool) -> None:
+            await channel_layer.group_send(
+                game_group_name,
                 {
                     "type": "game.message",
-                    "message": game.build_game_json(game_start=False),
+                    "message": game.build_complete_json(is_error=not is_saved),
                 },
             )
-            cnt += 1
 
-    async def send_game_messages_loop(self, game: GeneralGame) -> None:
+        return send_complete
+
+
+class RemotePlayer:
+    """
+    다른 프로세스에 접속한 플레이어를 소유 프로세스에서 대신하는 컨슈머의 공통 부분,
+    소켓으로 보낼 메시지를 원격 컨슈머의 채널로 전달
+    """
+
+    def __init__(self, scope: dict, channel_layer, channel_name: str):
+        super().__init__()
+        self.scope = scope
+        self.channel_layer = channel_layer
+        self.channel_name = channel_name
+
+    async def base_send(self, message: dict) -> None:
+        await self.channel_layer.send(
+            self.channel_name, {"type": "game.relay", "event": message}
+        )
+
+    async def accept(self, subprotocol=None) -> None:
+        # 원격 컨슈머가 이미 연결을 수락함
+        return
+
+
+class RemoteGeneralGamePlayer(RemotePlayer, GeneralGameConsumer):
+    """
+    다른 프로세스에 접속한 플레이어를 게임 소유 프로세스에서 대신하는 컨슈머,
+    소켓으로 보낼 메시지를 원격 GeneralGameConsumer의 채널로 전달
+    """
+
+
+class GameOwnerRelay:
+    """
+    다른 프로세스의 컨슈머가 보낸 연결, 입력, 종료를 받아
+    이 프로세스가 소유한 게임이나 토너먼트의 RemotePlayer에게 넘기는 클래스
+    """
+
+    def __init__(self):
+        self.__channel_name: Optional[str] = None
+        self.__task: Optional[asyncio.Task] = None
+        self.__players: dict[str, RemotePlayer] = {}
+
+    async def start(self) -> str:
         """
-        게임 메시지를 주기적으로 전송하는 함수
+        릴레이를 시작하고 입력을 받을 채널 이름을 반환하는 함수
+        Returns:
+            str: 다른 프로세스가 메시지를 보낼 채널 이름
+        """
+        if (
+            self.__task is None
+            or self.__task.done()
+            or self.__task.get_loop() is not asyncio.get_running_loop()
+        ):
+            channel_layer = get_channel_layer()
+            # channels_redis는 같은 접두사의 채널만 한 번의 receive로 함께 받으므로
+            # 다른 접두사를 쓰면 릴레이가 컨슈머의 receive를 막음
+            self.__channel_name = await channel_layer.new_channel()
+            self.__players.clear()
+            self.__task = asyncio.create_task(self.__run(channel_layer))
+        return self.__channel_name
+
+    async def stop(self) -> None:
+        """
+        릴레이를 멈추는 함수, 채널 레이어의 receive 잠금을 놓을 때까지 기다림
+        Returns:
+            None
+        """
+        task, self.__task = self.__task, None
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            task.cancel()
+            # 취소된 receive가 CancelledError 대신 다른 예외로 끝날 수 있음
+            await asyncio.gather(task, return_exceptions=True)
+        self.__channel_name = None
+        self.__players.clear()
+
+    async def __run(self, channel_layer) -> None:
+        while True:
+            event = await channel_layer.receive(self.__channel_name)
+            try:
+                await self.__dispatch(channel_layer, event)
+            except Exception:
+                logger.exception("game relay failed: %s", event.get("type"))
+
+    async def __dispatch(self, channel_layer, event: dict) -> None:
+        """
+        원격 컨슈머가 보낸 메시지를 처리하는 함수
         Args:
-            game: GeneralGame 객체
+            channel_layer: 메시지를 주고받을 채널 레이어
+            event: game.create, game.migrate, tournament.create, tournament.migrate,
+                player.attach, player.input, player.detach 메시지
 
         Returns:
             None
         """
-        await self.wait_ball(game)  # 시작 전 2초 동안 공 정지
+        if event["type"] == "game.create":
+            await create_general_game(event["game_id"], event["players"])
+            return
+        if event["type"] == "game.migrate":
+            game = GeneralGame.from_snapshot(event["snapshot"])
+            game.prepare_resume()
+            await register_general_game(event["game_id"], game)
+            return
+        if event["type"] == "tournament.create":
+            await create_tournament(event["tournament_name"], event["creator"])
+            return
+        if event["type"] == "tournament.migrate":
+            tournament = Tournament.from_snapshot(event["snapshot"])
+            tournament.prepare_resume()
+            ACTIVE_TOURNAMENTS[event["tournament_name"]] = tournament
+            TOURNAMENT_JOURNAL.append(JournalEvent.READY, tournament)
+            await sync_tournament_record(event["tournament_name"], tournament)
+            return
 
-        while True:
-            await asyncio.sleep(1 / 30)
+        channel_name = event["channel_name"]
+        if event["type"] == "player.attach":
+            user = await database_sync_to_async(Users.objects.get)(
+                intra_id=event["intra_id"]
+            )
+            # 일반 게임은 game_id만, 토너먼트는 소켓 주소의 인자를 모두 보냄
+            url_kwargs = event.get("url_route", {"game_id": event.get("game_id")})
+            scope = {
+                "type": "websocket",
+                "user": user,
+                "url_route": {"kwargs": url_kwargs},
+                "subprotocols": event["subprotocols"],
+            }
+            player_type = REMOTE_PLAYER_TYPES[event.get("consumer", "general")]
+            player = player_type(scope, channel_layer, channel_name)
+            self.__players[channel_name] = player
+            await player.connect()
+        elif event["type"] == "player.input":
+            player = self.__players.get(channel_name)
+            if player is not None:
+                await player.receive(text_data=event["text_data"])
+        elif event["type"] == "player.detach":
+            player = self.__players.pop(channel_name, None)
+            if player is not None:
+                await player.disconnect(1000)
+
+
+GAME_OWNER_RELAY: GameOwnerRelay = GameOwnerRelay()
+
+
+class WorkerDrain:
+    """
+    SIGTERM을 받으면 진행 중인 게임과 토너먼트를 다른 워커로 넘긴 뒤 원래의 종료 처리를 하는 클래스
 
-            # 게임 진행 중일 때
-            if game.get_status() == GameStatus.PLAYING:
-                await self.channel_layer.group_send(
-                    self.game_group_name,
-                    {"type": "game.message", "message": game.build_game_json()},
-                )
+    롤링 배포로 파드가 내려갈 때 게임이 끊기지 않도록 drain_games를 먼저 실행하고,
+    끝나면 원래 SIGTERM 핸들러를 되돌려서 같은 시그널을 다시 보낸다.
+    """
 
-            # 득점 시
-            elif game.get_status() == GameStatus.SCORE:
-                await self.channel_layer.group_send(
-                    self.game_group_name,
-                    {"type": "game.message", "message": game.build_score_json()},
+    def __init__(self):
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def install(self) -> None:
+        """
+        실행 중인 이벤트 루프에 SIGTERM 핸들러를 등록하는 함수, 루프마다 한 번만 등록
+        Returns:
+            None
+        """
+        loop = asyncio.get_running_loop()
+        if self.__loop is loop:
+            return
+        previous_handler = signal.getsignal(signal.SIGTERM)
+
+        def shutdown(task: asyncio.Task) -> None:
+            if not task.cancelled() and task.exception() is not None:
+                logger.error("game drain failed", exc_info=task.exception())
+            signal.signal(
+                signal.SIGTERM,
+                previous_handler if previous_handler is not None else signal.SIG_DFL,
+            )
+            signal.raise_signal(signal.SIGTERM)
+
+        def on_sigterm() -> None:
+            loop.remove_signal_handler(signal.SIGTERM)
+            loop.create_task(drain_games()).add_done_callback(shutdown)
+
+        try:
+            loop.add_signal_handler(signal.SIGTERM, on_sigterm)
+        except (NotImplementedError, RuntimeError, ValueError):
+            # 메인 스레드가 아니거나 시그널 핸들러를 지원하지 않는 루프
+            logger.warning("game drain is not available on this event loop")
+            return
+        self.__loop = loop
+
+
+WORKER_DRAIN: WorkerDrain = WorkerDrain()
+
+
+async def join_worker_ring() -> None:
+    """
+    게임 레지스트리를 다른 워커와 공유할 때 하트비트를 시작해서 링에 들어가는 함수
+    Returns:
+        None
+    """
+    if GAME_REGISTRY.is_shared:
+        await WORKER_HEARTBEAT.start(await GAME_OWNER_RELAY.start())
+        WORKER_DRAIN.install()
+
+
+async def stop_game_services() -> None:
+    """
+    이 프로세스의 일반 게임 백그라운드 작업을 멈추고 전역 상태를 비우는 함수,
+    테스트가 끝날 때 이전 이벤트 루프의 작업이 다음 테스트에 남지 않게 함
+    Returns:
+        None
+    """
+    await GAME_OWNER_RELAY.stop()
+    await WORKER_HEARTBEAT.stop()
+    await MATCH_LOOP.stop()
+    await GAME_SCHEDULER.stop()
+    await MATCH_MAKER.clear()
+    await GAME_REGISTRY.clear()
+    ACTIVE_GENERAL_GAMES.clear()
+
+
+async def drain_games() -> int:
+    """
+    링에서 빠진 뒤 진행 중인 일반 게임과 토너먼트를 모두 다른 워커로 넘기는 함수
+    Returns:
+        int: 넘긴 일반 게임과 토너먼트 수
+    """
+    return await drain_general_games() + await drain_tournaments()
+
+
+async def drain_general_games() -> int:
+    """
+    링에서 빠진 뒤 진행 중인 일반 게임을 링에서 새로 담당하게 된 워커로 넘기는 함수,
+    플레이어는 migrate 메시지를 받고 다시 접속해서 이어서 진행
+    Returns:
+        int: 넘긴 게임 수
+    """
+    await WORKER_HEARTBEAT.stop()
+    channel_layer = get_channel_layer()
+    migrated_cnt = 0
+    for game_id, game in list(ACTIVE_GENERAL_GAMES.items()):
+        if game.get_status() not in (GameStatus.WAIT, GameStatus.PLAYING):
+            continue
+        owner, owner_channel = WORKER_HEARTBEAT.get_owner(game_id)
+        if owner_channel is None:
+            logger.warning("no worker left to take over general games")
+            break
+
+        # 스케줄러에서 빼면 물리 엔진의 상태가 게임 객체로 옮겨짐
+        GAME_SCHEDULER.unregister(game_id)
+        ACTIVE_GENERAL_GAMES.pop(game_id)
+        intra_id1, intra_id2 = game.get_intra_ids()
+        # 새 워커가 게임을 받기 전에 다시 접속한 플레이어도 새 워커로 연결되도록 먼저 기록
+        await GAME_REGISTRY.register(
+            game_id,
+            GameRecord(
+                owner=owner,
+                status=GameStatus.WAIT.value,
+                player1=intra_id1,
+                player2=intra_id2,
+                owner_channel=owner_channel,
+            ),
+        )
+        await channel_layer.send(
+            owner_channel,
+            {
+                "type": "game.migrate",
+                "game_id": game_id,
+                "snapshot": game.build_snapshot(),
+            },
+        )
+        await channel_layer.group_send(
+            f"game_{game_id}",
+            {"type": "game.migrate", "message": game.build_migrate_json()},
+        )
+        migrated_cnt += 1
+    logger.info("migrated %d general games", migrated_cnt)
+    return migrated_cnt
+
+
+async def drain_tournaments() -> int:
+    """
+    링에서 빠진 뒤 끝나지 않은 토너먼트를 링에서 토너먼트 이름을 담당하게 된 워커로 넘기는 함수,
+    대기방과 라운드의 플레이어는 migrate 메시지를 받고 다시 접속해서 이어서 진행
+    Returns:
+        int: 넘긴 토너먼트 수
+    """
+    await WORKER_HEARTBEAT.stop()
+    channel_layer = get_channel_layer()
+    migrated_cnt = 0
+    for tournament_name, tournament in list(ACTIVE_TOURNAMENTS.items()):
+        if tournament.get_status() in (TournamentStatus.END, TournamentStatus.ERROR):
+            continue
+        owner, owner_channel = WORKER_HEARTBEAT.get_owner(tournament_name)
+        if owner_channel is None:
+            logger.warning("no worker left to take over tournaments")
+            break
+
+        round_group_names = {
+            round_number: hashlib.md5(
+                (tournament_name + "_" + str(round_number)).encode("utf-8")
+            ).hexdigest()
+            for round_number in range(1, 4)
+        }
+        # 스케줄러에서 빼면 물리 엔진의 상태가 라운드 객체로 옮겨짐
+        for round_group_name in round_group_names.values():
+            GAME_SCHEDULER.unregister(round_group_name)
+        ACTIVE_TOURNAMENTS.pop(tournament_name)
+        tournament.set_is_migrated(True)
+        # 새 워커가 토너먼트를 받기 전에 다시 접속한 플레이어도 새 워커로 연결되도록 먼저 기록
+        await GAME_REGISTRY.register(
+            get_tournament_record_id(tournament_name),
+            GameRecord(
+                owner=owner,
+                status=tournament.get_status().value,
+                player1="",
+                player2="",
+                owner_channel=owner_channel,
+                player_cnt=tournament.get_player_total_cnt(),
+            ),
+        )
+        await channel_layer.send(
+            owner_channel,
+            {
+                "type": "tournament.migrate",
+                "tournament_name": tournament_name,
+                "snapshot": tournament.build_snapshot(),
+            },
+        )
+
+        wait_message = json.dumps({"message_type": MessageType.MIGRATE.value})
+        for team in ("a", "b"):
+            await channel_layer.group_send(
+                hashlib.md5(
+                    (f"tournament_{tournament_name}" + team).encode("utf-8")
+                ).hexdigest(),
+                {"type": "game.migrate", "message": wait_message},
+            )
+        for round_number, round_group_name in round_group_names.items():
+            round_game = tournament.get_round(round_number)
+            if round_game is not None:
+                await channel_layer.group_send(
+                    round_group_name,
+                    {
+                        "type": "game.migrate",
+                        "message": round_game.build_migrate_json(),
+                    },
                 )
-                score1, score2 = game.get_score()
+        migrated_cnt += 1
+    logger.info("migrated %d tournaments", migrated_cnt)
+    return migrated_cnt
 
-                # 게임 종료 시
-                if score1 == MAX_SCORE or score2 == MAX_SCORE:
-                    await self.channel_layer.group_send(
-                        self.game_group_name,
-                        {"type": "game.message", "message": game.build_end_json()},
-                    )
-                    game.set_status(GameStatus.END)
-                    game.set_game_time(GameTimeType.END_TIME.value)
-                    break
-                game.set_status(GameStatus.PLAYING)
-                await self.wait_ball(game)  # 스코어 후 2초 동안 공 정지
-            # 게임 에러 발생
-            if game.get_status() == GameStatus.ERROR:
-                break
 
-    @database_sync_to_async
-    def save_game_user_data_to_db(
-        self, game_data: dict, winner_id: str, loser_id: str
-    ) -> None:
+async def create_general_game(game_id: str, players: list[list[str]]) -> None:
+    """
+    이 워커가 소유하는 일반 게임을 만들고 레지스트리에 기록하는 함수
+    Args:
+        game_id: 게임 id
+        players: player1, player2의 [intra_id, nickname, user_id]
+
+    Returns:
+        None
+    """
+    player1, player2 = players
+    await register_general_game(
+        game_id, GeneralGame(Player(1, *player1), Player(2, *player2))
+    )
+
+
+async def register_general_game(game_id: str, game: GeneralGame) -> None:
+    """
+    이 워커가 소유할 일반 게임을 ACTIVE_GENERAL_GAMES와 레지스트리에 기록하는 함수
+    Args:
+        game_id: 게임 id
+        game: 새로 만들거나 다른 워커에서 옮겨온 게임
+
+    Returns:
+        None
+    """
+    ACTIVE_GENERAL_GAMES[game_id] = game
+    intra_id1, intra_id2 = game.get_intra_ids()
+    owner_channel = await GAME_OWNER_RELAY.start() if GAME_REGISTRY.is_shared else ""
+    await GAME_REGISTRY.register(
+        game_id, GAME_REGISTRY.create_record(intra_id1, intra_id2, owner_channel)
+    )
+
+
+def get_tournament_record_id(tournament_name: str) -> str:
+    return TOURNAMENT_RECORD_PREFIX + tournament_name
+
+
+async def create_tournament(tournament_name: str, creator: list[str]) -> None:
+    """
+    이 워커가 소유하는 토너먼트를 만들고 저널과 레지스트리에 기록하는 함수
+    Args:
+        tournament_name: 토너먼트 이름
+        creator: 만든 사람의 [intra_id, nickname, user_id]
+
+    Returns:
+        None
+    """
+    intra_id, nickname, user_id = creator
+    tournament = Tournament(
+        tournament_name=tournament_name,
+        create_user_intra_id=intra_id,
+        create_user_nickname=nickname,
+        create_user_id=user_id,
+    )
+    ACTIVE_TOURNAMENTS[tournament_name] = tournament
+    TOURNAMENT_JOURNAL.append(JournalEvent.JOIN, tournament)
+    await sync_tournament_record(tournament_name, tournament)
+
+
+async def sync_tournament_record(tournament_name: str, tournament: Tournament) -> None:
+    """
+    레지스트리를 공유할 때 이 워커가 소유한 토너먼트의 상태와 참가 인원을 기록하는 함수,
+    다른 워커는 이 기록으로 소유 워커를 찾고 대기 중인 토너먼트 목록을 만듦
+    Args:
+        tournament_name: 토너먼트 이름
+        tournament: 이 워커의 토너먼트
+
+    Returns:
+        None
+    """
+    if not GAME_REGISTRY.is_shared:
+        return
+    record = GAME_REGISTRY.create_record("", "", await GAME_OWNER_RELAY.start())
+    record.status = tournament.get_status().value
+    record.player_cnt = tournament.get_player_total_cnt()
+    await GAME_REGISTRY.register(get_tournament_record_id(tournament_name), record)
+
+
+async def remove_tournament(tournament_name: str) -> None:
+    ACTIVE_TOURNAMENTS.pop(tournament_name, None)
+    await GAME_REGISTRY.remove(get_tournament_record_id(tournament_name))
+
+
+async def renew_tournament_records() -> None:
+    """
+    WORKER_HEARTBEAT가 하트비트마다 호출하여 진행 중인 토너먼트의 기록을 연장하는 함수
+    Returns:
+        None
+    """
+    for tournament_name, tournament in list(ACTIVE_TOURNAMENTS.items()):
+        if tournament.get_status() not in (
+            TournamentStatus.END,
+            TournamentStatus.ERROR,
+        ):
+            await GAME_REGISTRY.renew(get_tournament_record_id(tournament_name))
+
+
+async def recover_tournaments(journal: TournamentJournal) -> tuple[int, int]:
+    """
+    저널에서 끝나지 않은 토너먼트를 찾아 결승부터 이어서 진행하거나 끝난 라운드를 저장하는 함수
+
+    - 결승까지 끝났는데 결과를 저장하지 못한 토너먼트는 모든 라운드를 저장
+    - 1, 2라운드가 끝난 토너먼트는 ACTIVE_TOURNAMENTS에 다시 넣고 결승 준비를 기다림
+    - 1, 2라운드 중에 멈춘 토너먼트는 끝난 라운드만 저장
+    - 대기 중이거나 오류로 끝난 토너먼트는 버림
+    Args:
+        journal: 토너먼트 저널
+
+    Returns:
+        tuple[int, int]: 다시 넣은 토너먼트 수, 결과를 저장한 토너먼트 수
+    """
+    await journal.flush()
+    recovered_cnt, saved_cnt = 0, 0
+    for name, record in get_unfinished_records(await journal.load()).items():
+        if name in ACTIVE_TOURNAMENTS:
+            continue
+        tournament = Tournament.from_snapshot(record.snapshot)
+        status = tournament.get_status()
+        if status in (TournamentStatus.WAIT, TournamentStatus.ERROR):
+            journal.append(JournalEvent.REMOVE, tournament)
+            continue
+
+        if status != TournamentStatus.END and tournament.is_final_ready():
+            tournament.prepare_final_resume()
+            ACTIVE_TOURNAMENTS[name] = tournament
+            journal.append(JournalEvent.READY, tournament)
+            recovered_cnt += 1
+            continue
+
+        round_numbers = [
+            round_number
+            for round_number in range(1, 4)
+            if tournament.get_round(round_number) is not None
+            and tournament.get_round(round_number).get_status() == GameStatus.END
+        ]
+        if await GAME_RESULT_WRITER.submit(
+            build_tournament_result(tournament, round_numbers)
+        ):
+            saved_cnt += 1
+        else:
+            logger.error("failed to save recovered tournament %s", name)
+        journal.append(JournalEvent.REMOVE, tournament)
+
+    await journal.flush()
+    # 끝난 토너먼트의 기록을 지우고 이어서 진행하는 토너먼트의 마지막 기록만 남김
+    await journal.compact(list(get_unfinished_records(await journal.load()).values()))
+    logger.info(
+        "recovered %d tournaments, saved %d tournaments", recovered_cnt, saved_cnt
+    )
+    return recovered_cnt, saved_cnt
+
+
+class TournamentRecovery:
+    """
+    프로세스가 시작된 뒤 처음 토너먼트 소켓이 연결될 때 한 번만 recover_tournaments를 실행하는 클래스
+    """
+
+    def __init__(self, journal: TournamentJournal):
+        self.__journal: TournamentJournal = journal
+        self.__task: Optional[asyncio.Task] = None
+        self.__is_done: bool = False
+
+    async def run(self) -> None:
+        """
+        복구가 끝날 때까지 기다리는 함수, 동시에 연결된 소켓은 같은 복구를 기다림
+        Returns:
+            None
+        """
+        if self.__is_done:
+            return
+        if (
+            self.__task is None
+            or self.__task.get_loop() is not asyncio.get_running_loop()
+        ):
+            self.__task = asyncio.create_task(recover_tournaments(self.__journal))
+        try:
+            await asyncio.shield(self.__task)
+        except Exception:
+            logger.exception("tournament recovery failed")
+        self.__is_done = True
+
+
+TOURNAMENT_RECOVERY: TournamentRecovery = TournamentRecovery(TOURNAMENT_JOURNAL)
+
+
+class TournamentOwnerClient:
+    """
+    다른 프로세스가 소유한 토너먼트에 접속한 소켓을 소유 프로세스로 이어주는 컨슈머의 공통 부분,
+    GeneralGameConsumer의 원격 연결처럼 입력과 종료는 소유 프로세스의 릴레이 채널로 보내고
+    소유 프로세스의 RemotePlayer가 보낸 메시지는 그대로 소켓으로 보냄
+    """
+
+    # 소유 프로세스의 REMOTE_PLAYER_TYPES에서 대신 접속할 컨슈머 종류
+    remote_player_type: str = ""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 다른 프로세스가 소유한 토너먼트면 그 프로세스의 GAME_OWNER_RELAY 채널
+        self.owner_channel: Optional[str] = None
+
+    async def connect_remote_tournament(self, tournament_name: str) -> bool:
         """
-        게임 결과를 DB에 저장하는 함수
+        레지스트리에서 토너먼트의 소유 프로세스를 찾아 연결을 전달하는 함수
         Args:
-            game_data: GeneralGameLogsSerializer에 전달할 데이터
-            winner_id: 승자의 intra_id
-            loser_id: 패자의 intra_id
+            tournament_name: 토너먼트 이름
 
         Returns:
-            Nones
-        """
-        serializer = GeneralGameLogsSerializer(data=game_data)
-        # raise_exception=True 에러 발생시 예외처리 해야함
-        if serializer.is_valid(raise_exception=True):
-            serializer.save()
-
-        if winner_id and loser_id:
-            # winner = Users.objects.get(intra_id=winner_intra_id)
-            # winner.win_count += 1
-            # winner.save()
-            Users.objects.filter(intra_id=winner_id).update(
-                win_count=F("win_count") + 1
-            )
-            Users.objects.filter(intra_id=loser_id).update(
-                lose_count=F("lose_count") + 1
-            )
+            bool: 다른 프로세스가 소유한 토너먼트라서 연결을 전달했으면 True
+        """
+        record = await GAME_REGISTRY.get(get_tournament_record_id(tournament_name))
+        if record is None or GAME_REGISTRY.is_local(record) or not record.owner_channel:
+            return False
+        self.owner_channel = record.owner_channel
+        _, subprotocol = negotiate_frame_format(self.scope)
+        await self.accept(subprotocol)
+        await self.channel_layer.send(
+            self.owner_channel,
+            {
+                "type": "player.attach",
+                "consumer": self.remote_player_type,
+                "url_route": dict(self.scope["url_route"]["kwargs"]),
+                "channel_name": self.channel_name,
+                "intra_id": self.scope["user"].intra_id,
+                "subprotocols": self.scope.get("subprotocols", []),
+            },
+        )
+        return True
+
+    async def send_to_owner(self, event_type: str, **fields) -> None:
+        await self.channel_layer.send(
+            self.owner_channel,
+            {"type": event_type, "channel_name": self.channel_name, **fields},
+        )
+
+    async def game_relay(self, event) -> None:
+        """
+        소유 프로세스의 RemotePlayer가 보낸 메시지를 소켓으로 보내는 함수
+        """
+        await self.base_send(event["event"])
 
 
 class TournamentGameWaitConsumer(AsyncWebsocketConsumer):
@@ -369,12 +1221,24 @@ class TournamentGameWaitConsumer(AsyncWebsocketConsumer):
         return False
 
     @staticmethod
-    def _get_wait_list() -> list[dict[str, str]]:
+    async def _get_wait_list() -> list[dict[str, str]]:
         """
-        대기 중인 토너먼트 리스트를 반환하는 함수
+        대기 중인 토너먼트 리스트를 반환하는 함수,
+        레지스트리를 공유하면 모든 워커의 토너먼트를 레지스트리 기록으로 찾음
         Returns:
             list[dict[str, str]]: 참가 인원이 4명이 아니면서 대기 중인 토너먼트 리스트
         """
+        if GAME_REGISTRY.is_shared:
+            records = await GAME_REGISTRY.get_all(TOURNAMENT_RECORD_PREFIX)
+            return [
+                {
+                    "tournament_name": record_id[len(TOURNAMENT_RECORD_PREFIX) :],
+                    "wait_num": str(record.player_cnt),
+                }
+                for record_id, record in records.items()
+                if record.status == TournamentStatus.WAIT.value
+                and record.player_cnt < TOURNAMENT_PLAYER_MAX_CNT
+            ]
         wait_list = []
         for t in ACTIVE_TOURNAMENTS.values():
             if t.get_status() == TournamentStatus.WAIT and t.get_player_total_cnt() < 4:
@@ -384,8 +1248,10 @@ class TournamentGameWaitConsumer(AsyncWebsocketConsumer):
     async def connect(self) -> None:
         self.user = self.scope["user"]
         if self.user.is_authenticated:
+            await TOURNAMENT_RECOVERY.run()
             await self.accept()
-            await self.send(json.dumps({"game_list": self._get_wait_list()}))
+            await join_worker_ring()
+            await self.send(json.dumps({"game_list": await self._get_wait_list()}))
         else:
             await self.close()
 
@@ -412,27 +1278,65 @@ class TournamentGameWaitConsumer(AsyncWebsocketConsumer):
         elif tournament_name == NOT_ALLOWED_TOURNAMENT_NAME:
             result = ResultType.FAIL.value
         # 토너먼트 이름이 대기 중이거나 진행 중인 게임에 이미 존재
-        elif tournament_name in ACTIVE_TOURNAMENTS.keys():
+        elif (
+            tournament_name in ACTIVE_TOURNAMENTS.keys()
+            or await GAME_REGISTRY.get(get_tournament_record_id(tournament_name))
+            is not None
+        ):
             result = ResultType.FAIL.value
         else:
             result = ResultType.SUCCESS.value
             self.isProcessingComplete = True
-            ACTIVE_TOURNAMENTS[tournament_name] = Tournament(
-                tournament_name=tournament_name,
-                create_user_intra_id=self.user.intra_id,
-                create_user_nickname=self.user.nickname,
-            )
+            await self.create_owned_tournament(tournament_name)
 
         await self.send(
             json.dumps({"message_type": MessageType.CREATE.value, "result": result})
         )
 
+    async def create_owned_tournament(self, tournament_name: str) -> None:
+        """
+        링에서 토너먼트 이름을 담당하는 워커에 토너먼트를 만드는 함수,
+        다른 워커면 릴레이 채널로 생성을 보내서 플레이어의 접속보다 먼저 처리되게 함
+        Args:
+            tournament_name: 토너먼트 이름
 
-class TournamentGameConsumer(AsyncWebsocketConsumer):
+        Returns:
+            None
+        """
+        creator = [self.user.intra_id, self.user.nickname, str(self.user.user_id)]
+        owner, owner_channel = WORKER_HEARTBEAT.get_owner(tournament_name)
+        if not owner_channel or owner == GAME_REGISTRY.get_owner():
+            await create_tournament(tournament_name, creator)
+            return
+        # 소유 워커가 토너먼트를 만들기 전에 접속한 플레이어도 찾을 수 있도록 먼저 기록
+        await GAME_REGISTRY.register(
+            get_tournament_record_id(tournament_name),
+            GameRecord(
+                owner=owner,
+                status=TournamentStatus.WAIT.value,
+                player1="",
+                player2="",
+                owner_channel=owner_channel,
+                player_cnt=1,
+            ),
+        )
+        await self.channel_layer.send(
+            owner_channel,
+            {
+                "type": "tournament.create",
+                "tournament_name": tournament_name,
+                "creator": creator,
+            },
+        )
+
+
+class TournamentGameConsumer(TournamentOwnerClient, AsyncWebsocketConsumer):
     """
     토너먼트 게임 컨슈머
     """
 
+    remote_player_type = "tournament"
+
     def __init__(self, *args, **kwargs):
         super().__init__(args, kwargs)
         self.user: Optional[Users] = None
@@ -448,6 +1352,14 @@ class TournamentGameConsumer(AsyncWebsocketConsumer):
         # Send message to WebSocket
         await self.send(text_data=message)
 
+    async def game_migrate(self, event) -> None:
+        """
+        토너먼트가 다른 워커로 옮겨졌음을 알리고 소켓을 닫는 함수,
+        클라이언트는 migrate 메시지를 받으면 같은 대기방에 다시 접속함
+        """
+        await self.send(text_data=event["message"])
+        await self.close()
+
     async def connect(self) -> None:
         self.user = self.scope["user"]
         if self.user.is_authenticated:
@@ -463,7 +1375,13 @@ class TournamentGameConsumer(AsyncWebsocketConsumer):
             self.group_name_b = hashlib.md5(
                 (self.group_name_prefix + "b").encode("utf-8")
             ).hexdigest()
+            await TOURNAMENT_RECOVERY.run()
             self.tournament = ACTIVE_TOURNAMENTS.get(self.tournament_name)
+            # 이 프로세스에 없는 토너먼트면 소유 프로세스로 연결을 전달
+            if self.tournament is None and await self.connect_remote_tournament(
+                self.tournament_name
+            ):
+                return
         if (
             self.tournament is not None
             and self.tournament.get_status() == TournamentStatus.WAIT
@@ -471,9 +1389,13 @@ class TournamentGameConsumer(AsyncWebsocketConsumer):
             await self.accept()
             player_number, wait_detail_json = (
                 self.tournament.build_tournament_wait_detail_json(
-                    intra_id=self.user.intra_id, nickname=self.user.nickname
+                    intra_id=self.user.intra_id,
+                    nickname=self.user.nickname,
+                    user_id=str(self.user.user_id),
                 )
             )
+            TOURNAMENT_JOURNAL.append(JournalEvent.JOIN, self.tournament)
+            await sync_tournament_record(self.tournament_name, self.tournament)
 
             # 라운드 별로 서로 다른 그룹에 추가
             if int(player_number[-1]) <= TOURNAMENT_PLAYER_MAX_CNT // 2:
@@ -493,13 +1415,21 @@ class TournamentGameConsumer(AsyncWebsocketConsumer):
             await self.close()
 
     async def disconnect(self, close_code) -> None:
+        await discard_closed_channel(self.channel_layer, self.channel_name)
+        if self.owner_channel is not None:
+            await self.send_to_owner("player.detach")
+            return
         if not self.user.is_authenticated:
             return
 
-        if self.tournament.get_status() == TournamentStatus.READY:
+        if (
+            self.tournament.get_status() == TournamentStatus.READY
+            or self.tournament.get_is_migrated()
+        ):
             return
 
         data = self.tournament.disconnect_tournament(self.user.nickname)
+        TOURNAMENT_JOURNAL.append(JournalEvent.LEAVE, self.tournament)
         # 나간 인원과 줄어든 현재 인원을 전송
         await self.channel_layer.group_send(
             self.group_name_a,
@@ -516,9 +1446,17 @@ class TournamentGameConsumer(AsyncWebsocketConsumer):
             },
         )
         if self.tournament.get_player_total_cnt() == 0:
-            ACTIVE_TOURNAMENTS.pop(self.tournament_name)
+            await remove_tournament(self.tournament_name)
+            TOURNAMENT_JOURNAL.append(JournalEvent.REMOVE, self.tournament)
+        else:
+            await sync_tournament_record(self.tournament_name, self.tournament)
 
     async def receive(self, text_data: json = None, bytes_data=None) -> None:
+        # 다른 프로세스가 소유한 토너먼트면 입력을 그대로 전달
+        if self.owner_channel is not None:
+            await self.send_to_owner("player.input", text_data=text_data)
+            return
+
         data = json.loads(text_data)
         if data.get("message_type") == MessageType.WAIT.value:
             number = data.get("number")
@@ -550,13 +1488,16 @@ class TournamentGameConsumer(AsyncWebsocketConsumer):
                         ),
                     },
                 )
+            TOURNAMENT_JOURNAL.append(JournalEvent.READY, self.tournament)
 
 
-class TournamentGameRoundConsumer(AsyncWebsocketConsumer):
+class TournamentGameRoundConsumer(TournamentOwnerClient, AsyncWebsocketConsumer):
     """
     토너먼트 라운드 게임 컨슈머
     """
 
+    remote_player_type = "round"
+
     def __init__(self, *args, **kwargs):
         super().__init__(args, kwargs)
         self.user: Optional[Users] = None
@@ -567,7 +1508,8 @@ class TournamentGameRoundConsumer(AsyncWebsocketConsumer):
         self.game_group_name: str = ""  # 현재 게임 그룹 채널 이름
         self.tournament_broadcast: str = ""  # 현재 토너먼트 전체 채널 이름
         self.winner_group: str = ""  # 1,2라운드 승자 채널 이름
-        self.game_loop_task: Optional[asyncio.Task] = None  # 게임 루프
+        self.frame_format: FrameFormat = FrameFormat.JSON  # 게임 진행 프레임 형식
+        self.delta_snapshot: Optional[DeltaSnapshot] = None  # delta 프레임 기록
 
     async def game_message(self, event) -> None:
         message = event["message"]
@@ -575,6 +1517,29 @@ class TournamentGameRoundConsumer(AsyncWebsocketConsumer):
         # Send message to WebSocket
         await self.send(text_data=message)
 
+    def get_frame_send(self) -> Send:
+        """
+        GROUP_BROADCASTER가 게임 진행 프레임을 전달할 함수를 반환하는 함수,
+        delta 형식이 아니면 미리 만든 websocket.send 이벤트를 그대로 보냄
+        Returns:
+            Send: 프레임 이벤트를 받을 코루틴 함수
+        """
+        if self.frame_format == FrameFormat.DELTA:
+            return self.send_delta_frame
+        return self.base_send
+
+    async def send_delta_frame(self, event) -> None:
+        data = self.delta_snapshot.build(event["tick_no"], event["values"])
+        await self.send(text_data=json.dumps(data))
+
+    async def game_migrate(self, event) -> None:
+        """
+        토너먼트가 다른 워커로 옮겨졌음을 알리고 소켓을 닫는 함수,
+        클라이언트는 migrate 메시지를 받으면 같은 라운드에 다시 접속해서 이어서 진행
+        """
+        await self.send(text_data=event["message"])
+        await self.close()
+
     async def diff_game_message(self, event) -> None:
         """
         event에 따라 서로 다른 메시지를 전달하기 위한 함수
@@ -583,7 +1548,8 @@ class TournamentGameRoundConsumer(AsyncWebsocketConsumer):
         end_message = event["end_message"]
 
         # Send message to WebSocket
-        if self.user.nickname == self.round.get_winner():
+        # 소유 프로세스의 그룹 메시지를 받는 원격 소켓에는 라운드가 없으므로 승자를 함께 받음
+        if self.user.nickname == event["winner"]:
             await self.send(text_data=stay_message)
         else:
             await self.send(text_data=end_message)
@@ -592,7 +1558,13 @@ class TournamentGameRoundConsumer(AsyncWebsocketConsumer):
         self.user = self.scope["user"]
         if self.user.is_authenticated:
             self.tournament_name = self.scope["url_route"]["kwargs"]["tournament_name"]
+            await TOURNAMENT_RECOVERY.run()
             self.tournament = ACTIVE_TOURNAMENTS.get(self.tournament_name)
+            # 이 프로세스에 없는 토너먼트면 소유 프로세스로 연결을 전달
+            if self.tournament is None and await self.connect_remote_tournament(
+                self.tournament_name
+            ):
+                return
             self.round_number = int(self.scope["url_route"]["kwargs"]["round"])
             self.round = self.tournament.get_round(self.round_number)
 
@@ -613,11 +1585,27 @@ class TournamentGameRoundConsumer(AsyncWebsocketConsumer):
                         self.tournament.get_status() == TournamentStatus.PLAYING
                         and self.round_number == 3
                     )
+                    # 다른 워커로 옮겨진 뒤 결승을 기다리던 1,2라운드 승자가 다시 접속
+                    or (
+                        self.round_number < 3
+                        and self.round is not None
+                        and self.round.get_status() == GameStatus.END
+                        and self.round.get_winner() == self.user.nickname
+                    )
                 )
                 and self.round is not None
                 and self.round.get_player(self.user.intra_id) is not None
             ):
-                await self.accept()
+                self.frame_format, subprotocol = negotiate_frame_format(self.scope)
+                if self.frame_format == FrameFormat.DELTA:
+                    self.delta_snapshot = DeltaSnapshot()
+                await self.accept(subprotocol)
+                GROUP_BROADCASTER.add(
+                    self.game_group_name,
+                    self.channel_name,
+                    self.get_frame_send(),
+                    key=self.frame_format,
+                )
                 await self.channel_layer.group_add(
                     self.tournament_broadcast, self.channel_name
                 )
@@ -628,16 +1616,28 @@ class TournamentGameRoundConsumer(AsyncWebsocketConsumer):
             await self.close()
 
     async def disconnect(self, code) -> None:
+        await discard_closed_channel(self.channel_layer, self.channel_name)
+        if self.owner_channel is not None:
+            await self.send_to_owner("player.detach")
+            return
         if not self.user.is_authenticated:
             return
 
+        # 다른 워커로 옮겨진 토너먼트는 소켓만 정리
+        is_migrated = self.tournament.get_is_migrated()
         # 게임이 비정상 종료 되었을 때(3라운드 진출자가 대기 중에 나갔을 때도 포함)
-        if self.round.get_status() != GameStatus.END or (
-            self.tournament.get_round(2 if self.round_number == 1 else 1).get_status()
-            != GameStatus.END
-            and self.winner_group
+        if not is_migrated and (
+            self.round.get_status() != GameStatus.END
+            or (
+                self.tournament.get_round(
+                    2 if self.round_number == 1 else 1
+                ).get_status()
+                != GameStatus.END
+                and self.winner_group
+            )
         ):
             self.tournament.set_status(TournamentStatus.ERROR)
+            TOURNAMENT_JOURNAL.append(JournalEvent.REMOVE, self.tournament)
             data = self.round.build_error_json(self.user.nickname)
             await self.channel_layer.group_send(
                 self.tournament_broadcast,
@@ -645,31 +1645,39 @@ class TournamentGameRoundConsumer(AsyncWebsocketConsumer):
             )
 
         # 각 라운드의 loop가 아직 취소되지 않은 경우
-        if not self.round.get_is_closed():
+        if not is_migrated and not self.round.get_is_closed():
             self.round.set_is_closed(True)
             # 토너먼트가 종료되었을 때
             if (
                 self.tournament.get_status() == TournamentStatus.END
                 and self.tournament_name in ACTIVE_TOURNAMENTS.keys()
             ):
-                ACTIVE_TOURNAMENTS.pop(self.tournament_name)
-            try:  # cancel() 동작이 끝날 때까지 대기
-                self.game_loop_task.cancel()
-                await self.game_loop_task
-            except:
-                pass  # task가 이미 취소된 경우
+                await remove_tournament(self.tournament_name)
+            GAME_SCHEDULER.unregister(self.game_group_name)
         await self.channel_layer.group_discard(
             self.tournament_broadcast, self.channel_name
         )
+        GROUP_BROADCASTER.discard(self.game_group_name, self.channel_name)
         await self.channel_layer.group_discard(self.game_group_name, self.channel_name)
         # 승자 그룹이 지정되어 채널에 들어가 있을 때
         if self.winner_group:
             await self.channel_layer.group_discard(self.winner_group, self.channel_name)
 
     async def receive(self, text_data: json = None, bytes_data=None) -> None:
+        # 다른 프로세스가 소유한 토너먼트면 입력을 그대로 전달
+        if self.owner_channel is not None:
+            await self.send_to_owner("player.input", text_data=text_data)
+            return
+
         data = json.loads(text_data)
         message_type = data.get("message_type")
 
+        # delta 프레임을 받은 클라이언트의 확인
+        if message_type == MessageType.ACK.value:
+            if self.delta_snapshot is not None:
+                self.delta_snapshot.ack(int(data["tick"]))
+            return
+
         # 1,2 라운드 일 때 유효성 검사 or 3라운드 일 때 유효성 검사
         if (
             message_type == MessageType.READY.value
@@ -682,11 +1690,21 @@ class TournamentGameRoundConsumer(AsyncWebsocketConsumer):
         ):
             self.round.set_round_ready(self.user.intra_id)
             if self.round.is_all_ready():
-                self.game_loop_task = asyncio.create_task(
-                    self.send_game_messages_loop(self.round)
+                self.round.start_wait_ball()  # 시작 전 2초 동안 공 정지
+                game = self.round
+                start_game_loop(
+                    self.game_group_name,
+                    game,
+                    lambda step_cnt: self.game_tick(game, step_cnt),
                 )
 
-                if self.tournament.is_all_round_ready():
+                # 다른 워커에서 옮겨온 라운드는 이 라운드만 이어서 시작
+                if (
+                    game.get_status() == GameStatus.WAIT
+                    and game.get_game_time(GameTimeType.START_TIME.value) is not None
+                ):
+                    await self.resume_round()
+                elif self.tournament.is_all_round_ready():
                     if self.round_number != int(RoundNumber.FINAL_NUMBER.value):
                         player1_nickname, player2_nickname = self.tournament.get_round(
                             1
@@ -733,6 +1751,9 @@ class TournamentGameRoundConsumer(AsyncWebsocketConsumer):
                             time_type=GameTimeType.START_TIME, is_final=False
                         )
                         self.tournament.set_status(status=TournamentStatus.PLAYING)
+                        TOURNAMENT_JOURNAL.append(
+                            JournalEvent.ROUND_START, self.tournament
+                        )
 
                     else:
                         player1_nickname, player2_nickname = self.tournament.get_round(
@@ -760,6 +1781,9 @@ class TournamentGameRoundConsumer(AsyncWebsocketConsumer):
                         self.tournament.set_round_game_time(
                             time_type=GameTimeType.START_TIME, is_final=True
                         )
+                        TOURNAMENT_JOURNAL.append(
+                            JournalEvent.ROUND_START, self.tournament
+                        )
         elif (
             data["message_type"] == MessageType.PLAYING.value
             and self.round.get_status() == GameStatus.PLAYING
@@ -771,59 +1795,106 @@ class TournamentGameRoundConsumer(AsyncWebsocketConsumer):
         ):
             await self.next_match()
 
-    async def wait_ball(self, game: GeneralGame) -> None:
+    async def resume_round(self) -> None:
+        """
+        다른 워커에서 옮겨온 라운드를 처음 시작 시간과 점수를 유지한 채 다시 시작하는 함수,
+        1, 2라운드가 모두 다시 시작되거나 끝나면 토너먼트를 진행 중 상태로 되돌림
+        Returns:
+            None
+        """
+        # 두 플레이어의 ready가 겹쳐도 한 번만 시작하도록 보내기 전에 상태를 바꿈
+        self.round.set_status(GameStatus.PLAYING)
+        if all(
+            self.tournament.get_round(round_number).get_status() != GameStatus.WAIT
+            for round_number in (1, 2)
+        ):
+            self.tournament.set_status(TournamentStatus.PLAYING)
+        TOURNAMENT_JOURNAL.append(JournalEvent.ROUND_START, self.tournament)
+        player1_nickname, player2_nickname = self.round.get_nicknames()
+        await self.channel_layer.group_send(
+            self.game_group_name,
+            {
+                "type": "game.message",
+                "message": json.dumps(
+                    {
+                        "message_type": MessageType.START.value,
+                        "round": str(self.round_number),
+                        "1p": player1_nickname,
+                        "2p": player2_nickname,
+                    }
+                ),
+            },
+        )
+
+    async def game_tick(self, game: Round, step_cnt: int) -> bool:
         """
-        게임 시작 전 2초 동안 공 정지
+        GAME_SCHEDULER가 매 틱마다 호출하여 라운드 메시지를 전송하는 함수
         Args:
-            game: GeneralGame 객체
+            game: Round 객체
+            step_cnt: 지난 틱 이후 진행할 스텝 수
 
         Returns:
-            None
+            bool: 라운드가 계속 진행되면 True, 종료되면 False
         """
-        cnt = 0
-        while cnt < 60:
-            await asyncio.sleep(1 / 30)
+        if self.tournament.get_status() == TournamentStatus.ERROR:
+            return False
+
+        game.update_game(step_cnt, STEP_SCALE)
+
+        # 시작 전, 득점 후 2초 동안은 공이 정지한 상태로 전송
+        if game.get_status() == GameStatus.PLAYING or game.is_wait_ball():
+            events = build_frame_events(
+                game, GROUP_BROADCASTER.get_keys(self.game_group_name)
+            )
+            await GROUP_BROADCASTER.broadcast(self.game_group_name, events)
+        elif game.get_status() == GameStatus.SCORE:
             await self.channel_layer.group_send(
                 self.game_group_name,
+                {"type": "game.message", "message": game.build_score_json()},
+            )
+            score1, score2 = game.get_score()
+            if score1 == MAX_SCORE or score2 == MAX_SCORE:
+                await self.channel_layer.group_send(
+                    self.game_group_name,
+                    {
+                        "type": "diff.game.message",
+                        "end_message": game.build_end_json(),
+                        "stay_message": game.build_stay_json(),
+                        "winner": game.get_winner(),
+                    },
+                )
+                game.set_status(GameStatus.END)
+                game.set_game_time(GameTimeType.END_TIME.value)
+                TOURNAMENT_JOURNAL.append(JournalEvent.ROUND_END, self.tournament)
+                return False
+            game.set_status(GameStatus.PLAYING)
+            game.start_wait_ball()  # 스코어 후 2초 동안 공 정지
+        return True
+
+    def get_complete_send(self) -> OnSaved:
+        """
+        토너먼트 결과가 저장되면 저널에 기록하고 모두에게 complete를 보낼 함수를 반환하는 함수
+        Returns:
+            OnSaved: 저장 성공 여부를 받는 코루틴 함수
+        """
+        channel_layer, tournament = self.channel_layer, self.tournament
+        tournament_broadcast = self.tournament_broadcast
+
+        async def send_complete(is_saved: bool) -> None:
+            TOURNAMENT_JOURNAL.append(
+                JournalEvent.RESULT if is_saved else JournalEvent.REMOVE, tournament
+            )
+            await channel_layer.group_send(
+                tournament_broadcast,
                 {
                     "type": "game.message",
-                    "message": game.build_game_json(game_start=False),
+                    "message": tournament.build_tournament_complete_json(
+                        is_error=not is_saved
+                    ),
                 },
             )
-            cnt += 1
 
-    async def send_game_messages_loop(self, game: Round) -> None:
-        await self.wait_ball(game)  # 시작 전 2초 동안 공 정지
-
-        while True:
-            await asyncio.sleep(1 / 30)
-            if game.get_status() == GameStatus.PLAYING:
-                await self.channel_layer.group_send(
-                    self.game_group_name,
-                    {"type": "game.message", "message": game.build_game_json()},
-                )
-            elif game.get_status() == GameStatus.SCORE:
-                await self.channel_layer.group_send(
-                    self.game_group_name,
-                    {"type": "game.message", "message": game.build_score_json()},
-                )
-                score1, score2 = game.get_score()
-                if score1 == MAX_SCORE or score2 == MAX_SCORE:
-                    await self.channel_layer.group_send(
-                        self.game_group_name,
-                        {
-                            "type": "diff.game.message",
-                            "end_message": game.build_end_json(),
-                            "stay_message": game.build_stay_json(),
-                        },
-                    )
-                    game.set_status(GameStatus.END)
-                    game.set_game_time(GameTimeType.END_TIME.value)
-                    break
-                game.set_status(GameStatus.PLAYING)
-                await self.wait_ball(game)  # 스코어 후 2초 동안 공 정지
-            if self.tournament.get_status() == TournamentStatus.ERROR:
-                break
+        return send_complete
 
     async def next_match(self) -> None:
         """
@@ -833,29 +1904,10 @@ class TournamentGameRoundConsumer(AsyncWebsocketConsumer):
         """
         if self.round_number == 3:
             self.tournament.set_status(TournamentStatus.END)
-            try:
-                await self.save_tournament_game_user_data_to_db()
-                await self.channel_layer.group_send(
-                    self.tournament_broadcast,
-                    (
-                        {
-                            "type": "game.message",
-                            "message": self.tournament.build_tournament_complete_json(),
-                        }
-                    ),
-                )
-            except ValidationError:
-                await self.channel_layer.group_send(
-                    self.tournament_broadcast,
-                    (
-                        {
-                            "type": "game.message",
-                            "message": self.tournament.build_tournament_complete_json(
-                                is_error=True
-                            ),
-                        }
-                    ),
-                )
+            GAME_RESULT_WRITER.submit(
+                build_tournament_result(self.tournament, range(1, 4)),
+                self.get_complete_send(),
+            )
         else:
             round1, round2 = self.tournament.get_round(1), self.tournament.get_round(2)
             self.winner_group = hashlib.md5(
@@ -877,24 +1929,44 @@ class TournamentGameRoundConsumer(AsyncWebsocketConsumer):
                         ),
                     },
                 )
+                TOURNAMENT_JOURNAL.append(JournalEvent.READY, self.tournament)
 
-    @database_sync_to_async
-    def save_tournament_game_user_data_to_db(self) -> None:
-        """
-        토너먼트 게임 결과를 DB에 저장하는 함수
-        Returns:
-            None
-        """
-        for i in range(1, 4):
-            data = self.tournament.get_db_datas(i)
-            serializer = TournamentGameLogsSerializer(data=data)
-            if serializer.is_valid(raise_exception=True):
-                serializer.save()
-            winner_id, loser_id = self.tournament.get_winner_loser_intra_ids(i)
-            if winner_id and loser_id:
-                Users.objects.filter(intra_id=winner_id).update(
-                    win_count=F("win_count") + 1
-                )
-                Users.objects.filter(intra_id=loser_id).update(
-                    lose_count=F("lose_count") + 1
-                )
+
+class RemoteTournamentPlayer(RemotePlayer, TournamentGameConsumer):
+    """
+    다른 프로세스의 토너먼트 대기방 소켓을 토너먼트 소유 프로세스에서 대신하는 컨슈머
+    """
+
+
+class RemoteTournamentRoundPlayer(RemotePlayer, TournamentGameRoundConsumer):
+    """
+    다른 프로세스의 토너먼트 라운드 소켓을 토너먼트 소유 프로세스에서 대신하는 컨슈머
+    """
+
+
+# player.attach의 consumer 값별로 소유 프로세스에서 대신 접속할 컨슈머
+REMOTE_PLAYER_TYPES: dict[str, type] = {
+    "general": RemoteGeneralGamePlayer,
+    "tournament": RemoteTournamentPlayer,
+    "round": RemoteTournamentRoundPlayer,
+}
+
+
+def build_tournament_result(
+    tournament: Tournament, round_numbers: Iterable[int]
+) -> GameResult:
+    """
+    토너먼트 라운드 결과를 한 번에 저장할 GameResult로 만드는 함수
+    Args:
+        tournament: 결과를 저장할 토너먼트
+        round_numbers: 저장할 라운드 번호
+
+    Returns:
+        GameResult: 라운드별 로그와 승패
+    """
+    round_numbers = list(round_numbers)
+    return GameResult(
+        [tournament.get_db_datas(i) for i in round_numbers],
+        [tournament.get_winner_loser_intra_ids(i) for i in round_numbers],
+        False,
+    )
@@ -0,0 +1,68 @@
+import json
+import timeit
+
+from django.core.management.base import BaseCommand
+
+from pong_game.module.GameSetValue import GameStatus, GameTimeType, TournamentGroupName
+from pong_game.module.GeneralGame import GeneralGame
+from pong_game.module.Player import Player
+from pong_game.module.Tournament import Tournament
+
+
+class Command(BaseCommand):
+    help = "게임과 토너먼트 스냅샷의 binary, json 인코딩 크기와 속도를 비교"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--number", type=int, default=10000)
+
+    @staticmethod
+    def make_game() -> GeneralGame:
+        game = GeneralGame(Player(1, "intra1", "nick1"), Player(2, "intra2", "nick2"))
+        game.set_status(GameStatus.PLAYING)
+        game.set_game_time(GameTimeType.START_TIME.value)
+        game.key_input(json.dumps({"number": "player1", "input": "left_press"}))
+        for _ in range(200):
+            game.update_game(step_cnt=1)
+            if game.get_status() == GameStatus.SCORE:
+                game.set_status(GameStatus.PLAYING)
+        game.key_input(json.dumps({"number": "player2", "input": "right_press"}))
+        return game
+
+    @staticmethod
+    def make_tournament() -> Tournament:
+        tournament = Tournament("benchmark", "intra1", "nick1")
+        for idx in range(2, 5):
+            tournament.build_tournament_wait_detail_json(f"intra{idx}", f"nick{idx}")
+        tournament.build_tournament_ready_json(TournamentGroupName.A_TEAM)
+        tournament.build_tournament_ready_json(TournamentGroupName.B_TEAM)
+        return tournament
+
+    def report(self, name: str, target, number: int) -> None:
+        snapshot = target.build_snapshot()
+        text = json.dumps(target.get_state())
+        rows = (
+            (
+                "binary",
+                len(snapshot),
+                target.build_snapshot,
+                lambda: type(target).from_snapshot(snapshot),
+            ),
+            (
+                "json",
+                len(text.encode("utf-8")),
+                lambda: json.dumps(target.get_state()),
+                lambda: type(target).from_state(json.loads(text)),
+            ),
+        )
+        for encoding, size, encode, decode in rows:
+            encode_us = timeit.timeit(encode, number=number) / number * 1e6
+            decode_us = timeit.timeit(decode, number=number) / number * 1e6
+            self.stdout.write(
+                f"{name:<10} {encoding:<6} {size:>6} bytes "
+                f"encode {encode_us:8.2f}us decode {decode_us:8.2f}us"
+            )
+
+    def handle(self, *args, **options):
+        number = options["number"]
+        self.report("game", self.make_game(), number)
+        self.report("tournament", self.make_tournament(), number)
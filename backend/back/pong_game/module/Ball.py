@@ -1,3 +1,5 @@
+from typing import Optional
+
 from . import GameSetValue
 from .GameSetValue import FIELD_WIDTH, BALL_SPEED_X, BALL_RADIUS, PADDLE_CORRECTION
 
@@ -32,27 +34,37 @@ class Ball:
         self.__speed_z = GameSetValue.BALL_SPEED_Z
         self.__paddle_correction = PADDLE_CORRECTION
 
-    def update_ball_position(self) -> None:
+    def move(self, distance_x: float, distance_z: float) -> None:
         """
-        공의 속도에 따라 공의 위치를 업데이트하는 함수
+        공을 주어진 거리만큼 옮기는 함수
+        Args:
+            distance_x: x 방향 이동 거리
+            distance_z: z 방향 이동 거리
+
+        Returns:
+            None
         """
-        self.__position_x += self.__speed_x
-        self.__position_z += self.__speed_z
+        self.__position_x += distance_x
+        self.__position_z += distance_z
         self.__position_y = (
             -((self.__position_z - 1) * (self.__position_z - 1) / 5000) + 435
         )
 
-    def is_side_collision(self) -> bool:
+    def get_side_contact_time(self, distance_x: float) -> Optional[float]:
         """
-        공이 좌우 벽에 부딪혔는지 확인하는 함수
+        공이 distance_x만큼 움직이는 동안 좌우 벽에 닿는 시점을 구하는 함수
+        Args:
+            distance_x: 이번에 움직일 x 방향 거리
+
         Returns:
-            bool: 공이 좌우 벽에 부딪혔으면 True, 아니면 False
+            Optional[float]: 이동 구간 중 벽에 닿는 비율(0~1), 닿지 않으면 None
         """
-        half_field_width = (FIELD_WIDTH - 2) / 2
-        return (
-            self.__position_x - self.__radius < -half_field_width
-            or self.__position_x + self.__radius > half_field_width
-        )
+        limit_x = (FIELD_WIDTH - 2) / 2 - self.__radius
+        if distance_x > 0 and self.__position_x + distance_x > limit_x:
+            return max((limit_x - self.__position_x) / distance_x, 0)
+        if distance_x < 0 and self.__position_x + distance_x < -limit_x:
+            return max((-limit_x - self.__position_x) / distance_x, 0)
+        return None
 
     def hit_ball_back(self, paddle_x: float) -> None:
         """
@@ -148,3 +160,33 @@ class Ball:
             tuple: 공의 x, z 속도
         """
         return self.__speed_x, self.__speed_z
+
+    def get_state(self) -> dict[str, float]:
+        """
+        공의 상태를 스냅샷용 딕셔너리로 반환하는 함수
+        Returns:
+            dict: 공의 위치, 속도, 패들 보정값
+        """
+        return {
+            "x": self.__position_x,
+            "z": self.__position_z,
+            "vx": self.__speed_x,
+            "vz": self.__speed_z,
+            "paddle_correction": self.__paddle_correction,
+        }
+
+    def set_state(self, state: dict[str, float]) -> None:
+        """
+        get_state로 만든 스냅샷으로 공의 상태를 되돌리는 함수
+        Args:
+            state: 공의 상태
+
+        Returns:
+            None
+        """
+        self.__position_x = 0
+        self.__position_z = 0
+        self.move(state["x"], state["z"])
+        self.__speed_x = state["vx"]
+        self.__speed_z = state["vz"]
+        self.__paddle_correction = state["paddle_correction"]
@@ -0,0 +1,485 @@
+import logging
+
+import numpy as np
+
+from . import GameSetValue
+from .Paddle import get_paddle_velocity
+from .GameSetValue import (
+    BALL_RADIUS,
+    BALL_SPEED_X,
+    FIELD_LENGTH,
+    FIELD_WIDTH,
+    KeyboardInput,
+    MAX_SWEEP_COLLISION_CNT,
+    PADDLE_BOUNDARY,
+    PADDLE_CORRECTION,
+    PADDLE_SPEED,
+    PADDLE_WIDTH,
+)
+
+logger = logging.getLogger(__name__)
+
+# 슬롯 하나마다 한 칸씩 가지는 배열들, (이름, dtype, 슬롯 뒤에 붙는 shape)
+SLOT_ARRAYS: tuple[tuple[str, type, tuple[int, ...]], ...] = (
+    ("in_use", np.bool_, ()),
+    ("playing", np.bool_, ()),
+    ("wait_ball", np.float64, ()),
+    ("ball_x", np.float64, ()),
+    ("ball_z", np.float64, ()),
+    ("ball_vx", np.float64, ()),
+    ("ball_vz", np.float64, ()),
+    ("paddle_correction", np.float64, ()),
+    ("paddle_x", np.float64, (2,)),
+    ("key_left", np.bool_, (2,)),
+    ("key_right", np.bool_, (2,)),
+)
+
+
+class BatchPhysics:
+    """
+    활성화된 모든 게임의 공과 패들 상태를 슬롯별 배열(struct-of-arrays)로 보관하고
+    한 번의 벡터 연산으로 모든 게임의 스텝을 진행시키는 클래스
+
+    게임은 attach로 슬롯을 받고 BallSlot, PaddleSlot을 통해 자기 슬롯의 값을 읽고 쓴다.
+    키 입력 적용과 득점 처리처럼 드물게 일어나는 일만 게임별로 호출한다.
+    """
+
+    def __init__(self, step_scale: float = 1, capacity: int = 64):
+        self.__step_scale: float = step_scale
+        self.__capacity: int = 0
+        self.__games: list = []
+        self.__free_slots: list[int] = []
+        self.__key_input_slots: set[int] = set()
+        for name, dtype, shape in SLOT_ARRAYS:
+            setattr(self, name, np.zeros((0, *shape), dtype=dtype))
+        self.__grow(max(capacity, 1))
+
+    def attach(self, game) -> int:
+        """
+        게임에 슬롯을 할당하고 공과 패들을 초기 위치로 설정하는 함수
+        Args:
+            game: 슬롯을 사용할 GeneralGame
+
+        Returns:
+            int: 할당된 슬롯 번호
+        """
+        if not self.__free_slots:
+            self.__grow(self.__capacity * 2)
+        slot = self.__free_slots.pop()
+        self.__games[slot] = game
+        self.in_use[slot] = True
+        self.playing[slot] = False
+        self.wait_ball[slot] = 0
+        self.reset_ball(slot)
+        self.paddle_x[slot] = 0
+        self.key_left[slot] = False
+        self.key_right[slot] = False
+        return slot
+
+    def detach(self, slot: int) -> None:
+        """
+        슬롯을 반환하는 함수
+        Args:
+            slot: 반환할 슬롯 번호
+
+        Returns:
+            None
+        """
+        if not self.in_use[slot]:
+            return
+        self.in_use[slot] = False
+        self.playing[slot] = False
+        self.key_left[slot] = False
+        self.key_right[slot] = False
+        self.__games[slot] = None
+        self.__key_input_slots.discard(slot)
+        self.__free_slots.append(slot)
+
+    def get_game_cnt(self) -> int:
+        return self.__capacity - len(self.__free_slots)
+
+    def get_ball(self, slot: int) -> "BallSlot":
+        return BallSlot(self, slot)
+
+    def get_paddle(self, slot: int, number: int) -> "PaddleSlot":
+        return PaddleSlot(self, slot, number)
+
+    def set_playing(self, slot: int, is_playing: bool) -> None:
+        self.playing[slot] = is_playing
+
+    def set_wait_ball(self, slot: int, wait_ball_cnt: float) -> None:
+        self.wait_ball[slot] = wait_ball_cnt
+
+    def get_wait_ball(self, slot: int) -> float:
+        return float(self.wait_ball[slot])
+
+    def add_key_input(self, slot: int) -> None:
+        """
+        다음 스텝이 시작될 때 키 입력을 적용할 슬롯을 추가하는 함수
+        Args:
+            slot: 키 입력이 들어온 슬롯 번호
+
+        Returns:
+            None
+        """
+        self.__key_input_slots.add(slot)
+
+    def reset_ball(self, slot: int) -> None:
+        """
+        슬롯의 공 위치와 속도를 초기화하는 함수
+        Args:
+            slot: 초기화할 슬롯 번호
+
+        Returns:
+            None
+        """
+        self.ball_x[slot] = 0
+        self.ball_z[slot] = 0
+        self.ball_vx[slot] = BALL_SPEED_X
+        self.ball_vz[slot] = GameSetValue.BALL_SPEED_Z
+        self.paddle_correction[slot] = PADDLE_CORRECTION
+
+    def step(self, step_cnt: int = 1) -> None:
+        """
+        모든 슬롯을 step_cnt 스텝만큼 진행하는 함수
+        Args:
+            step_cnt: 진행할 스텝 수
+
+        Returns:
+            None
+        """
+        for _ in range(step_cnt):
+            # 슬롯을 하나씩 꺼내서 처리 중에 중단되어도 남은 슬롯의 입력은 다음 스텝에 적용
+            while self.__key_input_slots:
+                slot = self.__key_input_slots.pop()
+                game = self.__games[slot]
+                if game is None:
+                    continue
+                try:
+                    game.apply_key_input()
+                except Exception:
+                    logger.exception("key input failed: slot %s", slot)
+
+            past_paddle1, past_paddle2 = self.__step_once(self.__step_scale)
+            for slot in np.flatnonzero(past_paddle1):
+                self.__games[slot].score_point(2)
+            for slot in np.flatnonzero(past_paddle2):
+                self.__games[slot].score_point(1)
+
+    def __step_once(self, step_scale: float) -> tuple[np.ndarray, np.ndarray]:
+        """
+        모든 슬롯의 패들과 공을 한 스텝 움직이고 충돌을 처리하는 함수,
+        GeneralGame의 한 스텝과 같은 순서로 판정함
+        Args:
+            step_scale: GAME_TICK_RATE 한 틱 대비 한 스텝의 길이
+
+        Returns:
+            tuple: 공이 플레이어1, 플레이어2의 패들을 지나친 슬롯 마스크
+        """
+        # 패들, 플레이어2는 반대편에서 보기 때문에 방향이 반대
+        direction = (self.key_right & ~self.key_left).astype(np.int8) - (
+            self.key_left & ~self.key_right
+        )
+        direction[:, 1] *= -1
+        self.paddle_x += direction * (PADDLE_SPEED * step_scale)
+        np.clip(self.paddle_x, -PADDLE_BOUNDARY, PADDLE_BOUNDARY, out=self.paddle_x)
+
+        # 대기 시간인 슬롯은 공을 움직이지 않음
+        waiting = self.wait_ball > 0
+        self.wait_ball[waiting] -= step_scale
+        active = self.in_use & self.playing & ~waiting
+
+        is_paddle_hit = self.__sweep_ball(step_scale, active)
+
+        paddle1_z = FIELD_LENGTH / 2
+        paddle2_z = -FIELD_LENGTH / 2
+        past_paddle1 = active & (self.ball_z > paddle1_z + self.paddle_correction)
+        past_paddle2 = (
+            active & ~past_paddle1 & (self.ball_z < paddle2_z - self.paddle_correction)
+        )
+
+        # 패들 면을 지난 뒤 paddle_correction 범위 안에서 패들이 따라잡은 경우
+        remain = active & ~past_paddle1 & ~past_paddle2 & ~is_paddle_hit
+        hit_paddle1 = (
+            remain
+            & (self.ball_vz > 0)
+            & (self.ball_z + BALL_RADIUS >= paddle1_z)
+            & self.__is_aligned(self.ball_x, 0)
+        )
+        remain &= ~hit_paddle1
+        hit_paddle2 = (
+            remain
+            & (self.ball_vz < 0)
+            & (self.ball_z - BALL_RADIUS <= paddle2_z)
+            & self.__is_aligned(self.ball_x, 1)
+        )
+        self.__hit_ball_back(hit_paddle1, hit_paddle2)
+
+        scored = past_paddle1 | past_paddle2
+        if scored.any():
+            self.ball_x[scored] = 0
+            self.ball_z[scored] = 0
+            self.ball_vx[scored] = BALL_SPEED_X
+            self.ball_vz[scored] = GameSetValue.BALL_SPEED_Z
+            self.paddle_correction[scored] = PADDLE_CORRECTION
+        return past_paddle1, past_paddle2
+
+    def __sweep_ball(self, step_scale: float, active: np.ndarray) -> np.ndarray:
+        """
+        공이 한 스텝 동안 지나가는 선분을 따라 벽과 패들 면에 처음 닿는 시점을 구해서
+        그 지점에서 반사시키고 남은 시간만큼 다시 움직이는 함수,
+        GeneralGame.__sweep_ball과 같은 계산을 모든 슬롯에 대해 한 번에 수행함
+        Args:
+            step_scale: GAME_TICK_RATE 한 틱 대비 한 스텝의 길이
+            active: 공이 움직이는 슬롯 마스크
+
+        Returns:
+            np.ndarray: 이번 스텝에 패들에 맞은 슬롯 마스크
+        """
+        limit_x = (FIELD_WIDTH - 2) / 2 - BALL_RADIUS
+        plane1_z = FIELD_LENGTH / 2 - BALL_RADIUS
+        plane2_z = -FIELD_LENGTH / 2 + BALL_RADIUS
+        remain = active.astype(np.float64)
+        is_paddle_hit = np.zeros_like(active)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for _ in range(MAX_SWEEP_COLLISION_CNT):
+                x, z = self.ball_x, self.ball_z
+                distance_x = self.ball_vx * step_scale * remain
+                distance_z = self.ball_vz * step_scale * remain
+
+                side_time = np.full_like(x, np.inf)
+                right = (distance_x > 0) & (x + distance_x > limit_x)
+                left = (distance_x < 0) & (x + distance_x < -limit_x)
+                side_time[right] = (limit_x - x[right]) / distance_x[right]
+                side_time[left] = (-limit_x - x[left]) / distance_x[left]
+                np.maximum(side_time, 0, out=side_time)
+
+                toward1 = (
+                    (distance_z > 0) & (z < plane1_z) & (plane1_z <= z + distance_z)
+                )
+                toward2 = (
+                    (distance_z < 0) & (z + distance_z <= plane2_z) & (plane2_z < z)
+                )
+                plane_z = np.where(toward1, plane1_z, plane2_z)
+                paddle_time = (plane_z - z) / distance_z
+                contact_x = x + distance_x * paddle_time
+                hit_paddle1 = toward1 & self.__is_aligned(contact_x, 0)
+                hit_paddle2 = toward2 & self.__is_aligned(contact_x, 1)
+                hit_paddle = hit_paddle1 | hit_paddle2
+                paddle_time[~hit_paddle] = np.inf
+
+                hit_paddle &= paddle_time <= side_time
+                hit_side = ~hit_paddle & np.isfinite(side_time)
+                contact_time = np.where(
+                    hit_paddle, paddle_time, np.where(hit_side, side_time, 1)
+                )
+                self.ball_x += distance_x * contact_time
+                self.ball_z += distance_z * contact_time
+                self.ball_vx[hit_side] *= -1
+                self.__hit_ball_back(hit_paddle1 & hit_paddle, hit_paddle2 & hit_paddle)
+                is_paddle_hit |= hit_paddle
+
+                contact = hit_paddle | hit_side
+                remain = np.where(contact, remain * (1 - contact_time), 0)
+                if not contact.any():
+                    break
+        return is_paddle_hit
+
+    def __is_aligned(self, ball_x: np.ndarray, index: int) -> np.ndarray:
+        """
+        공의 x 좌표가 패들 폭 안에 있는지 확인하는 함수
+        Args:
+            ball_x: 확인할 공의 x 좌표 배열
+            index: 패들 인덱스, 플레이어1은 0, 플레이어2는 1
+
+        Returns:
+            np.ndarray: 패들 폭 안에 있는 슬롯 마스크
+        """
+        half_paddle_width = PADDLE_WIDTH / 2
+        paddle_x = self.paddle_x[:, index]
+        return (paddle_x - half_paddle_width < ball_x) & (
+            ball_x < paddle_x + half_paddle_width
+        )
+
+    def __hit_ball_back(self, hit_paddle1: np.ndarray, hit_paddle2: np.ndarray) -> None:
+        """
+        패들에 맞은 슬롯의 공을 되돌려 보내는 함수
+        Args:
+            hit_paddle1: 플레이어1의 패들에 맞은 슬롯 마스크
+            hit_paddle2: 플레이어2의 패들에 맞은 슬롯 마스크
+
+        Returns:
+            None
+        """
+        hit = hit_paddle1 | hit_paddle2
+        if not hit.any():
+            return
+        paddle_x = np.where(hit_paddle1, self.paddle_x[:, 0], self.paddle_x[:, 1])
+        self.ball_vx[hit] = (self.ball_x[hit] - paddle_x[hit]) / 5
+        self.ball_vz[hit] *= -1
+
+    def __grow(self, capacity: int) -> None:
+        """
+        슬롯 배열의 크기를 늘리는 함수
+        Args:
+            capacity: 새 슬롯 수
+
+        Returns:
+            None
+        """
+        for name, dtype, shape in SLOT_ARRAYS:
+            old = getattr(self, name)
+            new = np.zeros((capacity, *shape), dtype=dtype)
+            new[: len(old)] = old
+            setattr(self, name, new)
+        self.__games.extend([None] * (capacity - self.__capacity))
+        # 작은 번호의 슬롯부터 쓰도록 뒤에서부터 넣음
+        self.__free_slots.extend(range(capacity - 1, self.__capacity - 1, -1))
+        self.__capacity = capacity
+
+
+class BallSlot:
+    """
+    BatchPhysics 슬롯의 공 상태를 Ball과 같은 방식으로 다루는 클래스
+    """
+
+    def __init__(self, physics: BatchPhysics, slot: int):
+        self.__physics: BatchPhysics = physics
+        self.__slot: int = slot
+        self.__radius: float = BALL_RADIUS
+
+    def reset_position(self) -> None:
+        self.__physics.reset_ball(self.__slot)
+
+    def protego_maxima(self) -> None:
+        """
+        protego_maxima spell을 사용했을 때의 처리를 하는 함수
+        Returns:
+            None
+        """
+        physics, slot = self.__physics, self.__slot
+        physics.ball_vz[slot] += 4 if physics.ball_vz[slot] > 0 else -4
+        physics.paddle_correction[slot] += 4
+
+    @property
+    def position_x(self) -> float:
+        return float(self.__physics.ball_x[self.__slot])
+
+    @property
+    def position_z(self) -> float:
+        return float(self.__physics.ball_z[self.__slot])
+
+    @property
+    def radius(self) -> float:
+        return self.__radius
+
+    @property
+    def paddle_correction(self) -> float:
+        return float(self.__physics.paddle_correction[self.__slot])
+
+    @property
+    def speed_x(self) -> float:
+        return float(self.__physics.ball_vx[self.__slot])
+
+    @property
+    def speed_z(self) -> float:
+        return float(self.__physics.ball_vz[self.__slot])
+
+    @speed_x.setter
+    def speed_x(self, value):
+        self.__physics.ball_vx[self.__slot] = value
+
+    def get_position(self) -> tuple[float, float, float]:
+        """
+        공의 위치를 반환하는 함수
+        Returns:
+            tuple: 공의 x, y, z 좌표
+        """
+        position_z = self.position_z
+        position_y = -((position_z - 1) * (position_z - 1) / 5000) + 435
+        return self.position_x, position_y, position_z
+
+    def get_speed(self) -> tuple[float, float]:
+        return self.speed_x, self.speed_z
+
+    def get_state(self) -> dict[str, float]:
+        return {
+            "x": self.position_x,
+            "z": self.position_z,
+            "vx": self.speed_x,
+            "vz": self.speed_z,
+            "paddle_correction": self.paddle_correction,
+        }
+
+    def set_state(self, state: dict[str, float]) -> None:
+        physics, slot = self.__physics, self.__slot
+        physics.ball_x[slot] = state["x"]
+        physics.ball_z[slot] = state["z"]
+        physics.ball_vx[slot] = state["vx"]
+        physics.ball_vz[slot] = state["vz"]
+        physics.paddle_correction[slot] = state["paddle_correction"]
+
+
+class PaddleSlot:
+    """
+    BatchPhysics 슬롯의 패들 상태를 Paddle과 같은 방식으로 다루는 클래스
+    """
+
+    def __init__(self, physics: BatchPhysics, slot: int, number: int):
+        self.__physics: BatchPhysics = physics
+        self.__slot: int = slot
+        self.__index: int = number - 1
+        self.__position_z: float = (
+            FIELD_LENGTH / 2 if number == 1 else -FIELD_LENGTH / 2
+        )
+
+    def input_handler(self, key_input: str) -> None:
+        """
+        키보드 입력에 따라 패들을 움직이는 함수
+        Args:
+            key_input: 받은 키보드 입력
+
+        Returns:
+            None
+        """
+        key = self.__slot, self.__index
+        if key_input == KeyboardInput.LEFT_PRESS.value:
+            self.__physics.key_left[key] = True
+        elif key_input == KeyboardInput.LEFT_RELEASE.value:
+            self.__physics.key_left[key] = False
+        elif key_input == KeyboardInput.RIGHT_PRESS.value:
+            self.__physics.key_right[key] = True
+        elif key_input == KeyboardInput.RIGHT_RELEASE.value:
+            self.__physics.key_right[key] = False
+
+    @property
+    def position_x(self) -> float:
+        return float(self.__physics.paddle_x[self.__slot, self.__index])
+
+    @property
+    def velocity_x(self) -> float:
+        key = self.__slot, self.__index
+        return get_paddle_velocity(
+            self.__index + 1,
+            bool(self.__physics.key_left[key]),
+            bool(self.__physics.key_right[key]),
+            self.position_x,
+        )
+
+    @property
+    def position_z(self) -> float:
+        return self.__position_z
+
+    def get_state(self) -> dict:
+        key = self.__slot, self.__index
+        return {
+            "x": self.position_x,
+            "left": bool(self.__physics.key_left[key]),
+            "right": bool(self.__physics.key_right[key]),
+        }
+
+    def set_state(self, state: dict) -> None:
+        key = self.__slot, self.__index
+        self.__physics.paddle_x[key] = state["x"]
+        self.__physics.key_left[key] = state["left"]
+        self.__physics.key_right[key] = state["right"]
@@ -0,0 +1,31 @@
+from .GameSetValue import ELO_K_FACTOR
+
+
+def get_expected_score(rating: float, opponent_rating: float) -> float:
+    """
+    Elo 레이팅으로 상대를 이길 확률을 구하는 함수
+    Args:
+        rating: 자신의 레이팅
+        opponent_rating: 상대의 레이팅
+
+    Returns:
+        float: 0과 1 사이의 기대 승률
+    """
+    return 1 / (1 + 10 ** ((opponent_rating - rating) / 400))
+
+
+def update_elo(
+    winner_rating: int, loser_rating: int, k_factor: int = ELO_K_FACTOR
+) -> tuple[int, int]:
+    """
+    한 판의 결과로 두 플레이어의 새 레이팅을 구하는 함수, 두 레이팅의 합은 유지됨
+    Args:
+        winner_rating: 승자의 레이팅
+        loser_rating: 패자의 레이팅
+        k_factor: 한 판으로 바뀌는 레이팅의 최대 폭
+
+    Returns:
+        tuple[int, int]: 승자, 패자의 새 레이팅
+    """
+    delta = round(k_factor * (1 - get_expected_score(winner_rating, loser_rating)))
+    return winner_rating + delta, loser_rating - delta
@@ -0,0 +1,148 @@
+import struct
+from collections import OrderedDict
+from typing import Final, Optional
+
+from .GameSetValue import (
+    FRAME_QUANTIZE_SCALE,
+    KEYFRAME_TICK_CNT,
+    SNAPSHOT_HISTORY_SIZE,
+    MessageType,
+)
+
+# 메시지 타입(uint8), 틱 번호(uint32), paddle1, paddle2, ball_x, ball_y, ball_z,
+# ball_vx, ball_vz(int16), little endian 19 bytes
+GAME_FRAME_STRUCT: Final = struct.Struct("<BI7h")
+GAME_FRAME_FIELDS: Final = (
+    "paddle1",
+    "paddle2",
+    "ball_x",
+    "ball_y",
+    "ball_z",
+    "ball_vx",
+    "ball_vz",
+)
+PLAYING_FRAME_TYPE: Final = 1
+INT16_MIN: Final = -(2**15)
+INT16_MAX: Final = 2**15 - 1
+
+
+def quantize(value: float) -> int:
+    """
+    좌표나 속도를 int16 범위의 정수로 바꾸는 함수
+    Args:
+        value: 바꿀 값
+
+    Returns:
+        int: FRAME_QUANTIZE_SCALE을 곱해 반올림한 값
+    """
+    return max(INT16_MIN, min(INT16_MAX, round(value * FRAME_QUANTIZE_SCALE)))
+
+
+def pack_game_frame(tick_no: int, values: tuple[float, ...]) -> bytes:
+    """
+    게임 진행 상태를 binary 프레임으로 만드는 함수
+    Args:
+        tick_no: 게임 틱 번호
+        values: GAME_FRAME_FIELDS 순서의 값
+
+    Returns:
+        bytes: binary 프레임
+    """
+    return GAME_FRAME_STRUCT.pack(
+        PLAYING_FRAME_TYPE,
+        tick_no & 0xFFFFFFFF,
+        *(quantize(value) for value in values),
+    )
+
+
+def unpack_game_frame(frame: bytes) -> dict:
+    """
+    binary 프레임을 game json과 같은 키의 dict로 바꾸는 함수
+    Args:
+        frame: binary 프레임
+
+    Returns:
+        dict: frame_type, tick_no와 GAME_FRAME_FIELDS 값
+    """
+    frame_type, tick_no, *values = GAME_FRAME_STRUCT.unpack(frame)
+    data = {"frame_type": frame_type, "tick_no": tick_no}
+    for field, value in zip(GAME_FRAME_FIELDS, values):
+        data[field] = value / FRAME_QUANTIZE_SCALE
+    return data
+
+
+class DeltaSnapshot:
+    """
+    연결 하나에 보낸 프레임을 기억하고, 클라이언트가 마지막으로 확인(ack)한 프레임 대비
+    바뀐 값만 담은 delta 프레임을 만드는 클래스
+
+    확인받은 프레임이 없거나 KEYFRAME_TICK_CNT 틱이 지나면 전체 값을 담은 keyframe을 만든다.
+    """
+
+    def __init__(
+        self,
+        keyframe_tick_cnt: int = KEYFRAME_TICK_CNT,
+        history_size: int = SNAPSHOT_HISTORY_SIZE,
+    ):
+        self.__keyframe_tick_cnt: int = keyframe_tick_cnt
+        self.__history_size: int = history_size
+        self.__history: OrderedDict[int, tuple[float, ...]] = OrderedDict()
+        self.__acked_tick_no: Optional[int] = None
+        self.__keyframe_tick_no: Optional[int] = None
+
+    def ack(self, tick_no: int) -> None:
+        """
+        클라이언트가 받은 프레임의 틱 번호를 기록하는 함수, 기억하지 않는 틱 번호는 무시
+        Args:
+            tick_no: 클라이언트가 확인한 틱 번호
+
+        Returns:
+            None
+        """
+        if tick_no not in self.__history:
+            return
+        if self.__acked_tick_no is not None and tick_no <= self.__acked_tick_no:
+            return
+        self.__acked_tick_no = tick_no
+        while next(iter(self.__history)) < tick_no:
+            self.__history.popitem(last=False)
+
+    def build(self, tick_no: int, values: tuple[float, ...]) -> dict:
+        """
+        delta 프레임을 만드는 함수
+        Args:
+            tick_no: 게임 틱 번호
+            values: GAME_FRAME_FIELDS 순서의 값
+
+        Returns:
+            dict: keyframe이면 keyframe과 모든 값,
+                아니면 base(기준 틱 번호)와 바뀐 값만 담은 dict
+        """
+        values = tuple(values)
+        base = (
+            self.__history.get(self.__acked_tick_no)
+            if self.__acked_tick_no is not None
+            else None
+        )
+        is_keyframe = (
+            base is None
+            or self.__keyframe_tick_no is None
+            or tick_no - self.__keyframe_tick_no >= self.__keyframe_tick_cnt
+        )
+
+        self.__history[tick_no] = values
+        while len(self.__history) > self.__history_size:
+            self.__history.popitem(last=False)
+
+        data = {"message_type": MessageType.PLAYING.value, "tick": tick_no}
+        if is_keyframe:
+            self.__keyframe_tick_no = tick_no
+            data["keyframe"] = True
+            data.update(zip(GAME_FRAME_FIELDS, values))
+            return data
+
+        data["base"] = self.__acked_tick_no
+        for field, value, base_value in zip(GAME_FRAME_FIELDS, values, base):
+            if value != base_value:
+                data[field] = value
+        return data
@@ -0,0 +1,384 @@
+import os
+import socket
+import time
+from typing import Optional
+
+from redis import asyncio as aioredis
+
+from .GameSetValue import GAME_LEASE_SECONDS, WORKER_TTL_SECONDS, GameStatus
+
+
+def get_default_owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class GameRecord:
+    """
+    레지스트리에 기록되는 게임 정보, 게임을 소유한 프로세스와 상태, 플레이어 명단
+
+    토너먼트는 플레이어 명단 대신 대기 목록에 보여줄 참가 인원을 player_cnt에 기록한다.
+    """
+
+    def __init__(
+        self,
+        owner: str,
+        status: str,
+        player1: str,
+        player2: str,
+        owner_channel: str = "",
+        player_cnt: int = 0,
+    ):
+        self.owner: str = owner
+        self.owner_channel: str = owner_channel
+        self.status: str = status
+        self.player1: str = player1
+        self.player2: str = player2
+        self.player_cnt: int = player_cnt
+
+    def has_player(self, intra_id: str) -> bool:
+        return intra_id in (self.player1, self.player2)
+
+    def to_dict(self) -> dict[str, str]:
+        return {
+            "owner": self.owner,
+            "owner_channel": self.owner_channel,
+            "status": self.status,
+            "player1": self.player1,
+            "player2": self.player2,
+            "player_cnt": self.player_cnt,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, str]) -> "GameRecord":
+        return cls(
+            owner=data["owner"],
+            status=data["status"],
+            player1=data["player1"],
+            player2=data["player2"],
+            owner_channel=data.get("owner_channel", ""),
+            player_cnt=int(data.get("player_cnt", 0)),
+        )
+
+
+class GameRegistry:
+    """
+    게임을 소유한 프로세스를 찾기 위한 레지스트리의 기본 클래스
+
+    게임 객체는 소유 프로세스의 ACTIVE_GENERAL_GAMES에만 있고,
+    레지스트리에는 다른 프로세스가 게임을 찾는 데 필요한 GameRecord만 기록한다.
+    기록은 lease_seconds 동안 유효하며 소유 프로세스만 연장, 수정, 삭제할 수 있다.
+    """
+
+    # 다른 프로세스와 기록을 공유하는지 여부
+    is_shared: bool = False
+
+    def __init__(
+        self, owner: Optional[str] = None, lease_seconds: int = GAME_LEASE_SECONDS
+    ):
+        self.__owner: str = owner if owner else get_default_owner()
+        self.lease_seconds: int = lease_seconds
+
+    def get_owner(self) -> str:
+        return self.__owner
+
+    def is_local(self, record: GameRecord) -> bool:
+        return record.owner == self.__owner
+
+    def create_record(
+        self, player1: str, player2: str, owner_channel: str = ""
+    ) -> GameRecord:
+        """
+        이 프로세스가 소유하는 대기 상태의 GameRecord를 만드는 함수
+        Args:
+            player1: player1의 intra_id
+            player2: player2의 intra_id
+            owner_channel: 다른 프로세스의 입력을 받을 채널 이름
+
+        Returns:
+            GameRecord: 게임 정보
+        """
+        return GameRecord(
+            owner=self.__owner,
+            status=GameStatus.WAIT.value,
+            player1=player1,
+            player2=player2,
+            owner_channel=owner_channel,
+        )
+
+    async def register(self, game_id: str, record: GameRecord) -> None:
+        raise NotImplementedError
+
+    async def get(self, game_id: str) -> Optional[GameRecord]:
+        raise NotImplementedError
+
+    async def get_all(self, prefix: str) -> dict[str, GameRecord]:
+        """
+        id가 prefix로 시작하는 유효한 기록을 모두 반환하는 함수
+        Args:
+            prefix: 찾을 id의 접두사, glob 문자를 포함하지 않는 고정된 값
+
+        Returns:
+            dict[str, GameRecord]: id별 게임 정보
+        """
+        raise NotImplementedError
+
+    async def set_status(self, game_id: str, status: GameStatus) -> bool:
+        raise NotImplementedError
+
+    async def renew(self, game_id: str) -> bool:
+        raise NotImplementedError
+
+    async def remove(self, game_id: str) -> bool:
+        raise NotImplementedError
+
+    async def heartbeat(self, channel_name: str, load: int = 0) -> dict[str, str]:
+        """
+        이 워커가 살아있음을 기록하고 살아있는 워커 목록을 반환하는 함수
+        Args:
+            channel_name: 이 워커의 GameOwnerRelay 채널 이름
+            load: 이 워커가 진행 중인 게임 수
+
+        Returns:
+            dict[str, str]: 살아있는 워커별 채널 이름
+        """
+        raise NotImplementedError
+
+    async def get_worker_loads(self) -> dict[str, int]:
+        """
+        워커별로 마지막 하트비트에 기록한 게임 수를 반환하는 함수
+        Returns:
+            dict[str, int]: 워커별 게임 수
+        """
+        raise NotImplementedError
+
+    async def leave(self) -> None:
+        raise NotImplementedError
+
+    async def clear(self) -> None:
+        """
+        모든 게임 기록과 워커 목록을 지우는 함수, 테스트 사이에 상태를 초기화할 때 사용
+        Returns:
+            None
+        """
+        raise NotImplementedError
+
+
+class InMemoryGameRegistry(GameRegistry):
+    """
+    프로세스 안에서만 게임을 찾는 레지스트리, 단일 레플리카에서 사용
+    """
+
+    def __init__(
+        self, owner: Optional[str] = None, lease_seconds: int = GAME_LEASE_SECONDS
+    ):
+        super().__init__(owner, lease_seconds)
+        # 게임별 (GameRecord, 만료 시각)
+        self.__records: dict[str, tuple[GameRecord, float]] = {}
+        self.__load: int = 0
+
+    async def register(self, game_id: str, record: GameRecord) -> None:
+        self.__records[game_id] = (record, time.monotonic() + self.lease_seconds)
+
+    async def get(self, game_id: str) -> Optional[GameRecord]:
+        record, expire_time = self.__records.get(game_id, (None, 0))
+        if record is None or expire_time <= time.monotonic():
+            self.__records.pop(game_id, None)
+            return None
+        return record
+
+    async def get_all(self, prefix: str) -> dict[str, GameRecord]:
+        game_ids = [game_id for game_id in self.__records if game_id.startswith(prefix)]
+        records = {game_id: await self.get(game_id) for game_id in game_ids}
+        return {game_id: record for game_id, record in records.items() if record}
+
+    async def set_status(self, game_id: str, status: GameStatus) -> bool:
+        record = await self.get(game_id)
+        if record is None or not self.is_local(record):
+            return False
+        record.status = status.value
+        return True
+
+    async def renew(self, game_id: str) -> bool:
+        record = await self.get(game_id)
+        if record is None or not self.is_local(record):
+            return False
+        self.__records[game_id] = (record, time.monotonic() + self.lease_seconds)
+        return True
+
+    async def remove(self, game_id: str) -> bool:
+        record = await self.get(game_id)
+        if record is None or not self.is_local(record):
+            return False
+        self.__records.pop(game_id)
+        return True
+
+    async def heartbeat(self, channel_name: str, load: int = 0) -> dict[str, str]:
+        self.__load = load
+        return {self.get_owner(): channel_name}
+
+    async def get_worker_loads(self) -> dict[str, int]:
+        return {self.get_owner(): self.__load}
+
+    async def leave(self) -> None:
+        return
+
+    async def clear(self) -> None:
+        self.__records.clear()
+        self.__load = 0
+
+
+class RedisGameRegistry(GameRegistry):
+    """
+    Redis hash에 게임 정보를 기록해서 모든 레플리카가 게임을 찾을 수 있는 레지스트리
+
+    소유권 확인이 필요한 연장, 수정, 삭제는 Lua 스크립트로 한 번에 처리한다.
+    """
+
+    is_shared: bool = True
+
+    RENEW_SCRIPT = """
+        if redis.call('HGET', KEYS[1], 'owner') == ARGV[1] then
+            return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+        end
+        return 0
+    """
+    SET_STATUS_SCRIPT = """
+        if redis.call('HGET', KEYS[1], 'owner') == ARGV[1] then
+            redis.call('HSET', KEYS[1], 'status', ARGV[2])
+            return 1
+        end
+        return 0
+    """
+    REMOVE_SCRIPT = """
+        if redis.call('HGET', KEYS[1], 'owner') == ARGV[1] then
+            return redis.call('DEL', KEYS[1])
+        end
+        return 0
+    """
+
+    def __init__(
+        self,
+        url: str,
+        owner: Optional[str] = None,
+        lease_seconds: int = GAME_LEASE_SECONDS,
+        prefix: str = "pong:",
+        worker_ttl: int = WORKER_TTL_SECONDS,
+    ):
+        super().__init__(owner, lease_seconds)
+        self.__redis = aioredis.from_url(url, decode_responses=True)
+        self.__prefix: str = prefix
+        self.__worker_ttl: int = worker_ttl
+        # 워커별 마지막 하트비트 시각(sorted set)과 채널 이름, 게임 수(hash)
+        self.__workers_key: str = prefix + "workers"
+        self.__channels_key: str = prefix + "worker_channels"
+        self.__loads_key: str = prefix + "worker_loads"
+
+    def __key(self, game_id: str) -> str:
+        return f"{self.__prefix}game:{game_id}"
+
+    async def register(self, game_id: str, record: GameRecord) -> None:
+        async with self.__redis.pipeline(transaction=True) as pipe:
+            pipe.delete(self.__key(game_id))
+            pipe.hset(self.__key(game_id), mapping=record.to_dict())
+            pipe.pexpire(self.__key(game_id), self.lease_seconds * 1000)
+            await pipe.execute()
+
+    async def get(self, game_id: str) -> Optional[GameRecord]:
+        data = await self.__redis.hgetall(self.__key(game_id))
+        return GameRecord.from_dict(data) if data else None
+
+    async def get_all(self, prefix: str) -> dict[str, GameRecord]:
+        keys = [key async for key in self.__redis.scan_iter(self.__key(prefix + "*"))]
+        if not keys:
+            return {}
+        async with self.__redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.hgetall(key)
+            records = await pipe.execute()
+        start = len(self.__key(""))
+        # scan과 hgetall 사이에 만료된 기록은 빈 hash로 돌아옴
+        return {
+            key[start:]: GameRecord.from_dict(data)
+            for key, data in zip(keys, records)
+            if data
+        }
+
+    async def set_status(self, game_id: str, status: GameStatus) -> bool:
+        return bool(
+            await self.__redis.eval(
+                self.SET_STATUS_SCRIPT,
+                1,
+                self.__key(game_id),
+                self.get_owner(),
+                status.value,
+            )
+        )
+
+    async def renew(self, game_id: str) -> bool:
+        return bool(
+            await self.__redis.eval(
+                self.RENEW_SCRIPT,
+                1,
+                self.__key(game_id),
+                self.get_owner(),
+                self.lease_seconds * 1000,
+            )
+        )
+
+    async def remove(self, game_id: str) -> bool:
+        return bool(
+            await self.__redis.eval(
+                self.REMOVE_SCRIPT, 1, self.__key(game_id), self.get_owner()
+            )
+        )
+
+    async def heartbeat(self, channel_name: str, load: int = 0) -> dict[str, str]:
+        now = time.time()
+        async with self.__redis.pipeline(transaction=True) as pipe:
+            pipe.zadd(self.__workers_key, {self.get_owner(): now})
+            pipe.hset(self.__channels_key, self.get_owner(), channel_name)
+            pipe.hset(self.__loads_key, self.get_owner(), load)
+            pipe.zremrangebyscore(self.__workers_key, "-inf", now - self.__worker_ttl)
+            pipe.zrange(self.__workers_key, 0, -1)
+            pipe.hgetall(self.__channels_key)
+            *_, workers, channels = await pipe.execute()
+
+        # 하트비트가 끊긴 워커의 채널 정리
+        dead_workers = channels.keys() - set(workers)
+        if dead_workers:
+            async with self.__redis.pipeline(transaction=True) as pipe:
+                pipe.hdel(self.__channels_key, *dead_workers)
+                pipe.hdel(self.__loads_key, *dead_workers)
+                await pipe.execute()
+        return {worker: channels[worker] for worker in workers if worker in channels}
+
+    async def get_worker_loads(self) -> dict[str, int]:
+        loads = await self.__redis.hgetall(self.__loads_key)
+        return {worker: int(load) for worker, load in loads.items()}
+
+    async def leave(self) -> None:
+        async with self.__redis.pipeline(transaction=True) as pipe:
+            pipe.zrem(self.__workers_key, self.get_owner())
+            pipe.hdel(self.__channels_key, self.get_owner())
+            pipe.hdel(self.__loads_key, self.get_owner())
+            await pipe.execute()
+
+    async def clear(self) -> None:
+        keys = [key async for key in self.__redis.scan_iter(self.__key("*"))]
+        keys += [self.__workers_key, self.__channels_key, self.__loads_key]
+        await self.__redis.delete(*keys)
+
+
+def create_game_registry(backend: str, url: str = "") -> GameRegistry:
+    """
+    설정에 맞는 게임 레지스트리를 만드는 함수
+    Args:
+        backend: memory 또는 redis
+        url: redis 레지스트리가 사용할 Redis URL
+
+    Returns:
+        GameRegistry: 게임 레지스트리
+    """
+    if backend == "redis":
+        return RedisGameRegistry(url)
+    return InMemoryGameRegistry()
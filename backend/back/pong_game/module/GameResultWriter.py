@@ -0,0 +1,295 @@
+import asyncio
+import logging
+from collections import Counter, defaultdict
+from typing import Awaitable, Callable, Optional
+
+from channels.db import database_sync_to_async
+from django.db import DatabaseError, OperationalError, transaction
+from django.db.models import F, Q
+from rest_framework.exceptions import ValidationError
+
+from accounts.leaderboard import update_leaderboard_on_commit
+from accounts.models import Users
+from games.models import GeneralGameLogs, TournamentGameLogs
+from games.serializers import GeneralGameLogsSerializer, TournamentGameLogsSerializer
+from games.stats import add_head_to_head_stats, add_house_stats, count_head_to_head
+
+from .EloRating import update_elo
+from .GameSetValue import (
+    GAME_RESULT_BATCH_SIZE,
+    GAME_RESULT_FLUSH_SECONDS,
+    GAME_RESULT_RETRY_CNT,
+    GAME_RESULT_RETRY_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+# 저장이 끝나면 성공 여부를 받는 코루틴 함수
+OnSaved = Callable[[bool], Awaitable[None]]
+
+
+class GameResult:
+    """
+    한 번에 저장되어야 하는 게임 결과, 일반 게임 한 판 또는 토너먼트의 라운드들
+    """
+
+    def __init__(
+        self,
+        log_datas: list[dict],
+        outcomes: list[tuple[Optional[str], Optional[str]]],
+        is_general: bool,
+    ):
+        self.log_datas: list[dict] = log_datas
+        # (승자 intra_id, 패자 intra_id) 목록
+        self.outcomes: list[tuple[Optional[str], Optional[str]]] = outcomes
+        # 일반 게임만 레이팅에 반영
+        self.is_general: bool = is_general
+
+    def validate(self) -> list[dict]:
+        """
+        게임 로그 데이터를 serializer로 검사하는 함수
+        Returns:
+            list[dict]: 검사를 통과한 데이터
+
+        Raises:
+            ValidationError: 데이터가 올바르지 않을 때
+        """
+        serializer_class = (
+            GeneralGameLogsSerializer
+            if self.is_general
+            else TournamentGameLogsSerializer
+        )
+        validated_datas = []
+        for data in self.log_datas:
+            serializer = serializer_class(data=data)
+            serializer.is_valid(raise_exception=True)
+            validated_datas.append(serializer.validated_data)
+        return validated_datas
+
+
+def save_game_results(results: list[GameResult]) -> None:
+    """
+    게임 결과들의 로그, 승패 수, 레이팅을 저장하는 함수, 트랜잭션 안에서 호출해야 함
+
+    로그는 Player가 가진 user_id로 외래 키를 바로 채워서 모델별로 bulk_create 한 번,
+    승패 수와 레이팅은 유저별로 합쳐서 bulk_update 한 번으로 저장한다.
+    유저를 읽는 것은 user_id와 기숙사를 한 번에 조회할 때와 레이팅을 갱신할
+    유저를 잠글 때뿐이다. 상대 기숙사별 통계와 기숙사 통계도 같은 트랜잭션에서 더한다.
+    Args:
+        results: 저장할 게임 결과
+
+    Returns:
+        None
+
+    Raises:
+        ValidationError: 데이터가 올바르지 않거나 유저가 없을 때
+    """
+    validated = [(result, result.validate()) for result in results]
+    user_ids = {}
+    for result in results:
+        for data in result.log_datas:
+            for number in ("player1", "player2"):
+                if data.get(f"{number}_user_id"):
+                    user_ids[data[f"{number}_intra_id"]] = data[f"{number}_user_id"]
+    intra_ids = set()
+    for result, validated_datas in validated:
+        for data in validated_datas:
+            intra_ids.update((data["player1"]["intra_id"], data["player2"]["intra_id"]))
+        for outcome in result.outcomes:
+            intra_ids.update(intra_id for intra_id in outcome if intra_id)
+    # user_id가 없는 플레이어의 id와 통계에 쓸 기숙사를 한 번에 조회
+    houses = {}
+    for intra_id, user_id, house in Users.objects.filter(
+        Q(intra_id__in=intra_ids - user_ids.keys())
+        | Q(user_id__in=[user_ids[i] for i in intra_ids & user_ids.keys()])
+    ).values_list("intra_id", "user_id", "house"):
+        user_ids.setdefault(intra_id, user_id)
+        houses[intra_id] = house
+    if intra_ids - houses.keys():
+        raise ValidationError("User does not exist.")
+
+    # 동시에 끝난 다른 게임의 레이팅 갱신과 겹치지 않도록 잠금
+    rated_intra_ids = {
+        intra_id
+        for result in results
+        if result.is_general
+        for outcome in result.outcomes
+        if all(outcome)
+        for intra_id in outcome
+    }
+    ratings = {}
+    if rated_intra_ids:
+        ratings = dict(
+            Users.objects.select_for_update()
+            .filter(user_id__in=[user_ids[i] for i in rated_intra_ids])
+            .values_list("intra_id", "rating")
+        )
+
+    logs = {GeneralGameLogs: [], TournamentGameLogs: []}
+    win_counts, lose_counts = Counter(), Counter()
+    for result, validated_datas in validated:
+        model = GeneralGameLogs if result.is_general else TournamentGameLogs
+        for data in validated_datas:
+            data = dict(data)
+            data["player1_id"] = user_ids[data.pop("player1")["intra_id"]]
+            data["player2_id"] = user_ids[data.pop("player2")["intra_id"]]
+            logs[model].append(model(**data))
+        for winner_id, loser_id in result.outcomes:
+            if not (winner_id and loser_id):
+                continue
+            win_counts[winner_id] += 1
+            lose_counts[loser_id] += 1
+            if result.is_general:
+                ratings[winner_id], ratings[loser_id] = update_elo(
+                    ratings[winner_id], ratings[loser_id]
+                )
+
+    for model, objs in logs.items():
+        if objs:
+            model.objects.bulk_create(objs)
+    changed_users = [
+        Users(
+            user_id=user_ids[intra_id],
+            win_count=F("win_count") + win_counts[intra_id],
+            lose_count=F("lose_count") + lose_counts[intra_id],
+            rating=ratings.get(intra_id, F("rating")),
+        )
+        for intra_id in win_counts.keys() | lose_counts.keys()
+    ]
+    if changed_users:
+        Users.objects.bulk_update(changed_users, ["win_count", "lose_count", "rating"])
+    update_leaderboard_on_commit(
+        {str(user_ids[intra_id]): rating for intra_id, rating in ratings.items()}
+    )
+
+    add_head_to_head_stats(
+        count_head_to_head(
+            (
+                (log.player1_id, log.player2_id, log.player1_score, log.player2_score)
+                for objs in logs.values()
+                for log in objs
+            ),
+            {str(user_ids[intra_id]): house for intra_id, house in houses.items()},
+        )
+    )
+    house_counts = defaultdict(lambda: [0, 0])
+    for intra_id in win_counts.keys() | lose_counts.keys():
+        house_counts[houses[intra_id]][0] += win_counts[intra_id]
+        house_counts[houses[intra_id]][1] += lose_counts[intra_id]
+    add_house_stats(dict(house_counts))
+
+
+class GameResultWriter:
+    """
+    끝난 게임의 결과를 모아서 한 트랜잭션으로 저장하는 클래스
+
+    submit은 결과를 쌓기만 하므로 게임이 끝나는 흐름을 DB가 막지 않는다.
+    쌓인 결과는 백그라운드 작업이 flush_interval초마다 batch_size개씩 저장하고,
+    저장이 끝나면 결과마다 on_saved 콜백과 future로 성공 여부를 알린다.
+    일시적인 DB 오류는 배치 전체를 다시 시도하고, 그 밖의 오류는 결과를 하나씩
+    저장해서 문제가 있는 결과만 실패로 처리한다.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = GAME_RESULT_FLUSH_SECONDS,
+        batch_size: int = GAME_RESULT_BATCH_SIZE,
+        retry_cnt: int = GAME_RESULT_RETRY_CNT,
+        retry_interval: float = GAME_RESULT_RETRY_SECONDS,
+    ):
+        self.flush_interval: float = flush_interval
+        self.batch_size: int = batch_size
+        self.retry_cnt: int = retry_cnt
+        self.retry_interval: float = retry_interval
+        self.__pending: list[tuple[GameResult, Optional[OnSaved], asyncio.Future]] = []
+        self.__task: Optional[asyncio.Task] = None
+
+    def submit(
+        self, result: GameResult, on_saved: Optional[OnSaved] = None
+    ) -> asyncio.Future:
+        """
+        게임 결과를 저장 대기 목록에 추가하는 함수
+        Args:
+            result: 저장할 게임 결과
+            on_saved: 저장이 끝나면 성공 여부를 받는 코루틴 함수
+
+        Returns:
+            asyncio.Future: 저장이 끝나면 성공 여부가 담기는 future
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.__pending.append((result, on_saved, future))
+        if (
+            self.__task is None
+            or self.__task.done()
+            or self.__task.get_loop() is not loop
+        ):
+            self.__task = loop.create_task(self.__run())
+        return future
+
+    def get_pending_cnt(self) -> int:
+        return len(self.__pending)
+
+    async def __run(self) -> None:
+        while self.__pending:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self) -> int:
+        """
+        쌓인 결과를 batch_size개씩 저장하고 성공 여부를 알리는 함수
+        Returns:
+            int: 저장에 성공한 결과 수
+        """
+        saved_cnt = 0
+        while self.__pending:
+            batch = self.__pending[: self.batch_size]
+            del self.__pending[: self.batch_size]
+            saved = await self.__write_with_retry([result for result, _, _ in batch])
+            callbacks = []
+            for (_, on_saved, future), is_saved in zip(batch, saved):
+                if not future.done():
+                    future.set_result(is_saved)
+                if on_saved is not None:
+                    callbacks.append(on_saved(is_saved))
+            for error in await asyncio.gather(*callbacks, return_exceptions=True):
+                if isinstance(error, Exception):
+                    logger.error("game result callback failed", exc_info=error)
+            saved_cnt += sum(saved)
+        return saved_cnt
+
+    async def __write_with_retry(self, results: list[GameResult]) -> list[bool]:
+        for attempt in range(self.retry_cnt + 1):
+            try:
+                return await database_sync_to_async(self.write_batch)(results)
+            except OperationalError:
+                if attempt == self.retry_cnt:
+                    logger.exception("failed to save %d game results", len(results))
+                    return [False] * len(results)
+                logger.warning("retry saving game results: attempt %d", attempt + 1)
+                await asyncio.sleep(self.retry_interval * (attempt + 1))
+
+    def write_batch(self, results: list[GameResult]) -> list[bool]:
+        """
+        게임 결과들을 한 트랜잭션으로 저장하는 함수
+        Args:
+            results: 저장할 게임 결과
+
+        Returns:
+            list[bool]: 결과별 저장 성공 여부
+
+        Raises:
+            OperationalError: 다시 시도할 수 있는 DB 오류
+        """
+        try:
+            with transaction.atomic():
+                save_game_results(results)
+            return [True] * len(results)
+        except OperationalError:
+            raise
+        except (DatabaseError, ValidationError):
+            if len(results) == 1:
+                logger.exception("invalid game result")
+                return [False]
+        # 결과 하나의 오류로 배치 전체가 실패하지 않도록 하나씩 저장
+        return [self.write_batch([result])[0] for result in results]
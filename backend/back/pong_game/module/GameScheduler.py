@@ -0,0 +1,199 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional
+
+from .GameSetValue import GAME_TICK_RATE, MAX_CATCH_UP_TICK_CNT
+
+logger = logging.getLogger(__name__)
+
+GameTick = Callable[[int], Awaitable[bool]]
+GameStep = Callable[[int], None]
+
+
+class TickStats:
+    """
+    게임 하나가 스케줄러에서 받은 틱과 지연된 프레임 수를 기록하는 클래스
+    """
+
+    def __init__(self):
+        self.tick_cnt: int = 0
+        self.step_cnt: int = 0
+        self.late_frame_cnt: int = 0
+        self.skipped_frame_cnt: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "tick_cnt": self.tick_cnt,
+            "step_cnt": self.step_cnt,
+            "late_frame_cnt": self.late_frame_cnt,
+            "skipped_frame_cnt": self.skipped_frame_cnt,
+        }
+
+
+class GameScheduler:
+    """
+    프로세스 안의 모든 게임을 하나의 루프에서 고정된 주기로 진행시키는 클래스
+
+    틱(메시지 전송)은 tick_rate, 물리 스텝은 step_rate 주기로 진행하며
+    매 틱마다 그 시각까지 진행되어야 할 스텝 수를 계산해서 전달한다.
+    틱이 늦게 실행되면 그동안 지나간 주기만큼 스텝 수가 늘어나므로
+    게임 속도는 부하와 상관없이 monotonic 시간에 맞춰 진행된다.
+    한 번에 따라잡는 양은 max_catch_up_tick_cnt 틱으로 제한하고 넘친 스텝은 버린다.
+    before_tick이 주어지면 게임별 틱보다 먼저 이번 틱의 스텝 수로 한 번 호출한다.
+    """
+
+    def __init__(
+        self,
+        tick_rate: int = GAME_TICK_RATE,
+        step_rate: Optional[int] = None,
+        max_catch_up_tick_cnt: int = MAX_CATCH_UP_TICK_CNT,
+        before_tick: Optional[GameStep] = None,
+    ):
+        self.__tick_rate: int = tick_rate
+        self.__step_rate: int = step_rate if step_rate else tick_rate
+        self.__interval: float = 1 / tick_rate
+        self.__max_catch_up_step_cnt: int = max(
+            max_catch_up_tick_cnt * self.__step_rate // tick_rate, 1
+        )
+        self.__before_tick: Optional[GameStep] = before_tick
+        self.__games: dict[str, GameTick] = {}
+        self.__tick_stats: dict[str, TickStats] = {}
+        self.__finish_callbacks: dict[str, Callable[[], None]] = {}
+        self.__task: Optional[asyncio.Task] = None
+
+    def register(
+        self,
+        game_id: str,
+        tick: GameTick,
+        on_finish: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        게임을 스케줄러에 등록하는 함수
+        Args:
+            game_id: 게임을 구분하는 키
+            tick: 매 틱마다 진행할 스텝 수를 받아 호출할 코루틴 함수,
+                True가 아닌 값을 반환하면 등록 해제
+            on_finish: 게임이 등록 해제될 때 호출할 함수
+
+        Returns:
+            None
+        """
+        self.__games[game_id] = tick
+        self.__tick_stats[game_id] = TickStats()
+        if on_finish is not None:
+            self.__finish_callbacks[game_id] = on_finish
+        else:
+            self.__finish_callbacks.pop(game_id, None)
+        if (
+            self.__task is None
+            or self.__task.done()
+            or self.__task.get_loop() is not asyncio.get_running_loop()
+        ):
+            self.__task = asyncio.create_task(self.__run())
+
+    def unregister(self, game_id: str) -> None:
+        """
+        게임을 스케줄러에서 제거하는 함수
+        Args:
+            game_id: 게임을 구분하는 키
+
+        Returns:
+            None
+        """
+        self.__games.pop(game_id, None)
+        tick_stats = self.__tick_stats.pop(game_id, None)
+        if tick_stats is not None:
+            logger.info("game %s tick stats: %s", game_id, tick_stats.to_dict())
+        on_finish = self.__finish_callbacks.pop(game_id, None)
+        if on_finish is not None:
+            on_finish()
+
+    async def stop(self) -> None:
+        """
+        틱 작업을 멈추고 등록된 모든 게임을 등록 해제하는 함수
+        Returns:
+            None
+        """
+        task, self.__task = self.__task, None
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        for game_id in list(self.__games):
+            self.unregister(game_id)
+
+    def is_registered(self, game_id: str) -> bool:
+        return game_id in self.__games
+
+    def get_game_cnt(self) -> int:
+        return len(self.__games)
+
+    def get_tick_stats(self, game_id: str) -> Optional[dict[str, int]]:
+        """
+        게임의 틱 통계를 반환하는 함수
+        Args:
+            game_id: 게임을 구분하는 키
+
+        Returns:
+            Optional[dict[str, int]]: 틱, 스텝, 늦은 프레임, 버린 프레임 수
+        """
+        tick_stats = self.__tick_stats.get(game_id)
+        return tick_stats.to_dict() if tick_stats else None
+
+    async def __run(self) -> None:
+        """
+        등록된 게임이 있는 동안 monotonic 기준 시각에 맞춰 틱을 실행하는 함수
+        Returns:
+            None
+        """
+        start_time = time.monotonic()
+        tick_no, step_no = 0, 0
+        while self.__games:
+            tick_no += 1
+            deadline = start_time + tick_no * self.__interval
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            # 기준 시각보다 늦게 깨어났다면 지나간 틱만큼 기준을 옮기고 스텝을 더 진행
+            lateness = max(time.monotonic() - deadline, 0)
+            tick_no += int(lateness // self.__interval)
+            is_late = lateness > self.__interval / 2
+            step_cnt = tick_no * self.__step_rate // self.__tick_rate - step_no
+            step_no += step_cnt
+            skipped_cnt = max(step_cnt - self.__max_catch_up_step_cnt, 0)
+            await self.__tick_all(step_cnt - skipped_cnt, is_late, skipped_cnt)
+
+    async def __tick_all(self, step_cnt: int, is_late: bool, skipped_cnt: int) -> None:
+        """
+        등록된 모든 게임의 틱을 한 번에 실행하는 함수
+        Args:
+            step_cnt: 이번 틱에 진행할 스텝 수
+            is_late: 이번 틱이 기준 시각보다 늦게 실행되었는지 여부
+            skipped_cnt: 따라잡기 제한을 넘어 버린 스텝 수
+
+        Returns:
+            None
+        """
+        if self.__before_tick is not None and step_cnt:
+            try:
+                self.__before_tick(step_cnt)
+            except Exception:
+                logger.exception("game step failed")
+
+        games = list(self.__games.items())
+        for game_id, _ in games:
+            tick_stats = self.__tick_stats[game_id]
+            tick_stats.tick_cnt += 1
+            tick_stats.step_cnt += step_cnt
+            tick_stats.late_frame_cnt += is_late
+            tick_stats.skipped_frame_cnt += skipped_cnt
+
+        results = await asyncio.gather(
+            *(tick(step_cnt) for _, tick in games), return_exceptions=True
+        )
+        for (game_id, tick), result in zip(games, results):
+            if isinstance(result, Exception):
+                logger.error("game tick failed: %s", game_id, exc_info=result)
+            if result is not True and self.__games.get(game_id) is tick:
+                self.unregister(game_id)
@@ -15,6 +15,56 @@ PADDLE_BOUNDARY: Final = FIELD_WIDTH // 2 - PADDLE_WIDTH // 2
 TOURNAMENT_PLAYER_MAX_CNT: Final = 4
 NOT_ALLOWED_TOURNAMENT_NAME: Final = "wait"
 MAX_TOURNAMENT_NAME_LENGTH: Final = 20
+# 속도 값들은 GAME_TICK_RATE 주기 한 틱 동안의 이동량
+GAME_TICK_RATE: Final = 30
+WAIT_BALL_TICK_CNT: Final = 60
+MAX_CATCH_UP_TICK_CNT: Final = 5
+MAX_SWEEP_COLLISION_CNT: Final = 4
+BINARY_FRAME_SUBPROTOCOL: Final = "pong.binary.v1"
+DELTA_FRAME_SUBPROTOCOL: Final = "pong.delta.v1"
+# delta 프레임은 KEYFRAME_TICK_CNT 틱마다 전체 값을 보내고, 확인받지 못한 프레임은
+# SNAPSHOT_HISTORY_SIZE개까지만 기억
+KEYFRAME_TICK_CNT: Final = 30
+SNAPSHOT_HISTORY_SIZE: Final = 64
+TRAJECTORY_FRAME_SUBPROTOCOL: Final = "pong.trajectory.v1"
+# trajectory 형식은 움직임이 바뀔 때 말고도 TRAJECTORY_SYNC_TICK_CNT 틱마다 보정용으로 전송
+TRAJECTORY_SYNC_TICK_CNT: Final = 30
+# binary 프레임의 좌표와 속도는 FRAME_QUANTIZE_SCALE을 곱해 int16으로 저장
+FRAME_QUANTIZE_SCALE: Final = 10
+# 게임 레지스트리의 소유권은 GAME_LEASE_SECONDS초 동안 유효하고
+# 진행 중인 게임은 GAME_LEASE_RENEW_SECONDS초마다 연장
+GAME_LEASE_SECONDS: Final = 30
+GAME_LEASE_RENEW_SECONDS: Final = 10
+# 워커는 WORKER_HEARTBEAT_SECONDS초마다 하트비트를 보내고
+# WORKER_TTL_SECONDS초 동안 하트비트가 없으면 링에서 빠짐
+WORKER_HEARTBEAT_SECONDS: Final = 2
+WORKER_TTL_SECONDS: Final = 6
+RING_VNODE_CNT: Final = 64
+# 토너먼트 저널은 TOURNAMENT_JOURNAL_FLUSH_SECONDS초 동안 모은 기록을 한 번에 저장하고
+# Redis stream은 대략 TOURNAMENT_JOURNAL_MAXLEN개의 기록만 유지
+TOURNAMENT_JOURNAL_FLUSH_SECONDS: Final = 0.05
+TOURNAMENT_JOURNAL_MAXLEN: Final = 10000
+# 매칭 대기열에서 한 번에 꺼내는 최대 짝 수
+MATCH_POP_MAX_PAIRS: Final = 16
+# 매칭은 MATCH_INTERVAL_SECONDS초마다 오래 기다린 MATCH_SCAN_LIMIT명까지 한 번에 처리하고,
+# 레이팅 차이가 MATCH_RATING_WINDOW 이내인 상대와 매칭하되 기다린 1초마다
+# MATCH_RATING_WINDOW_PER_SECOND씩 MATCH_RATING_WINDOW_MAX까지 넓힘
+MATCH_INTERVAL_SECONDS: Final = 0.5
+MATCH_RATING_WINDOW: Final = 100
+MATCH_RATING_WINDOW_PER_SECOND: Final = 25
+MATCH_RATING_WINDOW_MAX: Final = 2000
+MATCH_SCAN_LIMIT: Final = 256
+# 메모리 매칭 대기열의 레이팅 인덱스를 나누는 구간의 폭
+MATCH_RATING_BUCKET_SIZE: Final = 100
+# 일반 게임 한 판으로 바뀌는 Elo 레이팅의 최대 폭
+ELO_K_FACTOR: Final = 32
+# 게임 결과는 GAME_RESULT_FLUSH_SECONDS초 동안 모아 최대 GAME_RESULT_BATCH_SIZE개씩
+# 한 트랜잭션으로 저장하고, 일시적인 DB 오류는 GAME_RESULT_RETRY_SECONDS초 간격으로
+# GAME_RESULT_RETRY_CNT번까지 다시 시도
+GAME_RESULT_FLUSH_SECONDS: Final = 0.05
+GAME_RESULT_BATCH_SIZE: Final = 100
+GAME_RESULT_RETRY_CNT: Final = 3
+GAME_RESULT_RETRY_SECONDS: Final = 0.2
 
 
 class KeyboardInput(Enum):
@@ -29,6 +79,24 @@ class KeyboardInput(Enum):
     SPACE = "space"
 
 
+# 게임 진행 중 키 입력 메시지의 number와 input으로 받는 값
+KEY_INPUT_NUMBERS: Final = ("player1", "player2")
+KEY_INPUT_VALUES: Final = tuple(key_input.value for key_input in KeyboardInput) + (
+    "protego_maxima",
+)
+
+
+class FrameFormat(Enum):
+    """
+    게임 진행 프레임 전송 형식에 대한 Enum 클래스
+    """
+
+    JSON = "json"
+    BINARY = "binary"
+    DELTA = "delta"
+    TRAJECTORY = "trajectory"
+
+
 class PlayerStatus(Enum):
     """
     플레이어의 상태에 대한 Enum 클래스
@@ -71,6 +139,23 @@ class MessageType(Enum):
     COMPLETE = "complete"
     ERROR = "error"
     STAY = "stay"
+    ACK = "ack"
+    TRAJECTORY = "trajectory"
+    MIGRATE = "migrate"
+
+
+class JournalEvent(Enum):
+    """
+    토너먼트 저널에 기록하는 상태 변화에 대한 Enum 클래스
+    """
+
+    JOIN = "join"
+    LEAVE = "leave"
+    READY = "ready"
+    ROUND_START = "round_start"
+    ROUND_END = "round_end"
+    RESULT = "result"
+    REMOVE = "remove"
 
 
 class GameTimeType(Enum):
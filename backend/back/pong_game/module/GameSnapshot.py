@@ -0,0 +1,413 @@
+import struct
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Final, Optional
+
+from .GameSetValue import (
+    GameStatus,
+    KEY_INPUT_NUMBERS,
+    KEY_INPUT_VALUES,
+    PlayerStatus,
+    RoundNumber,
+    TournamentStatus,
+    TOURNAMENT_PLAYER_MAX_CNT,
+)
+
+# 버전(uint8), 종류(uint8), little endian 2 bytes
+SNAPSHOT_HEADER_STRUCT: Final = struct.Struct("<BB")
+SNAPSHOT_VERSION: Final = 2
+# 버전 2부터 플레이어의 user_id를 기록, 이전 버전도 읽을 수 있음
+SUPPORTED_SNAPSHOT_VERSIONS: Final = (1, 2)
+GENERAL_GAME_SNAPSHOT: Final = 1
+ROUND_SNAPSHOT: Final = 2
+TOURNAMENT_SNAPSHOT: Final = 3
+
+# 번호, 상태(uint8), 패들 x(double), 누르고 있는 키(uint8 비트)
+PLAYER_STRUCT: Final = struct.Struct("<BBdB")
+# x, z, vx, vz, paddle_correction(double)
+BALL_STRUCT: Final = struct.Struct("<5d")
+# 점수1, 점수2, 상태, 시간 존재 여부(uint8), 시작 시간, 끝 시간(int64 마이크로초),
+# 대기 틱(double), 틱 번호(uint32), 키 입력 수(uint16)
+GAME_STRUCT: Final = struct.Struct("<4BqqdIH")
+# 라운드 번호, 종료 여부(uint8)
+ROUND_STRUCT: Final = struct.Struct("<BB")
+# 참가자 수, 상태, 참가자 존재 여부, 라운드 존재 여부, 닉네임 수(uint8)
+TOURNAMENT_STRUCT: Final = struct.Struct("<5B")
+UINT8_STRUCT: Final = struct.Struct("<B")
+KEY_INPUT_PLAYERS: Final = ("", "player1", "player2")
+
+LEFT_KEY: Final = 1
+RIGHT_KEY: Final = 2
+HAS_START_TIME: Final = 1
+HAS_END_TIME: Final = 2
+EPOCH: Final = datetime(1970, 1, 1)
+MICROSECOND: Final = timedelta(microseconds=1)
+
+GAME_STATUSES: Final = list(GameStatus)
+PLAYER_STATUSES: Final = list(PlayerStatus)
+ROUND_NUMBERS: Final = list(RoundNumber)
+TOURNAMENT_STATUSES: Final = list(TournamentStatus)
+
+
+class SnapshotError(ValueError):
+    """
+    스냅샷의 버전이나 종류가 맞지 않거나 데이터가 잘린 경우 발생하는 예외
+    """
+
+
+def enum_index(members: list[Enum]) -> dict[str, int]:
+    return {member.value: idx for idx, member in enumerate(members)}
+
+
+GAME_STATUS_INDEX: Final = enum_index(GAME_STATUSES)
+PLAYER_STATUS_INDEX: Final = enum_index(PLAYER_STATUSES)
+ROUND_NUMBER_INDEX: Final = enum_index(ROUND_NUMBERS)
+TOURNAMENT_STATUS_INDEX: Final = enum_index(TOURNAMENT_STATUSES)
+
+
+def datetime_to_micro(value: Optional[str]) -> int:
+    if value is None:
+        return 0
+    return (datetime.fromisoformat(value) - EPOCH) // MICROSECOND
+
+
+def micro_to_datetime(value: int) -> str:
+    return (EPOCH + value * MICROSECOND).isoformat()
+
+
+def normalize_key_input(data) -> Optional[dict[str, str]]:
+    """
+    키 입력에서 number와 input만 남기는 함수
+    Args:
+        data: 클라이언트가 보낸 키 입력 메시지
+
+    Returns:
+        dict or None: {"number", "input"}, 올바르지 않은 입력이면 None
+    """
+    if not isinstance(data, dict):
+        return None
+    number, key_input = data.get("number"), data.get("input")
+    if number not in KEY_INPUT_NUMBERS or key_input not in KEY_INPUT_VALUES:
+        return None
+    return {"number": number, "input": key_input}
+
+
+class SnapshotWriter:
+    """
+    스냅샷 바이트를 순서대로 쌓는 클래스
+    """
+
+    def __init__(self, kind: int):
+        self.__buffer: bytearray = bytearray(
+            SNAPSHOT_HEADER_STRUCT.pack(SNAPSHOT_VERSION, kind)
+        )
+
+    def pack(self, packer: struct.Struct, *values) -> None:
+        self.__buffer += packer.pack(*values)
+
+    def pack_str(self, value: str) -> None:
+        """
+        길이(uint8)와 utf-8 바이트로 문자열을 기록하는 함수
+        Args:
+            value: 기록할 문자열, 255 bytes 이하
+
+        Returns:
+            None
+        """
+        data = value.encode("utf-8")
+        if len(data) > 0xFF:
+            raise SnapshotError(f"string too long for snapshot: {value[:20]}")
+        self.__buffer.append(len(data))
+        self.__buffer += data
+
+    def pack_player(self, state: dict) -> None:
+        paddle = state["paddle"]
+        self.pack(
+            PLAYER_STRUCT,
+            state["number"],
+            PLAYER_STATUS_INDEX[state["status"]],
+            paddle["x"],
+            (LEFT_KEY if paddle["left"] else 0) | (RIGHT_KEY if paddle["right"] else 0),
+        )
+        self.pack_str(state["intra_id"])
+        self.pack_str(state["nickname"])
+        self.pack_str(state.get("user_id") or "")
+
+    def pack_game(self, state: dict) -> None:
+        """
+        GeneralGame.get_state의 상태를 기록하는 함수
+        Args:
+            state: 게임 상태
+
+        Returns:
+            None
+        """
+        self.pack_player(state["player1"])
+        self.pack_player(state["player2"])
+        ball = state["ball"]
+        # 올바르지 않은 키 입력은 스냅샷 전체를 실패시키지 않고 빼고 기록
+        key_inputs = [
+            key_input
+            for key_input in map(normalize_key_input, state["key_inputs"])
+            if key_input is not None
+        ]
+        self.pack(
+            BALL_STRUCT,
+            ball["x"],
+            ball["z"],
+            ball["vx"],
+            ball["vz"],
+            ball["paddle_correction"],
+        )
+        time_flags = (HAS_START_TIME if state["start_time"] else 0) | (
+            HAS_END_TIME if state["end_time"] else 0
+        )
+        self.pack(
+            GAME_STRUCT,
+            state["score1"],
+            state["score2"],
+            GAME_STATUS_INDEX[state["status"]],
+            time_flags,
+            datetime_to_micro(state["start_time"]),
+            datetime_to_micro(state["end_time"]),
+            state["wait_ball_cnt"],
+            state["tick_no"] & 0xFFFFFFFF,
+            len(key_inputs),
+        )
+        for key_input in key_inputs:
+            self.pack(UINT8_STRUCT, KEY_INPUT_PLAYERS.index(key_input["number"]))
+            self.pack_str(key_input["input"])
+
+    def pack_round(self, state: dict) -> None:
+        self.pack_game(state)
+        self.pack(
+            ROUND_STRUCT,
+            ROUND_NUMBER_INDEX[state["round_number"]],
+            state["is_closed"],
+        )
+        self.pack_str(state["winner"])
+        self.pack_str(state["loser"])
+
+    def get_bytes(self) -> bytes:
+        return bytes(self.__buffer)
+
+
+class SnapshotReader:
+    """
+    SnapshotWriter로 만든 바이트를 같은 순서로 읽는 클래스
+    """
+
+    def __init__(self, data: bytes, kind: int):
+        self.__view: memoryview = memoryview(data)
+        self.__offset: int = 0
+        version, data_kind = self.unpack(SNAPSHOT_HEADER_STRUCT)
+        if version not in SUPPORTED_SNAPSHOT_VERSIONS:
+            raise SnapshotError(f"unsupported snapshot version: {version}")
+        self.__version: int = version
+        if data_kind != kind:
+            raise SnapshotError(f"unexpected snapshot kind: {data_kind}")
+
+    def unpack(self, packer: struct.Struct) -> tuple:
+        try:
+            values = packer.unpack_from(self.__view, self.__offset)
+        except struct.error as e:
+            raise SnapshotError("truncated snapshot") from e
+        self.__offset += packer.size
+        return values
+
+    def unpack_str(self) -> str:
+        (length,) = self.unpack(UINT8_STRUCT)
+        end = self.__offset + length
+        if end > len(self.__view):
+            raise SnapshotError("truncated snapshot")
+        value = str(self.__view[self.__offset : end], "utf-8")
+        self.__offset = end
+        return value
+
+    def unpack_player(self) -> dict:
+        number, status, paddle_x, keys = self.unpack(PLAYER_STRUCT)
+        intra_id, nickname = self.unpack_str(), self.unpack_str()
+        user_id = self.unpack_str() if self.__version >= 2 else ""
+        return {
+            "number": number,
+            "intra_id": intra_id,
+            "nickname": nickname,
+            "user_id": user_id if user_id else None,
+            "status": PLAYER_STATUSES[status].value,
+            "paddle": {
+                "x": paddle_x,
+                "left": bool(keys & LEFT_KEY),
+                "right": bool(keys & RIGHT_KEY),
+            },
+        }
+
+    def unpack_game(self) -> dict:
+        """
+        pack_game으로 기록한 게임 상태를 읽는 함수
+        Returns:
+            dict: GeneralGame.get_state와 같은 형식의 게임 상태
+        """
+        player1 = self.unpack_player()
+        player2 = self.unpack_player()
+        ball_x, ball_z, ball_vx, ball_vz, paddle_correction = self.unpack(BALL_STRUCT)
+        (
+            score1,
+            score2,
+            status,
+            time_flags,
+            start_time,
+            end_time,
+            wait_ball_cnt,
+            tick_no,
+            key_input_cnt,
+        ) = self.unpack(GAME_STRUCT)
+        key_inputs = []
+        for _ in range(key_input_cnt):
+            (number,) = self.unpack(UINT8_STRUCT)
+            key_inputs.append(
+                {"number": KEY_INPUT_PLAYERS[number], "input": self.unpack_str()}
+            )
+        return {
+            "player1": player1,
+            "player2": player2,
+            "score1": score1,
+            "score2": score2,
+            "status": GAME_STATUSES[status].value,
+            "start_time": (
+                micro_to_datetime(start_time) if time_flags & HAS_START_TIME else None
+            ),
+            "end_time": (
+                micro_to_datetime(end_time) if time_flags & HAS_END_TIME else None
+            ),
+            "ball": {
+                "x": ball_x,
+                "z": ball_z,
+                "vx": ball_vx,
+                "vz": ball_vz,
+                "paddle_correction": paddle_correction,
+            },
+            "wait_ball_cnt": wait_ball_cnt,
+            "tick_no": tick_no,
+            "key_inputs": key_inputs,
+        }
+
+    def unpack_round(self) -> dict:
+        state = self.unpack_game()
+        round_number, is_closed = self.unpack(ROUND_STRUCT)
+        state["round_number"] = ROUND_NUMBERS[round_number].value
+        state["is_closed"] = bool(is_closed)
+        state["winner"] = self.unpack_str()
+        state["loser"] = self.unpack_str()
+        return state
+
+    def check_end(self) -> None:
+        if self.__offset != len(self.__view):
+            raise SnapshotError("trailing bytes in snapshot")
+
+
+def pack_general_game(state: dict) -> bytes:
+    """
+    GeneralGame.get_state의 상태를 binary 스냅샷으로 만드는 함수
+    Args:
+        state: 게임 상태
+
+    Returns:
+        bytes: 버전과 종류 헤더가 붙은 스냅샷
+    """
+    writer = SnapshotWriter(GENERAL_GAME_SNAPSHOT)
+    writer.pack_game(state)
+    return writer.get_bytes()
+
+
+def unpack_general_game(data: bytes) -> dict:
+    """
+    binary 스냅샷을 GeneralGame.get_state와 같은 형식의 상태로 바꾸는 함수
+    Args:
+        data: pack_general_game으로 만든 스냅샷
+
+    Returns:
+        dict: 게임 상태
+    """
+    reader = SnapshotReader(data, GENERAL_GAME_SNAPSHOT)
+    state = reader.unpack_game()
+    reader.check_end()
+    return state
+
+
+def pack_round(state: dict) -> bytes:
+    writer = SnapshotWriter(ROUND_SNAPSHOT)
+    writer.pack_round(state)
+    return writer.get_bytes()
+
+
+def unpack_round(data: bytes) -> dict:
+    reader = SnapshotReader(data, ROUND_SNAPSHOT)
+    state = reader.unpack_round()
+    reader.check_end()
+    return state
+
+
+def pack_tournament(state: dict) -> bytes:
+    """
+    Tournament.get_state의 상태를 binary 스냅샷으로 만드는 함수,
+    비어 있는 참가자와 라운드는 존재 여부 비트로만 기록
+    Args:
+        state: 토너먼트 상태
+
+    Returns:
+        bytes: 버전과 종류 헤더가 붙은 스냅샷
+    """
+    writer = SnapshotWriter(TOURNAMENT_SNAPSHOT)
+    players, rounds = state["players"], state["rounds"]
+    writer.pack(
+        TOURNAMENT_STRUCT,
+        state["player_total_cnt"],
+        TOURNAMENT_STATUS_INDEX[state["status"]],
+        sum(1 << idx for idx, player in enumerate(players) if player),
+        sum(1 << idx for idx, round_state in enumerate(rounds) if round_state),
+        len(state["nickname_list"]),
+    )
+    writer.pack_str(state["tournament_name"])
+    for nickname in state["nickname_list"]:
+        writer.pack_str(nickname)
+    for player in players:
+        if player:
+            writer.pack_player(player)
+    for round_state in rounds:
+        if round_state:
+            writer.pack_round(round_state)
+    return writer.get_bytes()
+
+
+def unpack_tournament(data: bytes) -> dict:
+    """
+    binary 스냅샷을 Tournament.get_state와 같은 형식의 상태로 바꾸는 함수
+    Args:
+        data: pack_tournament로 만든 스냅샷
+
+    Returns:
+        dict: 토너먼트 상태
+    """
+    reader = SnapshotReader(data, TOURNAMENT_SNAPSHOT)
+    player_total_cnt, status, player_bits, round_bits, nickname_cnt = reader.unpack(
+        TOURNAMENT_STRUCT
+    )
+    tournament_name = reader.unpack_str()
+    nickname_list = [reader.unpack_str() for _ in range(nickname_cnt)]
+    players = [
+        reader.unpack_player() if player_bits & (1 << idx) else None
+        for idx in range(TOURNAMENT_PLAYER_MAX_CNT)
+    ]
+    rounds = [
+        reader.unpack_round() if round_bits & (1 << idx) else None
+        for idx in range(len(ROUND_NUMBERS))
+    ]
+    reader.check_end()
+    return {
+        "tournament_name": tournament_name,
+        "players": players,
+        "nickname_list": nickname_list,
+        "player_total_cnt": player_total_cnt,
+        "status": TOURNAMENT_STATUSES[status].value,
+        "rounds": rounds,
+    }
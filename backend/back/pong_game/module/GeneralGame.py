@@ -1,8 +1,18 @@
 import json
+import logging
+from collections import deque
 from datetime import datetime
 from typing import Optional
 from .Player import Player
 from .Ball import Ball
+from .Paddle import Paddle
+from .BatchPhysics import BatchPhysics
+from .GameFrame import pack_game_frame
+from .GameSnapshot import (
+    normalize_key_input,
+    pack_general_game,
+    unpack_general_game,
+)
 from .GameSetValue import (
     PlayerStatus,
     PADDLE_WIDTH,
@@ -10,8 +20,12 @@ from .GameSetValue import (
     GameTimeType,
     MAX_SCORE,
     GameStatus,
+    WAIT_BALL_TICK_CNT,
+    MAX_SWEEP_COLLISION_CNT,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class GeneralGame:
     """
@@ -27,6 +41,12 @@ class GeneralGame:
         self.__status: GameStatus = GameStatus.WAIT
         self.__start_time: Optional[datetime] = None
         self.__end_time: Optional[datetime] = None
+        self.__wait_ball_cnt: float = 0
+        self.__key_input_queue: deque[dict] = deque()
+        self.__physics: Optional[BatchPhysics] = None
+        self.__slot: int = -1
+        self.__tick_no: int = 0
+        self.__last_motion: Optional[tuple[float, ...]] = None
 
     def is_all_ready(self) -> bool:
         """
@@ -73,9 +93,10 @@ class GeneralGame:
             bool: 공이 플레이어1의 패들과 충돌했으면 True, 아니면 False
         """
         return (
-            self.__ball.position_z + self.__ball.radius
+            self.__ball.speed_z > 0
+            and self.__ball.position_z + self.__ball.radius
             >= self._player1.get_paddle().position_z
-            and self.__is_ball_aligned_with_paddle(1)
+            and self.__is_ball_aligned_with_paddle(1, self.__ball.position_x)
         )
 
     def __is_paddle2_collision(self) -> bool:
@@ -85,16 +106,18 @@ class GeneralGame:
             bool: 공이 플레이어2의 패들과 충돌했으면 True, 아니면 False
         """
         return (
-            self.__ball.position_z - self.__ball.radius
+            self.__ball.speed_z < 0
+            and self.__ball.position_z - self.__ball.radius
             <= self._player2.get_paddle().position_z
-            and self.__is_ball_aligned_with_paddle(2)
+            and self.__is_ball_aligned_with_paddle(2, self.__ball.position_x)
         )
 
-    def __is_ball_aligned_with_paddle(self, paddle_num: int) -> bool:
+    def __is_ball_aligned_with_paddle(self, paddle_num: int, ball_x: float) -> bool:
         """
         공이 패들과 정렬되어 있는지 확인하는 함수
         Args:
             paddle_num: 패들 번호
+            ball_x: 확인할 공의 x 좌표
 
         Returns:
             bool: 공이 패들과 정렬되어 있으면 True, 아니면 False
@@ -107,7 +130,7 @@ class GeneralGame:
         )
         return (
             paddle.position_x - half_paddle_width
-            < self.__ball.position_x
+            < ball_x
             < paddle.position_x + half_paddle_width
         )
 
@@ -119,14 +142,142 @@ class GeneralGame:
         """
         self.__ball.reset_position()
 
-    def key_input(self, text_data: json) -> None:
-        data = json.loads(text_data)
-        if data["input"] == "protego_maxima":
-            self.__ball.protego_maxima()
-        elif data["number"] == "player1":
-            self._player1.paddle_handler(data["input"])
-        elif data["number"] == "player2":
-            self._player2.paddle_handler(data["input"])
+    def start_wait_ball(self) -> None:
+        """
+        게임 시작 전이나 득점 후 공을 정지시키는 대기 틱을 설정하는 함수
+        Returns:
+            None
+        """
+        self.__wait_ball_cnt = WAIT_BALL_TICK_CNT
+        if self.__physics is not None:
+            self.__physics.set_wait_ball(self.__slot, WAIT_BALL_TICK_CNT)
+
+    def is_wait_ball(self) -> bool:
+        """
+        공이 정지해 있어야 하는 대기 시간인지 확인하는 함수
+        Returns:
+            bool: 대기 중이면 True, 아니면 False
+        """
+        if self.__physics is not None:
+            return self.__physics.get_wait_ball(self.__slot) > 0
+        return self.__wait_ball_cnt > 0
+
+    def attach_physics(self, physics: BatchPhysics) -> None:
+        """
+        공과 패들 상태를 BatchPhysics 슬롯으로 옮기는 함수,
+        이후 물리 스텝은 update_game 대신 BatchPhysics.step에서 모든 게임과 함께 진행됨
+        Args:
+            physics: 슬롯을 할당받을 BatchPhysics
+
+        Returns:
+            None
+        """
+        if self.__physics is not None:
+            return
+        self.__physics = physics
+        self.__slot = physics.attach(self)
+        self.__move_objects(
+            physics.get_ball(self.__slot),
+            physics.get_paddle(self.__slot, 1),
+            physics.get_paddle(self.__slot, 2),
+        )
+        physics.set_wait_ball(self.__slot, self.__wait_ball_cnt)
+        physics.set_playing(self.__slot, self.__status == GameStatus.PLAYING)
+
+    def detach_physics(self) -> None:
+        """
+        BatchPhysics 슬롯을 반환하고 공과 패들을 다시 게임이 직접 가지도록 하는 함수
+        Returns:
+            None
+        """
+        if self.__physics is None:
+            return
+        self.__wait_ball_cnt = self.__physics.get_wait_ball(self.__slot)
+        self.__move_objects(Ball(), Paddle(1), Paddle(2))
+        self.__physics.detach(self.__slot)
+        self.__physics = None
+        self.__slot = -1
+
+    def __move_objects(self, ball, paddle1, paddle2) -> None:
+        """
+        공과 패들을 현재 상태 그대로 새 객체로 옮기는 함수
+        Args:
+            ball: 새 공(Ball 또는 BallSlot)
+            paddle1: 플레이어1의 새 패들(Paddle 또는 PaddleSlot)
+            paddle2: 플레이어2의 새 패들(Paddle 또는 PaddleSlot)
+
+        Returns:
+            None
+        """
+        ball.set_state(self.__ball.get_state())
+        paddle1.set_state(self._player1.get_paddle().get_state())
+        paddle2.set_state(self._player2.get_paddle().get_state())
+        self.__ball = ball
+        self._player1.set_paddle(paddle1)
+        self._player2.set_paddle(paddle2)
+
+    def key_input(self, text_data: json) -> bool:
+        """
+        키 입력을 저장하는 함수, 저장된 입력은 다음 스텝이 시작될 때 적용됨
+        Args:
+            text_data: 클라이언트가 보낸 키 입력 json
+
+        Returns:
+            bool: 저장했으면 True, 올바르지 않은 입력이라 버렸으면 False
+        """
+        try:
+            data = normalize_key_input(json.loads(text_data))
+        except (TypeError, ValueError):
+            data = None
+        if data is None:
+            return False
+        self.__key_input_queue.append(data)
+        if self.__physics is not None:
+            self.__physics.add_key_input(self.__slot)
+        return True
+
+    def apply_key_input(self) -> None:
+        """
+        저장된 키 입력을 모두 적용하는 함수, 적용하지 못한 입력은 버림
+        Returns:
+            None
+        """
+        while self.__key_input_queue:
+            data = self.__key_input_queue.popleft()
+            try:
+                if data["input"] == "protego_maxima":
+                    self.__ball.protego_maxima()
+                elif data["number"] == "player1":
+                    self._player1.paddle_handler(data["input"])
+                elif data["number"] == "player2":
+                    self._player2.paddle_handler(data["input"])
+            except Exception:
+                logger.exception("key input failed: %s", data)
+
+    def update_game(self, step_cnt: int = 1, step_scale: float = 1) -> None:
+        """
+        물리 스텝을 진행하는 함수, 대기 시간에는 패들만 움직이고 득점하면 남은 스텝은 버림
+        Args:
+            step_cnt: 진행할 스텝 수
+            step_scale: GAME_TICK_RATE 한 틱 대비 한 스텝의 길이
+
+        Returns:
+            None
+        """
+        self.__tick_no += 1
+        if self.__physics is not None:
+            return
+        for _ in range(step_cnt):
+            self.apply_key_input()
+            self.__move_paddle(step_scale)
+            if self.__wait_ball_cnt > 0:
+                self.__wait_ball_cnt -= step_scale
+                continue
+            if self.__status != GameStatus.PLAYING:
+                break
+            self.__move_ball(step_scale)
+            if self.__status == GameStatus.SCORE:
+                break
 
     @staticmethod
     def build_ready_json(number: int, nickname: str) -> json:
@@ -147,6 +298,20 @@ class GeneralGame:
             }
         )
 
+    def build_migrate_json(self) -> json:
+        """
+        게임이 다른 워커로 옮겨졌으니 다시 접속하라는 migrate json을 만드는 함수
+        Returns:
+            json: migrate json
+        """
+        return json.dumps(
+            {
+                "message_type": MessageType.MIGRATE.value,
+                "player1_score": self._score1,
+                "player2_score": self._score2,
+            }
+        )
+
     def build_start_json(self) -> json:
         """
         start json을 만드는 함수
@@ -161,22 +326,15 @@ class GeneralGame:
             }
         )
 
-    def build_game_json(self, game_start: bool = True) -> json:
+    def build_game_json(self) -> json:
         """
-        game json을 만드는 함수
-        Args:
-            game_start: game이 이제 시작해서 공을 멈춰야 하는지 여부
-
+        현재 게임 상태로 game json을 만드는 함수
         Returns:
             json: game json
         """
-        self.__move_paddle()
-        if game_start:
-            self.__move_ball()
-        paddle1 = self._player1.get_paddle().position_x
-        paddle2 = self._player2.get_paddle().position_x
-        ball_x, ball_y, ball_z = self.__ball.get_position()
-        ball_vx, ball_vz = self.__ball.get_speed()
+        paddle1, paddle2, ball_x, ball_y, ball_z, ball_vx, ball_vz = (
+            self.get_frame_values()
+        )
         return json.dumps(
             {
                 "message_type": MessageType.PLAYING.value,
@@ -190,6 +348,88 @@ class GeneralGame:
             }
         )
 
+    def build_game_frame(self) -> bytes:
+        """
+        현재 게임 상태로 binary 프레임을 만드는 함수, 형식은 GameFrame.GAME_FRAME_STRUCT
+        Returns:
+            bytes: binary 프레임
+        """
+        return pack_game_frame(self.__tick_no, self.get_frame_values())
+
+    def get_frame_values(self) -> tuple[float, ...]:
+        """
+        게임 진행 프레임에 담을 값을 반환하는 함수
+        Returns:
+            tuple: paddle1, paddle2, ball_x, ball_y, ball_z, ball_vx, ball_vz
+        """
+        ball_x, ball_y, ball_z = self.__ball.get_position()
+        ball_vx, ball_vz = self.__ball.get_speed()
+        return (
+            self._player1.get_paddle().position_x,
+            self._player2.get_paddle().position_x,
+            ball_x,
+            ball_y,
+            ball_z,
+            ball_vx,
+            ball_vz,
+        )
+
+    def get_tick_no(self) -> int:
+        return self.__tick_no
+
+    def __get_motion(self) -> tuple[float, ...]:
+        """
+        패들과 공의 현재 속도를 반환하는 함수, 공이 멈춰 있는 동안 공의 속도는 0
+        Returns:
+            tuple: paddle1_vx, paddle2_vx, ball_vx, ball_vz
+        """
+        paddle1_vx = self._player1.get_paddle().velocity_x
+        paddle2_vx = self._player2.get_paddle().velocity_x
+        if self.__status != GameStatus.PLAYING or self.is_wait_ball():
+            return paddle1_vx, paddle2_vx, 0, 0
+        ball_vx, ball_vz = self.__ball.get_speed()
+        return paddle1_vx, paddle2_vx, ball_vx, ball_vz
+
+    def check_motion_changed(self) -> bool:
+        """
+        지난 호출 이후 패들이나 공의 속도가 바뀌었는지 확인하는 함수,
+        벽이나 패들에 맞거나 득점, protego_maxima, 키 입력이 있으면 바뀜
+        Returns:
+            bool: 바뀌었으면 True, 아니면 False
+        """
+        motion = self.__get_motion()
+        is_changed = motion != self.__last_motion
+        self.__last_motion = motion
+        return is_changed
+
+    def build_trajectory_json(self, is_sync: bool = False) -> json:
+        """
+        현재 위치와 속도로 trajectory json을 만드는 함수,
+        클라이언트는 다음 trajectory를 받을 때까지 이 속도로 위치를 계산함
+        Args:
+            is_sync: 움직임이 바뀌지 않았지만 보정을 위해 보내는 경우 True
+
+        Returns:
+            json: trajectory json
+        """
+        paddle1_vx, paddle2_vx, ball_vx, ball_vz = self.__get_motion()
+        ball_x, _, ball_z = self.__ball.get_position()
+        return json.dumps(
+            {
+                "message_type": MessageType.TRAJECTORY.value,
+                "tick": self.__tick_no,
+                "sync": is_sync,
+                "paddle1": self._player1.get_paddle().position_x,
+                "paddle2": self._player2.get_paddle().position_x,
+                "paddle1_vx": paddle1_vx,
+                "paddle2_vx": paddle2_vx,
+                "ball_x": ball_x,
+                "ball_z": ball_z,
+                "ball_vx": ball_vx,
+                "ball_vz": ball_vz,
+            }
+        )
+
     def build_score_json(self) -> json:
         """
         score json을 만드는 함수
@@ -227,7 +467,7 @@ class GeneralGame:
         Returns:
             json: error json
         """
-        self.__status = GameStatus.END
+        self.set_status(GameStatus.END)
         return json.dumps(
             {
                 "message_type": MessageType.ERROR.value,
@@ -262,36 +502,122 @@ class GeneralGame:
             }
         )
 
-    def __move_paddle(self) -> None:
+    def __move_paddle(self, step_scale: float) -> None:
         """
         패들을 움직이는 함수
+        Args:
+            step_scale: GAME_TICK_RATE 한 틱 대비 한 스텝의 길이
+
         Returns:
             None
         """
-        self._player1.get_paddle().move_handler(player_num=1)
-        self._player2.get_paddle().move_handler(player_num=2)
+        self._player1.get_paddle().move_handler(player_num=1, step_scale=step_scale)
+        self._player2.get_paddle().move_handler(player_num=2, step_scale=step_scale)
 
-    def __move_ball(self) -> None:
+    def __move_ball(self, step_scale: float) -> None:
         """
         공을 움직이는 함수
+        Args:
+            step_scale: GAME_TICK_RATE 한 틱 대비 한 스텝의 길이
+
         Returns:
             None
         """
-        self.__ball.update_ball_position()
+        is_paddle_hit = self.__sweep_ball(step_scale)
         if self.__is_past_paddle1():
-            self._score2 += 1
             self.__reset_position()
-            self.__status = GameStatus.SCORE
+            self.score_point(2)
         elif self.__is_past_paddle2():
-            self._score1 += 1
             self.__reset_position()
-            self.__status = GameStatus.SCORE
-        elif self.__ball.is_side_collision():
-            self.__ball.speed_x = self.__ball.speed_x * -1
-        elif self.__is_paddle1_collision():
-            self.__ball.hit_ball_back(self._player1.get_paddle().position_x)
-        elif self.__is_paddle2_collision():
-            self.__ball.hit_ball_back(self._player2.get_paddle().position_x)
+            self.score_point(1)
+        elif not is_paddle_hit:
+            # 패들 면을 지난 뒤 paddle_correction 범위 안에서 패들이 따라잡은 경우
+            if self.__is_paddle1_collision():
+                self.__ball.hit_ball_back(self._player1.get_paddle().position_x)
+            elif self.__is_paddle2_collision():
+                self.__ball.hit_ball_back(self._player2.get_paddle().position_x)
+
+    def __sweep_ball(self, step_scale: float) -> bool:
+        """
+        공이 한 스텝 동안 지나가는 선분을 따라 벽과 패들 면에 처음 닿는 시점을 구해서
+        그 지점에서 반사시키고 남은 시간만큼 다시 움직이는 함수,
+        속도가 커도 공이 패들이나 벽을 뚫고 지나가지 않음
+        Args:
+            step_scale: GAME_TICK_RATE 한 틱 대비 한 스텝의 길이
+
+        Returns:
+            bool: 이번 스텝에 패들에 맞았으면 True, 아니면 False
+        """
+        ball = self.__ball
+        remain, is_paddle_hit = 1.0, False
+        for _ in range(MAX_SWEEP_COLLISION_CNT):
+            distance_x = ball.speed_x * step_scale * remain
+            distance_z = ball.speed_z * step_scale * remain
+            side_time = ball.get_side_contact_time(distance_x)
+            paddle_contact = self.__get_paddle_contact(distance_x, distance_z)
+            if paddle_contact is not None and (
+                side_time is None or paddle_contact[0] <= side_time
+            ):
+                contact_time, paddle = paddle_contact
+                ball.move(distance_x * contact_time, distance_z * contact_time)
+                ball.hit_ball_back(paddle.position_x)
+                is_paddle_hit = True
+            elif side_time is not None:
+                contact_time = side_time
+                ball.move(distance_x * contact_time, distance_z * contact_time)
+                ball.speed_x = ball.speed_x * -1
+            else:
+                ball.move(distance_x, distance_z)
+                break
+            remain *= 1 - contact_time
+        return is_paddle_hit
+
+    def __get_paddle_contact(
+        self, distance_x: float, distance_z: float
+    ) -> Optional[tuple[float, Paddle]]:
+        """
+        공이 이번 이동에서 다가가는 쪽 패들 면을 지날 때 패들에 맞는지 확인하는 함수
+        Args:
+            distance_x: 이번에 움직일 x 방향 거리
+            distance_z: 이번에 움직일 z 방향 거리
+
+        Returns:
+            Optional[tuple[float, Paddle]]: 이동 구간 중 닿는 비율(0~1)과 패들, 맞지 않으면 None
+        """
+        ball = self.__ball
+        if distance_z > 0:
+            paddle_num, paddle = 1, self._player1.get_paddle()
+            plane_z = paddle.position_z - ball.radius
+            if not ball.position_z < plane_z <= ball.position_z + distance_z:
+                return None
+        elif distance_z < 0:
+            paddle_num, paddle = 2, self._player2.get_paddle()
+            plane_z = paddle.position_z + ball.radius
+            if not ball.position_z + distance_z <= plane_z < ball.position_z:
+                return None
+        else:
+            return None
+        contact_time = (plane_z - ball.position_z) / distance_z
+        if not self.__is_ball_aligned_with_paddle(
+            paddle_num, ball.position_x + distance_x * contact_time
+        ):
+            return None
+        return contact_time, paddle
+
+    def score_point(self, player_num: int) -> None:
+        """
+        득점한 플레이어의 점수를 올리고 게임 상태를 득점으로 바꾸는 함수
+        Args:
+            player_num: 득점한 플레이어 번호
+
+        Returns:
+            None
+        """
+        if player_num == 1:
+            self._score1 += 1
+        else:
+            self._score2 += 1
+        self.set_status(GameStatus.SCORE)
 
     def get_player(self, intra_id: str) -> Optional[tuple[Player, int]]:
         """
@@ -308,6 +634,14 @@ class GeneralGame:
             return self._player2, 2
         return None
 
+    def get_intra_ids(self) -> tuple[str, str]:
+        """
+        플레이어들의 intra_id를 반환하는 함수
+        Returns:
+            tuple[str, str]: player1, player2의 intra_id
+        """
+        return self._player1.get_intra_id(), self._player2.get_intra_id()
+
     def get_status(self) -> GameStatus:
         """
         게임의 상태를 반환하는 함수
@@ -379,10 +713,116 @@ class GeneralGame:
             "end_time": self.__end_time,
             "player1_intra_id": self._player1.get_intra_id(),
             "player2_intra_id": self._player2.get_intra_id(),
+            "player1_user_id": self._player1.get_user_id(),
+            "player2_user_id": self._player2.get_user_id(),
             "player1_score": self._score1,
             "player2_score": self._score2,
         }
 
+    def get_state(self) -> dict:
+        """
+        다른 워커로 옮길 수 있도록 게임 상태를 딕셔너리로 반환하는 함수
+        Returns:
+            dict: 플레이어, 점수, 상태, 시간, 공, 대기 틱, 틱 번호, 처리하지 않은 키 입력
+        """
+        return {
+            "player1": self._player1.get_state(),
+            "player2": self._player2.get_state(),
+            "score1": self._score1,
+            "score2": self._score2,
+            "status": self.__status.value,
+            "start_time": (
+                self.__start_time.isoformat() if self.__start_time else None
+            ),
+            "end_time": self.__end_time.isoformat() if self.__end_time else None,
+            "ball": self.__ball.get_state(),
+            "wait_ball_cnt": (
+                self.__physics.get_wait_ball(self.__slot)
+                if self.__physics is not None
+                else self.__wait_ball_cnt
+            ),
+            "tick_no": self.__tick_no,
+            "key_inputs": list(self.__key_input_queue),
+        }
+
+    def set_state(self, state: dict) -> None:
+        """
+        get_state로 만든 상태로 게임을 되돌리는 함수, 플레이어는 from_state에서 만듦
+        Args:
+            state: 게임 상태
+
+        Returns:
+            None
+        """
+        self._score1 = state["score1"]
+        self._score2 = state["score2"]
+        self.set_status(GameStatus(state["status"]))
+        self.__start_time = (
+            datetime.fromisoformat(state["start_time"]) if state["start_time"] else None
+        )
+        self.__end_time = (
+            datetime.fromisoformat(state["end_time"]) if state["end_time"] else None
+        )
+        self.__ball.set_state(state["ball"])
+        self.__wait_ball_cnt = state["wait_ball_cnt"]
+        if self.__physics is not None:
+            self.__physics.set_wait_ball(self.__slot, self.__wait_ball_cnt)
+        self.__tick_no = state["tick_no"]
+        self.__key_input_queue = deque(
+            data
+            for data in map(normalize_key_input, state["key_inputs"])
+            if data is not None
+        )
+
+    def prepare_resume(self) -> None:
+        """
+        다른 워커에서 옮겨온 게임을 플레이어가 다시 준비할 때까지 대기 상태로 만드는 함수,
+        점수와 시작 시간은 그대로 두므로 다시 시작하면 이어서 진행
+        Returns:
+            None
+        """
+        if self.__status != GameStatus.PLAYING:
+            return
+        self.set_status(GameStatus.WAIT)
+        self._player1.set_status(PlayerStatus.WAIT)
+        self._player2.set_status(PlayerStatus.WAIT)
+
+    @classmethod
+    def from_state(cls, state: dict) -> "GeneralGame":
+        """
+        get_state로 만든 상태로 게임을 만드는 함수
+        Args:
+            state: 게임 상태
+
+        Returns:
+            GeneralGame: 복원된 게임
+        """
+        game = cls(
+            Player.from_state(state["player1"]), Player.from_state(state["player2"])
+        )
+        game.set_state(state)
+        return game
+
+    def build_snapshot(self) -> bytes:
+        """
+        게임 상태를 버전이 붙은 binary 스냅샷으로 만드는 함수
+        Returns:
+            bytes: 스냅샷
+        """
+        return pack_general_game(self.get_state())
+
+    @classmethod
+    def from_snapshot(cls, data: bytes) -> "GeneralGame":
+        """
+        build_snapshot으로 만든 스냅샷으로 게임을 만드는 함수
+        Args:
+            data: 스냅샷
+
+        Returns:
+            GeneralGame: 복원된 게임
+        """
+        return cls.from_state(unpack_general_game(data))
+
     def get_winner_loser_intra_id(self) -> tuple[Optional[str], Optional[str]]:
         """
         승자와 패자의 intra_id를 반환하는 함수
@@ -396,22 +836,28 @@ class GeneralGame:
         else:
             return None, None
 
-    def set_player(self, player_intra_id: str, player_nickname: str) -> None:
+    def set_player(
+        self,
+        player_intra_id: str,
+        player_nickname: str,
+        player_user_id: Optional[str] = None,
+    ) -> None:
         """
         플레이어를 설정하는 함수
         Args:
             player_intra_id: 플레이어의 intra_id
             player_nickname: 플레이어의 닉네임
+            player_user_id: 플레이어의 user_id
 
         Returns:
             None
         """
         if self._player1 is None:
-            self._player1 = Player(1, player_intra_id, player_nickname)
+            self._player1 = Player(1, player_intra_id, player_nickname, player_user_id)
             return
 
         if self._player2 is None:
-            self._player2 = Player(2, player_intra_id, player_nickname)
+            self._player2 = Player(2, player_intra_id, player_nickname, player_user_id)
             return
 
     def set_ready(self, number: str) -> None:
@@ -438,3 +884,5 @@ class GeneralGame:
             None
         """
         self.__status = status
+        if self.__physics is not None:
+            self.__physics.set_playing(self.__slot, status == GameStatus.PLAYING)
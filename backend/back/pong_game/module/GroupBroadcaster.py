@@ -0,0 +1,91 @@
+import logging
+from typing import Awaitable, Callable, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+Send = Callable[[dict], Awaitable[None]]
+
+
+class GroupBroadcaster:
+    """
+    같은 프로세스에 있는 그룹 멤버에게 채널 레이어를 거치지 않고 메시지를 보내는 클래스
+
+    멤버는 받을 메시지의 종류(key)와 함께 등록하고, broadcast는 key마다 한 번 만든
+    이벤트를 같은 key의 멤버 모두에게 그대로 전달한다.
+    보통 send는 컨슈머의 base_send이고 이벤트는 미리 만든 websocket.send 이벤트이다.
+    """
+
+    def __init__(self):
+        self.__groups: dict[str, dict[str, tuple[Hashable, Send]]] = {}
+
+    def add(
+        self, group: str, channel_name: str, send: Send, key: Hashable = None
+    ) -> None:
+        """
+        그룹에 멤버를 추가하는 함수
+        Args:
+            group: 그룹 이름
+            channel_name: 멤버의 채널 이름
+            send: 이벤트를 받을 코루틴 함수
+            key: 멤버가 받을 메시지 종류
+
+        Returns:
+            None
+        """
+        self.__groups.setdefault(group, {})[channel_name] = (key, send)
+
+    def discard(self, group: str, channel_name: str) -> None:
+        """
+        그룹에서 멤버를 제거하는 함수
+        Args:
+            group: 그룹 이름
+            channel_name: 멤버의 채널 이름
+
+        Returns:
+            None
+        """
+        members = self.__groups.get(group)
+        if members is None:
+            return
+        members.pop(channel_name, None)
+        if not members:
+            self.__groups.pop(group)
+
+    def get_member_cnt(self, group: str) -> int:
+        return len(self.__groups.get(group, {}))
+
+    def get_keys(self, group: str) -> set[Hashable]:
+        """
+        그룹 멤버들이 받는 메시지 종류를 반환하는 함수
+        Args:
+            group: 그룹 이름
+
+        Returns:
+            set: 메시지 종류
+        """
+        return {key for key, _ in self.__groups.get(group, {}).values()}
+
+    async def broadcast(
+        self, group: str, events: dict[Hashable, Optional[dict]]
+    ) -> int:
+        """
+        그룹 멤버에게 각자의 key에 해당하는 이벤트를 보내는 함수,
+        이벤트가 없는 key의 멤버에게는 보내지 않음
+        Args:
+            group: 그룹 이름
+            events: key별로 미리 만든 이벤트
+
+        Returns:
+            int: 보낸 멤버 수
+        """
+        sent_cnt = 0
+        for channel_name, (key, send) in list(self.__groups.get(group, {}).items()):
+            event = events.get(key)
+            if event is None:
+                continue
+            try:
+                await send(event)
+                sent_cnt += 1
+            except Exception:
+                logger.exception("broadcast to %s failed", channel_name)
+        return sent_cnt
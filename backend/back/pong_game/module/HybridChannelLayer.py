@@ -0,0 +1,115 @@
+import time
+
+from channels_redis.core import RedisChannelLayer
+
+
+class HybridChannelLayer(RedisChannelLayer):
+    """
+    그룹 멤버가 모두 이 프로세스에 있으면 Redis를 거치지 않고 메시지를 전달하는 채널 레이어
+
+    그룹 멤버십은 항상 Redis에도 기록하므로 다른 프로세스의 group_send는 그대로 동작한다.
+    group_send는 Redis에 기록된 멤버가 모두 이 프로세스의 채널일 때만 수신 버퍼에 직접 넣고,
+    다른 프로세스의 멤버가 하나라도 있으면 기존 Redis 경로로 보낸다.
+    멤버 확인은 보낼 때마다 Redis의 멤버 수(ZCOUNT)만 세므로, 다른 프로세스에서
+    방금 들어온 멤버도 다음 메시지부터 받는다.
+    직접 넣을 때도 Redis 경로처럼 group_expiry가 지난 멤버는 빼고, 연결이 끊겨
+    discard_channel로 빠진 채널에는 넣지 않는다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 그룹별 로컬 멤버와 group_add된 시각
+        self.__local_groups: dict[str, dict[str, float]] = {}
+
+    def is_local_channel(self, channel: str) -> bool:
+        return "!" in channel and self.non_local_name(channel).endswith(
+            self.client_prefix + "!"
+        )
+
+    def get_local_members(self, group: str) -> set[str]:
+        return set(self.__local_groups.get(group, ()))
+
+    async def group_add(self, group: str, channel: str) -> None:
+        await super().group_add(group, channel)
+        if self.is_local_channel(channel):
+            self.__local_groups.setdefault(group, {})[channel] = time.time()
+
+    async def group_discard(self, group: str, channel: str) -> None:
+        await super().group_discard(group, channel)
+        self.__discard_local(group, channel)
+
+    async def discard_channel(self, channel: str) -> None:
+        """
+        연결이 끊긴 채널을 이 프로세스에서 group_add한 모든 그룹에서 빼는 함수
+        Args:
+            channel: 연결이 끊긴 채널 이름
+
+        Returns:
+            None
+        """
+        for group in [
+            group
+            for group, members in self.__local_groups.items()
+            if channel in members
+        ]:
+            await self.group_discard(group, channel)
+
+    def __discard_local(self, group: str, channel: str) -> None:
+        members = self.__local_groups.get(group)
+        if members is not None:
+            members.pop(channel, None)
+            if not members:
+                self.__local_groups.pop(group)
+
+    def __get_live_members(self, group: str) -> set[str]:
+        """
+        group_expiry가 지난 로컬 멤버를 빼고 남은 멤버를 반환하는 함수
+        Args:
+            group: 그룹 이름
+
+        Returns:
+            set[str]: 아직 유효한 로컬 멤버
+        """
+        members = self.__local_groups.get(group, {})
+        expired_at = time.time() - self.group_expiry
+        for channel in [c for c, added_at in members.items() if added_at < expired_at]:
+            self.__discard_local(group, channel)
+        return set(self.__local_groups.get(group, ()))
+
+    async def group_send(self, group: str, message: dict) -> None:
+        """
+        그룹 멤버가 모두 로컬이면 각 채널의 수신 버퍼에 메시지를 직접 넣는 함수,
+        아니면 Redis로 보냄
+        Args:
+            group: 그룹 이름
+            message: 보낼 메시지
+
+        Returns:
+            None
+        """
+        assert self.valid_group_name(group), "Group name not valid"
+        members = self.__get_live_members(group)
+        if not members or not await self.__is_local_group(group, members):
+            await super().group_send(group, message)
+            return
+        for channel in members:
+            # Redis 경로처럼 채널마다 별도의 메시지를 받도록 복사
+            self.receive_buffer[channel].put_nowait(dict(message))
+
+    async def __is_local_group(self, group: str, members: set[str]) -> bool:
+        """
+        Redis에 기록된 그룹 멤버가 모두 이 프로세스의 채널인지 확인하는 함수,
+        로컬 멤버는 모두 Redis에도 기록되므로 Redis의 멤버 수가 같으면 모두 로컬
+        Args:
+            group: 그룹 이름
+            members: 이 프로세스에 있는 그룹 멤버
+
+        Returns:
+            bool: 멤버가 모두 로컬이면 True
+        """
+        connection = self.connection(self.consistent_hash(group))
+        # Redis 경로가 group_send에서 지우는 group_expiry가 지난 멤버는 제외
+        member_cnt = await connection.zcount(
+            self._group_key(group), f"({int(time.time()) - self.group_expiry}", "+inf"
+        )
+        return member_cnt == len(members)
@@ -0,0 +1,437 @@
+import asyncio
+import json
+import logging
+import time
+from typing import Awaitable, Callable, Optional
+
+from redis import asyncio as aioredis
+
+from .GameSetValue import (
+    MATCH_INTERVAL_SECONDS,
+    MATCH_POP_MAX_PAIRS,
+    MATCH_RATING_WINDOW,
+    MATCH_RATING_WINDOW_MAX,
+    MATCH_RATING_WINDOW_PER_SECOND,
+    MATCH_SCAN_LIMIT,
+    WORKER_TTL_SECONDS,
+)
+from .MatchQueue import MatchQueue, MatchStats
+
+logger = logging.getLogger(__name__)
+
+
+class MatchTicket:
+    """
+    매칭 대기열에 기록되는 대기자 정보, 매칭 결과를 받을 채널과 대기자가 접속한 워커
+    """
+
+    def __init__(
+        self,
+        intra_id: str,
+        nickname: str,
+        channel_name: str,
+        owner: str,
+        rating: int = 0,
+        enqueue_time: Optional[float] = None,
+        user_id: Optional[str] = None,
+    ):
+        self.intra_id: str = intra_id
+        self.nickname: str = nickname
+        self.channel_name: str = channel_name
+        self.owner: str = owner
+        self.rating: int = rating
+        self.user_id: Optional[str] = user_id
+        self.enqueue_time: float = enqueue_time if enqueue_time else time.time()
+
+    def to_dict(self) -> dict:
+        return {
+            "intra_id": self.intra_id,
+            "nickname": self.nickname,
+            "channel_name": self.channel_name,
+            "owner": self.owner,
+            "rating": self.rating,
+            "enqueue_time": self.enqueue_time,
+            "user_id": self.user_id,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "MatchTicket":
+        return cls(
+            intra_id=data["intra_id"],
+            nickname=data["nickname"],
+            channel_name=data["channel_name"],
+            owner=data["owner"],
+            rating=data["rating"],
+            enqueue_time=data["enqueue_time"],
+            user_id=data.get("user_id"),
+        )
+
+
+class MatchMaker:
+    """
+    일반 게임 매칭 대기열의 기본 클래스
+
+    짝은 MatchLoop가 주기적으로 pop_pairs를 호출해서 한 번에 만든다.
+    """
+
+    async def push(self, ticket: MatchTicket) -> bool:
+        """
+        대기열 끝에 대기자를 추가하는 함수
+        Args:
+            ticket: 대기자 정보
+
+        Returns:
+            bool: 추가되면 True, 같은 유저가 이미 대기 중이면 False
+        """
+        raise NotImplementedError
+
+    async def cancel(self, ticket: MatchTicket) -> bool:
+        """
+        대기자를 대기열에서 빼는 함수, 같은 유저가 다시 접속한 대기자는 빼지 않음
+        Args:
+            ticket: 대기자 정보
+
+        Returns:
+            bool: 뺐으면 True
+        """
+        raise NotImplementedError
+
+    async def pop_pairs(self) -> list[tuple[MatchTicket, MatchTicket]]:
+        """
+        오래 기다린 대기자부터 기다린 시간만큼 넓어진 레이팅 차이 안의
+        가장 가까운 상대와 짝지어 꺼내는 함수
+        Returns:
+            list[tuple[MatchTicket, MatchTicket]]: 짝 목록
+        """
+        raise NotImplementedError
+
+    async def get_depth(self) -> int:
+        raise NotImplementedError
+
+    async def get_stats(self) -> dict[str, float]:
+        raise NotImplementedError
+
+    async def clear(self) -> None:
+        """
+        대기열을 비우는 함수, 테스트 사이에 상태를 초기화할 때 사용
+        Returns:
+            None
+        """
+        raise NotImplementedError
+
+
+class InMemoryMatchMaker(MatchMaker):
+    """
+    프로세스 안에서만 매칭하는 대기열, 단일 레플리카에서 사용
+    """
+
+    def __init__(
+        self, max_pairs: int = MATCH_POP_MAX_PAIRS, scan_limit: int = MATCH_SCAN_LIMIT
+    ):
+        self.__queue: MatchQueue[MatchTicket] = MatchQueue()
+        self.__max_pairs: int = max_pairs
+        self.__scan_limit: int = scan_limit
+
+    async def push(self, ticket: MatchTicket) -> bool:
+        return self.__queue.push(ticket.intra_id, ticket, ticket.rating)
+
+    async def cancel(self, ticket: MatchTicket) -> bool:
+        return self.__queue.cancel(ticket.intra_id, ticket)
+
+    async def pop_pairs(self) -> list[tuple[MatchTicket, MatchTicket]]:
+        return self.__queue.pop_pairs(self.__max_pairs, self.__scan_limit)
+
+    async def get_depth(self) -> int:
+        return len(self.__queue)
+
+    async def get_stats(self) -> dict[str, float]:
+        return self.__queue.get_stats()
+
+    async def clear(self) -> None:
+        self.__queue = MatchQueue()
+
+
+class RedisMatchMaker(MatchMaker):
+    """
+    Redis sorted set을 대기열로 사용해서 모든 레플리카의 대기자를 함께 매칭하는 대기열
+
+    들어온 순서(sorted set, 점수는 들어온 시각)와 레이팅 인덱스(sorted set, 점수는
+    레이팅)에 intra_id를, 대기자 정보(hash)에 MatchTicket을 기록한다.
+    추가, 취소, 짝 꺼내기는 Lua 스크립트로 한 번에 처리하고, 짝 꺼내기는 오래 기다린
+    scan_limit명만 살펴보면서 레이팅 인덱스의 범위 조회로 가장 가까운 상대를
+    O(log n)에 찾으므로 대기열이 길어도 스크립트가 Redis를 오래 막지 않는다.
+    하트비트가 끊긴 워커의 대기자는 추가나 꺼내기 도중에 버린다.
+    """
+
+    PUSH_SCRIPT = """
+        local old = redis.call('HGET', KEYS[3], ARGV[1])
+        if old then
+            local alive = redis.call('ZSCORE', KEYS[4], cjson.decode(old)['owner'])
+            if alive and tonumber(alive) >= tonumber(ARGV[5]) then
+                return 0
+            end
+        end
+        redis.call('ZADD', KEYS[1], ARGV[2], ARGV[1])
+        redis.call('ZADD', KEYS[2], ARGV[3], ARGV[1])
+        redis.call('HSET', KEYS[3], ARGV[1], ARGV[4])
+        return 1
+    """
+    CANCEL_SCRIPT = """
+        local ticket = redis.call('HGET', KEYS[3], ARGV[1])
+        if ticket and cjson.decode(ticket)['channel_name'] == ARGV[2] then
+            redis.call('ZREM', KEYS[1], ARGV[1])
+            redis.call('ZREM', KEYS[2], ARGV[1])
+            redis.call('HDEL', KEYS[3], ARGV[1])
+            return 1
+        end
+        return 0
+    """
+    POP_PAIRS_SCRIPT = """
+        local max_cnt = tonumber(ARGV[1]) * 2
+        local cutoff = tonumber(ARGV[2])
+        local now = tonumber(ARGV[3])
+
+        local function remove(intra_id)
+            redis.call('ZREM', KEYS[1], intra_id)
+            redis.call('ZREM', KEYS[2], intra_id)
+            redis.call('HDEL', KEYS[3], intra_id)
+        end
+
+        local function get_alive_ticket(intra_id)
+            local ticket = redis.call('HGET', KEYS[3], intra_id)
+            if not ticket then
+                return nil
+            end
+            local alive = redis.call('ZSCORE', KEYS[4], cjson.decode(ticket)['owner'])
+            if alive and tonumber(alive) >= cutoff then
+                return ticket
+            end
+            return nil
+        end
+
+        local function nearest(intra_id, rating, candidates, best, best_gap)
+            for i = 1, #candidates, 2 do
+                if candidates[i] ~= intra_id then
+                    local gap = math.abs(tonumber(candidates[i + 1]) - rating)
+                    if best == nil or gap < best_gap then
+                        return candidates[i], gap
+                    end
+                    break
+                end
+            end
+            return best, best_gap
+        end
+
+        local tickets = {}
+        local scan_limit = tonumber(ARGV[7])
+        for _, intra_id in ipairs(redis.call('ZRANGE', KEYS[1], 0, scan_limit - 1)) do
+            if #tickets >= max_cnt then
+                break
+            end
+            if redis.call('ZSCORE', KEYS[1], intra_id) then
+                local ticket = get_alive_ticket(intra_id)
+                if not ticket then
+                    remove(intra_id)
+                else
+                    local data = cjson.decode(ticket)
+                    local rating = tonumber(data['rating'])
+                    local window = math.min(
+                        tonumber(ARGV[4])
+                            + tonumber(ARGV[5]) * (now - data['enqueue_time']),
+                        tonumber(ARGV[6])
+                    )
+                    local best, best_gap = nearest(intra_id, rating, redis.call(
+                        'ZREVRANGEBYSCORE', KEYS[2], rating, rating - window,
+                        'WITHSCORES', 'LIMIT', 0, 2
+                    ))
+                    best, best_gap = nearest(intra_id, rating, redis.call(
+                        'ZRANGEBYSCORE', KEYS[2], rating, rating + window,
+                        'WITHSCORES', 'LIMIT', 0, 2
+                    ), best, best_gap)
+                    local opponent = best and get_alive_ticket(best)
+                    if opponent then
+                        remove(intra_id)
+                        remove(best)
+                        table.insert(tickets, ticket)
+                        table.insert(tickets, opponent)
+                    end
+                end
+            end
+        end
+        return tickets
+    """
+
+    def __init__(
+        self,
+        url: str,
+        prefix: str = "pong:",
+        worker_ttl: int = WORKER_TTL_SECONDS,
+        max_pairs: int = MATCH_POP_MAX_PAIRS,
+        scan_limit: int = MATCH_SCAN_LIMIT,
+    ):
+        self.__redis = aioredis.from_url(url, decode_responses=True)
+        self.__worker_ttl: int = worker_ttl
+        self.__max_pairs: int = max_pairs
+        self.__scan_limit: int = scan_limit
+        # RedisGameRegistry가 하트비트를 기록하는 워커 목록을 함께 사용
+        self.__keys: tuple[str, str, str, str] = (
+            prefix + "match_queue",
+            prefix + "match_ratings",
+            prefix + "match_tickets",
+            prefix + "workers",
+        )
+        # 이 워커가 꺼내거나 취소한 대기자의 통계
+        self.__stats: MatchStats = MatchStats()
+
+    async def push(self, ticket: MatchTicket) -> bool:
+        return bool(
+            await self.__redis.eval(
+                self.PUSH_SCRIPT,
+                len(self.__keys),
+                *self.__keys,
+                ticket.intra_id,
+                ticket.enqueue_time,
+                ticket.rating,
+                json.dumps(ticket.to_dict()),
+                time.time() - self.__worker_ttl,
+            )
+        )
+
+    async def cancel(self, ticket: MatchTicket) -> bool:
+        is_cancelled = bool(
+            await self.__redis.eval(
+                self.CANCEL_SCRIPT,
+                len(self.__keys),
+                *self.__keys,
+                ticket.intra_id,
+                ticket.channel_name,
+            )
+        )
+        if is_cancelled:
+            self.__stats.cancel_cnt += 1
+        return is_cancelled
+
+    async def pop_pairs(self) -> list[tuple[MatchTicket, MatchTicket]]:
+        popped = await self.__redis.eval(
+            self.POP_PAIRS_SCRIPT,
+            len(self.__keys),
+            *self.__keys,
+            self.__max_pairs,
+            time.time() - self.__worker_ttl,
+            time.time(),
+            MATCH_RATING_WINDOW,
+            MATCH_RATING_WINDOW_PER_SECOND,
+            MATCH_RATING_WINDOW_MAX,
+            self.__scan_limit,
+        )
+        tickets = [MatchTicket.from_dict(json.loads(data)) for data in popped]
+        now = time.time()
+        for ticket in tickets:
+            self.__stats.add_wait_time(now - ticket.enqueue_time)
+        return list(zip(tickets[::2], tickets[1::2]))
+
+    async def get_depth(self) -> int:
+        return await self.__redis.zcard(self.__keys[0])
+
+    async def get_stats(self) -> dict[str, float]:
+        queue_key = self.__keys[0]
+        async with self.__redis.pipeline(transaction=False) as pipe:
+            pipe.zcard(queue_key)
+            pipe.zrange(queue_key, 0, 0, withscores=True)
+            depth, oldest = await pipe.execute()
+        return {
+            "depth": depth,
+            "oldest_wait_time": time.time() - oldest[0][1] if oldest else 0,
+            **self.__stats.to_dict(),
+        }
+
+    async def clear(self) -> None:
+        # 워커 목록은 RedisGameRegistry가 관리
+        await self.__redis.delete(*self.__keys[:3])
+        self.__stats = MatchStats()
+
+
+class MatchLoop:
+    """
+    MATCH_INTERVAL_SECONDS초마다 매칭 대기열을 한 번에 매칭하는 백그라운드 작업
+
+    대기자가 들어올 때 wake로 시작되고, 대기자가 두 명보다 적어지면 끝났다가
+    다음 wake에서 다시 시작된다. 기다리는 동안 레이팅 차이가 넓어지므로
+    상대를 찾지 못한 대기자가 있어도 계속 돈다.
+    """
+
+    def __init__(
+        self,
+        match_maker: MatchMaker,
+        on_match: Callable[[MatchTicket, MatchTicket], Awaitable[None]],
+        interval: float = MATCH_INTERVAL_SECONDS,
+    ):
+        self.__match_maker: MatchMaker = match_maker
+        self.__on_match: Callable[[MatchTicket, MatchTicket], Awaitable[None]] = (
+            on_match
+        )
+        self.__interval: float = interval
+        self.__task: Optional[asyncio.Task] = None
+
+    def wake(self) -> None:
+        """
+        매칭 작업이 돌고 있지 않으면 시작하는 함수
+        Returns:
+            None
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self.__task is None
+            or self.__task.done()
+            or self.__task.get_loop() is not loop
+        ):
+            self.__task = loop.create_task(self.__run())
+
+    async def stop(self) -> None:
+        """
+        매칭 작업을 멈추는 함수, 다음 wake에서 다시 시작
+        Returns:
+            None
+        """
+        task, self.__task = self.__task, None
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def __run(self) -> None:
+        while True:
+            await asyncio.sleep(self.__interval)
+            try:
+                await self.match()
+                if await self.__match_maker.get_depth() < 2:
+                    return
+            except Exception:
+                logger.exception("match loop failed")
+
+    async def match(self) -> int:
+        """
+        대기열을 한 번 매칭하는 함수
+        Returns:
+            int: 만든 짝 수
+        """
+        pairs = await self.__match_maker.pop_pairs()
+        for ticket1, ticket2 in pairs:
+            await self.__on_match(ticket1, ticket2)
+        if pairs:
+            logger.info("match queue stats: %s", await self.__match_maker.get_stats())
+        return len(pairs)
+
+
+def create_match_maker(backend: str, url: str = "") -> MatchMaker:
+    """
+    설정에 맞는 매칭 대기열을 만드는 함수
+    Args:
+        backend: memory 또는 redis
+        url: redis 대기열이 사용할 Redis URL
+
+    Returns:
+        MatchMaker: 매칭 대기열
+    """
+    if backend == "redis":
+        return RedisMatchMaker(url)
+    return InMemoryMatchMaker()
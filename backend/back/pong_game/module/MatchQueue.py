@@ -0,0 +1,221 @@
+import bisect
+import itertools
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+from .GameSetValue import (
+    MATCH_RATING_BUCKET_SIZE,
+    MATCH_RATING_WINDOW,
+    MATCH_RATING_WINDOW_MAX,
+    MATCH_RATING_WINDOW_PER_SECOND,
+)
+
+T = TypeVar("T")
+
+
+def get_rating_window(
+    wait_time: float,
+    window: float = MATCH_RATING_WINDOW,
+    window_per_second: float = MATCH_RATING_WINDOW_PER_SECOND,
+    max_window: float = MATCH_RATING_WINDOW_MAX,
+) -> float:
+    """
+    기다린 시간만큼 넓어진, 매칭할 수 있는 레이팅 차이를 구하는 함수
+    Args:
+        wait_time: 대기열에서 기다린 초
+        window: 처음 매칭할 수 있는 레이팅 차이
+        window_per_second: 1초마다 넓어지는 레이팅 차이
+        max_window: 최대 레이팅 차이
+
+    Returns:
+        float: 매칭할 수 있는 레이팅 차이
+    """
+    return min(window + window_per_second * wait_time, max_window)
+
+
+class MatchStats:
+    """
+    매칭 대기열에서 매칭된 유저 수와 대기 시간을 기록하는 클래스
+    """
+
+    def __init__(self):
+        self.matched_cnt: int = 0
+        self.cancel_cnt: int = 0
+        self.total_wait_time: float = 0
+        self.max_wait_time: float = 0
+
+    def add_wait_time(self, wait_time: float) -> None:
+        self.matched_cnt += 1
+        self.total_wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+
+    def to_dict(self) -> dict[str, float]:
+        return {
+            "matched_cnt": self.matched_cnt,
+            "cancel_cnt": self.cancel_cnt,
+            "avg_wait_time": (
+                self.total_wait_time / self.matched_cnt if self.matched_cnt else 0
+            ),
+            "max_wait_time": self.max_wait_time,
+        }
+
+
+class MatchQueue(Generic[T]):
+    """
+    intra_id로 대기자를 찾고 레이팅이 가까운 상대를 찾는 매칭 대기열
+
+    OrderedDict가 키의 해시 인덱스와 들어온 순서를 관리하고, 레이팅 인덱스는
+    bucket_size 폭의 구간마다 정렬된 목록을 두어서 추가와 삭제가 구간 하나의 크기만큼만
+    걸린다. 가장 가까운 상대는 자기 구간에서 시작해 바깥 구간으로 넓혀가며 찾는다.
+    pop_pairs는 오래 기다린 대기자부터 기다린 시간만큼 넓어진 레이팅 차이 안의
+    상대와 매칭한다.
+    """
+
+    def __init__(self, bucket_size: float = MATCH_RATING_BUCKET_SIZE):
+        # 키별 (대기자, 들어온 monotonic 시각, 레이팅, 들어온 순번)
+        self.__entries: OrderedDict[Hashable, tuple[T, float, float, int]] = (
+            OrderedDict()
+        )
+        # 레이팅 구간별로 정렬된 (레이팅, 들어온 순번, 키), 빈 구간은 지움
+        self.__buckets: dict[int, list[tuple[float, int, Hashable]]] = {}
+        self.__bucket_size: float = bucket_size
+        self.__seq = itertools.count()
+        self.__stats: MatchStats = MatchStats()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.__entries
+
+    def push(self, key: Hashable, item: T, rating: float = 0) -> bool:
+        """
+        대기열 끝에 대기자를 추가하는 함수
+        Args:
+            key: 대기자의 intra_id
+            item: 대기자
+            rating: 대기자의 레이팅
+
+        Returns:
+            bool: 추가되면 True, 같은 키가 이미 대기 중이면 False
+        """
+        if key in self.__entries:
+            return False
+        seq = next(self.__seq)
+        self.__entries[key] = (item, time.monotonic(), rating, seq)
+        bisect.insort(
+            self.__buckets.setdefault(self.__get_bucket(rating), []),
+            (rating, seq, key),
+        )
+        return True
+
+    def __get_bucket(self, rating: float) -> int:
+        return int(rating // self.__bucket_size)
+
+    def __remove(self, key: Hashable) -> tuple[T, float]:
+        item, enqueue_time, rating, seq = self.__entries.pop(key)
+        bucket = self.__get_bucket(rating)
+        ratings = self.__buckets[bucket]
+        del ratings[bisect.bisect_left(ratings, (rating, seq))]
+        if not ratings:
+            del self.__buckets[bucket]
+        return item, enqueue_time
+
+    def __find_opponent(
+        self, rating: float, seq: int, window: float
+    ) -> Optional[Hashable]:
+        """
+        레이팅 순서에서 바로 양 옆의 대기자 중 레이팅 차이가 window 이내인 가장 가까운
+        상대를 찾는 함수, 양 옆은 자기 구간에서 시작해 바깥 구간으로 넓혀가며 찾음
+        """
+        bucket = self.__get_bucket(rating)
+        ratings = self.__buckets[bucket]
+        index = bisect.bisect_left(ratings, (rating, seq))
+        lower = ratings[index - 1] if index > 0 else None
+        upper = ratings[index + 1] if index + 1 < len(ratings) else None
+        # offset칸 떨어진 구간의 레이팅은 적어도 (offset - 1) * bucket_size만큼 차이남
+        offset = 1
+        while (lower is None or upper is None) and (
+            offset - 1
+        ) * self.__bucket_size <= window:
+            if lower is None and bucket - offset in self.__buckets:
+                lower = self.__buckets[bucket - offset][-1]
+            if upper is None and bucket + offset in self.__buckets:
+                upper = self.__buckets[bucket + offset][0]
+            offset += 1
+        best = min(
+            (candidate for candidate in (lower, upper) if candidate is not None),
+            key=lambda candidate: (abs(candidate[0] - rating), candidate[1]),
+            default=None,
+        )
+        if best is None or abs(best[0] - rating) > window:
+            return None
+        return best[2]
+
+    def cancel(self, key: Hashable, item: Optional[T] = None) -> bool:
+        """
+        대기자를 대기열에서 빼는 함수
+        Args:
+            key: 대기자의 intra_id
+            item: 주어지면 같은 대기자일 때만 뺌
+
+        Returns:
+            bool: 뺐으면 True
+        """
+        entry = self.__entries.get(key)
+        if entry is None or (item is not None and entry[0] is not item):
+            return False
+        self.__remove(key)
+        self.__stats.cancel_cnt += 1
+        return True
+
+    def pop_pairs(
+        self, max_pairs: Optional[int] = None, scan_limit: Optional[int] = None
+    ) -> list[tuple[T, T]]:
+        """
+        오래 기다린 대기자부터 레이팅 차이가 허용 범위 안인 가장 가까운 상대와 짝지어
+        꺼내는 함수, 상대를 찾지 못한 대기자는 대기열에 그대로 둠
+        Args:
+            max_pairs: 한 번에 꺼낼 최대 짝 수, None이면 제한 없음
+            scan_limit: 오래 기다린 순으로 살펴볼 최대 대기자 수, None이면 제한 없음
+
+        Returns:
+            list[tuple[T, T]]: (먼저 들어온 대기자, 상대) 목록
+        """
+        now = time.monotonic()
+        pairs = []
+        for key in list(itertools.islice(self.__entries, scan_limit)):
+            if max_pairs is not None and len(pairs) >= max_pairs:
+                break
+            if key not in self.__entries:
+                continue
+            _, enqueue_time, rating, seq = self.__entries[key]
+            opponent_key = self.__find_opponent(
+                rating, seq, get_rating_window(now - enqueue_time)
+            )
+            if opponent_key is None:
+                continue
+            pair = []
+            for matched_key in (key, opponent_key):
+                item, matched_time = self.__remove(matched_key)
+                self.__stats.add_wait_time(now - matched_time)
+                pair.append(item)
+            pairs.append((pair[0], pair[1]))
+        return pairs
+
+    def get_stats(self) -> dict[str, float]:
+        """
+        대기열 길이, 가장 오래 기다린 시간과 매칭 통계를 반환하는 함수
+        Returns:
+            dict: depth, oldest_wait_time과 MatchStats 값
+        """
+        oldest_wait_time = 0
+        if self.__entries:
+            _, enqueue_time, _, _ = next(iter(self.__entries.values()))
+            oldest_wait_time = time.monotonic() - enqueue_time
+        return {
+            "depth": len(self.__entries),
+            "oldest_wait_time": oldest_wait_time,
+            **self.__stats.to_dict(),
+        }
@@ -6,6 +6,30 @@ from .GameSetValue import (
 )
 
 
+def get_paddle_velocity(
+    number: int, left: bool, right: bool, position_x: float
+) -> float:
+    """
+    누르고 있는 키에 따른 패들의 x 방향 속도를 구하는 함수, 경계에 막혀 있으면 0
+    Args:
+        number: 플레이어 번호, 플레이어2는 방향이 반대
+        left: 왼쪽 키를 누르고 있는지 여부
+        right: 오른쪽 키를 누르고 있는지 여부
+        position_x: 패들의 x 좌표
+
+    Returns:
+        float: GAME_TICK_RATE 한 틱 동안의 이동량
+    """
+    direction = int(right and not left) - int(left and not right)
+    if number == 2:
+        direction = -direction
+    if (direction > 0 and position_x >= PADDLE_BOUNDARY) or (
+        direction < 0 and position_x <= -PADDLE_BOUNDARY
+    ):
+        return 0
+    return direction * PADDLE_SPEED
+
+
 class Paddle:
     def __init__(self, number: int):
         self.__number: int = number
@@ -35,25 +59,26 @@ class Paddle:
         elif key_input == KeyboardInput.RIGHT_RELEASE.value:
             self.__right = False
 
-    def move_handler(self, player_num: int) -> None:
+    def move_handler(self, player_num: int, step_scale: float = 1) -> None:
         """
         플레이어가 누른 키에 따라 패들을 움직이는 함수
         Args:
             player_num: 플레이어의 번호
+            step_scale: GAME_TICK_RATE 한 틱 대비 이번 스텝의 길이
 
         Returns:
             None
         """
         if player_num == 1:
             if self.__left and not self.__right:
-                self.__move(-1)
+                self.__move(-step_scale)
             elif not self.__left and self.__right:
-                self.__move(1)
+                self.__move(step_scale)
         elif player_num == 2:
             if self.__left and not self.__right:
-                self.__move(1)
+                self.__move(step_scale)
             elif not self.__left and self.__right:
-                self.__move(-1)
+                self.__move(-step_scale)
 
     def reset_position(self, number: int) -> None:
         """
@@ -73,11 +98,11 @@ class Paddle:
         self.__left = False
         self.__right = False
 
-    def __move(self, direction: int) -> None:
+    def __move(self, direction: float) -> None:
         """
         패들을 움직이는 함수
         Args:
-            direction: 움직이는 방향
+            direction: 움직이는 방향과 스텝 길이를 곱한 값
 
         Returns:
             None
@@ -97,6 +122,17 @@ class Paddle:
         """
         return self.__position_x
 
+    @property
+    def velocity_x(self) -> float:
+        """
+        패들의 x 방향 속도를 반환하는 함수
+        Returns:
+            float: GAME_TICK_RATE 한 틱 동안의 이동량
+        """
+        return get_paddle_velocity(
+            self.__number, self.__left, self.__right, self.__position_x
+        )
+
     @property
     def position_z(self) -> float:
         """
@@ -105,3 +141,16 @@ class Paddle:
             float: position_z
         """
         return self.__position_z
+
+    def get_state(self) -> dict:
+        """
+        패들의 상태를 스냅샷용 딕셔너리로 반환하는 함수
+        Returns:
+            dict: 패들의 x 좌표와 누르고 있는 키
+        """
+        return {"x": self.__position_x, "left": self.__left, "right": self.__right}
+
+    def set_state(self, state: dict) -> None:
+        self.__position_x = state["x"]
+        self.__left = state["left"]
+        self.__right = state["right"]
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from .Paddle import Paddle
 from .GameSetValue import PlayerStatus
 
@@ -7,10 +9,18 @@ class Player:
     플레이어 클래스
     """
 
-    def __init__(self, number: int, intra_id: str, nickname: str = None):
+    def __init__(
+        self,
+        number: int,
+        intra_id: str,
+        nickname: str = None,
+        user_id: Optional[str] = None,
+    ):
         self.__number: int = number
         self.__intra_id: str = intra_id
         self.__nickname: str = nickname if nickname else intra_id
+        # 게임 로그를 저장할 때 유저를 다시 조회하지 않도록 Users의 기본 키를 함께 보관
+        self.__user_id: Optional[str] = user_id
         self.__status: PlayerStatus = PlayerStatus.WAIT
         self.__paddle: Paddle = Paddle(number)
 
@@ -23,12 +33,18 @@ class Player:
     def get_nickname(self) -> str:
         return self.__nickname
 
+    def get_user_id(self) -> Optional[str]:
+        return self.__user_id
+
     def get_status(self) -> PlayerStatus:
         return self.__status
 
     def get_paddle(self) -> Paddle:
         return self.__paddle
 
+    def set_paddle(self, paddle: Paddle) -> None:
+        self.__paddle = paddle
+
     def set_status(self, status: PlayerStatus) -> None:
         self.__status = status
 
@@ -38,3 +54,35 @@ class Player:
 
     def paddle_handler(self, key_input: str) -> None:
         self.__paddle.input_handler(key_input)
+
+    def get_state(self) -> dict:
+        """
+        플레이어의 상태를 스냅샷용 딕셔너리로 반환하는 함수
+        Returns:
+            dict: 플레이어 정보와 패들 상태
+        """
+        return {
+            "number": self.__number,
+            "intra_id": self.__intra_id,
+            "nickname": self.__nickname,
+            "user_id": self.__user_id,
+            "status": self.__status.value,
+            "paddle": self.__paddle.get_state(),
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "Player":
+        """
+        get_state로 만든 스냅샷으로 플레이어를 만드는 함수
+        Args:
+            state: 플레이어의 상태
+
+        Returns:
+            Player: 복원된 플레이어
+        """
+        player = cls(
+            state["number"], state["intra_id"], state["nickname"], state.get("user_id")
+        )
+        player.set_status(PlayerStatus(state["status"]))
+        player.get_paddle().set_state(state["paddle"])
+        return player
@@ -1,8 +1,9 @@
 import json
 
 from .GeneralGame import GeneralGame
-from .GameSetValue import RoundNumber, PlayerStatus, MessageType
+from .GameSetValue import RoundNumber, PlayerStatus, MessageType, GameStatus
 from .Player import Player
+from .GameSnapshot import pack_round, unpack_round
 
 
 class Round(GeneralGame):
@@ -96,6 +97,50 @@ class Round(GeneralGame):
             return True
         return False
 
+    def get_state(self) -> dict:
+        state = super().get_state()
+        state["round_number"] = self.__round_number.value
+        state["winner"] = self.__winner
+        state["loser"] = self.__loser
+        state["is_closed"] = self.__is_closed
+        return state
+
+    def set_state(self, state: dict) -> None:
+        super().set_state(state)
+        self.__winner = state["winner"]
+        self.__loser = state["loser"]
+        self.__is_closed = state["is_closed"]
+
+    @classmethod
+    def from_state(cls, state: dict) -> "Round":
+        game = cls(
+            Player.from_state(state["player1"]),
+            Player.from_state(state["player2"]),
+            RoundNumber(state["round_number"]),
+        )
+        game.set_state(state)
+        return game
+
+    def prepare_resume(self) -> None:
+        """
+        진행 중이던 라운드를 플레이어의 라운드 준비를 다시 기다리는 상태로 만드는 함수,
+        점수는 그대로 유지
+        Returns:
+            None
+        """
+        if self.get_status() != GameStatus.PLAYING:
+            return
+        self.set_status(GameStatus.WAIT)
+        self._player1.set_status(PlayerStatus.READY)
+        self._player2.set_status(PlayerStatus.READY)
+
+    def build_snapshot(self) -> bytes:
+        return pack_round(self.get_state())
+
+    @classmethod
+    def from_snapshot(cls, data: bytes) -> "Round":
+        return cls.from_state(unpack_round(data))
+
     def get_winner(self) -> str:
         return self.__winner
 
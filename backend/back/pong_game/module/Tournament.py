@@ -13,6 +13,7 @@ from .GameSetValue import (
 )
 from .Player import Player
 from .Round import Round
+from .GameSnapshot import pack_tournament, unpack_tournament
 
 
 class Tournament:
@@ -25,12 +26,16 @@ class Tournament:
         tournament_name: str,
         create_user_intra_id: str,
         create_user_nickname: str,
+        create_user_id: Optional[str] = None,
     ):
         self.__tournament_name: str = tournament_name
         self.__round_list: list[Optional[Round]] = [None, None, None]
         self.__player_list: list[Optional[Player]] = [
             Player(
-                number=1, intra_id=create_user_intra_id, nickname=create_user_nickname
+                number=1,
+                intra_id=create_user_intra_id,
+                nickname=create_user_nickname,
+                user_id=create_user_id,
             ),
             None,
             None,
@@ -39,6 +44,8 @@ class Tournament:
         self.__nickname_list: list[str] = ["", "", "", ""]
         self.__player_total_cnt: int = 1
         self.__status: TournamentStatus = TournamentStatus.WAIT
+        # 다른 워커로 옮겨진 뒤에는 이 워커의 소켓이 끊겨도 토너먼트를 바꾸지 않음
+        self.__is_migrated: bool = False
 
     def build_tournament_wait_dict(self) -> dict:
         """
@@ -52,44 +59,51 @@ class Tournament:
         }
 
     def _join_tournament_with_intra_id(
-        self, intra_id: str, nickname: str
+        self, intra_id: str, nickname: str, user_id: Optional[str] = None
     ) -> PlayerNumber:
         """
         토너먼트에 참가하는 함수
         Args:
             intra_id: 참가자의 intra_id
             nickname: 참가자의 닉네임
+            user_id: 참가자의 user_id
 
         Returns:
             PlayerNumber: 참가자의 번호
         """
+        # 다른 워커에서 옮겨와 다시 접속한 참가자는 원래 번호를 그대로 사용
+        for idx, player in enumerate(self.__player_list):
+            if player is not None and player.get_intra_id() == intra_id:
+                return list(PlayerNumber)[idx]
         for idx, player in enumerate(self.__player_list):
             if player is None:
                 self.__player_list[idx] = Player(
-                    number=2 if idx % 2 else 1, intra_id=intra_id, nickname=nickname
+                    number=2 if idx % 2 else 1,
+                    intra_id=intra_id,
+                    nickname=nickname,
+                    user_id=user_id,
                 )
                 self.__player_total_cnt += 1
                 if self.__player_total_cnt == TOURNAMENT_PLAYER_MAX_CNT:
                     self.__status = TournamentStatus.READY
                 return list(PlayerNumber)[idx]
-            elif player.get_intra_id() == intra_id:
-                return PlayerNumber.PLAYER_1
 
     def build_tournament_wait_detail_json(
-        self, intra_id: str, nickname: str
+        self, intra_id: str, nickname: str, user_id: Optional[str] = None
     ) -> tuple[str, json]:
         """
         대기 중인 토너먼트 정보를 json 형태로 반환하는 함수
         Args:
             intra_id: 참가자의 intra_id
             nickname: 참가자의 닉네임
+            user_id: 참가자의 user_id
 
         Returns:
             str: 참가자의 번호
             json: 대기 중인 토너먼트 정보
         """
         player_number = self._join_tournament_with_intra_id(
-            intra_id=intra_id, nickname=nickname
+            intra_id=intra_id, nickname=nickname, user_id=user_id
         ).value
         return player_number, json.dumps(
             {
@@ -263,6 +277,134 @@ class Tournament:
     def set_status(self, status: TournamentStatus) -> None:
         self.__status = status
 
+    def get_is_migrated(self) -> bool:
+        return self.__is_migrated
+
+    def set_is_migrated(self, is_migrated: bool) -> None:
+        self.__is_migrated = is_migrated
+
+    def get_state(self) -> dict:
+        """
+        다른 워커로 옮길 수 있도록 토너먼트 상태를 딕셔너리로 반환하는 함수
+        Returns:
+            dict: 참가자, 닉네임 목록, 참가자 수, 상태, 라운드 상태
+        """
+        return {
+            "tournament_name": self.__tournament_name,
+            "players": [
+                player.get_state() if player else None for player in self.__player_list
+            ],
+            "nickname_list": list(self.__nickname_list),
+            "player_total_cnt": self.__player_total_cnt,
+            "status": self.__status.value,
+            "rounds": [
+                round_game.get_state() if round_game else None
+                for round_game in self.__round_list
+            ],
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "Tournament":
+        """
+        get_state로 만든 상태로 토너먼트를 만드는 함수,
+        라운드의 플레이어는 토너먼트 참가자 객체를 그대로 공유
+        Args:
+            state: 토너먼트 상태
+
+        Returns:
+            Tournament: 복원된 토너먼트
+        """
+        tournament = cls(state["tournament_name"], "", "")
+        tournament.__player_list = [
+            Player.from_state(player) if player else None for player in state["players"]
+        ]
+        tournament.__nickname_list = list(state["nickname_list"])
+        tournament.__player_total_cnt = state["player_total_cnt"]
+        tournament.__status = TournamentStatus(state["status"])
+
+        players = {
+            player.get_intra_id(): player
+            for player in tournament.__player_list
+            if player is not None
+        }
+        for idx, round_state in enumerate(state["rounds"]):
+            if round_state is None:
+                continue
+            round_game = Round(
+                players[round_state["player1"]["intra_id"]],
+                players[round_state["player2"]["intra_id"]],
+                RoundNumber(round_state["round_number"]),
+            )
+            round_game.set_state(round_state)
+            tournament.__round_list[idx] = round_game
+        return tournament
+
+    def build_snapshot(self) -> bytes:
+        """
+        토너먼트 상태를 버전이 붙은 binary 스냅샷으로 만드는 함수
+        Returns:
+            bytes: 스냅샷
+        """
+        return pack_tournament(self.get_state())
+
+    @classmethod
+    def from_snapshot(cls, data: bytes) -> "Tournament":
+        """
+        build_snapshot으로 만든 스냅샷으로 토너먼트를 만드는 함수
+        Args:
+            data: 스냅샷
+
+        Returns:
+            Tournament: 복원된 토너먼트
+        """
+        return cls.from_state(unpack_tournament(data))
+
+    def is_final_ready(self) -> bool:
+        """
+        1, 2라운드가 모두 끝나서 결승을 진행할 수 있는지 확인하는 함수
+        Returns:
+            bool: 결승을 진행할 수 있으면 True, 아니면 False
+        """
+        return all(
+            round_game is not None and round_game.get_status() == GameStatus.END
+            for round_game in self.__round_list[:2]
+        )
+
+    def prepare_final_resume(self) -> None:
+        """
+        복구한 토너먼트를 결승 라운드 준비를 기다리는 상태로 만드는 함수,
+        결승 라운드가 아직 없으면 1, 2라운드 승자로 만듦
+        Returns:
+            None
+        """
+        final_round = self.__round_list[int(RoundNumber.FINAL_NUMBER.value) - 1]
+        if final_round is not None:
+            final_round.prepare_resume()
+            return
+        self.build_tournament_ready_json(
+            TournamentGroupName.FINAL_TEAM,
+            self.__round_list[0].get_winner(),
+            self.__round_list[1].get_winner(),
+        )
+
+    def prepare_resume(self) -> None:
+        """
+        다른 워커에서 옮겨온 토너먼트를 진행 중이던 라운드의 재접속을 기다리는 상태로 만드는 함수,
+        1, 2라운드를 이어서 하려면 라운드 소켓이 다시 접속할 수 있도록 준비 상태로 되돌림
+        Returns:
+            None
+        """
+        if self.__status != TournamentStatus.PLAYING:
+            return
+        final_round = self.__round_list[int(RoundNumber.FINAL_NUMBER.value) - 1]
+        if final_round is not None:
+            final_round.prepare_resume()
+            return
+        for round_game in self.__round_list[:2]:
+            if round_game.get_status() == GameStatus.PLAYING:
+                round_game.prepare_resume()
+                self.__status = TournamentStatus.READY
+
     def try_set_ready(self, player_number: str, nickname: str) -> bool:
         """
         플레이어의 레디 상태를 설정하는 함수
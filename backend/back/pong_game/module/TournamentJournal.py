@@ -0,0 +1,299 @@
+import asyncio
+import base64
+import json
+import logging
+import os
+from typing import Optional
+
+from redis import asyncio as aioredis
+
+from .GameSetValue import (
+    TOURNAMENT_JOURNAL_FLUSH_SECONDS,
+    TOURNAMENT_JOURNAL_MAXLEN,
+    JournalEvent,
+)
+from .Tournament import Tournament
+
+logger = logging.getLogger(__name__)
+
+# 이 이벤트가 마지막 기록이면 더 복구할 것이 없는 토너먼트
+FINISHED_EVENTS = (JournalEvent.RESULT.value, JournalEvent.REMOVE.value)
+
+
+class JournalRecord:
+    """
+    저널에 기록되는 토너먼트 상태 변화, 이벤트 종류와 그 시점의 토너먼트 스냅샷
+    """
+
+    def __init__(self, event: str, tournament_name: str, snapshot: bytes):
+        self.event: str = event
+        self.tournament_name: str = tournament_name
+        self.snapshot: bytes = snapshot
+
+    def to_dict(self) -> dict[str, str]:
+        return {
+            "event": self.event,
+            "tournament_name": self.tournament_name,
+            "snapshot": base64.b64encode(self.snapshot).decode("ascii"),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, str]) -> "JournalRecord":
+        return cls(
+            event=data["event"],
+            tournament_name=data["tournament_name"],
+            snapshot=base64.b64decode(data["snapshot"]),
+        )
+
+
+def get_unfinished_records(records: list[JournalRecord]) -> dict[str, JournalRecord]:
+    """
+    토너먼트별 마지막 기록 중 결과 저장이나 제거로 끝나지 않은 기록을 반환하는 함수
+    Args:
+        records: 저널의 모든 기록
+
+    Returns:
+        dict[str, JournalRecord]: 토너먼트 이름별 마지막 기록
+    """
+    latest = {}
+    for record in records:
+        latest[record.tournament_name] = record
+    return {
+        name: record
+        for name, record in latest.items()
+        if record.event not in FINISHED_EVENTS
+    }
+
+
+class TournamentJournal:
+    """
+    토너먼트 상태가 바뀔 때마다 스냅샷을 기록하는 append-only 저널의 기본 클래스
+
+    append는 기록을 메모리에 쌓기만 하므로 게임 틱 안에서 불러도 바로 반환한다.
+    쌓인 기록은 백그라운드 작업이 flush_interval초마다 write_batch로 한 번에 저장하고,
+    저장할 기록이 없으면 작업이 끝났다가 다음 append에서 다시 시작된다.
+    """
+
+    def __init__(self, flush_interval: float = TOURNAMENT_JOURNAL_FLUSH_SECONDS):
+        self.flush_interval: float = flush_interval
+        self.__pending: list[JournalRecord] = []
+        self.__task: Optional[asyncio.Task] = None
+
+    def append(self, event: JournalEvent, tournament: Tournament) -> None:
+        """
+        토너먼트의 현재 상태를 저장 대기 목록에 추가하는 함수
+        Args:
+            event: 상태 변화 종류
+            tournament: 상태가 바뀐 토너먼트
+
+        Returns:
+            None
+        """
+        self.__pending.append(
+            JournalRecord(
+                event.value, tournament.tournament_name, tournament.build_snapshot()
+            )
+        )
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # 이벤트 루프 밖에서는 다음 flush까지 쌓아 둠
+            return
+        if (
+            self.__task is None
+            or self.__task.done()
+            or self.__task.get_loop() is not loop
+        ):
+            self.__task = loop.create_task(self.__run())
+
+    def get_pending_cnt(self) -> int:
+        return len(self.__pending)
+
+    async def __run(self) -> None:
+        while self.__pending:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self) -> int:
+        """
+        쌓인 기록을 한 번에 저장하는 함수, 실패하면 다음 flush에서 다시 시도
+        Returns:
+            int: 저장한 기록 수
+        """
+        if not self.__pending:
+            return 0
+        batch, self.__pending = self.__pending, []
+        try:
+            await self.write_batch(batch)
+        except Exception:
+            logger.exception("tournament journal write failed")
+            self.__pending = batch + self.__pending
+            return 0
+        return len(batch)
+
+    async def write_batch(self, records: list[JournalRecord]) -> None:
+        raise NotImplementedError
+
+    async def load(self) -> list[JournalRecord]:
+        raise NotImplementedError
+
+    async def compact(self, records: list[JournalRecord]) -> None:
+        """
+        저널을 주어진 기록만 남도록 다시 쓰는 함수
+        Args:
+            records: 남길 기록
+
+        Returns:
+            None
+        """
+        raise NotImplementedError
+
+
+class InMemoryTournamentJournal(TournamentJournal):
+    """
+    프로세스 메모리에만 기록하는 저널, 프로세스가 죽으면 기록도 사라짐
+    """
+
+    def __init__(self, flush_interval: float = TOURNAMENT_JOURNAL_FLUSH_SECONDS):
+        super().__init__(flush_interval)
+        self.__records: list[JournalRecord] = []
+
+    async def write_batch(self, records: list[JournalRecord]) -> None:
+        self.__records.extend(records)
+
+    async def load(self) -> list[JournalRecord]:
+        return list(self.__records)
+
+    async def compact(self, records: list[JournalRecord]) -> None:
+        self.__records = list(records)
+
+
+class FileTournamentJournal(TournamentJournal):
+    """
+    로컬 파일에 한 줄에 하나씩 json으로 기록하는 저널
+
+    flush마다 모은 기록을 한 번에 쓰고 fsync도 한 번만 하며,
+    파일 입출력은 이벤트 루프를 막지 않도록 스레드에서 실행한다.
+    """
+
+    def __init__(
+        self, path: str, flush_interval: float = TOURNAMENT_JOURNAL_FLUSH_SECONDS
+    ):
+        super().__init__(flush_interval)
+        self.path: str = path
+
+    async def write_batch(self, records: list[JournalRecord]) -> None:
+        data = "".join(json.dumps(record.to_dict()) + "\n" for record in records)
+        await asyncio.to_thread(self.__write, data.encode("utf-8"))
+
+    def __write(self, data: bytes) -> None:
+        with open(self.path, "ab") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+    async def load(self) -> list[JournalRecord]:
+        return await asyncio.to_thread(self.__read)
+
+    def __read(self) -> list[JournalRecord]:
+        if not os.path.exists(self.path):
+            return []
+        records = []
+        with open(self.path, "rb") as f:
+            for line in f:
+                try:
+                    records.append(JournalRecord.from_dict(json.loads(line)))
+                except ValueError:
+                    # 기록 도중 프로세스가 죽어서 잘린 줄
+                    logger.warning("skip broken tournament journal line")
+        return records
+
+    async def compact(self, records: list[JournalRecord]) -> None:
+        data = "".join(json.dumps(record.to_dict()) + "\n" for record in records)
+        await asyncio.to_thread(self.__replace, data.encode("utf-8"))
+
+    def __replace(self, data: bytes) -> None:
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+
+class RedisTournamentJournal(TournamentJournal):
+    """
+    Redis stream에 기록하는 저널, flush마다 모은 기록을 pipeline 한 번으로 추가
+
+    파드가 바뀌어도 같은 stream을 읽도록 호스트 이름이 아닌 고정된 key를 사용한다.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        key: Optional[str] = None,
+        flush_interval: float = TOURNAMENT_JOURNAL_FLUSH_SECONDS,
+        maxlen: int = TOURNAMENT_JOURNAL_MAXLEN,
+    ):
+        super().__init__(flush_interval)
+        self.__redis = aioredis.from_url(url)
+        self.__key: str = key if key else "pong:tournament_journal"
+        self.__maxlen: int = maxlen
+
+    async def write_batch(self, records: list[JournalRecord]) -> None:
+        async with self.__redis.pipeline(transaction=False) as pipe:
+            for record in records:
+                pipe.xadd(
+                    self.__key,
+                    self.__fields(record),
+                    maxlen=self.__maxlen,
+                    approximate=True,
+                )
+            await pipe.execute()
+
+    @staticmethod
+    def __fields(record: JournalRecord) -> dict:
+        return {
+            "event": record.event,
+            "tournament_name": record.tournament_name,
+            "snapshot": record.snapshot,
+        }
+
+    async def load(self) -> list[JournalRecord]:
+        entries = await self.__redis.xrange(self.__key)
+        return [
+            JournalRecord(
+                event=fields[b"event"].decode("utf-8"),
+                tournament_name=fields[b"tournament_name"].decode("utf-8"),
+                snapshot=fields[b"snapshot"],
+            )
+            for _, fields in entries
+        ]
+
+    async def compact(self, records: list[JournalRecord]) -> None:
+        async with self.__redis.pipeline(transaction=True) as pipe:
+            pipe.delete(self.__key)
+            for record in records:
+                pipe.xadd(self.__key, self.__fields(record))
+            await pipe.execute()
+
+
+def create_tournament_journal(
+    backend: str, path: str = "", url: str = "", key: str = ""
+) -> TournamentJournal:
+    """
+    설정에 맞는 토너먼트 저널을 만드는 함수
+    Args:
+        backend: memory, file 또는 redis
+        path: file 저널이 사용할 파일 경로
+        url: redis 저널이 사용할 Redis URL
+        key: redis 저널이 사용할 stream key
+
+    Returns:
+        TournamentJournal: 토너먼트 저널
+    """
+    if backend == "file":
+        return FileTournamentJournal(path)
+    if backend == "redis":
+        return RedisTournamentJournal(url, key)
+    return InMemoryTournamentJournal()
@@ -0,0 +1,185 @@
+import asyncio
+import bisect
+import hashlib
+import logging
+from typing import Awaitable, Callable, Iterable, Optional
+
+from .GameRegistry import GameRegistry
+from .GameSetValue import RING_VNODE_CNT, WORKER_HEARTBEAT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+def hash_key(key: str) -> int:
+    return int.from_bytes(hashlib.md5(key.encode("utf-8")).digest()[:8], "big")
+
+
+class HashRing:
+    """
+    게임 id나 토너먼트 이름을 워커에 나누는 consistent hash ring
+
+    워커마다 vnode_cnt개의 가상 노드를 링에 올리고, 키는 자신의 해시 다음에 오는
+    가상 노드의 워커에게 배정한다. 워커가 들어오거나 나가도 그 워커의 구간에 있던
+    키만 옮겨진다.
+    """
+
+    def __init__(self, vnode_cnt: int = RING_VNODE_CNT):
+        self.__vnode_cnt: int = vnode_cnt
+        self.__workers: frozenset[str] = frozenset()
+        self.__hashes: list[int] = []
+        self.__owners: list[str] = []
+
+    def get_workers(self) -> frozenset[str]:
+        return self.__workers
+
+    def set_workers(self, workers: Iterable[str]) -> bool:
+        """
+        링의 워커 목록을 바꾸는 함수
+        Args:
+            workers: 살아있는 워커 이름
+
+        Returns:
+            bool: 워커 목록이 바뀌었으면 True
+        """
+        workers = frozenset(workers)
+        if workers == self.__workers:
+            return False
+        vnodes = sorted(
+            (hash_key(f"{worker}#{index}"), worker)
+            for worker in workers
+            for index in range(self.__vnode_cnt)
+        )
+        self.__workers = workers
+        self.__hashes = [vnode_hash for vnode_hash, _ in vnodes]
+        self.__owners = [worker for _, worker in vnodes]
+        return True
+
+    def get_owner(self, key: str) -> Optional[str]:
+        """
+        키를 담당하는 워커를 반환하는 함수
+        Args:
+            key: 게임 id 또는 토너먼트 이름
+
+        Returns:
+            Optional[str]: 워커 이름, 링이 비어 있으면 None
+        """
+        if not self.__hashes:
+            return None
+        index = bisect.bisect(self.__hashes, hash_key(key)) % len(self.__hashes)
+        return self.__owners[index]
+
+
+class WorkerHeartbeat:
+    """
+    주기적으로 레지스트리에 살아있음을 알리고 살아있는 워커로 링을 갱신하는 클래스
+
+    워커마다 GameOwnerRelay 채널을 함께 기록하므로 링에서 찾은 워커로
+    게임 생성과 플레이어 입력을 바로 보낼 수 있다.
+    하트비트에는 get_load로 구한 워커의 게임 수도 함께 기록하고,
+    하트비트마다 on_beat를 실행해서 이 워커가 소유한 기록을 연장할 수 있다.
+    """
+
+    def __init__(
+        self,
+        registry: GameRegistry,
+        ring: HashRing,
+        interval: float = WORKER_HEARTBEAT_SECONDS,
+        get_load: Callable[[], int] = lambda: 0,
+        on_beat: Optional[Callable[[], Awaitable[None]]] = None,
+    ):
+        self.__registry: GameRegistry = registry
+        self.__ring: HashRing = ring
+        self.__interval: float = interval
+        self.__get_load: Callable[[], int] = get_load
+        self.__on_beat: Optional[Callable[[], Awaitable[None]]] = on_beat
+        self.__channels: dict[str, str] = {}
+        self.__loads: dict[str, int] = {}
+        self.__task: Optional[asyncio.Task] = None
+
+    def get_ring(self) -> HashRing:
+        return self.__ring
+
+    async def start(self, channel_name: str) -> None:
+        """
+        하트비트를 시작하는 함수, 첫 하트비트가 끝난 뒤 반환
+        Args:
+            channel_name: 이 워커의 GameOwnerRelay 채널 이름
+
+        Returns:
+            None
+        """
+        if (
+            self.__task is not None
+            and not self.__task.done()
+            and self.__task.get_loop() is asyncio.get_running_loop()
+        ):
+            return
+        await self.beat(channel_name)
+        self.__task = asyncio.create_task(self.__run(channel_name))
+
+    async def stop(self) -> None:
+        """
+        하트비트를 멈추고 링에서 빠지는 함수,
+        이 워커의 게임을 넘길 수 있도록 마지막으로 본 다른 워커는 링에 남겨 둠
+        Returns:
+            None
+        """
+        if self.__task is not None:
+            self.__task.cancel()
+            self.__task = None
+        await self.__registry.leave()
+        self.__channels.pop(self.__registry.get_owner(), None)
+        self.__ring.set_workers(self.__channels.keys())
+
+    async def beat(self, channel_name: str) -> None:
+        """
+        하트비트를 한 번 보내고 링을 갱신하는 함수
+        Args:
+            channel_name: 이 워커의 GameOwnerRelay 채널 이름
+
+        Returns:
+            None
+        """
+        self.__channels = await self.__registry.heartbeat(
+            channel_name, self.__get_load()
+        )
+        self.__loads = await self.__registry.get_worker_loads()
+        if self.__ring.set_workers(self.__channels.keys()):
+            logger.info("worker ring changed: %s", sorted(self.__channels))
+        if self.__on_beat is not None:
+            await self.__on_beat()
+
+    async def __run(self, channel_name: str) -> None:
+        while True:
+            await asyncio.sleep(self.__interval)
+            try:
+                await self.beat(channel_name)
+            except Exception:
+                logger.exception("worker heartbeat failed")
+
+    def get_owner(self, key: str) -> tuple[Optional[str], Optional[str]]:
+        """
+        키를 담당하는 워커와 그 워커의 채널을 반환하는 함수
+        Args:
+            key: 게임 id 또는 토너먼트 이름
+
+        Returns:
+            tuple: 워커 이름과 채널 이름, 링이 비어 있으면 (None, None)
+        """
+        worker = self.__ring.get_owner(key)
+        return worker, self.__channels.get(worker)
+
+    def get_least_loaded(self) -> tuple[Optional[str], Optional[str]]:
+        """
+        살아있는 워커 중 게임 수가 가장 적은 워커와 그 워커의 채널을 반환하는 함수,
+        다음 하트비트 전까지 같은 워커로 몰리지 않도록 고른 워커의 게임 수를 하나 늘림
+        Returns:
+            tuple: 워커 이름과 채널 이름, 살아있는 워커가 없으면 (None, None)
+        """
+        if not self.__channels:
+            return None, None
+        worker = min(
+            self.__channels, key=lambda name: (self.__loads.get(name, 0), name)
+        )
+        self.__loads[worker] = self.__loads.get(worker, 0) + 1
+        return worker, self.__channels[worker]
@@ -1,18 +1,27 @@
 import asyncio
 import datetime
+import functools
+import hashlib
 import json
+import os
+import tempfile
 import uuid
 import time
-from unittest.mock import patch
+import types
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from back.asgi import (
     application,
 )
 
+from django.db import OperationalError, connection
+from django.test.utils import CaptureQueriesContext
 from django.test import TestCase
 from channels.testing import WebsocketCommunicator
 from django.contrib.auth import get_user_model
 from channels.db import database_sync_to_async
+from asgiref.sync import iscoroutinefunction
 from accounts.models import Users, UserStatusEnum
 from pong_game.module.GameSetValue import (
     MessageType,
@@ -20,12 +29,101 @@ from pong_game.module.GameSetValue import (
     NOT_ALLOWED_TOURNAMENT_NAME,
     PlayerNumber,
     TournamentStatus,
+    TournamentGroupName,
+    GameTimeType,
+    JournalEvent,
 )
 from games.models import GeneralGameLogs
-from pong_game.consumers import ACTIVE_TOURNAMENTS
+from pong_game.consumers import (
+    ACTIVE_GENERAL_GAMES,
+    ACTIVE_TOURNAMENTS,
+    GAME_OWNER_RELAY,
+    GAME_REGISTRY,
+    MATCH_MAKER,
+    WORKER_HEARTBEAT,
+    TournamentGameWaitConsumer,
+    drain_general_games,
+    drain_tournaments,
+    match_general_game,
+    recover_tournaments,
+    stop_game_services,
+)
 from pong_game.module.Tournament import Tournament
+from pong_game.module import GameSetValue
+from pong_game.module.BatchPhysics import BatchPhysics
+from pong_game.module.GameScheduler import GameScheduler
+from pong_game.module.GameFrame import (
+    GAME_FRAME_STRUCT,
+    PLAYING_FRAME_TYPE,
+    DeltaSnapshot,
+    pack_game_frame,
+    unpack_game_frame,
+)
+from pong_game.module.GeneralGame import GeneralGame
+from pong_game.module.GameSnapshot import (
+    SnapshotError,
+    pack_general_game,
+    unpack_general_game,
+)
+from pong_game.module.Round import Round
+from pong_game.module.GroupBroadcaster import GroupBroadcaster
+from pong_game.module.MatchQueue import MatchQueue, get_rating_window
+from pong_game.module.MatchMaker import InMemoryMatchMaker, MatchLoop, MatchTicket
+from pong_game.module.EloRating import get_expected_score, update_elo
+from pong_game.module.GameResultWriter import GameResult, GameResultWriter
+from pong_game.module.HybridChannelLayer import HybridChannelLayer
+from pong_game.module.GameRegistry import GameRecord, InMemoryGameRegistry
+from pong_game.module.WorkerRing import HashRing, WorkerHeartbeat
+from pong_game.module.TournamentJournal import (
+    FileTournamentJournal,
+    InMemoryTournamentJournal,
+    create_tournament_journal,
+    get_unfinished_records,
+)
+from channels.layers import DEFAULT_CHANNEL_LAYER, channel_layers, get_channel_layer
+from channels_redis.core import RedisChannelLayer
+from pong_game.module.Player import Player
+from pong_game.module.GameSetValue import (
+    GameStatus,
+    BINARY_FRAME_SUBPROTOCOL,
+    DELTA_FRAME_SUBPROTOCOL,
+    TRAJECTORY_FRAME_SUBPROTOCOL,
+    TRAJECTORY_SYNC_TICK_CNT,
+    WAIT_BALL_TICK_CNT,
+)
 from django.utils import timezone
-from games.models import TournamentGameLogs
+from games.models import TournamentGameLogs, HeadToHeadStats, HouseStats
+from games.stats import rebuild_game_stats
+
+
+class GameServiceTestCase(TestCase):
+    """
+    async 테스트가 끝나면 같은 이벤트 루프에서 asyncTearDown을 실행하는 TestCase
+
+    TestCase는 async 테스트마다 새 이벤트 루프를 만들고 tearDown은 루프 밖에서 실행하므로,
+    전역 게임 작업은 테스트를 감싸서 루프가 닫히기 전에 멈춘다.
+    """
+
+    def __init__(self, methodName="runTest"):
+        super().__init__(methodName)
+        test_method = getattr(self, methodName, None)
+        if not iscoroutinefunction(test_method):
+            return
+
+        @functools.wraps(test_method)
+        async def run_test(self):
+            try:
+                await test_method()
+            finally:
+                await self.asyncTearDown()
+
+        setattr(self, methodName, types.MethodType(run_test, self))
+
+    async def asyncTearDown(self):
+        await stop_game_services()
+        # channels_redis는 취소된 receive의 채널 잠금을 이전 루프에 묶어 둘 수 있으므로
+        # 다음 테스트는 새 채널 레이어를 사용
+        channel_layers.backends.pop(DEFAULT_CHANNEL_LAYER, None)
 
 
 class LoginConsumerTests(TestCase):
@@ -74,7 +172,7 @@ class LoginConsumerTests(TestCase):
         self.assertFalse(connected)
 
 
-class GeneralGameWaitConsumerTests(TestCase):
+class GeneralGameWaitConsumerTests(GameServiceTestCase):
     @database_sync_to_async
     def create_test_user(self, intra_id):
         # 테스트 사용자 생성
@@ -114,9 +212,223 @@ class GeneralGameWaitConsumerTests(TestCase):
 
         # game_id 동일 한지 확인
         self.assertEqual(user1_response_dict["game_id"], user2_response_dict["game_id"])
+        await communicator1.disconnect()
+        await communicator2.disconnect()
 
+    async def test_cancelled_user_not_matched(self):
+        """
+        대기 중에 나간 유저는 매칭되지 않고 다음 유저를 기다리는지 확인
+        """
+        user1 = await self.create_test_user(intra_id="cancel1")
+        user2 = await self.create_test_user(intra_id="cancel2")
+        user3 = await self.create_test_user(intra_id="cancel3")
+        communicator1 = WebsocketCommunicator(application, "/ws/general_game/wait/")
+        communicator1.scope["user"] = user1
+        connected, _ = await communicator1.connect()
+        self.assertTrue(connected)
+        await communicator1.disconnect()
+        self.assertEqual((await MATCH_MAKER.get_stats())["depth"], 0)
+
+        communicator2 = WebsocketCommunicator(application, "/ws/general_game/wait/")
+        communicator2.scope["user"] = user2
+        connected, _ = await communicator2.connect()
+        self.assertTrue(connected)
+        self.assertTrue(await communicator2.receive_nothing())
+
+        communicator3 = WebsocketCommunicator(application, "/ws/general_game/wait/")
+        communicator3.scope["user"] = user3
+        connected, _ = await communicator3.connect()
+        self.assertTrue(connected)
+        user2_response_dict = json.loads(await communicator2.receive_from())
+        user3_response_dict = json.loads(await communicator3.receive_from())
+        self.assertEqual(user2_response_dict["game_id"], user3_response_dict["game_id"])
+        self.assertEqual((await MATCH_MAKER.get_stats())["depth"], 0)
+        await communicator2.disconnect()
+        await communicator3.disconnect()
+
+
+class MatchQueueTests(TestCase):
+    def test_push_rejects_duplicate_key(self):
+        queue = MatchQueue()
+        self.assertTrue(queue.push("user1", "a"))
+        self.assertFalse(queue.push("user1", "b"))
+        self.assertEqual(len(queue), 1)
+        self.assertIn("user1", queue)
+
+    def test_cancel_checks_item(self):
+        queue = MatchQueue()
+        queue.push("user1", "a")
+        # 같은 키로 다시 접속한 다른 대기자는 빼지 않음
+        self.assertFalse(queue.cancel("user1", "b"))
+        self.assertTrue(queue.cancel("user1", "a"))
+        self.assertFalse(queue.cancel("user1"))
+        self.assertEqual(queue.get_stats()["cancel_cnt"], 1)
+
+    def test_pop_pairs_keeps_order(self):
+        queue = MatchQueue()
+        for i in range(5):
+            queue.push(f"user{i}", i)
+        queue.cancel("user1")
+        self.assertEqual(queue.pop_pairs(), [(0, 2), (3, 4)])
+        self.assertEqual(queue.pop_pairs(), [])
+
+        stats = queue.get_stats()
+        self.assertEqual(stats["depth"], 0)
+        self.assertEqual(stats["matched_cnt"], 4)
+        self.assertGreaterEqual(stats["max_wait_time"], stats["avg_wait_time"])
+
+    def test_pop_pairs_picks_nearest_rating(self):
+        """
+        오래 기다린 대기자부터 레이팅이 가장 가까운 상대와 매칭되는지 확인
+        """
+        queue = MatchQueue()
+        for key, rating in (("a", 1000), ("b", 1300), ("c", 1050), ("d", 1280)):
+            queue.push(key, key, rating)
+        self.assertEqual(queue.pop_pairs(), [("a", "c"), ("b", "d")])
 
-class GeneralGameConsumerTests(TestCase):
+    def test_rating_window_widens_with_wait_time(self):
+        """
+        레이팅 차이가 크면 기다리다가 허용 범위가 넓어진 뒤에 매칭되는지 확인
+        """
+        queue = MatchQueue()
+        with patch("pong_game.module.MatchQueue.time.monotonic", return_value=0):
+            queue.push("a", "a", 1000)
+            queue.push("b", "b", 1300)
+            self.assertEqual(queue.pop_pairs(), [])
+        self.assertEqual(get_rating_window(0), GameSetValue.MATCH_RATING_WINDOW)
+        wait_time = (
+            300 - GameSetValue.MATCH_RATING_WINDOW
+        ) / GameSetValue.MATCH_RATING_WINDOW_PER_SECOND
+        with patch(
+            "pong_game.module.MatchQueue.time.monotonic", return_value=wait_time
+        ):
+            self.assertEqual(queue.pop_pairs(), [("a", "b")])
+        self.assertEqual(len(queue), 0)
+
+    def test_pop_pairs_limit(self):
+        queue = MatchQueue()
+        for i in range(6):
+            queue.push(f"user{i}", i, 1000)
+        self.assertEqual(queue.pop_pairs(max_pairs=2), [(0, 1), (2, 3)])
+        self.assertEqual(len(queue), 2)
+
+    def test_pop_pairs_scan_limit(self):
+        """
+        오래 기다린 scan_limit명만 살펴보고 나머지는 다음 매칭까지 남기는지 확인
+        """
+        queue = MatchQueue()
+        for key, rating in (("a", 1000), ("b", 3000), ("c", 3000), ("d", 1000)):
+            queue.push(key, key, rating)
+        self.assertEqual(queue.pop_pairs(scan_limit=1), [("a", "d")])
+        self.assertEqual(queue.pop_pairs(scan_limit=1), [("b", "c")])
+
+    def test_nearest_rating_across_buckets(self):
+        """
+        레이팅 구간 경계를 넘거나 빈 구간을 건너뛰어도 가장 가까운 상대를 찾는지 확인
+        """
+        queue = MatchQueue(bucket_size=10)
+        for key, rating in (("a", 1009), ("b", 1080), ("c", 1011), ("d", 1150)):
+            queue.push(key, key, rating)
+        self.assertEqual(queue.pop_pairs(), [("a", "c"), ("b", "d")])
+        self.assertEqual(len(queue), 0)
+
+
+class EloRatingTests(TestCase):
+    def test_update_elo(self):
+        self.assertEqual(update_elo(1000, 1000), (1016, 984))
+        # 낮은 레이팅이 이기면 더 많이 오름
+        winner, loser = update_elo(1000, 1400)
+        self.assertEqual(winner + loser, 2400)
+        self.assertGreater(winner - 1000, 16)
+        self.assertAlmostEqual(
+            get_expected_score(1000, 1400) + get_expected_score(1400, 1000), 1
+        )
+
+
+class MatchMakerTests(GameServiceTestCase):
+    async def test_cancel_checks_channel(self):
+        """
+        같은 유저가 다시 접속한 대기자는 이전 연결의 취소로 빠지지 않는지 확인
+        """
+        match_maker = InMemoryMatchMaker()
+        ticket = MatchTicket("user1", "nick1", "channel.a", "worker1")
+        self.assertTrue(await match_maker.push(ticket))
+        self.assertFalse(
+            await match_maker.push(
+                MatchTicket("user1", "nick1", "channel.b", "worker1")
+            )
+        )
+        self.assertFalse(
+            await match_maker.cancel(
+                MatchTicket("user1", "nick1", "channel.b", "worker1")
+            )
+        )
+        self.assertTrue(await match_maker.cancel(ticket))
+        self.assertEqual(await match_maker.pop_pairs(), [])
+
+    async def test_match_loop_runs_until_queue_drains(self):
+        """
+        매칭 작업이 주기적으로 짝을 만들고 대기자가 한 명만 남으면 끝나는지 확인
+        """
+        match_maker = InMemoryMatchMaker()
+        matched = []
+
+        async def on_match(ticket1, ticket2):
+            matched.append((ticket1.intra_id, ticket2.intra_id))
+
+        match_loop = MatchLoop(match_maker, on_match, interval=0.01)
+        for i, rating in enumerate((1000, 1600, 1010)):
+            await match_maker.push(
+                MatchTicket(f"user{i}", f"nick{i}", f"channel.{i}", "worker1", rating)
+            )
+        match_loop.wake()
+        await asyncio.sleep(0.1)
+        self.assertEqual(matched, [("user0", "user2")])
+        self.assertEqual(await match_maker.get_depth(), 1)
+        await match_loop.stop()
+
+    def test_ticket_round_trip(self):
+        ticket = MatchTicket("user1", "nick1", "channel.a", "worker1")
+        restored = MatchTicket.from_dict(json.loads(json.dumps(ticket.to_dict())))
+        self.assertEqual(restored.to_dict(), ticket.to_dict())
+
+    async def test_match_on_least_loaded_worker(self):
+        """
+        게임 수가 가장 적은 다른 워커에 게임을 만들고 두 대기자에게 채널로 알리는지 확인
+        """
+        channel_layer = get_channel_layer()
+        tickets = [
+            MatchTicket(
+                f"user{i}", f"nick{i}", await channel_layer.new_channel(), "worker1"
+            )
+            for i in (1, 2)
+        ]
+        # 이 프로세스의 릴레이를 다른 워커로 사용
+        owner_channel = await GAME_OWNER_RELAY.start()
+        with patch.object(
+            WORKER_HEARTBEAT,
+            "get_least_loaded",
+            return_value=("worker2", owner_channel),
+        ):
+            await match_general_game(*tickets)
+
+        game_ids = set()
+        for ticket in tickets:
+            message = await channel_layer.receive(ticket.channel_name)
+            self.assertEqual(message["type"], "match.found")
+            game_ids.add(message["game_id"])
+        self.assertEqual(len(game_ids), 1)
+        game_id = game_ids.pop()
+        for _ in range(10):
+            if game_id in ACTIVE_GENERAL_GAMES:
+                break
+            await asyncio.sleep(0.05)
+        game = ACTIVE_GENERAL_GAMES.pop(game_id)
+        self.assertEqual(game.get_intra_ids(), ("user1", "user2"))
+        await GAME_REGISTRY.remove(game_id)
+
+
+class GeneralGameConsumerTests(GameServiceTestCase):
     @database_sync_to_async
     def create_test_user(self, intra_id, nickname=None):
         # 테스트 사용자 생성
@@ -160,7 +472,11 @@ class GeneralGameConsumerTests(TestCase):
                 await asyncio.sleep(0.2)
         return None
 
-    async def setup_game_environment_before_start(self) -> tuple:
+    async def setup_game_environment_before_start(
+        self,
+        player1_subprotocols: Optional[list[str]] = None,
+        player2_subprotocols: Optional[list[str]] = None,
+    ) -> tuple:
         """
         start 전까지 환경 세팅
         """
@@ -193,7 +509,9 @@ class GeneralGameConsumerTests(TestCase):
         # 게임방 입장
         self.game_id = user_response_dict["game_id"]
         communicator3 = WebsocketCommunicator(
-            application, f"/ws/general_game/{self.game_id}/"
+            application,
+            f"/ws/general_game/{self.game_id}/",
+            subprotocols=player1_subprotocols,
         )
 
         communicator3.scope["user"] = self.user1
@@ -201,7 +519,9 @@ class GeneralGameConsumerTests(TestCase):
         self.assertTrue(connected)
 
         communicator4 = WebsocketCommunicator(
-            application, f"/ws/general_game/{self.game_id}/"
+            application,
+            f"/ws/general_game/{self.game_id}/",
+            subprotocols=player2_subprotocols,
         )
 
         communicator4.scope["user"] = self.user2
@@ -399,6 +719,9 @@ class GeneralGameConsumerTests(TestCase):
         self.assertEqual(test2.win_count, 1)
         self.assertEqual(test1.lose_count, 1)
         self.assertEqual(test2.lose_count, 0)
+        # 같은 레이팅이면 K 값의 절반만큼 오르내림
+        self.assertEqual(test1.rating, 984)
+        self.assertEqual(test2.rating, 1016)
 
         await communicator1.disconnect()
         await communicator2.disconnect()
@@ -446,6 +769,248 @@ class GeneralGameConsumerTests(TestCase):
         await communicator1.disconnect()
         await communicator2.disconnect()
 
+    async def test_binary_frame_negotiation(self):
+        """
+        binary 서브프로토콜을 요청한 플레이어만 게임 진행 프레임을 bytes로 받는지 확인
+        """
+        communicator1, communicator2 = await self.setup_game_environment_before_start(
+            player1_subprotocols=[BINARY_FRAME_SUBPROTOCOL]
+        )
+
+        while True:
+            output = await communicator1.receive_output()
+            if output.get("bytes") is not None:
+                frame = unpack_game_frame(output["bytes"])
+                self.assertEqual(len(output["bytes"]), GAME_FRAME_STRUCT.size)
+                self.assertEqual(frame["frame_type"], PLAYING_FRAME_TYPE)
+                self.assertGreater(frame["tick_no"], 0)
+                break
+
+        while True:
+            user2_dict = json.loads(await communicator2.receive_from())
+            if user2_dict["message_type"] == "playing":
+                break
+
+        await communicator1.disconnect()
+        await communicator2.disconnect()
+
+    async def test_delta_frame_with_ack(self):
+        """
+        delta 서브프로토콜을 요청하면 keyframe을 받고, ack 이후에는 바뀐 값만 받는지 확인
+        """
+        communicator1, communicator2 = await self.setup_game_environment_before_start(
+            player1_subprotocols=[DELTA_FRAME_SUBPROTOCOL]
+        )
+
+        while True:
+            user1_dict = json.loads(await communicator1.receive_from())
+            if user1_dict["message_type"] == "playing":
+                break
+        self.assertTrue(user1_dict["keyframe"])
+        self.assertIn("paddle1", user1_dict)
+        await communicator1.send_to(
+            text_data=json.dumps({"message_type": "ack", "tick": user1_dict["tick"]})
+        )
+
+        while True:
+            delta_dict = json.loads(await communicator1.receive_from())
+            if delta_dict["message_type"] == "playing" and "base" in delta_dict:
+                break
+        self.assertEqual(delta_dict["base"], user1_dict["tick"])
+        self.assertGreater(delta_dict["tick"], user1_dict["tick"])
+        self.assertNotIn("paddle1", delta_dict)
+        self.assertNotIn("paddle2", delta_dict)
+
+        await communicator1.disconnect()
+        await communicator2.disconnect()
+
+    async def test_remote_game_forwards_to_owner(self):
+        """
+        다른 프로세스가 소유한 게임에 접속하면 입력을 소유 프로세스로 전달하고
+        소유 프로세스가 보낸 메시지를 소켓으로 보내는지 확인
+        """
+        self.user1 = await self.create_test_user(intra_id="test1")
+        channel_layer = get_channel_layer()
+        # 소유 프로세스는 다른 채널 레이어로 받음, 같은 레이어를 쓰면 컨슈머가 끝날 때
+        # 취소되는 receive가 소유 프로세스로 가는 메시지를 꺼낸 채로 사라질 수 있음
+        owner_layer = (
+            channel_layers.make_backend(DEFAULT_CHANNEL_LAYER)
+            if isinstance(channel_layer, RedisChannelLayer)
+            else channel_layer
+        )
+        owner_channel = await owner_layer.new_channel()
+        game_id = str(uuid.uuid4())
+        await GAME_REGISTRY.register(
+            game_id,
+            GameRecord(
+                owner="other-worker",
+                status="wait",
+                player1="test1",
+                player2="test2",
+                owner_channel=owner_channel,
+            ),
+        )
+
+        communicator = WebsocketCommunicator(
+            application, f"/ws/general_game/{game_id}/"
+        )
+        communicator.scope["user"] = self.user1
+        connected, _ = await communicator.connect()
+        self.assertTrue(connected)
+
+        attach = await owner_layer.receive(owner_channel)
+        self.assertEqual(attach["type"], "player.attach")
+        self.assertEqual(attach["intra_id"], "test1")
+
+        await communicator.send_to(text_data='{"message_type": "ready"}')
+        data = await owner_layer.receive(owner_channel)
+        self.assertEqual(data["type"], "player.input")
+        self.assertEqual(data["text_data"], '{"message_type": "ready"}')
+
+        await owner_layer.send(
+            attach["channel_name"],
+            {"type": "game.relay", "event": {"type": "websocket.send", "text": "hi"}},
+        )
+        self.assertEqual(await communicator.receive_from(), "hi")
+
+        await communicator.disconnect()
+        data = await owner_layer.receive(owner_channel)
+        self.assertEqual(data["type"], "player.detach")
+
+    async def test_owner_relay_hosts_remote_player(self):
+        """
+        소유 프로세스의 릴레이가 원격 플레이어를 대신 접속시키고 종료를 처리하는지 확인
+        """
+        self.user1 = await self.create_test_user(intra_id="test1")
+        self.user2 = await self.create_test_user(intra_id="test2")
+        communicators = []
+        for user in (self.user1, self.user2):
+            communicator = WebsocketCommunicator(application, "/ws/general_game/wait/")
+            communicator.scope["user"] = user
+            await communicator.connect()
+            communicators.append(communicator)
+        game_id = json.loads(await communicators[0].receive_from())["game_id"]
+        for communicator in communicators:
+            await communicator.disconnect()
+        self.assertIsNotNone(await GAME_REGISTRY.get(game_id))
+
+        channel_layer = get_channel_layer()
+        owner_channel = await GAME_OWNER_RELAY.start()
+        remote_channel = await channel_layer.new_channel()
+        await channel_layer.send(
+            owner_channel,
+            {
+                "type": "player.attach",
+                "game_id": game_id,
+                "channel_name": remote_channel,
+                "intra_id": "test2",
+                "subprotocols": [],
+            },
+        )
+        relay = await asyncio.wait_for(channel_layer.receive(remote_channel), 1)
+        self.assertEqual(relay["type"], "game.relay")
+        ready = json.loads(relay["event"]["text"])
+        self.assertEqual(ready["message_type"], "ready")
+        self.assertEqual(ready["number"], "player2")
+
+        await channel_layer.send(
+            owner_channel, {"type": "player.detach", "channel_name": remote_channel}
+        )
+        await asyncio.wait_for(channel_layer.receive(remote_channel), 1)
+        self.assertNotIn(game_id, ACTIVE_GENERAL_GAMES)
+        self.assertIsNone(await GAME_REGISTRY.get(game_id))
+
+    async def test_owner_relay_creates_game(self):
+        """
+        다른 워커가 매칭한 게임을 소유 워커의 릴레이가 만들고 기록하는지 확인
+        """
+        game_id = str(uuid.uuid4())
+        owner_channel = await GAME_OWNER_RELAY.start()
+        await get_channel_layer().send(
+            owner_channel,
+            {
+                "type": "game.create",
+                "game_id": game_id,
+                "players": [["test1", "nick1"], ["test2", "nick2"]],
+            },
+        )
+        for _ in range(10):
+            if game_id in ACTIVE_GENERAL_GAMES:
+                break
+            await asyncio.sleep(0.05)
+        game = ACTIVE_GENERAL_GAMES.pop(game_id)
+        self.assertEqual(game.get_player("test2")[0].get_nickname(), "nick2")
+        record = await GAME_REGISTRY.get(game_id)
+        self.assertTrue(GAME_REGISTRY.is_local(record))
+        await GAME_REGISTRY.remove(game_id)
+
+    async def test_drain_migrates_game(self):
+        """
+        워커가 내려갈 때 진행 중인 게임을 다른 워커로 넘기고 플레이어에게 migrate를 보내는지 확인
+        """
+        communicator1, communicator2 = await self.setup_game_environment_before_start()
+        await asyncio.sleep(0.2)
+        game = ACTIVE_GENERAL_GAMES[self.game_id]
+        tick_no = game.get_tick_no()
+
+        # 이 프로세스의 릴레이를 다른 워커로 사용
+        owner_channel = await GAME_OWNER_RELAY.start()
+        with patch.object(WORKER_HEARTBEAT, "stop", AsyncMock()), patch.object(
+            WORKER_HEARTBEAT, "get_owner", return_value=("worker2", owner_channel)
+        ):
+            self.assertEqual(await drain_general_games(), 1)
+
+        for communicator in (communicator1, communicator2):
+            while True:
+                data = json.loads(await communicator.receive_from())
+                if data["message_type"] == "migrate":
+                    break
+            self.assertEqual(data["player1_score"], 0)
+            self.assertEqual(
+                (await communicator.receive_output())["type"], "websocket.close"
+            )
+
+        for _ in range(10):
+            if self.game_id in ACTIVE_GENERAL_GAMES:
+                break
+            await asyncio.sleep(0.05)
+        migrated = ACTIVE_GENERAL_GAMES.pop(self.game_id)
+        self.assertIsNot(migrated, game)
+        self.assertEqual(migrated.get_status(), GameStatus.WAIT)
+        self.assertGreaterEqual(migrated.get_tick_no(), tick_no)
+        self.assertIsNotNone(migrated.get_game_time(GameTimeType.START_TIME.value))
+        await GAME_REGISTRY.remove(self.game_id)
+
+    async def test_trajectory_frame(self):
+        """
+        모두 trajectory 서브프로토콜을 요청하면 움직임이 바뀔 때와 보정 주기에만 받는지 확인
+        """
+        communicator1, communicator2 = await self.setup_game_environment_before_start(
+            player1_subprotocols=[TRAJECTORY_FRAME_SUBPROTOCOL],
+            player2_subprotocols=[TRAJECTORY_FRAME_SUBPROTOCOL],
+        )
+
+        trajectory_list = []
+        while True:
+            # 보정 프레임 주기(1초)보다 길게 기다림
+            user1_dict = json.loads(await communicator1.receive_from(timeout=3))
+            if user1_dict["message_type"] != "trajectory":
+                continue
+            trajectory_list.append(user1_dict)
+            if user1_dict["ball_vz"] != 0:
+                break
+
+        # 시작 시 정지한 공, 보정 프레임, 공이 출발할 때
+        self.assertEqual(trajectory_list[0]["ball_vz"], 0)
+        self.assertFalse(trajectory_list[-1]["sync"])
+        self.assertLessEqual(
+            len(trajectory_list), WAIT_BALL_TICK_CNT // TRAJECTORY_SYNC_TICK_CNT + 3
+        )
+        self.assertGreaterEqual(trajectory_list[-1]["tick"], WAIT_BALL_TICK_CNT / 4)
+
+        await communicator1.disconnect()
+        await communicator2.disconnect()
+
     @patch("pong_game.module.GameSetValue.BALL_SPEED_Z", 300)
     async def test_move_paddle_logic_2(self):
         """
@@ -2291,3 +2856,1379 @@ class TournamentGameRoundConsumerTests(TestCase):
                     self.assertTrue(False)
 
         self.assertEqual(count, 1)
+
+
+class TournamentOwnerRelayTests(GameServiceTestCase):
+    def setUp(self):
+        # 앞선 TestCase가 이전 이벤트 루프에 묶어 둔 채널 레이어를 쓰지 않도록 새로 만듦
+        channel_layers.backends.pop(DEFAULT_CHANNEL_LAYER, None)
+
+    @database_sync_to_async
+    def create_test_user(self, intra_id: str, nickname: str):
+        return get_user_model().objects.create_user(
+            intra_id=intra_id, nickname=nickname
+        )
+
+    async def test_create_on_ring_owner(self):
+        """
+        토너먼트 이름을 담당하는 워커가 다른 워커면 그 워커의 릴레이로 토너먼트를 만드는지 확인
+        """
+        user = await self.create_test_user("test1", "nick1")
+        # 이 프로세스의 릴레이를 다른 워커로 사용
+        owner_channel = await GAME_OWNER_RELAY.start()
+        communicator = WebsocketCommunicator(application, "/ws/tournament_game/wait/")
+        communicator.scope["user"] = user
+        await communicator.connect()
+        await communicator.receive_from()
+        with patch.object(
+            WORKER_HEARTBEAT, "get_owner", return_value=("worker2", owner_channel)
+        ):
+            await communicator.send_to(
+                text_data=json.dumps(
+                    {"message_type": "create", "tournament_name": "ring"}
+                )
+            )
+            response = json.loads(await communicator.receive_from())
+        self.assertEqual(response["result"], "success")
+        self.assertEqual(
+            (await GAME_REGISTRY.get("tournament:ring")).owner_channel, owner_channel
+        )
+
+        for _ in range(10):
+            if "ring" in ACTIVE_TOURNAMENTS:
+                break
+            await asyncio.sleep(0.05)
+        tournament = ACTIVE_TOURNAMENTS.pop("ring")
+        self.assertEqual(tournament.get_player_total_cnt(), 1)
+        await communicator.disconnect()
+
+    async def test_remote_tournament_forwards_to_owner(self):
+        """
+        다른 프로세스가 소유한 토너먼트에 접속하면 연결, 입력, 종료를 소유 프로세스로 전달하는지 확인
+        """
+        user = await self.create_test_user("test1", "nick1")
+        channel_layer = get_channel_layer()
+        # 소유 프로세스는 다른 채널 레이어로 받음
+        owner_layer = (
+            channel_layers.make_backend(DEFAULT_CHANNEL_LAYER)
+            if isinstance(channel_layer, RedisChannelLayer)
+            else channel_layer
+        )
+        owner_channel = await owner_layer.new_channel()
+        await GAME_REGISTRY.register(
+            "tournament:remote",
+            GameRecord("other-worker", "playing", "", "", owner_channel),
+        )
+
+        communicator = WebsocketCommunicator(
+            application, "/ws/tournament_game/remote/1/"
+        )
+        communicator.scope["user"] = user
+        connected, _ = await communicator.connect()
+        self.assertTrue(connected)
+
+        attach = await owner_layer.receive(owner_channel)
+        self.assertEqual(attach["type"], "player.attach")
+        self.assertEqual(attach["consumer"], "round")
+        self.assertEqual(attach["url_route"]["tournament_name"], "remote")
+
+        await communicator.send_to(text_data='{"message_type": "ready"}')
+        data = await owner_layer.receive(owner_channel)
+        self.assertEqual(data["type"], "player.input")
+        self.assertEqual(data["text_data"], '{"message_type": "ready"}')
+
+        await owner_layer.send(
+            attach["channel_name"],
+            {"type": "game.relay", "event": {"type": "websocket.send", "text": "hi"}},
+        )
+        self.assertEqual(await communicator.receive_from(), "hi")
+
+        await communicator.disconnect()
+        data = await owner_layer.receive(owner_channel)
+        self.assertEqual(data["type"], "player.detach")
+
+    async def test_owner_relay_hosts_remote_tournament_player(self):
+        """
+        소유 프로세스의 릴레이가 다른 프로세스의 플레이어를 토너먼트 대기방에 넣고 빼는지 확인
+        """
+        await self.create_test_user("test2", "nick2")
+        ACTIVE_TOURNAMENTS["hosted"] = Tournament("hosted", "test1", "nick1")
+        channel_layer = get_channel_layer()
+        owner_channel = await GAME_OWNER_RELAY.start()
+        remote_channel = await channel_layer.new_channel()
+        await channel_layer.send(
+            owner_channel,
+            {
+                "type": "player.attach",
+                "consumer": "tournament",
+                "url_route": {"tournament_name": "hosted"},
+                "channel_name": remote_channel,
+                "intra_id": "test2",
+                "subprotocols": [],
+            },
+        )
+        message = await asyncio.wait_for(channel_layer.receive(remote_channel), 1)
+        self.assertEqual(message["type"], "send.message")
+        self.assertEqual(json.loads(message["message"])["total"], 2)
+
+        await channel_layer.send(
+            owner_channel, {"type": "player.detach", "channel_name": remote_channel}
+        )
+        for _ in range(10):
+            if ACTIVE_TOURNAMENTS["hosted"].get_player_total_cnt() == 1:
+                break
+            await asyncio.sleep(0.05)
+        self.assertEqual(ACTIVE_TOURNAMENTS.pop("hosted").get_player_total_cnt(), 1)
+
+    # 다른 테스트가 남긴 토너먼트는 옮기지 않도록 비운 상태에서 실행
+    @patch.dict(ACTIVE_TOURNAMENTS, clear=True)
+    async def test_drain_migrates_tournament(self):
+        """
+        워커가 내려갈 때 진행 중인 토너먼트를 다른 워커로 넘기고, 다시 접속한 라운드는
+        다른 라운드를 기다리지 않고 이어서 시작하는지 확인
+        """
+        users = [
+            await self.create_test_user(f"test{idx}", f"nick{idx}") for idx in (1, 2)
+        ]
+        tournament = TournamentJournalTests.make_tournament("drained")
+        tournament.set_round_status(status=GameStatus.PLAYING, is_final=False)
+        tournament.set_round_game_time(
+            time_type=GameTimeType.START_TIME, is_final=False
+        )
+        ACTIVE_TOURNAMENTS["drained"] = tournament
+        channel_layer = get_channel_layer()
+        round_channel = await channel_layer.new_channel()
+        round_group_name = hashlib.md5("drained_1".encode("utf-8")).hexdigest()
+        await channel_layer.group_add(round_group_name, round_channel)
+
+        # 이 프로세스의 릴레이를 다른 워커로 사용
+        owner_channel = await GAME_OWNER_RELAY.start()
+        with patch.object(WORKER_HEARTBEAT, "stop", AsyncMock()), patch.object(
+            WORKER_HEARTBEAT, "get_owner", return_value=("worker2", owner_channel)
+        ):
+            self.assertEqual(await drain_tournaments(), 1)
+        message = await asyncio.wait_for(channel_layer.receive(round_channel), 1)
+        self.assertEqual(message["type"], "game.migrate")
+        self.assertEqual(json.loads(message["message"])["message_type"], "migrate")
+        self.assertTrue(tournament.get_is_migrated())
+
+        for _ in range(10):
+            if "drained" in ACTIVE_TOURNAMENTS:
+                break
+            await asyncio.sleep(0.05)
+        migrated = ACTIVE_TOURNAMENTS["drained"]
+        self.assertIsNot(migrated, tournament)
+        self.assertEqual(migrated.get_status(), TournamentStatus.READY)
+        self.assertEqual(migrated.get_round(1).get_status(), GameStatus.WAIT)
+
+        communicators = []
+        for user in users:
+            communicator = WebsocketCommunicator(
+                application, "/ws/tournament_game/drained/1/"
+            )
+            communicator.scope["user"] = user
+            connected, _ = await communicator.connect()
+            self.assertTrue(connected)
+            communicators.append(communicator)
+        for communicator in communicators:
+            await communicator.send_to(text_data='{"message_type": "ready"}')
+        while True:
+            data = json.loads(await communicators[0].receive_from())
+            if data["message_type"] == "start":
+                break
+        self.assertEqual(data["round"], "1")
+        self.assertEqual(migrated.get_round(1).get_status(), GameStatus.PLAYING)
+        # 2라운드가 다시 접속할 수 있도록 준비 상태를 유지
+        self.assertEqual(migrated.get_status(), TournamentStatus.READY)
+
+        for communicator in communicators:
+            await communicator.disconnect()
+
+    async def test_shared_wait_list(self):
+        """
+        레지스트리를 공유하면 다른 워커의 대기 중인 토너먼트도 목록에 보여주는지 확인
+        """
+        await GAME_REGISTRY.register(
+            "tournament:other", GameRecord("worker2", "wait", "", "", player_cnt=2)
+        )
+        await GAME_REGISTRY.register(
+            "tournament:full", GameRecord("worker2", "wait", "", "", player_cnt=4)
+        )
+        with patch.object(GAME_REGISTRY, "is_shared", True):
+            wait_list = await TournamentGameWaitConsumer._get_wait_list()
+        self.assertEqual(wait_list, [{"tournament_name": "other", "wait_num": "2"}])
+
+
+class GameSchedulerTests(TestCase):
+    async def test_tick_all_registered_games(self):
+        """
+        등록된 모든 게임이 하나의 루프에서 틱을 받는지 확인
+        """
+        scheduler = GameScheduler(tick_rate=100)
+        tick_cnt = {"game1": 0, "game2": 0}
+
+        def make_tick(game_id: str):
+            async def tick(step_cnt: int) -> bool:
+                tick_cnt[game_id] += 1
+                return True
+
+            return tick
+
+        scheduler.register("game1", make_tick("game1"))
+        scheduler.register("game2", make_tick("game2"))
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(scheduler.get_game_cnt(), 2)
+        self.assertGreater(tick_cnt["game1"], 0)
+        self.assertGreater(tick_cnt["game2"], 0)
+        self.assertLessEqual(abs(tick_cnt["game1"] - tick_cnt["game2"]), 1)
+
+        scheduler.unregister("game1")
+        scheduler.unregister("game2")
+        self.assertEqual(scheduler.get_game_cnt(), 0)
+
+    async def test_unregister_finished_game(self):
+        """
+        틱 함수가 False를 반환하거나 예외가 발생하면 등록 해제되는지 확인
+        """
+        scheduler = GameScheduler(tick_rate=100)
+
+        async def finished_tick(step_cnt: int) -> bool:
+            return False
+
+        async def error_tick(step_cnt: int) -> bool:
+            raise ValueError
+
+        scheduler.register("finished", finished_tick)
+        scheduler.register("error", error_tick)
+        await asyncio.sleep(0.05)
+
+        self.assertFalse(scheduler.is_registered("finished"))
+        self.assertFalse(scheduler.is_registered("error"))
+
+    async def test_catch_up_late_tick(self):
+        """
+        틱이 밀리면 밀린 스텝을 한 번에 진행하고, 제한을 넘는 스텝은 버린 프레임으로 기록하는지 확인
+        """
+        scheduler = GameScheduler(tick_rate=100, max_catch_up_tick_cnt=3)
+        step_cnt_list = []
+
+        async def blocking_tick(step_cnt: int) -> bool:
+            step_cnt_list.append(step_cnt)
+            if len(step_cnt_list) == 1:
+                time.sleep(0.1)  # 이벤트 루프를 막아서 다음 틱을 10틱 정도 밀리게 함
+            return True
+
+        scheduler.register("blocking", blocking_tick)
+        while len(step_cnt_list) < 2:
+            await asyncio.sleep(0.01)
+        tick_stats = scheduler.get_tick_stats("blocking")
+        scheduler.unregister("blocking")
+
+        self.assertEqual(step_cnt_list[0], 1)
+        self.assertEqual(step_cnt_list[1], 3)
+        self.assertGreaterEqual(tick_stats["late_frame_cnt"], 1)
+        self.assertGreater(tick_stats["skipped_frame_cnt"], 0)
+
+    async def test_step_rate_separated_from_tick_rate(self):
+        """
+        물리 스텝 주기가 틱 주기의 4배일 때 틱마다 4 스텝씩 진행하는지 확인
+        """
+        scheduler = GameScheduler(tick_rate=50, step_rate=200)
+        step_cnt_list = []
+
+        async def tick(step_cnt: int) -> bool:
+            step_cnt_list.append(step_cnt)
+            return len(step_cnt_list) < 5
+
+        scheduler.register("game", tick)
+        while scheduler.is_registered("game"):
+            await asyncio.sleep(0.02)
+
+        # 늦게 실행된 틱은 지나간 틱의 스텝까지 진행하므로 4의 배수
+        self.assertTrue(
+            all(step_cnt and step_cnt % 4 == 0 for step_cnt in step_cnt_list)
+        )
+
+
+class GeneralGameUpdateTests(TestCase):
+    def setUp(self):
+        self.game = GeneralGame(Player(1, "test1"), Player(2, "test2"))
+        self.game.set_status(GameStatus.PLAYING)
+
+    def test_step_scale(self):
+        """
+        step_scale 0.25로 4 스텝 진행한 결과가 한 스텝 진행한 결과와 같은지 확인
+        """
+        other = GeneralGame(Player(1, "test3"), Player(2, "test4"))
+        other.set_status(GameStatus.PLAYING)
+
+        self.game.update_game(step_cnt=4, step_scale=0.25)
+        other.update_game(step_cnt=1)
+
+        self.assertEqual(self.game.get_ball_position(), other.get_ball_position())
+
+    def test_key_input_applied_at_step(self):
+        """
+        키 입력은 저장만 되고 다음 스텝이 시작될 때 적용되는지 확인
+        """
+        self.game.key_input(json.dumps({"number": "player1", "input": "left_press"}))
+        self.assertEqual(json.loads(self.game.build_game_json())["paddle1"], 0)
+
+        self.game.update_game(step_cnt=1)
+        self.assertLess(json.loads(self.game.build_game_json())["paddle1"], 0)
+
+    def test_invalid_key_input_dropped(self):
+        """
+        형식이 잘못된 키 입력은 저장하지 않고 다음 스텝도 그대로 진행되는지 확인
+        """
+        for text_data in (
+            "not json",
+            json.dumps([]),
+            json.dumps({"message_type": "playing"}),
+            json.dumps({"number": "player3", "input": "left_press"}),
+            json.dumps({"number": "player1", "input": 0}),
+            json.dumps({"number": ["player1"], "input": "left_press"}),
+        ):
+            self.assertFalse(self.game.key_input(text_data))
+        self.assertTrue(
+            self.game.key_input(
+                json.dumps({"number": "player2", "input": "left_press", "x": 1})
+            )
+        )
+        self.assertEqual(
+            self.game.get_state()["key_inputs"],
+            [{"number": "player2", "input": "left_press"}],
+        )
+
+        self.game.update_game(step_cnt=1)
+        self.assertEqual(self.game.get_tick_no(), 1)
+        self.assertGreater(json.loads(self.game.build_game_json())["paddle2"], 0)
+
+    def test_check_motion_changed(self):
+        """
+        키 입력, 공 출발, 벽 충돌처럼 속도가 바뀔 때만 움직임이 바뀐 것으로 보는지 확인
+        """
+        self.game.start_wait_ball()
+        self.assertTrue(self.game.check_motion_changed())
+        self.game.update_game(step_cnt=1)
+        self.assertFalse(self.game.check_motion_changed())
+
+        self.game.key_input(json.dumps({"number": "player2", "input": "left_press"}))
+        self.game.update_game(step_cnt=1)
+        self.assertTrue(self.game.check_motion_changed())
+        trajectory = json.loads(self.game.build_trajectory_json())
+        self.assertEqual(trajectory["paddle2_vx"], 30)
+        self.assertEqual(trajectory["ball_vz"], 0)
+
+        self.game.update_game(step_cnt=WAIT_BALL_TICK_CNT)
+        self.assertTrue(self.game.check_motion_changed())
+        self.game.update_game(step_cnt=1)
+        self.assertFalse(self.game.check_motion_changed())
+
+    @patch("pong_game.module.GameSetValue.BALL_SPEED_Z", 200)
+    def test_fast_ball_does_not_pass_paddle(self):
+        """
+        한 스텝에 paddle_correction보다 많이 움직이는 공도 패들에 맞고 튕겨 나오는지 확인
+        """
+        game = GeneralGame(Player(1, "test3"), Player(2, "test4"))
+        game.set_status(GameStatus.PLAYING)
+        for _ in range(8):
+            game.update_game(step_cnt=1)
+
+        self.assertEqual(game.get_score(), (0, 0))
+        self.assertEqual(game.get_ball_speed(), (0, -200))
+        self.assertEqual(game.get_ball_position(), (0, 1480 - 120))
+
+    @patch("pong_game.module.GameSetValue.BALL_SPEED_Z", 200)
+    def test_fast_ball_misses_paddle(self):
+        """
+        패들이 없는 곳으로 가는 빠른 공은 득점이 되는지 확인
+        """
+        game = GeneralGame(Player(1, "test3"), Player(2, "test4"))
+        game.set_status(GameStatus.PLAYING)
+        game.key_input(json.dumps({"number": "player1", "input": "left_press"}))
+        for _ in range(8):
+            game.update_game(step_cnt=1)
+
+        self.assertEqual(game.get_score(), (0, 1))
+
+
+class GameFrameTests(TestCase):
+    def test_build_game_frame(self):
+        """
+        binary 프레임이 game json과 같은 값을 양자화해서 담는지 확인
+        """
+        game = GeneralGame(Player(1, "test1"), Player(2, "test2"))
+        game.set_status(GameStatus.PLAYING)
+        game.key_input(json.dumps({"number": "player1", "input": "left_press"}))
+        game.update_game(step_cnt=3)
+
+        frame = game.build_game_frame()
+        message = game.build_game_json()
+        data = unpack_game_frame(frame)
+        self.assertEqual(data["tick_no"], 1)
+        for key, value in json.loads(message).items():
+            if key != "message_type":
+                self.assertAlmostEqual(data[key], value, delta=0.05)
+        self.assertEqual(len(frame), 19)
+        self.assertLess(len(frame) * 5, len(message))
+
+    def test_quantize_clamps_to_int16(self):
+        """
+        int16 범위를 넘는 값은 잘라서 저장하는지 확인
+        """
+        frame = pack_game_frame(1, (0, 0, 0, 0, 0, 1e9, -1e9))
+        data = unpack_game_frame(frame)
+        self.assertEqual(data["ball_vx"], 32767 / 10)
+        self.assertEqual(data["ball_vz"], -32768 / 10)
+
+
+class DeltaSnapshotTests(TestCase):
+    def setUp(self):
+        self.snapshot = DeltaSnapshot(keyframe_tick_cnt=10, history_size=4)
+
+    def test_keyframe_until_ack(self):
+        """
+        ack를 받기 전까지는 모든 값을 담은 keyframe을 보내는지 확인
+        """
+        for tick_no in (1, 2):
+            data = self.snapshot.build(tick_no, (0, 0, 0, 435, 10, 0, 30))
+            self.assertTrue(data["keyframe"])
+            self.assertEqual(data["tick"], tick_no)
+            self.assertEqual(data["ball_vz"], 30)
+
+    def test_delta_from_acked_frame(self):
+        """
+        마지막으로 ack한 프레임 대비 바뀐 값만 보내는지 확인
+        """
+        self.snapshot.build(1, (0, 0, 0, 435, 10, 0, 30))
+        self.snapshot.build(2, (0, 0, 0, 435, 20, 0, 30))
+        self.snapshot.ack(1)
+
+        data = self.snapshot.build(3, (5, 0, 0, 435, 30, 0, 30))
+        self.assertEqual(
+            data,
+            {
+                "message_type": "playing",
+                "tick": 3,
+                "base": 1,
+                "paddle1": 5,
+                "ball_z": 30,
+            },
+        )
+
+        # 기억하지 않는 틱이나 이전 틱의 ack는 무시
+        self.snapshot.ack(100)
+        self.snapshot.ack(0)
+        self.assertEqual(self.snapshot.build(4, (5, 0, 0, 435, 40, 0, 30))["base"], 1)
+
+    def test_keyframe_interval_and_history(self):
+        """
+        keyframe 주기가 지나거나 ack한 프레임을 잊어버리면 keyframe을 보내는지 확인
+        """
+        values = (0, 0, 0, 435, 0, 0, 30)
+        self.snapshot.build(1, values)
+        self.snapshot.ack(1)
+        self.assertNotIn("keyframe", self.snapshot.build(5, values))
+        self.assertTrue(self.snapshot.build(11, values)["keyframe"])
+
+        self.snapshot.ack(11)
+        for tick_no in range(12, 16):
+            self.snapshot.build(tick_no, values)
+        self.assertTrue(self.snapshot.build(16, values)["keyframe"])
+
+
+class GroupBroadcasterTests(TestCase):
+    def setUp(self):
+        self.broadcaster = GroupBroadcaster()
+        self.received: dict[str, list] = {"a": [], "b": [], "c": []}
+        for channel_name, key in (("a", "json"), ("b", "json"), ("c", "binary")):
+            received = self.received[channel_name]
+
+            async def send(event, received=received):
+                received.append(event)
+
+            self.broadcaster.add("game_1", channel_name, send, key=key)
+
+    async def test_broadcast_same_event_by_key(self):
+        """
+        같은 key의 멤버들이 한 번 만든 같은 이벤트 객체를 받는지 확인
+        """
+        self.assertEqual(self.broadcaster.get_keys("game_1"), {"json", "binary"})
+        json_event, binary_event = {"text": "frame"}, {"bytes": b"frame"}
+
+        sent_cnt = await self.broadcaster.broadcast(
+            "game_1", {"json": json_event, "binary": binary_event}
+        )
+        self.assertEqual(sent_cnt, 3)
+        self.assertIs(self.received["a"][0], json_event)
+        self.assertIs(self.received["b"][0], json_event)
+        self.assertIs(self.received["c"][0], binary_event)
+
+        # 이벤트가 없는 key의 멤버에게는 보내지 않음
+        sent_cnt = await self.broadcaster.broadcast("game_1", {"json": json_event})
+        self.assertEqual(sent_cnt, 2)
+        self.assertEqual(len(self.received["c"]), 1)
+
+    async def test_discard_and_failed_send(self):
+        """
+        제거된 멤버는 받지 않고 한 멤버의 전송 실패가 다른 멤버에 영향이 없는지 확인
+        """
+
+        async def broken_send(event):
+            raise RuntimeError("closed")
+
+        self.broadcaster.add("game_1", "a", broken_send, key="json")
+        self.broadcaster.discard("game_1", "c")
+        with self.assertLogs("pong_game.module.GroupBroadcaster", "ERROR"):
+            sent_cnt = await self.broadcaster.broadcast(
+                "game_1", {"json": {"text": "frame"}, "binary": {"bytes": b""}}
+            )
+        self.assertEqual(sent_cnt, 1)
+        self.assertEqual(len(self.received["b"]), 1)
+        self.assertEqual(self.received["c"], [])
+
+        self.broadcaster.discard("game_1", "a")
+        self.broadcaster.discard("game_1", "b")
+        self.assertEqual(self.broadcaster.get_member_cnt("game_1"), 0)
+        self.assertEqual(self.broadcaster.get_keys("game_1"), set())
+
+
+@patch.object(RedisChannelLayer, "group_send", new_callable=AsyncMock)
+@patch.object(RedisChannelLayer, "group_discard", new_callable=AsyncMock)
+@patch.object(RedisChannelLayer, "group_add", new_callable=AsyncMock)
+class HybridChannelLayerTests(TestCase):
+    def setUp(self):
+        self.layer = HybridChannelLayer(hosts=[("localhost", 6379)])
+        self.connection = MagicMock()
+        self.connection.zcount = AsyncMock()
+        self.layer.connection = MagicMock(return_value=self.connection)
+
+    async def test_local_group_skips_redis(self, group_add, group_discard, group_send):
+        """
+        그룹 멤버가 모두 로컬이면 Redis로 보내지 않고 수신 버퍼로 바로 전달하는지 확인
+        """
+        channels = [await self.layer.new_channel() for _ in range(2)]
+        for channel in channels:
+            await self.layer.group_add("game_1", channel)
+        self.assertEqual(group_add.await_count, 2)
+        self.connection.zcount.return_value = 2
+
+        for _ in range(3):
+            await self.layer.group_send("game_1", {"type": "game.message"})
+        group_send.assert_not_awaited()
+        # 보낼 때마다 Redis의 멤버 수를 확인
+        self.assertEqual(self.connection.zcount.await_count, 3)
+        for channel in channels:
+            for _ in range(3):
+                message = await self.layer.receive(channel)
+                self.assertEqual(message, {"type": "game.message"})
+
+        # 멤버가 바뀌면 다시 확인
+        await self.layer.group_discard("game_1", channels[0])
+        self.connection.zcount.return_value = 1
+        await self.layer.group_send("game_1", {"type": "game.message"})
+        group_send.assert_not_awaited()
+        self.assertEqual(self.layer.get_local_members("game_1"), {channels[1]})
+
+    async def test_remote_member_falls_back_to_redis(
+        self, group_add, group_discard, group_send
+    ):
+        """
+        다른 프로세스의 멤버가 있거나 로컬 멤버가 없으면 Redis로 보내는지 확인
+        """
+        await self.layer.group_send("game_1", {"type": "game.message"})
+        self.assertEqual(group_send.await_count, 1)
+        self.connection.zcount.assert_not_awaited()
+
+        channel = await self.layer.new_channel()
+        await self.layer.group_add("game_1", channel)
+        self.connection.zcount.return_value = 1
+        await self.layer.group_send("game_1", {"type": "game.message"})
+        self.assertEqual(group_send.await_count, 1)
+        self.assertEqual(await self.layer.receive(channel), {"type": "game.message"})
+
+        # 다른 프로세스에서 방금 들어온 멤버도 다음 메시지부터 Redis로 받음
+        remote_channel = "specific.other!abc"
+        self.assertFalse(self.layer.is_local_channel(remote_channel))
+        await self.layer.group_add("game_1", remote_channel)
+        self.connection.zcount.return_value = 2
+        await self.layer.group_send("game_1", {"type": "game.message"})
+        self.assertEqual(group_send.await_count, 2)
+        self.assertTrue(self.layer.receive_buffer[channel].empty())
+
+    async def test_stale_member_not_written(self, group_add, group_discard, group_send):
+        """
+        연결이 끊긴 채널이나 group_expiry가 지난 멤버의 수신 버퍼에는 넣지 않는지 확인
+        """
+        channels = [await self.layer.new_channel() for _ in range(3)]
+        for channel in channels:
+            await self.layer.group_add("game_1", channel)
+        await self.layer.discard_channel(channels[0])
+        group_discard.assert_awaited_once_with("game_1", channels[0])
+        self.assertEqual(self.layer.get_local_members("game_1"), set(channels[1:]))
+
+        now = time.time()
+        with patch(
+            "pong_game.module.HybridChannelLayer.time.time",
+            return_value=now + self.layer.group_expiry / 2,
+        ):
+            await self.layer.group_add("game_1", channels[2])
+        self.connection.zcount.return_value = 1
+        with patch(
+            "pong_game.module.HybridChannelLayer.time.time",
+            return_value=now + self.layer.group_expiry + 1,
+        ):
+            await self.layer.group_send("game_1", {"type": "game.message"})
+        group_send.assert_not_awaited()
+        self.assertEqual(self.layer.get_local_members("game_1"), {channels[2]})
+        self.assertNotIn(channels[0], self.layer.receive_buffer)
+        self.assertNotIn(channels[1], self.layer.receive_buffer)
+        self.assertEqual(
+            await self.layer.receive(channels[2]), {"type": "game.message"}
+        )
+
+
+class GameRegistryTests(TestCase):
+    def setUp(self):
+        self.registry = InMemoryGameRegistry(owner="worker1", lease_seconds=60)
+
+    async def test_register_and_owner_only_update(self):
+        """
+        소유 프로세스만 상태 변경, 연장, 삭제를 할 수 있는지 확인
+        """
+        record = self.registry.create_record("test1", "test2")
+        await self.registry.register("game_1", record)
+        self.assertTrue(self.registry.is_local(await self.registry.get("game_1")))
+        self.assertTrue(await self.registry.set_status("game_1", GameStatus.PLAYING))
+        self.assertEqual((await self.registry.get("game_1")).status, "playing")
+
+        await self.registry.register(
+            "game_2", GameRecord("worker2", "wait", "test3", "test4")
+        )
+        self.assertFalse(await self.registry.set_status("game_2", GameStatus.END))
+        self.assertFalse(await self.registry.renew("game_2"))
+        self.assertFalse(await self.registry.remove("game_2"))
+
+        self.assertTrue(await self.registry.remove("game_1"))
+        self.assertIsNone(await self.registry.get("game_1"))
+
+    async def test_lease_expires(self):
+        """
+        연장하지 않은 기록은 lease_seconds가 지나면 사라지는지 확인
+        """
+        self.registry.lease_seconds = 0.05
+        await self.registry.register("game_1", self.registry.create_record("a", "b"))
+        await asyncio.sleep(0.03)
+        self.assertTrue(await self.registry.renew("game_1"))
+        await asyncio.sleep(0.03)
+        self.assertIsNotNone(await self.registry.get("game_1"))
+        await asyncio.sleep(0.06)
+        self.assertIsNone(await self.registry.get("game_1"))
+
+    def test_record_round_trip(self):
+        record = GameRecord("worker1", "wait", "test1", "test2", "game_owner.x!y")
+        self.assertEqual(
+            GameRecord.from_dict(record.to_dict()).to_dict(), record.to_dict()
+        )
+        self.assertTrue(record.has_player("test2"))
+        self.assertFalse(record.has_player("test3"))
+
+    async def test_get_all_by_prefix(self):
+        """
+        접두사가 같은 유효한 기록만 모두 찾는지 확인
+        """
+        await self.registry.register("game_1", self.registry.create_record("a", "b"))
+        await self.registry.register(
+            "tournament:t1", GameRecord("worker2", "wait", "", "", player_cnt=2)
+        )
+        records = await self.registry.get_all("tournament:")
+        self.assertEqual(list(records), ["tournament:t1"])
+        self.assertEqual(records["tournament:t1"].player_cnt, 2)
+
+
+class HashRingTests(TestCase):
+    def setUp(self):
+        self.keys = [str(uuid.uuid4()) for _ in range(3000)]
+
+    def test_even_distribution(self):
+        """
+        키가 워커들에게 고르게 나뉘는지 확인
+        """
+        ring = HashRing()
+        self.assertIsNone(ring.get_owner("game"))
+        ring.set_workers(["worker1", "worker2", "worker3"])
+        counts = {}
+        for key in self.keys:
+            owner = ring.get_owner(key)
+            counts[owner] = counts.get(owner, 0) + 1
+        self.assertEqual(set(counts), {"worker1", "worker2", "worker3"})
+        for count in counts.values():
+            self.assertGreater(count, len(self.keys) / 3 * 0.7)
+
+    def test_rebalance_moves_only_changed_worker_keys(self):
+        """
+        워커가 들어오거나 나갈 때 그 워커의 키만 옮겨지는지 확인
+        """
+        ring = HashRing()
+        ring.set_workers(["worker1", "worker2", "worker3"])
+        before = {key: ring.get_owner(key) for key in self.keys}
+
+        self.assertTrue(ring.set_workers(["worker1", "worker2", "worker3", "worker4"]))
+        self.assertFalse(ring.set_workers(["worker4", "worker3", "worker2", "worker1"]))
+        moved = [key for key in self.keys if ring.get_owner(key) != before[key]]
+        self.assertTrue(all(ring.get_owner(key) == "worker4" for key in moved))
+        self.assertLess(len(moved), len(self.keys) / 4 * 1.3)
+
+        ring.set_workers(["worker1", "worker3"])
+        for key in self.keys:
+            if before[key] != "worker2":
+                self.assertEqual(ring.get_owner(key), before[key])
+
+    async def test_heartbeat_updates_ring(self):
+        """
+        하트비트가 살아있는 워커로 링을 갱신하고 멈추면 링에서 빠지는지 확인
+        """
+        registry = InMemoryGameRegistry(owner="worker1")
+        heartbeat = WorkerHeartbeat(registry, HashRing(), interval=60)
+        await heartbeat.start("game_owner.x!1")
+        self.assertEqual(heartbeat.get_owner("game"), ("worker1", "game_owner.x!1"))
+        await heartbeat.stop()
+        self.assertEqual(heartbeat.get_owner("game"), (None, None))
+
+    async def test_stop_keeps_peers(self):
+        """
+        하트비트를 멈춘 워커의 링에는 게임을 넘겨받을 다른 워커만 남는지 확인
+        """
+        registry = InMemoryGameRegistry(owner="worker1")
+        registry.heartbeat = AsyncMock(
+            return_value={"worker1": "game_owner.x!1", "worker2": "game_owner.y!1"}
+        )
+        heartbeat = WorkerHeartbeat(registry, HashRing(), interval=60)
+        await heartbeat.start("game_owner.x!1")
+        await heartbeat.stop()
+        for key in ("game1", "game2", "game3"):
+            self.assertEqual(heartbeat.get_owner(key), ("worker2", "game_owner.y!1"))
+
+    async def test_least_loaded_worker(self):
+        """
+        게임 수가 가장 적은 워커를 고르고 다음 하트비트 전까지 고른 워커의 게임 수를 늘리는지 확인
+        """
+        registry = InMemoryGameRegistry(owner="worker1")
+        registry.heartbeat = AsyncMock(
+            return_value={"worker1": "game_owner.x!1", "worker2": "game_owner.y!1"}
+        )
+        registry.get_worker_loads = AsyncMock(return_value={"worker1": 3, "worker2": 1})
+        heartbeat = WorkerHeartbeat(registry, HashRing(), interval=60)
+        await heartbeat.beat("game_owner.x!1")
+        owners = [heartbeat.get_least_loaded()[0] for _ in range(4)]
+        self.assertEqual(owners, ["worker2", "worker2", "worker1", "worker2"])
+
+    async def test_heartbeat_records_load(self):
+        registry = InMemoryGameRegistry(owner="worker1")
+        heartbeat = WorkerHeartbeat(
+            registry, HashRing(), interval=60, get_load=lambda: 5
+        )
+        await heartbeat.beat("game_owner.x!1")
+        self.assertEqual(await registry.get_worker_loads(), {"worker1": 5})
+        self.assertEqual(heartbeat.get_least_loaded(), ("worker1", "game_owner.x!1"))
+
+
+class BatchPhysicsTests(TestCase):
+    def setUp(self):
+        self.physics = BatchPhysics(step_scale=0.25, capacity=1)
+
+    def test_key_input_error_isolated_per_slot(self):
+        """
+        한 슬롯의 키 입력 적용이 실패해도 다른 슬롯의 입력은 적용되고 스텝이 진행되는지 확인
+        """
+        physics = BatchPhysics(capacity=2)
+        broken_game = self.make_game("a1", "a2")
+        game = self.make_game("b1", "b2")
+        broken_game.attach_physics(physics)
+        game.attach_physics(physics)
+
+        def broken_apply_key_input():
+            raise ValueError
+
+        broken_game.apply_key_input = broken_apply_key_input
+        for target in (broken_game, game):
+            target.key_input(json.dumps({"number": "player1", "input": "left_press"}))
+
+        with self.assertLogs("pong_game.module.BatchPhysics", level="ERROR"):
+            physics.step(step_cnt=1)
+        self.assertLess(json.loads(game.build_game_json())["paddle1"], 0)
+
+    @staticmethod
+    def make_game(player1: str, player2: str) -> GeneralGame:
+        game = GeneralGame(Player(1, player1), Player(2, player2))
+        game.set_status(GameStatus.PLAYING)
+        return game
+
+    def assert_same_as_scalar(
+        self, physics: BatchPhysics, step_scale: float, inputs: dict, step_cnt: int
+    ) -> GeneralGame:
+        """
+        같은 입력을 주었을 때 batch 엔진과 게임별 계산 결과가 매 스텝 같은지 확인
+        """
+        scalar_games = [self.make_game("a1", "a2"), self.make_game("b1", "b2")]
+        batch_games = [self.make_game("c1", "c2"), self.make_game("d1", "d2")]
+        for game in batch_games:
+            game.attach_physics(physics)
+
+        for step in range(step_cnt):
+            if step in inputs:
+                number, key = inputs[step]
+                text_data = json.dumps({"number": number, "input": key})
+                for game in scalar_games + batch_games:
+                    game.key_input(text_data)
+            for game in scalar_games:
+                game.update_game(step_cnt=1, step_scale=step_scale)
+            physics.step(step_cnt=1)
+
+            for scalar_game, batch_game in zip(scalar_games, batch_games):
+                self.assertEqual(
+                    json.loads(scalar_game.build_game_json()),
+                    json.loads(batch_game.build_game_json()),
+                )
+                self.assertEqual(scalar_game.get_score(), batch_game.get_score())
+                self.assertEqual(scalar_game.get_status(), batch_game.get_status())
+                for game in (scalar_game, batch_game):
+                    if game.get_status() == GameStatus.SCORE:
+                        game.set_status(GameStatus.PLAYING)
+        return scalar_games[0]
+
+    def test_same_result_as_scalar(self):
+        """
+        패들 이동, 벽 충돌, 득점이 batch 엔진과 게임별 계산에서 같은지 확인
+        """
+        inputs = {
+            0: ("player1", "right_press"),
+            8: ("player1", "right_release"),
+            40: ("player2", "left_press"),
+            60: ("player2", "left_release"),
+            500: ("player1", "protego_maxima"),
+        }
+        game = self.assert_same_as_scalar(self.physics, 0.25, inputs, 2000)
+        self.assertNotEqual(game.get_score(), (0, 0))
+
+    @patch("pong_game.module.GameSetValue.BALL_SPEED_Z", 80)
+    def test_same_swept_collision_as_scalar(self):
+        """
+        한 스텝에 패들 면과 벽을 넘어가는 빠른 공도 batch 엔진과 게임별 계산에서 같은지 확인
+        """
+        inputs = {
+            0: ("player1", "right_press"),
+            3: ("player1", "right_release"),
+            40: ("player2", "protego_maxima"),
+            100: ("player2", "left_press"),
+            110: ("player2", "left_release"),
+        }
+        physics = BatchPhysics(step_scale=1)
+        game = self.assert_same_as_scalar(physics, 1, inputs, 400)
+        self.assertNotEqual(game.get_score(), (0, 0))
+
+    def test_attach_and_detach(self):
+        """
+        슬롯이 부족하면 늘어나고 반환한 슬롯은 다시 사용되는지 확인
+        """
+        games = [self.make_game(f"{i}_1", f"{i}_2") for i in range(3)]
+        for game in games:
+            game.attach_physics(self.physics)
+        self.assertEqual(self.physics.get_game_cnt(), 3)
+
+        games[0].detach_physics()
+        self.assertEqual(self.physics.get_game_cnt(), 2)
+        self.assertEqual(games[0].get_ball_position(), (0, 0))
+
+        games[0].attach_physics(self.physics)
+        self.physics.step(step_cnt=4)
+        self.assertEqual(self.physics.get_game_cnt(), 3)
+        for game in games:
+            self.assertEqual(game.get_ball_position(), (0, GameSetValue.BALL_SPEED_Z))
+
+
+class GameStateTests(TestCase):
+    @staticmethod
+    def play(game: GeneralGame, step_cnt: int) -> None:
+        for _ in range(step_cnt):
+            game.update_game(step_cnt=1)
+            if game.get_status() == GameStatus.SCORE:
+                game.set_status(GameStatus.PLAYING)
+
+    def test_general_game_round_trip(self):
+        """
+        get_state로 만든 상태에서 복원한 게임이 원래 게임과 똑같이 진행되는지 확인
+        """
+        game = BatchPhysicsTests.make_game("test1", "test2")
+        game.set_game_time(GameTimeType.START_TIME.value)
+        game.key_input(json.dumps({"number": "player1", "input": "right_press"}))
+        self.play(game, 300)
+        game.key_input(json.dumps({"number": "player2", "input": "left_press"}))
+
+        restored = GeneralGame.from_state(json.loads(json.dumps(game.get_state())))
+        self.assertEqual(restored.get_state(), game.get_state())
+
+        self.play(game, 300)
+        self.play(restored, 300)
+        self.assertEqual(restored.get_frame_values(), game.get_frame_values())
+        self.assertEqual(restored.get_score(), game.get_score())
+
+    def test_detach_physics_keeps_state(self):
+        """
+        batch 엔진에서 진행하던 게임을 떼어내도 공, 패들, 대기 틱이 유지되는지 확인
+        """
+        physics = BatchPhysics(step_scale=1, capacity=1)
+        game = BatchPhysicsTests.make_game("test1", "test2")
+        game.attach_physics(physics)
+        game.start_wait_ball()
+        game.key_input(json.dumps({"number": "player1", "input": "left_press"}))
+        physics.step(step_cnt=WAIT_BALL_TICK_CNT + 5)
+        state = game.get_state()
+
+        game.detach_physics()
+        self.assertEqual(game.get_state(), state)
+        self.assertNotEqual(game.get_ball_position(), (0, 0))
+
+    def test_prepare_resume(self):
+        """
+        옮겨온 진행 중인 게임은 점수를 유지한 채 플레이어의 ready를 다시 기다리는지 확인
+        """
+        game = BatchPhysicsTests.make_game("test1", "test2")
+        game.set_ready("player1")
+        game.set_ready("player2")
+        state = game.get_state()
+        state["score1"] = 2
+
+        restored = GeneralGame.from_state(state)
+        restored.prepare_resume()
+        self.assertEqual(restored.get_status(), GameStatus.WAIT)
+        self.assertFalse(restored.is_all_ready())
+        self.assertEqual(restored.get_score(), (2, 0))
+
+    def test_tournament_round_trip(self):
+        """
+        복원한 토너먼트의 라운드가 토너먼트 참가자 객체를 공유하는지 확인
+        """
+        tournament = Tournament("state", "test1", "nick1")
+        for idx in range(2, 5):
+            tournament.build_tournament_wait_detail_json(f"test{idx}", f"nick{idx}")
+        tournament.build_tournament_ready_json(TournamentGroupName.A_TEAM)
+        tournament.build_tournament_ready_json(TournamentGroupName.B_TEAM)
+        tournament.get_round(1).set_status(GameStatus.PLAYING)
+        self.play(tournament.get_round(1), 100)
+
+        restored = Tournament.from_state(json.loads(json.dumps(tournament.get_state())))
+        self.assertEqual(restored.get_state(), tournament.get_state())
+        self.assertIs(
+            restored.get_round(2).get_player("test3")[0], restored.player_list[2]
+        )
+
+    def test_snapshot_round_trip(self):
+        """
+        binary 스냅샷으로 복원한 게임, 라운드, 토너먼트의 상태가 원래와 같은지 확인
+        """
+        game = BatchPhysicsTests.make_game("test1", "test2")
+        game.set_game_time(GameTimeType.START_TIME.value)
+        self.play(game, 200)
+        game.key_input(json.dumps({"number": "player2", "input": "protego_maxima"}))
+        snapshot = game.build_snapshot()
+        self.assertEqual(
+            GeneralGame.from_snapshot(snapshot).get_state(), game.get_state()
+        )
+        self.assertLess(len(snapshot), len(json.dumps(game.get_state())) / 3)
+
+        tournament = Tournament("snapshot", "test1", "nick1")
+        for idx in range(2, 5):
+            tournament.build_tournament_wait_detail_json(f"test{idx}", f"nick{idx}")
+        tournament.build_tournament_ready_json(TournamentGroupName.A_TEAM)
+        round_game = tournament.get_round(1)
+        round_game.set_status(GameStatus.PLAYING)
+        self.play(round_game, 100)
+        self.assertEqual(
+            Round.from_snapshot(round_game.build_snapshot()).get_state(),
+            round_game.get_state(),
+        )
+        self.assertEqual(
+            Tournament.from_snapshot(tournament.build_snapshot()).get_state(),
+            tournament.get_state(),
+        )
+
+    def test_snapshot_skips_invalid_key_input(self):
+        """
+        상태에 올바르지 않은 키 입력이 있어도 스냅샷을 만들고 그 입력만 빠지는지 확인
+        """
+        game = BatchPhysicsTests.make_game("test1", "test2")
+        state = game.get_state()
+        state["key_inputs"] = [
+            {"input": "left_press"},
+            {"number": "player3", "input": "left_press"},
+            {"number": "player1", "input": 0},
+            {"number": "player1", "input": "right_press", "extra": 1},
+        ]
+        self.assertEqual(
+            unpack_general_game(pack_general_game(state))["key_inputs"],
+            [{"number": "player1", "input": "right_press"}],
+        )
+
+    def test_snapshot_rejects_wrong_data(self):
+        """
+        다른 버전, 다른 종류, 잘린 스냅샷은 SnapshotError가 발생하는지 확인
+        """
+        snapshot = BatchPhysicsTests.make_game("test1", "test2").build_snapshot()
+        for data in (b"\x09" + snapshot[1:], snapshot[:-1], snapshot + b"\x00"):
+            with self.assertRaises(SnapshotError):
+                GeneralGame.from_snapshot(data)
+        with self.assertRaises(SnapshotError):
+            Round.from_snapshot(snapshot)
+
+    def test_snapshot_keeps_user_id(self):
+        """
+        플레이어의 user_id가 스냅샷과 게임 로그 데이터에 그대로 남는지 확인
+        """
+        user_id = str(uuid.uuid4())
+        game = GeneralGame(Player(1, "test1", user_id=user_id), Player(2, "test2"))
+        restored = GeneralGame.from_snapshot(game.build_snapshot())
+        self.assertEqual(restored.get_db_data()["player1_user_id"], user_id)
+        self.assertIsNone(restored.get_db_data()["player2_user_id"])
+
+
+class TournamentJournalTests(TestCase):
+    @staticmethod
+    def make_tournament(name: str) -> Tournament:
+        tournament = Tournament(name, "test1", "nick1")
+        for idx in range(2, 5):
+            tournament.build_tournament_wait_detail_json(f"test{idx}", f"nick{idx}")
+        tournament.build_tournament_ready_json(TournamentGroupName.A_TEAM)
+        tournament.build_tournament_ready_json(TournamentGroupName.B_TEAM)
+        tournament.set_status(TournamentStatus.PLAYING)
+        return tournament
+
+    @staticmethod
+    def finish_round(round_game: Round) -> None:
+        now = datetime.datetime.now()
+        state = round_game.get_state()
+        state["score1"] = GameSetValue.MAX_SCORE
+        state["status"] = GameStatus.END.value
+        state["start_time"] = (now - datetime.timedelta(minutes=1)).isoformat()
+        state["end_time"] = (now - datetime.timedelta(seconds=1)).isoformat()
+        round_game.set_state(state)
+        round_game.build_end_json()
+
+    async def test_append_writes_in_batch(self):
+        """
+        여러 번 append해도 flush_interval 동안 모은 기록을 한 번에 저장하는지 확인
+        """
+        journal = InMemoryTournamentJournal(flush_interval=0.05)
+        journal.write_batch = AsyncMock(wraps=journal.write_batch)
+        tournament = Tournament("batch", "test1", "nick1")
+        for event in (JournalEvent.JOIN, JournalEvent.LEAVE, JournalEvent.REMOVE):
+            journal.append(event, tournament)
+        self.assertEqual(journal.get_pending_cnt(), 3)
+
+        await asyncio.sleep(0.2)
+        journal.write_batch.assert_awaited_once()
+        self.assertEqual(
+            [record.event for record in await journal.load()],
+            ["join", "leave", "remove"],
+        )
+        self.assertEqual(get_unfinished_records(await journal.load()), {})
+
+    async def test_file_journal(self):
+        """
+        파일 저널이 잘린 마지막 줄을 건너뛰고 읽고, compact하면 주어진 기록만 남는지 확인
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            journal = FileTournamentJournal(os.path.join(tmp_dir, "journal"))
+            tournament = Tournament("file", "test1", "nick1")
+            journal.append(JournalEvent.JOIN, tournament)
+            tournament.build_tournament_wait_detail_json("test2", "nick2")
+            journal.append(JournalEvent.JOIN, tournament)
+            self.assertEqual(await journal.flush(), 2)
+            with open(journal.path, "a") as f:
+                f.write('{"event": "le')
+
+            records = await journal.load()
+            self.assertEqual(len(records), 2)
+            restored = Tournament.from_snapshot(records[-1].snapshot)
+            self.assertEqual(restored.get_player_total_cnt(), 2)
+
+            await journal.compact(records[-1:])
+            self.assertEqual(len(await journal.load()), 1)
+
+    async def test_recover_tournaments(self):
+        """
+        결승 전에 멈춘 토너먼트는 다시 넣고, 결승이 끝난 토너먼트는 결과를 저장하는지 확인
+        """
+        for idx in range(1, 5):
+            await database_sync_to_async(get_user_model().objects.create_user)(
+                intra_id=f"test{idx}", nickname=f"nick{idx}"
+            )
+        journal = InMemoryTournamentJournal()
+
+        semifinal = self.make_tournament("semifinal")
+        self.finish_round(semifinal.get_round(1))
+        self.finish_round(semifinal.get_round(2))
+        journal.append(JournalEvent.ROUND_END, semifinal)
+
+        final = self.make_tournament("final")
+        self.finish_round(final.get_round(1))
+        self.finish_round(final.get_round(2))
+        final.build_tournament_ready_json(
+            TournamentGroupName.FINAL_TEAM, "nick1", "nick3"
+        )
+        self.finish_round(final.get_round(3))
+        final.set_status(TournamentStatus.END)
+        journal.append(JournalEvent.ROUND_END, final)
+
+        journal.append(JournalEvent.JOIN, Tournament("waiting", "test1", "nick1"))
+
+        self.assertEqual(await recover_tournaments(journal), (1, 1))
+        restored = ACTIVE_TOURNAMENTS.pop("semifinal")
+        self.assertEqual(restored.get_round(3).get_nicknames(), ("nick1", "nick3"))
+        self.assertEqual(
+            restored.get_round(3).get_player("test3")[0].get_status(),
+            GameSetValue.PlayerStatus.READY,
+        )
+        self.assertEqual(
+            await database_sync_to_async(
+                TournamentGameLogs.objects.filter(tournament_name="final").count
+            )(),
+            3,
+        )
+        self.assertNotIn("final", ACTIVE_TOURNAMENTS)
+        self.assertEqual(
+            [record.tournament_name for record in await journal.load()], ["semifinal"]
+        )
+
+    async def test_redis_journal_survives_host_change(self):
+        """
+        파드가 바뀌어 호스트 이름이 달라져도 같은 key의 stream에서 토너먼트를 복구하는지 확인
+        """
+        url = "redis://127.0.0.1:6379/0"
+        key = "pong:test_tournament_journal"
+        with patch("socket.gethostname", return_value="web-old"):
+            journal = create_tournament_journal("redis", url=url, key=key)
+        await journal.compact([])
+        tournament = self.make_tournament("moved")
+        self.finish_round(tournament.get_round(1))
+        self.finish_round(tournament.get_round(2))
+        journal.append(JournalEvent.ROUND_END, tournament)
+        await journal.flush()
+
+        with patch("socket.gethostname", return_value="web-new"):
+            journal = create_tournament_journal("redis", url=url, key=key)
+        try:
+            self.assertEqual(await recover_tournaments(journal), (1, 0))
+            self.assertIn("moved", ACTIVE_TOURNAMENTS)
+        finally:
+            ACTIVE_TOURNAMENTS.pop("moved", None)
+            await journal.compact([])
+
+
+class GameResultWriterTests(TestCase):
+    def setUp(self):
+        self.user_ids = {
+            intra_id: str(get_user_model().objects.create_user(intra_id=intra_id).pk)
+            for intra_id in ("user1", "user2", "user3", "user4")
+        }
+
+    @staticmethod
+    def make_result(winner_id: str, loser_id: str, **kwargs) -> GameResult:
+        end_time = timezone.now()
+        data = {
+            "start_time": end_time - datetime.timedelta(minutes=1),
+            "end_time": end_time,
+            "player1_intra_id": loser_id,
+            "player2_intra_id": winner_id,
+            "player1_score": 1,
+            "player2_score": 3,
+        }
+        data.update(kwargs)
+        return GameResult([data], [(winner_id, loser_id)], True)
+
+    @database_sync_to_async
+    def get_users(self) -> dict:
+        return {user.intra_id: user for user in Users.objects.all()}
+
+    @database_sync_to_async
+    def get_log_cnt(self) -> int:
+        return GeneralGameLogs.objects.count()
+
+    async def test_batch_aggregates_counts(self):
+        """
+        모인 결과를 한 번에 저장하고 유저별 승패 수와 레이팅을 합쳐서 갱신하는지 확인
+        """
+        writer = GameResultWriter(flush_interval=60)
+        saved = []
+
+        async def on_saved(is_saved):
+            saved.append(is_saved)
+
+        futures = [
+            writer.submit(self.make_result("user1", "user2"), on_saved),
+            writer.submit(self.make_result("user1", "user3"), on_saved),
+            writer.submit(self.make_result("user2", "user3"), on_saved),
+        ]
+        self.assertEqual(await writer.flush(), 3)
+        self.assertEqual([future.result() for future in futures], [True] * 3)
+        self.assertEqual(saved, [True] * 3)
+        self.assertEqual(await self.get_log_cnt(), 3)
+
+        users = await self.get_users()
+        self.assertEqual(
+            [
+                (users[i].win_count, users[i].lose_count)
+                for i in ("user1", "user2", "user3")
+            ],
+            [(2, 0), (1, 1), (0, 2)],
+        )
+        rating1, _ = update_elo(1000, 1000)
+        rating1, _ = update_elo(rating1, 1000)
+        self.assertEqual(users["user1"].rating, rating1)
+        self.assertEqual(sum(user.rating for user in users.values()), 4000)
+
+    async def test_invalid_result_is_isolated(self):
+        """
+        잘못된 결과만 실패하고 같은 배치의 다른 결과는 저장되는지 확인
+        """
+        writer = GameResultWriter(flush_interval=60)
+        valid = writer.submit(self.make_result("user1", "user2"))
+        invalid = writer.submit(self.make_result("user1", "user3", player1_score=-1))
+        unknown = writer.submit(self.make_result("user1", "nobody"))
+        self.assertEqual(await writer.flush(), 1)
+        self.assertEqual(
+            [valid.result(), invalid.result(), unknown.result()], [True, False, False]
+        )
+        self.assertEqual(await self.get_log_cnt(), 1)
+        self.assertEqual((await self.get_users())["user1"].win_count, 1)
+
+    async def test_retry_transient_error(self):
+        """
+        일시적인 DB 오류는 다시 시도하고 계속 실패하면 실패로 알리는지 확인
+        """
+        writer = GameResultWriter(flush_interval=60, retry_interval=0)
+        with patch(
+            "pong_game.module.GameResultWriter.save_game_results",
+            side_effect=[OperationalError("locked"), None],
+        ) as save:
+            future = writer.submit(self.make_result("user1", "user2"))
+            self.assertEqual(await writer.flush(), 1)
+        self.assertTrue(future.result())
+        self.assertEqual(save.call_count, 2)
+
+        with patch(
+            "pong_game.module.GameResultWriter.save_game_results",
+            side_effect=OperationalError("locked"),
+        ) as save:
+            future = writer.submit(self.make_result("user1", "user2"))
+            self.assertEqual(await writer.flush(), 0)
+        self.assertFalse(future.result())
+        self.assertEqual(save.call_count, writer.retry_cnt + 1)
+
+    def test_tournament_rounds_read_users_once(self):
+        """
+        user_id를 가진 토너먼트 라운드는 유저를 플레이어마다 조회하지 않고 로그를 한 번에 저장하는지 확인
+        """
+        end_time = timezone.now()
+        pairs = [("user1", "user2"), ("user3", "user4"), ("user1", "user3")]
+        datas = [
+            {
+                "tournament_name": "tournament",
+                "round": idx + 1,
+                "player1_intra_id": winner_id,
+                "player2_intra_id": loser_id,
+                "player1_user_id": self.user_ids[winner_id],
+                "player2_user_id": self.user_ids[loser_id],
+                "player1_score": 3,
+                "player2_score": 0,
+                "start_time": end_time - datetime.timedelta(minutes=1),
+                "end_time": end_time,
+                "is_final": idx == 2,
+            }
+            for idx, (winner_id, loser_id) in enumerate(pairs)
+        ]
+        writer = GameResultWriter()
+        with CaptureQueriesContext(connection) as context:
+            self.assertEqual(
+                writer.write_batch([GameResult(datas, pairs, False)]), [True]
+            )
+        user_queries = [
+            query["sql"]
+            for query in context.captured_queries
+            if query["sql"].startswith("SELECT") and 'FROM "Users"' in query["sql"]
+        ]
+        self.assertEqual(len(user_queries), 1)
+        inserts = [
+            query["sql"]
+            for query in context.captured_queries
+            if query["sql"].startswith('INSERT INTO "TournamentGameLogs"')
+        ]
+        self.assertEqual(len(inserts), 1)
+
+        user1 = Users.objects.get(intra_id="user1")
+        self.assertEqual((user1.win_count, user1.rating), (2, 1000))
+        self.assertEqual(
+            TournamentGameLogs.objects.get(round=3).player2_id,
+            uuid.UUID(self.user_ids["user3"]),
+        )
+
+    def test_stats_match_rebuild(self):
+        """
+        결과를 저장할 때 더한 상대 기숙사별 통계와 기숙사 통계가 다시 만든 통계와 같은지 확인
+        """
+        for intra_id, house in zip(self.user_ids, ("GR", "RA", "SL", "HU")):
+            Users.objects.filter(intra_id=intra_id).update(house=house)
+        end_time = timezone.now()
+        tournament_datas = [
+            {
+                "tournament_name": "tournament",
+                "round": 1,
+                "player1_intra_id": "user3",
+                "player2_intra_id": "user1",
+                "player1_score": 3,
+                "player2_score": 1,
+                "start_time": end_time - datetime.timedelta(minutes=1),
+                "end_time": end_time,
+                "is_final": False,
+            }
+        ]
+        writer = GameResultWriter()
+        writer.write_batch(
+            [
+                self.make_result("user1", "user2"),
+                self.make_result("user1", "user3"),
+                self.make_result("user4", "user1"),
+                GameResult(tournament_datas, [("user3", "user1")], False),
+            ]
+        )
+        writer.write_batch([self.make_result("user2", "user1")])
+
+        def get_stats():
+            return (
+                set(
+                    HeadToHeadStats.objects.values_list(
+                        "user__intra_id", "opponent_house", "win_count", "lose_count"
+                    )
+                ),
+                set(
+                    HouseStats.objects.exclude(win_count=0, lose_count=0).values_list(
+                        "house", "win_count", "lose_count"
+                    )
+                ),
+            )
+
+        head_to_head, house = get_stats()
+        self.assertIn(("user1", "RA", 1, 1), head_to_head)
+        self.assertIn(("user1", "SL", 1, 1), head_to_head)
+        self.assertIn(("user1", "HU", 0, 1), head_to_head)
+        self.assertIn(("GR", 2, 3), house)
+        rebuild_game_stats()
+        self.assertEqual(get_stats(), (head_to_head, house))
+
+    async def test_submit_flushes_in_background(self):
+        writer = GameResultWriter(flush_interval=0.01)
+        future = writer.submit(self.make_result("user1", "user2"))
+        self.assertTrue(await asyncio.wait_for(future, timeout=2))
+        self.assertEqual(writer.get_pending_cnt(), 0)
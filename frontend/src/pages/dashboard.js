@@ -47,12 +47,22 @@ function Dashboard({ initialState }) {
     const csrfToken = getCSRFToken();
     if (csrfToken !== null) {
       const apiResponse = await fetchChartData();
-      const gameLogs = await fetchGameLogs();
+      let gameLogs = [];
+      let recordsError = false;
+      try {
+        ({ logs: gameLogs } = await fetchGameLogs());
+      } catch (error) {
+        console.error(error);
+        recordsError = true;
+      }
       const houseRates = apiResponse.house;
       const userRates = apiResponse.rate;
 
       this.renderChart(houseRates, userRates);
       this.renderRecords(gameLogs);
+      if (recordsError) {
+        this.renderRecordsError();
+      }
     }
 
     window.addEventListener("beforeunload", this.removeLanguageChangeListener);
@@ -83,6 +93,16 @@ function Dashboard({ initialState }) {
     this.renderMoreButton(gameLogs);
   };
 
+  this.renderRecordsError = () => {
+    const recordsList = document.getElementById("records-list");
+    if (recordsList) {
+      const li = document.createElement("li");
+      li.textContent = locale.records.loadError;
+      li.style.color = "black";
+      recordsList.appendChild(li);
+    }
+  };
+
   this.renderMoreButton = (gameLogs) => {
     const recordsList = document.getElementById("records-list");
 
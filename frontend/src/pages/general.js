@@ -24,6 +24,7 @@ function General({ $app, initialState }) {
 		blinkAniId,
 		gameIdValue,
 		gameMode,
+		stayRound,
 		ballMaterials,
 		ballCustom = 0;
 
@@ -119,6 +120,7 @@ function General({ $app, initialState }) {
 				gameSocket.send(event.data);
 			} else {
 				gameSocket.send(event.data);
+				stayRound = data.round;
 				$("#nav-bar").hidden = true;
 				state = "playing";
 				this.$element.innerHTML = `
@@ -133,6 +135,14 @@ function General({ $app, initialState }) {
 				gameSocket.addEventListener("message", this.finalGame);
 				gameSocket.send(event.data);
 			}
+		} else if (data.message_type == "migrate") {
+			// 게임이 다른 서버로 옮겨짐, 다시 접속하면 점수를 유지한 채 이어서 진행
+			score.player1 = data.player1_score;
+			score.player2 = data.player2_score;
+			gameSocket.removeEventListener("message", this.onGame);
+			running = false;
+			clearThreeJs();
+			setTimeout(this.makeGame, 500);
 		} else if (data.message_type == "error") {
 			clearThreeJs();
 			closeSocket();
@@ -168,6 +178,22 @@ function General({ $app, initialState }) {
 			const targetURL = `https://${process.env.BASE_IP}/tournament_game/${tournamentURL}`;
 			closeSocket();
 			navigate(targetURL);
+		} else if (data.message_type == "migrate") {
+			// 결승을 기다리는 중에 토너먼트가 다른 서버로 옮겨짐, 끝난 라운드로 다시 접속해서 계속 기다림
+			gameSocket.removeEventListener("message", this.finalGame);
+			setTimeout(this.waitFinal, 500);
+		}
+	};
+
+	this.waitFinal = async () => {
+		try {
+			const tournamentName = sessionStorage.getItem("tournamentName");
+			gameIdValue = `${tournamentName}/${stayRound}`;
+			await this.connectWebSocket();
+			gameSocket.addEventListener("message", this.finalGame);
+			gameSocket.send(JSON.stringify({ message_type: "stay" }));
+		} catch (error) {
+			console.error("Error socket connet:", error);
 		}
 	};
 
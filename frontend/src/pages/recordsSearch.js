@@ -1,4 +1,4 @@
-import { fetchGameLogs } from "../utils/fetches.js";
+import { fetchGameLogs, hasMoreGameLogs } from "../utils/fetches.js";
 import { replaceHttpWithHttps } from "../utils/imageUpload.js";
 import { getCurrentLanguage } from "../utils/languageUtils.js";
 import locales from "../utils/locales/locales.js";
@@ -35,11 +35,28 @@ function RecordsSearch({ initialState }) {
   const determineWinner = (log) => {
     return log.player1_score > log.player2_score ? log.player1 : log.player2;
   };
+  // 지금까지 받은 기록과 각 목록의 다음 페이지 주소 (undefined면 아직 첫 페이지도 안 받음)
+  this.gameLogs = [];
+  this.nextCursors = undefined;
+  this.loadError = false;
+  this.loadGameLogs = async () => {
+    try {
+      const { logs, next } = await fetchGameLogs(this.nextCursors);
+      this.gameLogs = [...this.gameLogs, ...logs];
+      this.nextCursors = next;
+      this.loadError = false;
+    } catch (error) {
+      console.error(error);
+      this.loadError = true;
+    }
+  };
   this.render = async () => {
     const language = getCurrentLanguage();
     const locale = locales[language] || locales.en;
-    const gameLogs = await fetchGameLogs();
-    const gameElements = gameLogs
+    if (this.nextCursors === undefined && !this.loadError) {
+      await this.loadGameLogs();
+    }
+    const gameElements = this.gameLogs
       .map((log) => {
         const winner = determineWinner(log);
         return `
@@ -86,8 +103,26 @@ function RecordsSearch({ initialState }) {
             <div class="record-container">
                 ${gameElements}
             </div>
+            ${
+              this.loadError
+                ? `<div class="fs-6" style="color:white;">${locale.records.loadError}</div>`
+                : ""
+            }
+            ${
+              this.nextCursors === undefined || hasMoreGameLogs(this.nextCursors)
+                ? `<button class="more-button" id="records-more">${locale.records.more}</button>`
+                : ""
+            }
         </div>
     `;
+    const moreButton = this.$element.querySelector("#records-more");
+    if (moreButton) {
+      moreButton.addEventListener("click", async () => {
+        moreButton.disabled = true;
+        await this.loadGameLogs();
+        this.render();
+      });
+    }
   };
 
   this.init = () => {
@@ -208,6 +208,9 @@ function Tournament({ $app, initialState }) {
           closeSocket();
           navigate(targetURL);
           // 저장된 토너먼트 모드, 토너먼트방이름, 라운드 합쳐서 스토리지에 저장 후 게임 연결
+        } else if (data.message_type == "migrate") {
+          // 토너먼트가 다른 서버로 옮겨짐, 같은 대기방에 다시 접속
+          setTimeout(this.renderWaiting, 500);
         }
       });
     } catch (error) {
@@ -359,36 +359,38 @@ export const fetchChartData = async () => {
   }
 };
 
-export const fetchGameLogs = async () => {
-  try {
-    const response1 = await fetch(
-      `https://${process.env.BASE_IP}/api/v1/general_game_logs/me/`
-    );
-    const response2 = await fetch(
-      `https://${process.env.BASE_IP}/api/v1/tournament_game_logs/me/`
-    );
+const GAME_LOG_URLS = [
+  `https://${process.env.BASE_IP}/api/v1/general_game_logs/me/`,
+  `https://${process.env.BASE_IP}/api/v1/tournament_game_logs/me/`,
+];
 
-    let data1 = [];
-    let data2 = [];
+// 한 페이지만 가져오고, 다음 페이지 주소(next)는 호출한 쪽에서 보관
+const fetchGameLogPage = async (url) => {
+  if (!url) {
+    return { results: [], next: null };
+  }
+  const response = await fetch(url);
+  if (!response.ok) {
+    throw new Error(
+      `Error fetching game logs: ${response.status} ${response.statusText}`
+    );
+  }
+  const data = await response.json();
+  return { results: data.results, next: data.next };
+};
 
-    if (response1.ok) {
-      data1 = await response1.json();
-    }
-    if (response2.ok) {
-      data2 = await response2.json();
-    }
+/**
+ *
+ * @param cursors 이전 호출이 돌려준 next 목록 (없으면 첫 페이지)
+ * @returns { logs, next } - 응답이 실패하면 예외를 던짐
+ */
+export const fetchGameLogs = async (cursors = GAME_LOG_URLS) => {
+  const pages = await Promise.all(cursors.map(fetchGameLogPage));
 
-    const combinedData = [...data1, ...data2];
-    combinedData.sort(
-      (a, b) => new Date(b.start_time) - new Date(a.start_time)
-    );
-    combinedData.sort(
-      (a, b) => new Date(b.start_time) - new Date(a.start_time)
-    );
+  const logs = pages.flatMap((page) => page.results);
+  logs.sort((a, b) => new Date(b.start_time) - new Date(a.start_time));
 
-    return combinedData;
-  } catch (error) {
-    console.error("Error fetching game logs:", error);
-    return [];
-  }
+  return { logs, next: pages.map((page) => page.next) };
 };
+
+export const hasMoreGameLogs = (cursors) => cursors.some((url) => url);
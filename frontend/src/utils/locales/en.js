@@ -76,6 +76,8 @@ const enLocale = {
     mainText: "Records",
     startTime: "Start time",
     vs: "VS",
+    more: "More",
+    loadError: "Failed to load records.",
   },
   profileTab: {
     myInfoTab: "MY",
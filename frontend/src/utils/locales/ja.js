@@ -76,6 +76,8 @@ const jaLocale = {
     mainText: "レコード",
     startTime: "スタートタイム",
     vs: "対",
+    more: "もっと見る",
+    loadError: "記録を読み込めませんでした。",
   },
   profileTab: {
     myInfoTab: "マイインフォ",
@@ -75,6 +75,8 @@ const koLocale = {
     mainText: "기록",
     startTime: "게임 시작 시간",
     vs: "대",
+    more: "더보기",
+    loadError: "기록을 불러오지 못했습니다.",
   },
   profileTab: {
     myInfoTab: "내 정보",